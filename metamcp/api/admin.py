@@ -18,6 +18,7 @@ from ..admin.interface import (
     get_user_management_data,
 )
 from ..services.auth_service import AuthService
+from ..services.search_service import get_search_service
 from ..services.tool_service import ToolService
 from ..utils.logging import get_logger
 
@@ -28,7 +29,7 @@ admin_router = APIRouter()
 
 # Initialize services
 auth_service = AuthService()
-tool_service = ToolService()
+tool_service = ToolService(search_service=get_search_service())
 
 
 # Pydantic models for request/response
@@ -17,7 +17,10 @@ from ..composition.models import (
     WorkflowExecutionResult,
     WorkflowStatus,
 )
-from ..composition.orchestrator import WorkflowOrchestrator
+from ..composition.orchestrator import (
+    WorkflowOrchestrator,
+    get_workflow_orchestrator,
+)
 from ..exceptions import WorkflowExecutionError, WorkflowValidationError
 from ..utils.logging import get_logger
 
@@ -27,14 +30,6 @@ logger = get_logger(__name__)
 composition_router = APIRouter(prefix="/composition", tags=["composition"])
 
 
-# Dependency injection
-def get_workflow_orchestrator() -> WorkflowOrchestrator:
-    """Get workflow orchestrator instance."""
-    # Note: In a production environment, this would use a proper DI container
-    # like FastAPI's dependency injection system with scoped instances
-    return WorkflowOrchestrator()
-
-
 # Request/Response models
 class WorkflowRegistrationRequest(BaseModel):
     """Request to register a workflow."""
@@ -57,6 +52,10 @@ class WorkflowExecutionResponse(BaseModel):
     status: WorkflowStatus = Field(..., description="Execution status")
     result: dict[str, Any] | None = Field(None, description="Execution result")
     error: str | None = Field(None, description="Error message if failed")
+    partial_results: dict[str, dict[int, Any]] = Field(
+        default_factory=dict,
+        description="Results of running loop and parallel steps, by call index",
+    )
     execution_time: float | None = Field(None, description="Execution time in seconds")
     started_at: datetime = Field(..., description="Start time")
     completed_at: datetime | None = Field(None, description="Completion time")
@@ -78,6 +77,17 @@ class ExecutionHistoryResponse(BaseModel):
     total_count: int = Field(..., description="Total number of executions")
 
 
+# Mock tool executor for now
+async def mock_tool_executor(tool_name: str, arguments: dict[str, Any]) -> Any:
+    """Pretend to execute a tool."""
+    return {
+        "tool_name": tool_name,
+        "arguments": arguments,
+        "result": f"Mock execution of {tool_name}",
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
 # API Endpoints
 @composition_router.post(
     "/workflows",
@@ -256,15 +266,6 @@ async def execute_workflow(
         # Set workflow ID from path
         request.workflow_id = workflow_id
 
-        # Mock tool executor for now
-        async def mock_tool_executor(tool_name: str, arguments: dict[str, Any]) -> Any:
-            return {
-                "tool_name": tool_name,
-                "arguments": arguments,
-                "result": f"Mock execution of {tool_name}",
-                "timestamp": datetime.now(UTC).isoformat(),
-            }
-
         # Execute workflow
         result = await orchestrator.execute_workflow(request, mock_tool_executor)
 
@@ -298,6 +299,38 @@ async def execute_workflow(
         )
 
 
+@composition_router.get(
+    "/executions/interrupted",
+    response_model=ExecutionHistoryResponse,
+    summary="Get interrupted executions",
+)
+async def get_interrupted_executions(
+    orchestrator: WorkflowOrchestrator = Depends(get_workflow_orchestrator),
+) -> ExecutionHistoryResponse:
+    """
+    Get executions left unfinished by a previous run, which can be resumed.
+
+    Args:
+        orchestrator: Workflow orchestrator
+
+    Returns:
+        Interrupted executions
+    """
+    try:
+        executions = await orchestrator.get_interrupted_executions()
+
+        return ExecutionHistoryResponse(
+            executions=executions, total_count=len(executions)
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to get interrupted executions: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
 @composition_router.get(
     "/executions/{execution_id}",
     response_model=WorkflowExecutionResponse,
@@ -332,6 +365,7 @@ async def get_execution_status(
             status=result.status,
             result=result.result,
             error=result.error,
+            partial_results=result.partial_results,
             execution_time=result.execution_time,
             started_at=result.started_at,
             completed_at=result.completed_at,
@@ -347,6 +381,107 @@ async def get_execution_status(
         )
 
 
+@composition_router.post(
+    "/executions/{execution_id}/resume",
+    response_model=WorkflowExecutionResponse,
+    summary="Resume execution",
+)
+async def resume_execution(
+    execution_id: str,
+    orchestrator: WorkflowOrchestrator = Depends(get_workflow_orchestrator),
+) -> WorkflowExecutionResponse:
+    """
+    Resume an interrupted workflow execution from its last checkpoint.
+
+    Args:
+        execution_id: Execution ID to resume
+        orchestrator: Workflow orchestrator
+
+    Returns:
+        Execution response
+    """
+    try:
+        result = await orchestrator.resume_workflow(execution_id, mock_tool_executor)
+
+        return WorkflowExecutionResponse(
+            execution_id=result.execution_id,
+            workflow_id=result.workflow_id,
+            status=result.status,
+            result=result.result,
+            error=result.error,
+            execution_time=result.execution_time,
+            started_at=result.started_at,
+            completed_at=result.completed_at,
+        )
+
+    except WorkflowExecutionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": e.error_code,
+                    "message": e.message,
+                    "details": e.details,
+                }
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to resume execution {execution_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
+@composition_router.delete(
+    "/executions/{execution_id}/checkpoint", summary="Discard checkpoint"
+)
+async def discard_checkpoint(
+    execution_id: str,
+    orchestrator: WorkflowOrchestrator = Depends(get_workflow_orchestrator),
+) -> dict[str, str]:
+    """
+    Discard the checkpoint of an execution that will not be resumed.
+
+    Args:
+        execution_id: Execution ID
+        orchestrator: Workflow orchestrator
+
+    Returns:
+        Deletion response
+    """
+    try:
+        deleted = await orchestrator.discard_interrupted_execution(execution_id)
+
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No checkpoint found for execution '{execution_id}'",
+            )
+
+        return {"message": f"Checkpoint of execution '{execution_id}' discarded"}
+
+    except HTTPException:
+        raise
+    except WorkflowExecutionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "error": {
+                    "code": e.error_code,
+                    "message": e.message,
+                    "details": e.details,
+                }
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to discard checkpoint {execution_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
 @composition_router.post(
     "/executions/{execution_id}/cancel", summary="Cancel execution"
 )
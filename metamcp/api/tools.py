@@ -14,13 +14,14 @@ from pydantic import BaseModel, Field
 
 from ..config import get_settings
 from ..exceptions import MetaMCPError, ToolNotFoundError, ValidationError
+from ..security.middleware import PreparsedBodyRoute
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Create router
-tools_router = APIRouter()
+# Create router; tool payloads reuse the body parsed by SecurityMiddleware
+tools_router = APIRouter(route_class=PreparsedBodyRoute)
 
 # Mock tool registry (in production, this would be a database)
 mock_tools: dict[str, dict[str, Any]] = {}
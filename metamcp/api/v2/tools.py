@@ -13,13 +13,14 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 
 from ...config import get_settings
+from ...security.middleware import PreparsedBodyRoute
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Create router
-tools_router = APIRouter()
+# Create router; tool payloads reuse the body parsed by SecurityMiddleware
+tools_router = APIRouter(route_class=PreparsedBodyRoute)
 security = HTTPBearer()
 
 
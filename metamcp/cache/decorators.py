@@ -6,30 +6,46 @@ This module provides decorators for easy caching integration.
 
 import functools
 import hashlib
+import inspect
 import json
 from collections.abc import Callable
 from typing import Any
 
+from ..utils.cache import SingleFlight, load_through
 from ..utils.logging import get_logger
 from .redis_cache import get_cache_manager
 
 logger = get_logger(__name__)
 
+# Concurrent misses for the same key share one computation
+_flight = SingleFlight()
+
 
 def cache_result(
     ttl: int = 3600,
     key_prefix: str = "",
     strategy: str = "default",
     key_generator: Callable = None,
+    stale_ttl: int | None = None,
+    beta: float = 1.0,
+    tags: list[str] | None = None,
 ):
     """
     Decorator to cache function results.
 
+    Concurrent calls that miss the same key wait for a single execution of
+    the function instead of each executing it.
+
     Args:
         ttl: Time to live in seconds
         key_prefix: Prefix for cache key
         strategy: Cache strategy (default, short, long, session)
         key_generator: Custom key generation function
+        stale_ttl: Seconds a result may be served stale while it is
+            recomputed in the background; None disables stale serving
+        beta: Eagerness of probabilistic early recomputation
+        tags: Tags to invalidate the result by; templates such as
+            ``"user:{user_id}"`` are filled with the call's arguments
     """
 
     def decorator(func: Callable) -> Callable:
@@ -41,23 +57,15 @@ def cache_result(
             else:
                 cache_key = _generate_cache_key(func, args, kwargs, key_prefix)
 
-            # Get cache manager
-            cache_manager = get_cache_manager()
-
-            # Try to get from cache
-            cached_result = await cache_manager.get(cache_key, strategy=strategy)
-            if cached_result is not None:
-                logger.debug(f"Cache HIT for {func.__name__}: {cache_key}")
-                return cached_result
-
-            # Execute function
-            logger.debug(f"Cache MISS for {func.__name__}: {cache_key}")
-            result = await func(*args, **kwargs)
-
-            # Cache result
-            await cache_manager.set(cache_key, result, ttl, strategy)
-
-            return result
+            return await _load(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl,
+                strategy,
+                stale_ttl,
+                beta,
+                _format_tags(func, tags, args, kwargs),
+            )
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -77,13 +85,19 @@ def cache_result(
     return decorator
 
 
-def cache_invalidate(pattern: str = None, key_generator: Callable = None):
+def cache_invalidate(
+    pattern: str = None,
+    key_generator: Callable = None,
+    tags: list[str] | None = None,
+):
     """
     Decorator to invalidate cache after function execution.
 
     Args:
         pattern: Cache key pattern to invalidate
         key_generator: Custom key generation function
+        tags: Tags to invalidate; templates such as ``"tool:{name}"`` are
+            filled with the call's arguments
     """
 
     def decorator(func: Callable) -> Callable:
@@ -95,9 +109,15 @@ def cache_invalidate(pattern: str = None, key_generator: Callable = None):
             # Invalidate cache
             cache_manager = get_cache_manager()
 
+            if tags:
+                # Invalidate entries cached under the tags
+                call_tags = _format_tags(func, tags, args, kwargs)
+                cleared = await cache_manager.invalidate_tags(call_tags)
+                logger.debug(f"Invalidated {cleared} cache entries tagged: {call_tags}")
+
             if pattern:
                 # Invalidate by pattern
-                cleared = await cache_manager.redis_cache.clear_pattern(pattern)
+                cleared = await cache_manager.clear_pattern(pattern)
                 logger.debug(
                     f"Invalidated {cleared} cache entries with pattern: {pattern}"
                 )
@@ -135,6 +155,9 @@ def cache_method_result(
     key_prefix: str = "",
     strategy: str = "default",
     include_self: bool = False,
+    stale_ttl: int | None = None,
+    beta: float = 1.0,
+    tags: list[str] | None = None,
 ):
     """
     Decorator to cache method results.
@@ -144,6 +167,11 @@ def cache_method_result(
         key_prefix: Prefix for cache key
         strategy: Cache strategy
         include_self: Include self object in cache key
+        stale_ttl: Seconds a result may be served stale while it is
+            recomputed in the background; None disables stale serving
+        beta: Eagerness of probabilistic early recomputation
+        tags: Tags to invalidate the result by; templates such as
+            ``"user:{user_id}"`` are filled with the call's arguments
     """
 
     def decorator(method: Callable) -> Callable:
@@ -159,23 +187,15 @@ def cache_method_result(
             else:
                 cache_key = _generate_cache_key(method, args, kwargs, key_prefix)
 
-            # Get cache manager
-            cache_manager = get_cache_manager()
-
-            # Try to get from cache
-            cached_result = await cache_manager.get(cache_key, strategy=strategy)
-            if cached_result is not None:
-                logger.debug(f"Cache HIT for {method.__name__}: {cache_key}")
-                return cached_result
-
-            # Execute method
-            logger.debug(f"Cache MISS for {method.__name__}: {cache_key}")
-            result = await method(self, *args, **kwargs)
-
-            # Cache result
-            await cache_manager.set(cache_key, result, ttl, strategy)
-
-            return result
+            return await _load(
+                cache_key,
+                lambda: method(self, *args, **kwargs),
+                ttl,
+                strategy,
+                stale_ttl,
+                beta,
+                _format_tags(method, tags, (self,) + args, kwargs),
+            )
 
         @functools.wraps(method)
         def sync_wrapper(self, *args, **kwargs):
@@ -194,6 +214,47 @@ def cache_method_result(
     return decorator
 
 
+async def _load(
+    cache_key: str,
+    compute: Callable,
+    ttl: int,
+    strategy: str,
+    stale_ttl: int | None,
+    beta: float,
+    tags: list[str],
+) -> Any:
+    """Get a cached result, computing it once per key on a miss."""
+    cache_manager = get_cache_manager()
+
+    async def get(key: str) -> Any:
+        return await cache_manager.get(key, strategy=strategy)
+
+    async def set(key: str, value: Any, ttl: int | None) -> bool:
+        return await cache_manager.set(key, value, ttl, strategy, tags=tags)
+
+    return await load_through(
+        cache_key,
+        get,
+        set,
+        compute,
+        _flight,
+        ttl=ttl,
+        stale_ttl=stale_ttl,
+        beta=beta,
+    )
+
+
+def _format_tags(
+    func: Callable, tags: list[str] | None, args: tuple, kwargs: dict
+) -> list[str]:
+    """Fill tag templates with the arguments of a call."""
+    if not tags:
+        return []
+    bound = inspect.signature(func).bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return [tag.format(**bound.arguments) for tag in tags]
+
+
 def _generate_cache_key(
     func: Callable, args: tuple, kwargs: dict, prefix: str = ""
 ) -> str:
@@ -6,20 +6,29 @@ TTL management, and performance optimizations.
 """
 
 import asyncio
-import json
 from typing import Any
 
 from ..config import get_settings
+from ..utils.cache import (
+    CacheBackend,
+    CacheConfig,
+    MemoryCacheBackend,
+    TieredCacheBackend,
+    add_tags,
+    invalidate_tag,
+    unlink_matching,
+)
+from ..utils.cache_codecs import CacheSerializer, create_serializer
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
-class RedisCache:
+class RedisCache(CacheBackend):
     """Redis-based caching implementation."""
 
-    def __init__(self, redis_url: str = None):
+    def __init__(self, redis_url: str = None, serializer: CacheSerializer = None):
         """Initialize Redis cache."""
         self.redis_url = redis_url or settings.cache_redis_url
         self._redis = None
@@ -27,6 +36,11 @@ class RedisCache:
         self._connection_pool = None
         self.default_ttl = 3600  # 1 hour
         self.max_ttl = 86400 * 7  # 1 week
+        self.serializer = serializer or create_serializer(
+            settings.cache_codec,
+            settings.cache_compression,
+            settings.cache_compression_threshold,
+        )
 
     async def _get_redis(self):
         """Get Redis connection."""
@@ -36,7 +50,7 @@ class RedisCache:
 
                 self._redis = redis.from_url(
                     self.redis_url,
-                    decode_responses=False,  # Keep as bytes for pickle
+                    decode_responses=False,  # Values are encoded by the serializer
                     max_connections=20,
                     retry_on_timeout=True,
                     socket_keepalive=True,
@@ -58,20 +72,21 @@ class RedisCache:
             if value is None:
                 return default
 
-            # Try to deserialize JSON, fallback to UTF-8 string
-            try:
-                return json.loads(value.decode("utf-8"))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                return value.decode("utf-8")
+            return self.serializer.loads(value)
 
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return default
 
     async def set(
-        self, key: str, value: Any, ttl: int = None, serialize: bool = True
+        self,
+        key: str,
+        value: Any,
+        ttl: int = None,
+        serialize: bool = True,
+        tags: list[str] = None,
     ) -> bool:
-        """Set value in cache."""
+        """Set value in cache, optionally registering it under tags."""
         try:
             redis_client = await self._get_redis()
 
@@ -81,18 +96,18 @@ class RedisCache:
             elif ttl > self.max_ttl:
                 ttl = self.max_ttl
 
-            # Serialize value (JSON for common types, else UTF-8 string)
-            if serialize:
-                if isinstance(value, (dict, list, int, float, bool, type(None))):
-                    serialized = json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
-                else:
-                    serialized = str(value).encode("utf-8")
-            else:
-                serialized = value
+            serialized = self.serializer.dumps(value) if serialize else value
 
-            # Set with TTL
-            result = await redis_client.setex(key, ttl, serialized)
-            return bool(result)
+            if not tags:
+                result = await redis_client.setex(key, ttl, serialized)
+                return bool(result)
+
+            # Write the value and its tag memberships in one round trip
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.setex(key, ttl, serialized)
+            add_tags(pipe, key, tags, ttl)
+            results = await pipe.execute()
+            return bool(results[0])
 
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
@@ -118,6 +133,33 @@ class RedisCache:
             logger.error(f"Cache exists error for key {key}: {e}")
             return False
 
+    async def clear(self) -> bool:
+        """Clear all keys in the cache database."""
+        try:
+            redis_client = await self._get_redis()
+            await redis_client.flushdb()
+            return True
+        except Exception as e:
+            logger.error(f"Cache clear error: {e}")
+            return False
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get Redis server statistics."""
+        try:
+            redis_client = await self._get_redis()
+            info = await redis_client.info()
+            return {
+                "backend": "redis",
+                "used_memory": info.get("used_memory", 0),
+                "used_memory_peak": info.get("used_memory_peak", 0),
+                "connected_clients": info.get("connected_clients", 0),
+                "total_commands_processed": info.get("total_commands_processed", 0),
+                "serializer": self.serializer.get_stats(),
+            }
+        except Exception as e:
+            logger.error(f"Cache stats error: {e}")
+            return {"backend": "redis", "error": str(e)}
+
     async def ttl(self, key: str) -> int:
         """Get TTL for key."""
         try:
@@ -139,34 +181,40 @@ class RedisCache:
             return False
 
     async def clear_pattern(self, pattern: str) -> int:
-        """Clear all keys matching pattern."""
+        """Clear all keys matching pattern with SCAN and UNLINK."""
         try:
             redis_client = await self._get_redis()
-            keys = await redis_client.keys(pattern)
-            if keys:
-                result = await redis_client.delete(*keys)
-                logger.info(f"Cleared {result} keys matching pattern: {pattern}")
-                return result
-            return 0
+            result = await unlink_matching(redis_client, pattern)
+            logger.info(f"Cleared {result} keys matching pattern: {pattern}")
+            return result
         except Exception as e:
             logger.error(f"Cache clear pattern error for {pattern}: {e}")
             return 0
 
+    async def invalidate_tags(self, tags: list[str]) -> list[str]:
+        """Delete all keys cached under any of the tags."""
+        keys = []
+        for tag in tags:
+            try:
+                redis_client = await self._get_redis()
+                keys.extend(await invalidate_tag(redis_client, tag))
+            except Exception as e:
+                logger.error(f"Cache invalidate tag error for {tag}: {e}")
+        if keys:
+            logger.info(f"Invalidated {len(keys)} keys tagged: {', '.join(tags)}")
+        return keys
+
     async def get_many(self, keys: list[str]) -> dict[str, Any]:
         """Get multiple values from cache."""
         try:
             redis_client = await self._get_redis()
             values = await redis_client.mget(keys)
 
-            result = {}
-            for key, value in zip(keys, values, strict=False):
-                if value is not None:
-                    try:
-                        result[key] = json.loads(value.decode("utf-8"))
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        result[key] = value.decode("utf-8")
-
-            return result
+            return {
+                key: self.serializer.loads(value)
+                for key, value in zip(keys, values, strict=False)
+                if value is not None
+            }
 
         except Exception as e:
             logger.error(f"Cache get_many error: {e}")
@@ -176,22 +224,13 @@ class RedisCache:
         """Set multiple values in cache."""
         try:
             redis_client = await self._get_redis()
+            ttl = min(ttl or self.default_ttl, self.max_ttl)
 
-            # Prepare pipeline
-            pipe = redis_client.pipeline()
-
+            # Send all writes in one round trip without MULTI/EXEC
+            pipe = redis_client.pipeline(transaction=False)
             for key, value in data.items():
-                if isinstance(value, (dict, list, int, float, bool, type(None))):
-                    serialized = json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
-                else:
-                    serialized = str(value).encode("utf-8")
+                pipe.setex(key, ttl, self.serializer.dumps(value))
 
-                if ttl is None:
-                    ttl = self.default_ttl
-
-                pipe.setex(key, ttl, serialized)
-
-            # Execute pipeline
             await pipe.execute()
             return True
 
@@ -222,6 +261,21 @@ class CacheManager:
     def __init__(self, redis_url: str = None):
         """Initialize cache manager."""
         self.redis_cache = RedisCache(redis_url)
+
+        # Serve hot keys from an in-process L1 in front of Redis
+        self.backend: CacheBackend = self.redis_cache
+        if settings.cache_l1_max_size > 0:
+            self.backend = TieredCacheBackend(
+                self.redis_cache,
+                MemoryCacheBackend(
+                    CacheConfig(
+                        ttl=settings.cache_l1_ttl,
+                        max_size=settings.cache_l1_max_size,
+                    )
+                ),
+                redis_url=self.redis_cache.redis_url,
+                channel=settings.cache_invalidation_channel,
+            )
         self._cache_stats = {
             "hits": 0,
             "misses": 0,
@@ -235,7 +289,7 @@ class CacheManager:
         """Get value with cache strategy."""
         try:
             # Check cache
-            value = await self.redis_cache.get(key)
+            value = await self.backend.get(key)
 
             if value is not None:
                 self._cache_stats["hits"] += 1
@@ -251,9 +305,14 @@ class CacheManager:
             return default
 
     async def set(
-        self, key: str, value: Any, ttl: int = None, strategy: str = "default"
+        self,
+        key: str,
+        value: Any,
+        ttl: int = None,
+        strategy: str = "default",
+        tags: list[str] = None,
     ) -> bool:
-        """Set value with cache strategy."""
+        """Set value with cache strategy, optionally under tags."""
         try:
             # Apply strategy-specific TTL
             if strategy == "short":
@@ -265,7 +324,10 @@ class CacheManager:
             else:
                 ttl = ttl or 3600  # 1 hour default
 
-            result = await self.redis_cache.set(key, value, ttl)
+            if tags:
+                result = await self.backend.set(key, value, ttl, tags=tags)
+            else:
+                result = await self.backend.set(key, value, ttl)
             if result:
                 self._cache_stats["sets"] += 1
                 logger.debug(f"Cache SET for key: {key} (TTL: {ttl}s)")
@@ -279,7 +341,7 @@ class CacheManager:
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         try:
-            result = await self.redis_cache.delete(key)
+            result = await self.backend.delete(key)
             if result:
                 self._cache_stats["deletes"] += 1
             return result
@@ -287,21 +349,31 @@ class CacheManager:
             logger.error(f"Cache manager delete error: {e}")
             return False
 
+    async def clear_pattern(self, pattern: str) -> int:
+        """Clear all keys matching pattern."""
+        return await self.backend.clear_pattern(pattern)
+
+    async def invalidate_tags(self, tags: list[str]) -> int:
+        """Delete all entries cached under any of the tags."""
+        keys = await self.backend.invalidate_tags(tags)
+        self._cache_stats["deletes"] += len(keys)
+        return len(keys)
+
     async def clear_tool_cache(self, tool_name: str = None) -> int:
         """Clear tool-related cache."""
         if tool_name:
-            pattern = f"tool:{tool_name}:*"
-        else:
-            pattern = "tool:*"
-        return await self.redis_cache.clear_pattern(pattern)
+            # Entries tagged by cache decorators, then keys named after it
+            count = await self.invalidate_tags([f"tool:{tool_name}"])
+            return count + await self.clear_pattern(f"tool:{tool_name}:*")
+        return await self.clear_pattern("tool:*")
 
     async def clear_user_cache(self, user_id: str = None) -> int:
         """Clear user-related cache."""
         if user_id:
-            pattern = f"user:{user_id}:*"
-        else:
-            pattern = "user:*"
-        return await self.redis_cache.clear_pattern(pattern)
+            # Entries tagged by cache decorators, then keys named after it
+            count = await self.invalidate_tags([f"user:{user_id}"])
+            return count + await self.clear_pattern(f"user:{user_id}:*")
+        return await self.clear_pattern("user:*")
 
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -309,7 +381,7 @@ class CacheManager:
             redis_client = await self.redis_cache._get_redis()
             info = await redis_client.info()
 
-            return {
+            stats = {
                 "cache_stats": self._cache_stats.copy(),
                 "redis_info": {
                     "used_memory": info.get("used_memory", 0),
@@ -324,12 +396,17 @@ class CacheManager:
                     else 0
                 ),
             }
+            if isinstance(self.backend, TieredCacheBackend):
+                stats["tiers"] = await self.backend.get_stats()
+            return stats
         except Exception as e:
             logger.error(f"Cache stats error: {e}")
             return {"cache_stats": self._cache_stats.copy()}
 
     async def close(self):
         """Close cache manager."""
+        if isinstance(self.backend, TieredCacheBackend):
+            await self.backend.close()
         await self.redis_cache.close()
 
 
@@ -0,0 +1,212 @@
+"""
+Workflow Checkpoints
+
+This module records the progress of workflow executions so they can be
+resumed after a restart. The engine marks an execution as changed after
+each step; a background task periodically writes the latest state of all
+changed executions to the database in one batch.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from ..utils.constants import (
+    DEFAULT_WORKFLOW_CHECKPOINT_BATCH_SIZE,
+    DEFAULT_WORKFLOW_CHECKPOINT_INTERVAL,
+)
+from ..utils.logging import get_logger
+from .models import StepStatus, WorkflowExecutionRequest, WorkflowState, WorkflowStatus
+
+if TYPE_CHECKING:
+    from .persistence import WorkflowPersistence
+
+logger = get_logger(__name__)
+
+
+def snapshot_state(state: WorkflowState) -> dict[str, Any]:
+    """
+    Snapshot the resumable parts of a workflow state.
+
+    Args:
+        state: Workflow execution state
+
+    Returns:
+        JSON-compatible copy of the state
+    """
+    return {
+        "workflow_id": state.workflow_id,
+        "execution_id": state.execution_id,
+        "status": state.status.value,
+        "step_results": dict(state.step_results),
+        "step_statuses": {
+            step_id: status.value for step_id, status in state.step_statuses.items()
+        },
+        "variables": dict(state.variables),
+        "cache_hits": list(state.cache_hits),
+        "error": state.error,
+        "started_at": state.started_at.isoformat() if state.started_at else None,
+        "completed_at": (
+            state.completed_at.isoformat() if state.completed_at else None
+        ),
+        "metadata": dict(state.metadata),
+    }
+
+
+def restore_state(data: dict[str, Any]) -> WorkflowState:
+    """
+    Restore a workflow state from a snapshot.
+
+    Args:
+        data: Snapshot created by snapshot_state
+
+    Returns:
+        Workflow execution state
+    """
+    return WorkflowState(
+        workflow_id=data["workflow_id"],
+        execution_id=data.get("execution_id"),
+        status=WorkflowStatus(data["status"]),
+        step_results=data.get("step_results", {}),
+        step_statuses={
+            step_id: StepStatus(status)
+            for step_id, status in data.get("step_statuses", {}).items()
+        },
+        variables=data.get("variables", {}),
+        cache_hits=data.get("cache_hits", []),
+        error=data.get("error"),
+        started_at=_parse_datetime(data.get("started_at")),
+        completed_at=_parse_datetime(data.get("completed_at")),
+        metadata=data.get("metadata", {}),
+    )
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO datetime from a snapshot."""
+    return datetime.fromisoformat(value) if value else None
+
+
+class CheckpointWriter:
+    """
+    Batched, asynchronous writer of workflow checkpoints.
+
+    Recording a checkpoint only marks the execution as changed, so it is
+    cheap enough to do after every step. Each flush snapshots the latest
+    state of every changed execution and saves them in one batch, so an
+    execution finishing many steps between flushes is written once.
+
+    Args:
+        persistence: Workflow persistence layer
+        interval: Seconds between flushes
+        batch_size: Maximum executions saved per batch
+    """
+
+    def __init__(
+        self,
+        persistence: "WorkflowPersistence",
+        interval: float = DEFAULT_WORKFLOW_CHECKPOINT_INTERVAL,
+        batch_size: int = DEFAULT_WORKFLOW_CHECKPOINT_BATCH_SIZE,
+    ):
+        """Initialize checkpoint writer."""
+        self.persistence = persistence
+        self.interval = interval
+        self.batch_size = batch_size
+        self._pending: dict[str, tuple[WorkflowExecutionRequest, WorkflowState]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._written = 0
+        self._failures = 0
+
+    def record(self, request: WorkflowExecutionRequest, state: WorkflowState) -> None:
+        """
+        Mark an execution as changed since its last checkpoint.
+
+        Args:
+            request: Workflow execution request
+            state: Workflow execution state
+        """
+        if state.execution_id:
+            self._pending[state.execution_id] = (request, state)
+
+    def discard(self, execution_id: str) -> None:
+        """
+        Forget changes to an execution that have not been written yet.
+
+        Args:
+            execution_id: Execution ID
+        """
+        self._pending.pop(execution_id, None)
+
+    def start(self) -> None:
+        """Start flushing checkpoints in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task and write remaining checkpoints."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write the checkpoints of all changed executions.
+
+        Returns:
+            Number of checkpoints written
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                batch = {}
+                for execution_id in list(self._pending)[: self.batch_size]:
+                    batch[execution_id] = self._pending.pop(execution_id)
+
+                # States keep changing while the batch is written, so
+                # snapshot them now
+                checkpoints = [
+                    {
+                        "execution_id": execution_id,
+                        "workflow_id": state.workflow_id,
+                        "status": state.status.value,
+                        "request": request.model_dump(mode="json"),
+                        "state": snapshot_state(state),
+                    }
+                    for execution_id, (request, state) in batch.items()
+                ]
+
+                try:
+                    await self.persistence.save_checkpoints(checkpoints)
+                except Exception as e:
+                    self._failures += 1
+                    logger.error(f"Failed to write workflow checkpoints: {e}")
+                    # Retry on the next flush unless a newer state was recorded
+                    for execution_id, entry in batch.items():
+                        self._pending.setdefault(execution_id, entry)
+                    break
+
+                written += len(checkpoints)
+
+            self._written += written
+            return written
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get checkpoint writer statistics."""
+        return {
+            "pending": len(self._pending),
+            "written": self._written,
+            "failures": self._failures,
+            "interval": self.interval,
+        }
+
+    async def _run(self) -> None:
+        """Flush checkpoints every interval."""
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._pending:
+                await self.flush()
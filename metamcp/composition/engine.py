@@ -6,15 +6,24 @@ complex tool compositions and workflows.
 """
 
 import asyncio
+import hashlib
+import json
 import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
 from ..exceptions import WorkflowExecutionError
+from ..utils.cache import Cache, create_memory_cache
+from ..utils.constants import (
+    DEFAULT_WORKFLOW_FAN_OUT_CONCURRENCY,
+    DEFAULT_WORKFLOW_STEP_CACHE_TTL,
+)
 from ..utils.logging import get_logger
+from .checkpoint import CheckpointWriter
 from .models import (
-    ConditionOperator,
     StepStatus,
     StepType,
     WorkflowDefinition,
@@ -24,9 +33,36 @@ from .models import (
     WorkflowStatus,
     WorkflowStep,
 )
+from .plan import CompiledStep, WorkflowPlan, compile_workflow
 
 logger = get_logger(__name__)
 
+STEP_CACHE_PREFIX = "workflow:step:"
+
+# Statuses of steps that need not run again when resuming
+_DONE = (StepStatus.COMPLETED, StepStatus.SKIPPED)
+
+
+def step_cache_key(tool_name: str, arguments: Any) -> str:
+    """
+    Get the step cache key of a tool call.
+
+    Arguments are hashed in a canonical JSON form, so calls with equal
+    arguments share a key regardless of dict ordering.
+
+    Args:
+        tool_name: Tool name
+        arguments: Substituted tool arguments
+
+    Returns:
+        Cache key
+    """
+    canonical = json.dumps(
+        arguments, sort_keys=True, separators=(",", ":"), default=str
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{STEP_CACHE_PREFIX}{tool_name}:{digest}"
+
 
 class WorkflowEngine:
     """
@@ -36,10 +72,37 @@ class WorkflowEngine:
     conditional logic, parallel execution, and error handling.
     """
 
-    def __init__(self):
-        """Initialize the workflow engine."""
+    def __init__(
+        self,
+        max_concurrent_steps: int | None = None,
+        step_cache: Cache | None = None,
+        step_cache_ttl: int = DEFAULT_WORKFLOW_STEP_CACHE_TTL,
+        checkpointer: CheckpointWriter | None = None,
+    ):
+        """
+        Initialize the workflow engine.
+
+        Args:
+            max_concurrent_steps: Maximum steps running at once across all
+                executions of this engine, or None for no limit. The API
+                runs every execution on the engine of the global
+                orchestrator, so the limit applies process-wide.
+            step_cache: Cache for results of cacheable tool steps, defaults
+                to an in-memory cache
+            step_cache_ttl: Default time to live of cached step results
+            checkpointer: Writer persisting execution progress after each
+                step, so executions can be resumed
+        """
         self.workflows: dict[str, WorkflowDefinition] = {}
+        self.plans: dict[str, WorkflowPlan] = {}
         self.executions: dict[str, WorkflowState] = {}
+        self.max_concurrent_steps = max_concurrent_steps
+        self.step_cache = step_cache or create_memory_cache()
+        self.step_cache_ttl = step_cache_ttl
+        self.checkpointer = checkpointer
+        self._step_semaphore = (
+            asyncio.Semaphore(max_concurrent_steps) if max_concurrent_steps else None
+        )
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -60,15 +123,19 @@ class WorkflowEngine:
         """
         Register a workflow definition.
 
+        The workflow is validated and compiled into an execution plan once,
+        so executions do not re-parse its graph, variables or conditions.
+
         Args:
             workflow: Workflow definition to register
         """
         try:
-            # Validate workflow
-            self._validate_workflow(workflow)
+            # Validate and compile workflow
+            plan = compile_workflow(workflow)
 
             # Store workflow
             self.workflows[workflow.id] = workflow
+            self.plans[workflow.id] = plan
 
             logger.info(f"Registered workflow: {workflow.id}")
 
@@ -89,35 +156,82 @@ class WorkflowEngine:
         Returns:
             Workflow execution result
         """
-        execution_id = str(uuid.uuid4())
+        return await self._run_execution(str(uuid.uuid4()), request, tool_executor)
+
+    async def resume_workflow(
+        self,
+        request: WorkflowExecutionRequest,
+        state: WorkflowState,
+        tool_executor: callable,
+    ) -> WorkflowExecutionResult:
+        """
+        Resume an interrupted workflow execution.
+
+        Completed and skipped steps keep their results, and execution
+        restarts from the steps whose dependencies have all completed.
+
+        Args:
+            request: Original workflow execution request
+            state: Last checkpointed state of the execution
+            tool_executor: Function to execute tools
+
+        Returns:
+            Workflow execution result
+        """
+        if not state.execution_id:
+            raise WorkflowExecutionError("Cannot resume an execution without an ID")
+
+        state.status = WorkflowStatus.RUNNING
+        state.error = None
+        state.completed_at = None
+        state.partial_results.clear()
+
+        logger.info(f"Resuming workflow execution: {state.execution_id}")
+
+        return await self._run_execution(
+            state.execution_id, request, tool_executor, state
+        )
+
+    async def _run_execution(
+        self,
+        execution_id: str,
+        request: WorkflowExecutionRequest,
+        tool_executor: callable,
+        state: WorkflowState | None = None,
+    ) -> WorkflowExecutionResult:
+        """Run a new or resumed workflow execution."""
         start_time = time.time()
 
         try:
-            # Get workflow definition
-            workflow = self.workflows.get(request.workflow_id)
-            if not workflow:
+            # Get workflow plan
+            plan = self._get_plan(request.workflow_id)
+            if not plan:
                 raise WorkflowExecutionError(
                     f"Workflow not found: {request.workflow_id}"
                 )
 
             # Initialize execution state
-            state = WorkflowState(
-                workflow_id=request.workflow_id,
-                status=WorkflowStatus.RUNNING,
-                variables=request.variables.copy(),
-                started_at=datetime.now(UTC),
-            )
+            if state is None:
+                state = WorkflowState(
+                    workflow_id=request.workflow_id,
+                    status=WorkflowStatus.RUNNING,
+                    execution_id=execution_id,
+                    variables=request.variables.copy(),
+                    started_at=datetime.now(UTC),
+                )
             self.executions[execution_id] = state
 
             logger.info(f"Starting workflow execution: {execution_id}")
 
             # Execute workflow
             result = await self._execute_workflow_internal(
-                workflow, state, request, tool_executor
+                plan, state, request, tool_executor
             )
 
             # Calculate execution time
             execution_time = time.time() - start_time
+            state.completed_at = datetime.now(UTC)
+            self._checkpoint(request, state)
 
             # Create result
             execution_result = WorkflowExecutionResult(
@@ -126,9 +240,10 @@ class WorkflowEngine:
                 status=state.status,
                 result=result,
                 step_results=state.step_results,
+                cache_hits=state.cache_hits,
                 execution_time=execution_time,
                 started_at=state.started_at,
-                completed_at=datetime.now(UTC),
+                completed_at=state.completed_at,
                 metadata=state.metadata,
             )
 
@@ -143,25 +258,46 @@ class WorkflowEngine:
                 state.status = WorkflowStatus.FAILED
                 state.error = str(e)
                 state.completed_at = datetime.now(UTC)
+                self._checkpoint(request, state)
 
             logger.error(f"Workflow execution failed: {e}")
             raise WorkflowExecutionError(f"Workflow execution failed: {str(e)}")
 
+    def _checkpoint(
+        self, request: WorkflowExecutionRequest, state: WorkflowState
+    ) -> None:
+        """Record the progress of an execution with the checkpointer."""
+        if self.checkpointer is not None:
+            self.checkpointer.record(request, state)
+
+    def _get_plan(self, workflow_id: str) -> WorkflowPlan | None:
+        """Get the execution plan of a registered workflow."""
+        workflow = self.workflows.get(workflow_id)
+        if not workflow:
+            return None
+
+        # Workflows stored without register_workflow are compiled on first use
+        plan = self.plans.get(workflow_id)
+        if plan is None or plan.workflow is not workflow:
+            plan = self.plans[workflow_id] = compile_workflow(workflow)
+        return plan
+
     async def _execute_workflow_internal(
         self,
-        workflow: WorkflowDefinition,
+        plan: WorkflowPlan,
         state: WorkflowState,
         request: WorkflowExecutionRequest,
         tool_executor: callable,
     ) -> dict[str, Any]:
         """Internal workflow execution implementation."""
         try:
-            # Initialize step statuses
-            for step in workflow.steps:
-                state.step_statuses[step.id] = StepStatus.PENDING
+            # Initialize step statuses, keeping those of a resumed execution
+            for step in plan.steps:
+                if state.step_statuses.get(step.id) not in _DONE:
+                    state.step_statuses[step.id] = StepStatus.PENDING
 
             # Execute workflow steps
-            result = await self._execute_steps(workflow, state, request, tool_executor)
+            result = await self._execute_steps(plan, state, request, tool_executor)
 
             # Update final status
             if state.error:
@@ -178,78 +314,136 @@ class WorkflowEngine:
 
     async def _execute_steps(
         self,
-        workflow: WorkflowDefinition,
+        plan: WorkflowPlan,
         state: WorkflowState,
         request: WorkflowExecutionRequest,
         tool_executor: callable,
     ) -> dict[str, Any]:
-        """Execute workflow steps."""
-        # Create step dependency graph
-        step_graph = self._build_step_graph(workflow.steps)
+        """
+        Execute workflow steps in dependency order.
 
-        # Execute steps in dependency order
-        executed_steps = set()
+        Each step keeps a count of its unfinished dependencies and is started
+        as soon as the count reaches zero, so a slow step only delays the
+        steps that depend on it. Without parallel execution steps run one at
+        a time in the same order. Steps a resumed execution already
+        completed are not run again.
+        """
+        workflow = plan.workflow
+        steps = plan.steps
+        indegree = list(plan.indegrees)
         final_result = {}
 
-        while len(executed_steps) < len(workflow.steps):
-            # Find ready steps
-            ready_steps = self._get_ready_steps(
-                workflow.steps, step_graph, executed_steps, state
-            )
+        # Count steps completed before a resume as finished dependencies
+        for step in steps:
+            if state.step_statuses[step.id] in _DONE:
+                final_result[step.id] = state.step_results.get(step.id)
+                for dependent in step.dependents:
+                    indegree[dependent] -= 1
+
+        limit = 1
+        if workflow.parallel_execution:
+            limit = workflow.max_concurrency or len(steps) or 1
+
+        ready = deque(
+            step.index
+            for step in steps
+            if indegree[step.index] == 0 and step.id not in final_result
+        )
+        running: dict[asyncio.Task, CompiledStep] = {}
+        failure: tuple[str, Exception] | None = None
 
-            if not ready_steps:
-                # Check for circular dependencies or deadlock
-                remaining_steps = {step.id for step in workflow.steps} - executed_steps
-                if remaining_steps:
-                    raise WorkflowExecutionError(
-                        f"Circular dependency detected: {remaining_steps}"
+        try:
+            while ready or running:
+                # Start ready steps up to the workflow's concurrency limit
+                while ready and len(running) < limit and failure is None:
+                    step = steps[ready.popleft()]
+                    task = asyncio.create_task(
+                        self._run_step(step, state, request, tool_executor)
                     )
-                break
+                    running[task] = step
 
-            # Execute ready steps
-            if workflow.parallel_execution:
-                # Parallel execution
-                tasks = []
-                for step in ready_steps:
-                    task = self._execute_step(step, state, request, tool_executor)
-                    tasks.append(task)
+                if not running:
+                    break
 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
 
-                for step, result in zip(ready_steps, results, strict=False):
-                    if isinstance(result, Exception):
-                        state.step_statuses[step.id] = StepStatus.FAILED
-                        state.error = str(result)
-                        raise WorkflowExecutionError(f"Step {step.id} failed: {result}")
-                    else:
-                        executed_steps.add(step.id)
-                        state.step_results[step.id] = result
-                        final_result[step.id] = result
-            else:
-                # Sequential execution
-                for step in ready_steps:
+                for task in done:
+                    step = running.pop(task)
                     try:
-                        result = await self._execute_step(
-                            step, state, request, tool_executor
-                        )
-                        executed_steps.add(step.id)
-                        state.step_results[step.id] = result
-                        final_result[step.id] = result
+                        result = task.result()
                     except Exception as e:
                         state.step_statuses[step.id] = StepStatus.FAILED
                         state.error = str(e)
-                        raise WorkflowExecutionError(f"Step {step.id} failed: {e}")
+                        if failure is None:
+                            failure = (step.id, e)
+                        continue
+
+                    state.step_results[step.id] = result
+                    final_result[step.id] = result
+
+                    for dependent in step.dependents:
+                        indegree[dependent] -= 1
+                        if indegree[dependent] == 0:
+                            ready.append(dependent)
+
+                self._checkpoint(request, state)
+
+                if failure is not None and workflow.fail_fast:
+                    break
+
+        finally:
+            # Cancel steps still running after a failure or cancellation
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+                for step in running.values():
+                    state.step_statuses[step.id] = StepStatus.CANCELLED
+
+        if failure is not None:
+            step_id, error = failure
+            raise WorkflowExecutionError(f"Step {step_id} failed: {error}")
 
         return final_result
 
+    async def _run_step(
+        self,
+        step: CompiledStep,
+        state: WorkflowState,
+        request: WorkflowExecutionRequest,
+        tool_executor: callable,
+    ) -> Any:
+        """Execute a step within the engine-wide concurrency limit."""
+        if self._step_semaphore is None:
+            return await self._execute_step(step, state, request, tool_executor)
+
+        async with self._step_semaphore:
+            return await self._execute_step(step, state, request, tool_executor)
+
     async def _execute_step(
         self,
-        step: WorkflowStep,
+        compiled: CompiledStep,
         state: WorkflowState,
         request: WorkflowExecutionRequest,
         tool_executor: callable,
+        variables: dict[str, Any] | None = None,
     ) -> Any:
-        """Execute a single workflow step."""
+        """
+        Execute a single workflow step.
+
+        Args:
+            compiled: Compiled step to execute
+            state: Workflow execution state
+            request: Workflow execution request
+            tool_executor: Function to execute tools
+            variables: Variables visible to the step, defaults to the
+                workflow variables (loop iterations get their own scope)
+        """
+        step = compiled.step
+        if variables is None:
+            variables = state.variables
         start_time = time.time()
         state.current_step = step.id
         state.step_statuses[step.id] = StepStatus.RUNNING
@@ -258,28 +452,30 @@ class WorkflowEngine:
             logger.info(f"Executing step: {step.id}")
 
             # Check conditions
-            if step.condition and not self._evaluate_condition(step.condition, state):
+            if compiled.condition and not compiled.condition(variables):
                 state.step_statuses[step.id] = StepStatus.SKIPPED
                 logger.info(f"Step {step.id} skipped due to condition")
                 return None
 
             # Execute step based on type
             if step.step_type == StepType.TOOL_CALL:
-                result = await self._execute_tool_step(step, state, tool_executor)
+                result = await self._execute_tool_step(
+                    compiled, state, variables, tool_executor
+                )
             elif step.step_type == StepType.CONDITION:
-                result = await self._execute_condition_step(step, state)
+                result = await self._execute_condition_step(compiled, variables)
             elif step.step_type == StepType.PARALLEL:
                 result = await self._execute_parallel_step(
-                    step, state, request, tool_executor
+                    compiled, state, request, tool_executor, variables
                 )
             elif step.step_type == StepType.LOOP:
                 result = await self._execute_loop_step(
-                    step, state, request, tool_executor
+                    compiled, state, request, tool_executor, variables
                 )
             elif step.step_type == StepType.DELAY:
                 result = await self._execute_delay_step(step)
             elif step.step_type == StepType.HTTP_REQUEST:
-                result = await self._execute_http_step(step, state)
+                result = await self._execute_http_step(compiled, variables)
             else:
                 raise WorkflowExecutionError(f"Unsupported step type: {step.step_type}")
 
@@ -297,17 +493,55 @@ class WorkflowEngine:
             raise
 
     async def _execute_tool_step(
-        self, step: WorkflowStep, state: WorkflowState, tool_executor: callable
+        self,
+        compiled: CompiledStep,
+        state: WorkflowState,
+        variables: dict[str, Any],
+        tool_executor: callable,
     ) -> Any:
-        """Execute a tool call step."""
+        """
+        Execute a tool call step.
+
+        Results of cacheable steps are memoized in the step cache by tool
+        name and arguments, across executions. Concurrent calls with the
+        same arguments share one tool call.
+        """
+        step = compiled.step
         tool_name = step.config.get("tool_name")
         if not tool_name:
             raise WorkflowExecutionError(f"Tool name not specified for step {step.id}")
 
         # Prepare arguments with variable substitution
-        arguments = self._substitute_variables(step.config.get("arguments", {}), state)
+        arguments = compiled.arguments(variables)
+
+        if not step.cacheable:
+            return await self._call_tool(step, tool_name, arguments, tool_executor)
+
+        called = False
+
+        async def call() -> Any:
+            nonlocal called
+            called = True
+            return await self._call_tool(step, tool_name, arguments, tool_executor)
 
-        # Execute tool with retry logic
+        result = await self.step_cache.get_or_set(
+            step_cache_key(tool_name, arguments),
+            call,
+            ttl=step.cache_ttl or self.step_cache_ttl,
+        )
+        if not called:
+            state.cache_hits.append(step.id)
+            logger.debug(f"Step {step.id} result served from cache")
+        return result
+
+    async def _call_tool(
+        self,
+        step: WorkflowStep,
+        tool_name: str,
+        arguments: Any,
+        tool_executor: callable,
+    ) -> Any:
+        """Call a tool with the step's retry logic."""
         retry_config = step.retry_config or {}
         max_attempts = retry_config.get("max_attempts", 1)
 
@@ -324,245 +558,169 @@ class WorkflowEngine:
                 await asyncio.sleep(delay)
 
     async def _execute_condition_step(
-        self, step: WorkflowStep, state: WorkflowState
+        self, compiled: CompiledStep, variables: dict[str, Any]
     ) -> bool:
         """Execute a condition step."""
-        condition = step.config.get("condition")
-        if not condition:
-            raise WorkflowExecutionError(f"Condition not specified for step {step.id}")
+        if not compiled.check:
+            raise WorkflowExecutionError(
+                f"Condition not specified for step {compiled.id}"
+            )
 
-        result = self._evaluate_condition(condition, state)
+        result = compiled.check(variables)
         return result
 
     async def _execute_parallel_step(
         self,
-        step: WorkflowStep,
+        compiled: CompiledStep,
         state: WorkflowState,
         request: WorkflowExecutionRequest,
         tool_executor: callable,
+        variables: dict[str, Any],
     ) -> list[Any]:
         """Execute a parallel step."""
-        sub_steps = step.config.get("steps", [])
-        if not sub_steps:
+        if not compiled.sub_steps:
             raise WorkflowExecutionError(
-                f"No sub-steps specified for parallel step {step.id}"
-            )
-
-        # Create tasks for sub-steps
-        tasks = []
-        for sub_step_config in sub_steps:
-            sub_step = WorkflowStep(
-                id=f"{step.id}_sub_{len(tasks)}",
-                name=sub_step_config.get("name", "sub_step"),
-                step_type=StepType(sub_step_config.get("type", "tool_call")),
-                config=sub_step_config.get("config", {}),
-                metadata=sub_step_config.get("metadata", {}),
+                f"No sub-steps specified for parallel step {compiled.id}"
             )
-            task = self._execute_step(sub_step, state, request, tool_executor)
-            tasks.append(task)
 
-        # Execute sub-steps in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        max_concurrency = compiled.step.config.get(
+            "max_concurrency", DEFAULT_WORKFLOW_FAN_OUT_CONCURRENCY
+        )
 
-        # Check for errors
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                raise WorkflowExecutionError(f"Parallel sub-step {i} failed: {result}")
+        calls = [
+            lambda sub_step=sub_step: self._execute_step(
+                sub_step, state, request, tool_executor, variables
+            )
+            for sub_step in compiled.sub_steps
+        ]
 
-        return results
+        return await self._fan_out(
+            compiled.id, calls, state, max_concurrency, label="Parallel sub-step"
+        )
 
     async def _execute_loop_step(
         self,
-        step: WorkflowStep,
+        compiled: CompiledStep,
         state: WorkflowState,
         request: WorkflowExecutionRequest,
         tool_executor: callable,
+        variables: dict[str, Any],
     ) -> list[Any]:
-        """Execute a loop step."""
+        """
+        Execute a loop step.
+
+        Each iteration sees the step's variables plus its own loop_item and
+        loop_index. In "map" mode independent iterations run concurrently,
+        up to max_concurrency at a time; otherwise they run one by one.
+        Results are returned in item order either way.
+        """
+        step = compiled.step
         loop_config = step.config.get("loop", {})
-        items = loop_config.get("items", [])
+        items = compiled.items(variables) or []
         max_iterations = loop_config.get("max_iterations", 100)
 
-        results = []
-        for i, item in enumerate(items[:max_iterations]):
-            # Set loop variable
-            state.variables["loop_item"] = item
-            state.variables["loop_index"] = i
-
-            # Execute loop body
-            body_step = WorkflowStep(
-                id=f"{step.id}_body_{i}",
-                name=f"Loop body {i}",
-                step_type=StepType.TOOL_CALL,
-                config=step.config.get("body", {}),
+        max_concurrency = 1
+        if loop_config.get("mode") == "map":
+            max_concurrency = loop_config.get(
+                "max_concurrency", DEFAULT_WORKFLOW_FAN_OUT_CONCURRENCY
             )
 
-            try:
-                result = await self._execute_step(
-                    body_step, state, request, tool_executor
-                )
-                results.append(result)
-            except Exception as e:
-                if loop_config.get("continue_on_error", False):
-                    logger.warning(f"Loop iteration {i} failed: {e}")
-                    continue
-                else:
-                    raise
+        def iteration(index: int, item: Any) -> Callable[[], Awaitable[Any]]:
+            body_step = compiled.body.with_id(
+                f"{step.id}_body_{index}", f"Loop body {index}"
+            )
+            scope = {**variables, "loop_item": item, "loop_index": index}
+            return lambda: self._execute_step(
+                body_step, state, request, tool_executor, scope
+            )
 
-        return results
+        calls = [
+            iteration(i, item) for i, item in enumerate(list(items)[:max_iterations])
+        ]
+
+        return await self._fan_out(
+            compiled.id,
+            calls,
+            state,
+            max_concurrency,
+            label="Loop iteration",
+            continue_on_error=loop_config.get("continue_on_error", False),
+        )
+
+    async def _fan_out(
+        self,
+        step_id: str,
+        calls: list[Callable[[], Awaitable[Any]]],
+        state: WorkflowState,
+        max_concurrency: int,
+        label: str,
+        continue_on_error: bool = False,
+    ) -> list[Any]:
+        """
+        Run the calls of a loop or parallel step with bounded concurrency.
+
+        A fixed number of workers pull calls in order, so memory does not
+        grow with the number of calls. Results appear in
+        state.partial_results as they complete, where the orchestrator's
+        status reports them, and are returned in call order once all calls
+        are done.
+
+        Args:
+            step_id: ID of the loop or parallel step
+            calls: Functions starting each call
+            state: Workflow execution state
+            max_concurrency: Maximum calls running at once
+            label: Name of a call in log and error messages
+            continue_on_error: Skip failed calls instead of failing the step
+
+        Returns:
+            Results of the successful calls, in call order
+        """
+        partial = state.partial_results.setdefault(step_id, {})
+        pending = iter(enumerate(calls))
+
+        async def worker() -> None:
+            for index, call in pending:
+                try:
+                    partial[index] = await call()
+                except Exception as e:
+                    if not continue_on_error:
+                        raise WorkflowExecutionError(f"{label} {index} failed: {e}")
+                    logger.warning(f"{label} {index} failed: {e}")
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max(max_concurrency, 1), len(calls)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Stop the remaining calls after a failure or cancellation
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            state.partial_results.pop(step_id, None)
+
+        return [partial[index] for index in range(len(calls)) if index in partial]
 
     async def _execute_delay_step(self, step: WorkflowStep) -> None:
         """Execute a delay step."""
         delay_seconds = step.config.get("delay_seconds", 1.0)
         await asyncio.sleep(delay_seconds)
 
-    async def _execute_http_step(self, step: WorkflowStep, state: WorkflowState) -> Any:
+    async def _execute_http_step(
+        self, compiled: CompiledStep, variables: dict[str, Any]
+    ) -> Any:
         """Execute an HTTP request step."""
         import httpx
 
+        step = compiled.step
         url = step.config.get("url")
         method = step.config.get("method", "GET")
         headers = step.config.get("headers", {})
-        data = self._substitute_variables(step.config.get("data", {}), state)
+        data = compiled.data(variables)
 
         async with httpx.AsyncClient() as client:
             response = await client.request(method, url, headers=headers, json=data)
             response.raise_for_status()
             return response.json()
-
-    def _evaluate_condition(
-        self, condition: dict[str, Any], state: WorkflowState
-    ) -> bool:
-        """Evaluate a condition."""
-        operator = condition.get("operator")
-        left_operand = condition.get("left_operand")
-        right_operand = condition.get("right_operand")
-
-        # Get actual values
-        left_value = self._get_variable_value(left_operand, state)
-        right_value = (
-            self._get_variable_value(right_operand, state) if right_operand else None
-        )
-
-        # Evaluate condition
-        if operator == ConditionOperator.EQUALS:
-            return left_value == right_value
-        elif operator == ConditionOperator.NOT_EQUALS:
-            return left_value != right_value
-        elif operator == ConditionOperator.GREATER_THAN:
-            return left_value > right_value
-        elif operator == ConditionOperator.LESS_THAN:
-            return left_value < right_value
-        elif operator == ConditionOperator.CONTAINS:
-            return right_value in left_value
-        elif operator == ConditionOperator.NOT_CONTAINS:
-            return right_value not in left_value
-        elif operator == ConditionOperator.EXISTS:
-            return left_value is not None
-        elif operator == ConditionOperator.NOT_EXISTS:
-            return left_value is None
-        else:
-            raise WorkflowExecutionError(f"Unsupported condition operator: {operator}")
-
-    def _get_variable_value(self, variable_path: str, state: WorkflowState) -> Any:
-        """Get variable value from workflow state."""
-        if not variable_path.startswith("$"):
-            return variable_path
-
-        # Remove $ prefix
-        path = variable_path[1:]
-
-        # Navigate through variables
-        value = state.variables
-        for part in path.split("."):
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                return None
-
-        return value
-
-    def _substitute_variables(self, data: Any, state: WorkflowState) -> Any:
-        """Substitute variables in data structure."""
-        if isinstance(data, str):
-            if data.startswith("$"):
-                return self._get_variable_value(data, state)
-            return data
-        elif isinstance(data, dict):
-            return {k: self._substitute_variables(v, state) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._substitute_variables(item, state) for item in data]
-        else:
-            return data
-
-    def _build_step_graph(self, steps: list[WorkflowStep]) -> dict[str, list[str]]:
-        """Build dependency graph for steps."""
-        graph = {}
-        for step in steps:
-            graph[step.id] = step.depends_on
-        return graph
-
-    def _get_ready_steps(
-        self,
-        steps: list[WorkflowStep],
-        graph: dict[str, list[str]],
-        executed_steps: set,
-        state: WorkflowState,
-    ) -> list[WorkflowStep]:
-        """Get steps that are ready to execute."""
-        ready_steps = []
-
-        for step in steps:
-            if step.id in executed_steps:
-                continue
-
-            # Check dependencies
-            dependencies = graph.get(step.id, [])
-            if all(dep in executed_steps for dep in dependencies):
-                ready_steps.append(step)
-
-        return ready_steps
-
-    def _validate_workflow(self, workflow: WorkflowDefinition) -> None:
-        """Validate workflow definition."""
-        # Check for duplicate step IDs
-        step_ids = [step.id for step in workflow.steps]
-        if len(step_ids) != len(set(step_ids)):
-            raise WorkflowExecutionError("Duplicate step IDs found")
-
-        # Check entry point exists
-        if workflow.entry_point not in step_ids:
-            raise WorkflowExecutionError(
-                f"Entry point {workflow.entry_point} not found"
-            )
-
-        # Check for circular dependencies
-        graph = self._build_step_graph(workflow.steps)
-        if self._has_circular_dependencies(graph):
-            raise WorkflowExecutionError("Circular dependencies detected")
-
-    def _has_circular_dependencies(self, graph: dict[str, list[str]]) -> bool:
-        """Check for circular dependencies using DFS."""
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        for node in graph:
-            if node not in visited:
-                if dfs(node):
-                    return True
-
-        return False
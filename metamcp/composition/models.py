@@ -30,6 +30,7 @@ class StepStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    CANCELLED = "cancelled"
 
 
 class StepType(str, Enum):
@@ -69,6 +70,11 @@ class WorkflowStep:
     retry_config: dict[str, Any] | None = None
     timeout: int | None = None
     parallel: bool = False
+    # Memoize tool call results by tool name and arguments. The cache is
+    # shared by all executions and callers, so only mark steps whose result
+    # does not depend on who calls the tool.
+    cacheable: bool = False
+    cache_ttl: int | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
@@ -78,10 +84,13 @@ class WorkflowState:
 
     workflow_id: str
     status: WorkflowStatus
+    execution_id: str | None = None
     current_step: str | None = None
     step_results: dict[str, Any] = field(default_factory=dict)
     step_statuses: dict[str, StepStatus] = field(default_factory=dict)
     variables: dict[str, Any] = field(default_factory=dict)
+    partial_results: dict[str, dict[int, Any]] = field(default_factory=dict)
+    cache_hits: list[str] = field(default_factory=list)
     error: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -108,6 +117,12 @@ class WorkflowDefinition(BaseModel):
     parallel_execution: bool = Field(
         False, description="Enable parallel step execution"
     )
+    max_concurrency: int | None = Field(
+        None, description="Maximum steps running at once with parallel execution"
+    )
+    fail_fast: bool = Field(
+        True, description="Cancel running steps as soon as a step fails"
+    )
 
     # Metadata
     tags: list[str] = Field(default_factory=list, description="Workflow tags")
@@ -153,6 +168,14 @@ class WorkflowExecutionResult(BaseModel):
     step_results: dict[str, Any] = Field(
         default_factory=dict, description="Individual step results"
     )
+    cache_hits: list[str] = Field(
+        default_factory=list,
+        description="Steps whose results were served from the step cache",
+    )
+    partial_results: dict[str, dict[int, Any]] = Field(
+        default_factory=dict,
+        description="Results of running loop and parallel steps, by call index",
+    )
     execution_time: float | None = Field(
         None, description="Total execution time in seconds"
     )
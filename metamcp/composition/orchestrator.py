@@ -7,8 +7,11 @@ including workflow management, execution coordination, and state persistence.
 
 from datetime import UTC, datetime
 
+from ..config import get_settings
 from ..exceptions import WorkflowExecutionError, WorkflowValidationError
+from ..utils.cache import Cache, create_memory_cache, create_redis_cache
 from ..utils.logging import get_logger
+from .checkpoint import CheckpointWriter, restore_state
 from .engine import WorkflowEngine
 from .models import (
     WorkflowDefinition,
@@ -21,6 +24,24 @@ from .models import (
 logger = get_logger(__name__)
 
 
+def create_step_cache(backend: str, redis_url: str | None = None) -> Cache:
+    """
+    Create the cache for workflow step results.
+
+    Args:
+        backend: "memory" or "redis"
+        redis_url: Redis URL for the redis backend
+
+    Returns:
+        Step cache
+    """
+    if backend == "redis":
+        return create_redis_cache(redis_url)
+    if backend != "memory":
+        raise WorkflowValidationError(f"Unknown step cache backend: {backend}")
+    return create_memory_cache()
+
+
 class WorkflowOrchestrator:
     """
     High-level workflow orchestrator.
@@ -31,9 +52,20 @@ class WorkflowOrchestrator:
 
     def __init__(self):
         """Initialize the workflow orchestrator."""
-        self.engine = WorkflowEngine()
+        settings = get_settings()
+        self.engine = WorkflowEngine(
+            max_concurrent_steps=settings.workflow_max_concurrent_steps,
+            step_cache=create_step_cache(
+                settings.workflow_step_cache_backend, settings.cache_redis_url
+            ),
+            step_cache_ttl=settings.workflow_step_cache_ttl,
+        )
+        self.checkpoints_enabled = settings.workflow_checkpoints_enabled
+        self.checkpoint_interval = settings.workflow_checkpoint_interval
         self.execution_history: dict[str, WorkflowExecutionResult] = {}
         self.active_executions: dict[str, WorkflowState] = {}
+        self.interrupted_executions: dict[str, WorkflowExecutionResult] = {}
+        self._resuming: set[str] = set()
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -50,6 +82,18 @@ class WorkflowOrchestrator:
             # Load persisted workflows
             await self._load_persisted_workflows()
 
+            # Checkpoint executions so they can be resumed after a restart
+            if self.checkpoints_enabled:
+                from metamcp.composition.persistence import get_persistence_manager
+
+                self.engine.checkpointer = CheckpointWriter(
+                    get_persistence_manager(), self.checkpoint_interval
+                )
+                self.engine.checkpointer.start()
+
+                # Find executions a previous run left unfinished
+                await self._discover_interrupted_executions()
+
             self._initialized = True
             logger.info("Workflow Orchestrator initialized successfully")
 
@@ -107,27 +151,131 @@ class WorkflowOrchestrator:
             logger.error(f"Workflow execution failed: {e}")
             raise WorkflowExecutionError(f"Workflow execution failed: {str(e)}")
 
+    async def resume_workflow(
+        self, execution_id: str, tool_executor: callable
+    ) -> WorkflowExecutionResult:
+        """
+        Resume an interrupted workflow execution from its last checkpoint.
+
+        Steps completed before the interruption are not run again. An
+        execution still running in this process cannot be resumed.
+
+        Args:
+            execution_id: Execution ID to resume
+            tool_executor: Function to execute tools
+
+        Returns:
+            Workflow execution result
+        """
+        if self._is_running(execution_id):
+            raise WorkflowExecutionError(
+                f"Workflow resume failed: execution is still running: {execution_id}"
+            )
+        self._resuming.add(execution_id)
+
+        try:
+            from metamcp.composition.persistence import get_persistence_manager
+
+            checkpoint = await get_persistence_manager().load_checkpoint(execution_id)
+            if not checkpoint:
+                raise WorkflowValidationError(
+                    f"No checkpoint found for execution: {execution_id}"
+                )
+            if checkpoint["status"] == WorkflowStatus.COMPLETED.value:
+                raise WorkflowValidationError(
+                    f"Execution already completed: {execution_id}"
+                )
+
+            request = WorkflowExecutionRequest(**checkpoint["request"])
+            self._validate_execution_request(request)
+
+            result = await self.engine.resume_workflow(
+                request, restore_state(checkpoint["state"]), tool_executor
+            )
+            self.execution_history[result.execution_id] = result
+            self.interrupted_executions.pop(execution_id, None)
+
+            logger.info(f"Resumed workflow execution completed: {execution_id}")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to resume workflow execution {execution_id}: {e}")
+            raise WorkflowExecutionError(f"Workflow resume failed: {str(e)}")
+        finally:
+            self._resuming.discard(execution_id)
+
+    async def discard_interrupted_execution(self, execution_id: str) -> bool:
+        """
+        Delete the checkpoint of an execution that will not be resumed.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            True if a checkpoint was deleted, False otherwise
+        """
+        if self._is_running(execution_id):
+            raise WorkflowExecutionError(
+                f"Cannot discard a running execution: {execution_id}"
+            )
+
+        from metamcp.composition.persistence import get_persistence_manager
+
+        if self.engine.checkpointer is not None:
+            self.engine.checkpointer.discard(execution_id)
+        self.interrupted_executions.pop(execution_id, None)
+
+        deleted = await get_persistence_manager().delete_checkpoint(execution_id)
+        if deleted:
+            logger.info(f"Discarded checkpoint of execution: {execution_id}")
+        return deleted
+
+    async def get_interrupted_executions(self) -> list[WorkflowExecutionResult]:
+        """
+        Get executions found unfinished at startup that can be resumed.
+
+        Returns:
+            List of interrupted execution results
+        """
+        return list(self.interrupted_executions.values())
+
+    def _is_running(self, execution_id: str) -> bool:
+        """Check if an execution is running or being resumed in this process."""
+        state = self.engine.executions.get(execution_id)
+        return execution_id in self._resuming or (
+            state is not None and state.status == WorkflowStatus.RUNNING
+        )
+
     async def get_workflow_status(
         self, execution_id: str
     ) -> WorkflowExecutionResult | None:
         """
         Get the status of a workflow execution.
 
+        While an execution runs, the result includes the results of its
+        loop and parallel steps completed so far.
+
         Args:
             execution_id: Execution ID
 
         Returns:
             Workflow execution result or None if not found
         """
-        # Check active executions
-        if execution_id in self.active_executions:
-            state = self.active_executions[execution_id]
+        # Check active executions, including those still running in the engine
+        state = self.active_executions.get(execution_id)
+        if state is None:
+            state = self.engine.executions.get(execution_id)
+            if state is not None and state.status != WorkflowStatus.RUNNING:
+                state = None
+        if state is not None:
             return WorkflowExecutionResult(
                 execution_id=execution_id,
                 workflow_id=state.workflow_id,
                 status=state.status,
                 error=state.error,
                 step_results=state.step_results,
+                partial_results=state.partial_results,
                 started_at=state.started_at,
                 completed_at=state.completed_at,
                 metadata=state.metadata,
@@ -210,6 +358,7 @@ class WorkflowOrchestrator:
         try:
             if workflow_id in self.engine.workflows:
                 del self.engine.workflows[workflow_id]
+                self.engine.plans.pop(workflow_id, None)
                 logger.info(f"Deleted workflow: {workflow_id}")
                 return True
             return False
@@ -258,6 +407,7 @@ class WorkflowOrchestrator:
                 status=state.status,
                 error=state.error,
                 step_results=state.step_results,
+                partial_results=state.partial_results,
                 started_at=state.started_at,
                 completed_at=state.completed_at,
                 metadata=state.metadata,
@@ -331,6 +481,40 @@ class WorkflowOrchestrator:
             logger.error(f"Failed to load persisted workflows: {e}")
             # Don't raise exception to allow startup to continue
 
+    async def _discover_interrupted_executions(self) -> None:
+        """
+        Load the checkpoints of executions that were still running.
+
+        At startup nothing runs in this process yet, so these were left
+        unfinished by a previous run and can be resumed or discarded.
+        """
+        try:
+            from metamcp.composition.persistence import get_persistence_manager
+
+            checkpoints = await get_persistence_manager().get_interrupted_checkpoints()
+
+            for checkpoint in checkpoints:
+                state = restore_state(checkpoint["state"])
+                execution_id = checkpoint["execution_id"]
+                self.interrupted_executions[execution_id] = WorkflowExecutionResult(
+                    execution_id=execution_id,
+                    workflow_id=checkpoint["workflow_id"],
+                    status=state.status,
+                    error=state.error,
+                    step_results=state.step_results,
+                    started_at=state.started_at or checkpoint["updated_at"],
+                    metadata=state.metadata,
+                )
+
+            if checkpoints:
+                logger.warning(
+                    f"Found {len(checkpoints)} interrupted workflow executions"
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to discover interrupted executions: {e}")
+            # Don't raise exception to allow startup to continue
+
     async def _persist_workflow(self, workflow: WorkflowDefinition) -> None:
         """Persist workflow to storage."""
         try:
@@ -358,5 +542,34 @@ class WorkflowOrchestrator:
         for execution_id in list(self.active_executions.keys()):
             await self.cancel_workflow(execution_id)
 
+        # Write outstanding checkpoints
+        if self.engine.checkpointer is not None:
+            await self.engine.checkpointer.close()
+
         self._initialized = False
         logger.info("Workflow Orchestrator shutdown complete")
+
+
+# Global orchestrator instance
+_workflow_orchestrator: WorkflowOrchestrator | None = None
+
+
+def get_workflow_orchestrator() -> WorkflowOrchestrator:
+    """
+    Get the global workflow orchestrator.
+
+    Registered workflows, the step cache and the step concurrency limit are
+    shared by every request through this instance.
+    """
+    global _workflow_orchestrator
+    if _workflow_orchestrator is None:
+        _workflow_orchestrator = WorkflowOrchestrator()
+    return _workflow_orchestrator
+
+
+async def close_workflow_orchestrator() -> None:
+    """Shut down the global workflow orchestrator."""
+    global _workflow_orchestrator
+    if _workflow_orchestrator is not None:
+        await _workflow_orchestrator.shutdown()
+        _workflow_orchestrator = None
@@ -87,6 +87,21 @@ class WorkflowPersistence:
             """
             )
 
+            # Create workflow checkpoints table, holding the latest state
+            # of each execution so it can be resumed
+            await self.db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS workflow_checkpoints (
+                    execution_id TEXT PRIMARY KEY,
+                    workflow_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    request JSONB NOT NULL,
+                    state JSONB NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """
+            )
+
             # Create indexes for better performance
             await self.db.execute(
                 """
@@ -113,6 +128,12 @@ class WorkflowPersistence:
                 CREATE INDEX IF NOT EXISTS idx_step_executions_execution_id ON workflow_step_executions(execution_id)
             """
             )
+            await self.db.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_checkpoints_status
+                ON workflow_checkpoints(status)
+            """
+            )
 
             logger.info("Workflow persistence tables created successfully")
 
@@ -366,6 +387,96 @@ class WorkflowPersistence:
             logger.error(f"Failed to get executions for workflow {workflow_id}: {e}")
             raise WorkflowPersistenceError(f"Failed to get workflow executions: {e}")
 
+    async def save_checkpoints(self, checkpoints: list[dict[str, Any]]) -> None:
+        """Save the latest state of several workflow executions in one batch."""
+        if not checkpoints:
+            return
+
+        try:
+            updated_at = datetime.utcnow()
+            await self.db.executemany(
+                """
+                INSERT INTO workflow_checkpoints
+                (execution_id, workflow_id, status, request, state, updated_at)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (execution_id) DO UPDATE
+                SET status = EXCLUDED.status, state = EXCLUDED.state,
+                    updated_at = EXCLUDED.updated_at
+            """,
+                [
+                    (
+                        checkpoint["execution_id"],
+                        checkpoint["workflow_id"],
+                        checkpoint["status"],
+                        json.dumps(checkpoint["request"], default=str),
+                        json.dumps(checkpoint["state"], default=str),
+                        updated_at,
+                    )
+                    for checkpoint in checkpoints
+                ],
+            )
+            logger.debug(f"Saved {len(checkpoints)} workflow checkpoints")
+
+        except Exception as e:
+            logger.error(f"Failed to save workflow checkpoints: {e}")
+            raise WorkflowPersistenceError(f"Failed to save checkpoints: {e}")
+
+    async def load_checkpoint(self, execution_id: str) -> dict[str, Any] | None:
+        """Load the latest checkpoint of a workflow execution."""
+        try:
+            row = await self.db.fetchrow(
+                """
+                SELECT * FROM workflow_checkpoints WHERE execution_id = $1
+            """,
+                execution_id,
+            )
+
+            if row:
+                return _checkpoint_from_row(row)
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint {execution_id}: {e}")
+            raise WorkflowPersistenceError(f"Failed to load checkpoint: {e}")
+
+    async def get_interrupted_checkpoints(
+        self, limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """Get checkpoints of executions that were still running."""
+        try:
+            rows = await self.db.fetch(
+                """
+                SELECT * FROM workflow_checkpoints
+                WHERE status = 'running'
+                ORDER BY updated_at
+                LIMIT $1
+            """,
+                limit,
+            )
+
+            return [_checkpoint_from_row(row) for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to get interrupted checkpoints: {e}")
+            raise WorkflowPersistenceError(f"Failed to get checkpoints: {e}")
+
+    async def delete_checkpoint(self, execution_id: str) -> bool:
+        """Delete the checkpoint of a workflow execution."""
+        try:
+            result = await self.db.execute(
+                """
+                DELETE FROM workflow_checkpoints WHERE execution_id = $1
+            """,
+                execution_id,
+            )
+
+            return bool(result and "DELETE 1" in result)
+
+        except Exception as e:
+            logger.error(f"Failed to delete checkpoint {execution_id}: {e}")
+            raise WorkflowPersistenceError(f"Failed to delete checkpoint: {e}")
+
     async def cleanup_old_executions(self, days: int = 30) -> int:
         """Clean up old execution records."""
         try:
@@ -374,16 +485,24 @@ class WorkflowPersistence:
                 DELETE FROM workflow_step_executions
                 WHERE execution_id IN (
                     SELECT id FROM workflow_executions
-                    WHERE created_at < NOW() - INTERVAL '%s days'
+                    WHERE created_at < NOW() - make_interval(days => $1)
                 )
             """,
                 days,
             )
 
+            await self.db.execute(
+                """
+                DELETE FROM workflow_checkpoints
+                WHERE updated_at < NOW() - make_interval(days => $1)
+            """,
+                days,
+            )
+
             result = await self.db.execute(
                 """
                 DELETE FROM workflow_executions
-                WHERE created_at < NOW() - INTERVAL '%s days'
+                WHERE created_at < NOW() - make_interval(days => $1)
             """,
                 days,
             )
@@ -401,6 +520,15 @@ class WorkflowPersistence:
             raise WorkflowPersistenceError(f"Failed to cleanup executions: {e}")
 
 
+def _checkpoint_from_row(row: Any) -> dict[str, Any]:
+    """Convert a workflow_checkpoints row to a checkpoint dict."""
+    checkpoint = dict(row)
+    for column in ("request", "state"):
+        if isinstance(checkpoint[column], str):
+            checkpoint[column] = json.loads(checkpoint[column])
+    return checkpoint
+
+
 # Global persistence manager instance
 _persistence_manager: WorkflowPersistence | None = None
 
@@ -0,0 +1,282 @@
+"""
+Workflow Plans
+
+This module compiles workflow definitions into immutable execution plans.
+Compiling validates the step graph once, orders the steps topologically
+and turns variable paths and conditions into closures, so executing a
+workflow only runs the plan.
+"""
+
+import operator
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from ..exceptions import WorkflowExecutionError
+from .models import ConditionOperator, StepType, WorkflowDefinition, WorkflowStep
+
+# Reads a value from the workflow variables
+Accessor = Callable[[dict[str, Any]], Any]
+
+# Evaluates a condition against the workflow variables
+Predicate = Callable[[dict[str, Any]], bool]
+
+_OPERATORS: dict[ConditionOperator, Callable[[Any, Any], bool]] = {
+    ConditionOperator.EQUALS: operator.eq,
+    ConditionOperator.NOT_EQUALS: operator.ne,
+    ConditionOperator.GREATER_THAN: operator.gt,
+    ConditionOperator.LESS_THAN: operator.lt,
+    ConditionOperator.CONTAINS: lambda left, right: right in left,
+    ConditionOperator.NOT_CONTAINS: lambda left, right: right not in left,
+    ConditionOperator.EXISTS: lambda left, right: left is not None,
+    ConditionOperator.NOT_EXISTS: lambda left, right: left is None,
+}
+
+
+@dataclass(frozen=True)
+class CompiledStep:
+    """A workflow step with its variables and conditions compiled."""
+
+    step: WorkflowStep
+    index: int
+    dependents: tuple[int, ...] = ()
+    condition: Predicate | None = None
+    arguments: Accessor | None = None
+    check: Predicate | None = None
+    data: Accessor | None = None
+    items: Accessor | None = None
+    sub_steps: tuple["CompiledStep", ...] = ()
+    body: "CompiledStep | None" = None
+
+    @property
+    def id(self) -> str:
+        """Get the step ID."""
+        return self.step.id
+
+    def with_id(self, step_id: str, name: str | None = None) -> "CompiledStep":
+        """Get a copy of this step under another ID, e.g. for a loop iteration."""
+        step = replace(self.step, id=step_id, name=name or self.step.name)
+        return replace(self, step=step)
+
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """Immutable execution plan of a workflow."""
+
+    workflow: WorkflowDefinition
+    steps: tuple[CompiledStep, ...]
+    order: tuple[int, ...]
+    indegrees: tuple[int, ...]
+    roots: tuple[int, ...]
+
+
+def compile_variable(value: Any) -> Accessor:
+    """
+    Compile a variable reference.
+
+    Args:
+        value: "$a.b.c" to read a nested variable, or a literal value
+
+    Returns:
+        Function reading the value from the workflow variables
+    """
+    if not isinstance(value, str) or not value.startswith("$"):
+        return lambda variables: value
+
+    parts = tuple(value[1:].split("."))
+
+    def access(variables: dict[str, Any]) -> Any:
+        current = variables
+        for part in parts:
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                return None
+        return current
+
+    return access
+
+
+def compile_arguments(data: Any) -> Accessor:
+    """
+    Compile a data structure containing variable references.
+
+    Args:
+        data: Dicts, lists and values, where "$..." strings are variables
+
+    Returns:
+        Function building the substituted structure from the variables
+    """
+    if isinstance(data, str):
+        return compile_variable(data)
+    elif isinstance(data, dict):
+        items = tuple((key, compile_arguments(value)) for key, value in data.items())
+        return lambda variables: {key: get(variables) for key, get in items}
+    elif isinstance(data, list):
+        values = tuple(compile_arguments(item) for item in data)
+        return lambda variables: [get(variables) for get in values]
+    else:
+        return lambda variables: data
+
+
+def compile_condition(condition: dict[str, Any]) -> Predicate:
+    """
+    Compile a condition.
+
+    Args:
+        condition: Condition with operator, left_operand and right_operand
+
+    Returns:
+        Function evaluating the condition against the workflow variables
+
+    Raises:
+        WorkflowExecutionError: If the operator is not supported
+    """
+    try:
+        compare = _OPERATORS[ConditionOperator(condition.get("operator"))]
+    except ValueError:
+        raise WorkflowExecutionError(
+            f"Unsupported condition operator: {condition.get('operator')}"
+        )
+
+    left = compile_variable(condition.get("left_operand"))
+    right_operand = condition.get("right_operand")
+    right = compile_variable(right_operand) if right_operand else (lambda _: None)
+
+    return lambda variables: compare(left(variables), right(variables))
+
+
+def compile_workflow(workflow: WorkflowDefinition) -> WorkflowPlan:
+    """
+    Validate a workflow and compile it into an execution plan.
+
+    Args:
+        workflow: Workflow definition
+
+    Returns:
+        Execution plan
+
+    Raises:
+        WorkflowExecutionError: If the workflow is invalid
+    """
+    index = {}
+    for i, step in enumerate(workflow.steps):
+        if step.id in index:
+            raise WorkflowExecutionError("Duplicate step IDs found")
+        index[step.id] = i
+
+    if workflow.entry_point not in index:
+        raise WorkflowExecutionError(f"Entry point {workflow.entry_point} not found")
+
+    dependents: list[list[int]] = [[] for _ in workflow.steps]
+    indegrees = []
+    for i, step in enumerate(workflow.steps):
+        for dep in step.depends_on:
+            if dep not in index:
+                raise WorkflowExecutionError(
+                    f"Step {step.id} depends on unknown step {dep}"
+                )
+            dependents[index[dep]].append(i)
+        indegrees.append(len(step.depends_on))
+
+    # Kahn's algorithm; steps left over are part of a cycle
+    roots = tuple(i for i, count in enumerate(indegrees) if count == 0)
+    remaining = list(indegrees)
+    queue = deque(roots)
+    order = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for dependent in dependents[i]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                queue.append(dependent)
+
+    if len(order) < len(workflow.steps):
+        raise WorkflowExecutionError("Circular dependencies detected")
+
+    steps = tuple(
+        _compile_step(step, i, tuple(dependents[i]))
+        for i, step in enumerate(workflow.steps)
+    )
+
+    return WorkflowPlan(
+        workflow=workflow,
+        steps=steps,
+        order=tuple(order),
+        indegrees=tuple(indegrees),
+        roots=roots,
+    )
+
+
+def _compile_step(
+    step: WorkflowStep, index: int, dependents: tuple[int, ...] = ()
+) -> CompiledStep:
+    """Compile the variables and conditions of a step."""
+    config = step.config
+    arguments = check = data = items = body = None
+    sub_steps: tuple[CompiledStep, ...] = ()
+
+    if step.step_type == StepType.TOOL_CALL:
+        arguments = compile_arguments(config.get("arguments", {}))
+    elif step.step_type == StepType.CONDITION and config.get("condition"):
+        check = compile_condition(config["condition"])
+    elif step.step_type == StepType.HTTP_REQUEST:
+        data = compile_arguments(config.get("data", {}))
+    elif step.step_type == StepType.PARALLEL:
+        _check_max_concurrency(step, config)
+        sub_steps = tuple(
+            _compile_step(
+                WorkflowStep(
+                    id=f"{step.id}_sub_{i}",
+                    name=sub_step_config.get("name", "sub_step"),
+                    step_type=StepType(sub_step_config.get("type", "tool_call")),
+                    config=sub_step_config.get("config", {}),
+                    cacheable=sub_step_config.get("cacheable", step.cacheable),
+                    cache_ttl=sub_step_config.get("cache_ttl", step.cache_ttl),
+                    metadata=sub_step_config.get("metadata", {}),
+                ),
+                i,
+            )
+            for i, sub_step_config in enumerate(config.get("steps", []))
+        )
+    elif step.step_type == StepType.LOOP:
+        _check_max_concurrency(step, config.get("loop", {}))
+        items = compile_variable(config.get("loop", {}).get("items", []))
+        body = _compile_step(
+            WorkflowStep(
+                id=f"{step.id}_body",
+                name="Loop body",
+                step_type=StepType.TOOL_CALL,
+                config=config.get("body", {}),
+                cacheable=step.cacheable,
+                cache_ttl=step.cache_ttl,
+            ),
+            0,
+        )
+
+    return CompiledStep(
+        step=step,
+        index=index,
+        dependents=dependents,
+        condition=compile_condition(step.condition) if step.condition else None,
+        arguments=arguments,
+        check=check,
+        data=data,
+        items=items,
+        sub_steps=sub_steps,
+        body=body,
+    )
+
+
+def _check_max_concurrency(step: WorkflowStep, config: dict[str, Any]) -> None:
+    """Reject a fan-out max_concurrency that is not a positive integer."""
+    if "max_concurrency" not in config:
+        return
+    value = config["max_concurrency"]
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise WorkflowExecutionError(
+            f"max_concurrency of step {step.id} must be a positive integer, "
+            f"got {value!r}"
+        )
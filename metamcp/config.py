@@ -13,6 +13,12 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 
 from .utils.constants import (
+    DEFAULT_CACHE_CODEC,
+    DEFAULT_CACHE_COMPRESSION,
+    DEFAULT_CACHE_COMPRESSION_THRESHOLD,
+    DEFAULT_CACHE_INVALIDATION_CHANNEL,
+    DEFAULT_CACHE_L1_MAX_SIZE,
+    DEFAULT_CACHE_L1_TTL,
     DEFAULT_CACHE_MAX_CONNECTIONS,
     DEFAULT_CACHE_TTL,
     DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
@@ -22,20 +28,41 @@ from .utils.constants import (
     DEFAULT_DB_POOL_RECYCLE,
     DEFAULT_DB_POOL_SIZE,
     DEFAULT_DB_POOL_TIMEOUT,
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_EMBEDDING_BATCH_WINDOW,
+    DEFAULT_EMBEDDING_CACHE_SIZE,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_LOG_FORMAT,
     DEFAULT_LOG_LEVEL,
     DEFAULT_MAX_SEARCH_RESULTS,
     DEFAULT_METRICS_PORT,
+    DEFAULT_POLICY_DECISION_CACHE_SIZE,
+    DEFAULT_POLICY_DECISION_CACHE_TTL,
+    DEFAULT_RATE_LIMIT_LEASE_SIZE,
+    DEFAULT_RATE_LIMIT_LEASE_TTL,
     DEFAULT_RATE_LIMIT_REQUESTS,
+    DEFAULT_RATE_LIMIT_STRATEGY,
     DEFAULT_RATE_LIMIT_WINDOW,
     DEFAULT_SIMILARITY_THRESHOLD,
+    DEFAULT_STDIO_POOL_IDLE_TIMEOUT,
+    DEFAULT_STDIO_POOL_MAX_IN_FLIGHT,
+    DEFAULT_STDIO_POOL_MAX_SIZE,
+    DEFAULT_STDIO_POOL_REAP_INTERVAL,
     DEFAULT_TOOL_RETRY_ATTEMPTS,
     DEFAULT_TOOL_RETRY_DELAY,
     DEFAULT_TOOL_TIMEOUT,
+    DEFAULT_VECTOR_BACKEND,
     DEFAULT_VECTOR_DIMENSION,
+    DEFAULT_WORKFLOW_CHECKPOINT_INTERVAL,
+    DEFAULT_WORKFLOW_MAX_CONCURRENT_STEPS,
+    DEFAULT_WORKFLOW_STEP_CACHE_TTL,
     LOCKOUT_DURATION_MINUTES,
     MAX_CACHE_TTL,
+    MAX_JSON_DEPTH,
     MAX_LOGIN_ATTEMPTS,
+    MAX_REQUEST_BODY_SIZE,
     PASSWORD_MIN_LENGTH,
     SESSION_TIMEOUT_MINUTES,
     TOKEN_EXPIRY_MINUTES,
@@ -93,6 +120,13 @@ class Settings(BaseSettings):
     )
 
     # Vector Database Settings
+    vector_backend: str = Field(
+        default=DEFAULT_VECTOR_BACKEND,
+        description="Vector search backend (weaviate or embedded)",
+    )
+    vector_index_path: str | None = Field(
+        default=None, description="Directory for persisting the embedded vector index"
+    )
     weaviate_url: str = Field(
         default="http://localhost:8080", description="Weaviate vector database URL"
     )
@@ -111,6 +145,21 @@ class Settings(BaseSettings):
     openai_embedding_model: str = Field(
         default="text-embedding-ada-002", description="OpenAI embedding model"
     )
+    embedding_cache_size: int = Field(
+        default=DEFAULT_EMBEDDING_CACHE_SIZE,
+        description="Maximum number of cached embeddings",
+    )
+    embedding_cache_path: str | None = Field(
+        default=None, description="File for persisting the embedding cache"
+    )
+    embedding_batch_size: int = Field(
+        default=DEFAULT_EMBEDDING_BATCH_SIZE,
+        description="Maximum texts per embedding provider call",
+    )
+    embedding_batch_window: float = Field(
+        default=DEFAULT_EMBEDDING_BATCH_WINDOW,
+        description="Seconds to wait for concurrent embedding requests to batch",
+    )
 
     # Authentication Settings
     secret_key: str = Field(
@@ -153,6 +202,13 @@ class Settings(BaseSettings):
         default=LOCKOUT_DURATION_MINUTES,
         description="Account lockout duration in minutes",
     )
+    security_max_body_size: int = Field(
+        default=MAX_REQUEST_BODY_SIZE,
+        description="Maximum request body size in bytes",
+    )
+    security_max_json_depth: int = Field(
+        default=MAX_JSON_DEPTH, description="Maximum nesting depth of JSON bodies"
+    )
 
     # Logging Settings
     log_level: str = Field(default=DEFAULT_LOG_LEVEL, description="Logging level")
@@ -196,6 +252,18 @@ class Settings(BaseSettings):
     rate_limit_redis_url: str = Field(
         default="redis://localhost:6379", description="Redis URL for rate limiting"
     )
+    rate_limit_strategy: str = Field(
+        default=DEFAULT_RATE_LIMIT_STRATEGY,
+        description="Rate limiting strategy used with Redis (e.g. fixed_window, gcra)",
+    )
+    rate_limit_lease_size: int = Field(
+        default=DEFAULT_RATE_LIMIT_LEASE_SIZE,
+        description="Tokens each worker leases from Redis at once (0 disables)",
+    )
+    rate_limit_lease_ttl: float = Field(
+        default=DEFAULT_RATE_LIMIT_LEASE_TTL,
+        description="Seconds a leased batch of rate limit tokens is served locally",
+    )
 
     # Tool Execution Settings
     tool_timeout: int = Field(
@@ -211,6 +279,44 @@ class Settings(BaseSettings):
         description="Delay between retry attempts in seconds",
     )
 
+    # Outbound HTTP Client Settings
+    http_client_max_connections_per_host: int = Field(
+        default=DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST,
+        description="Maximum outbound HTTP connections per upstream host",
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        description="Maximum idle keep-alive connections per upstream host",
+    )
+    http_client_keepalive_expiry: float = Field(
+        default=DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        description="Seconds an idle keep-alive connection is kept open",
+    )
+    http_client_http2: bool = Field(
+        default=False, description="Enable HTTP/2 for outbound calls (requires h2)"
+    )
+
+    # Stdio Session Pool Settings
+    stdio_pool_max_size: int = Field(
+        default=DEFAULT_STDIO_POOL_MAX_SIZE,
+        description="Maximum stdio server processes per wrapped server",
+    )
+    stdio_pool_max_in_flight: int = Field(
+        default=DEFAULT_STDIO_POOL_MAX_IN_FLIGHT,
+        description="Outstanding requests per stdio process before spawning another",
+    )
+    stdio_pool_idle_timeout: int = Field(
+        default=DEFAULT_STDIO_POOL_IDLE_TIMEOUT,
+        description="Seconds before an idle stdio process is terminated",
+    )
+    stdio_pool_reap_interval: int = Field(
+        default=DEFAULT_STDIO_POOL_REAP_INTERVAL,
+        description="Interval in seconds between idle stdio process sweeps",
+    )
+    stdio_pool_handshake: bool = Field(
+        default=True, description="Send MCP initialize when spawning stdio processes"
+    )
+
     # Circuit Breaker Settings
     circuit_breaker_enabled: bool = Field(
         default=True, description="Enable circuit breaker pattern"
@@ -243,6 +349,36 @@ class Settings(BaseSettings):
         default=DEFAULT_CACHE_MAX_CONNECTIONS,
         description="Maximum Redis connections for cache",
     )
+    cache_l1_max_size: int = Field(
+        default=DEFAULT_CACHE_L1_MAX_SIZE,
+        description="Maximum entries in the in-process L1 cache (0 disables)",
+    )
+    cache_l1_ttl: int = Field(
+        default=DEFAULT_CACHE_L1_TTL,
+        description="Seconds an entry stays in the in-process L1 cache",
+    )
+    cache_invalidation_channel: str = Field(
+        default=DEFAULT_CACHE_INVALIDATION_CHANNEL,
+        description="Redis pub/sub channel for L1 cache invalidation",
+    )
+    cache_codec: str = Field(
+        default=DEFAULT_CACHE_CODEC,
+        description=(
+            "Codec for values cached in Redis (json, pickle, or msgpack with "
+            "the cache-codecs extra)"
+        ),
+    )
+    cache_compression: str = Field(
+        default=DEFAULT_CACHE_COMPRESSION,
+        description=(
+            "Compression for large cached values (zlib, none, or zstd or lz4 "
+            "with the cache-codecs extra)"
+        ),
+    )
+    cache_compression_threshold: int = Field(
+        default=DEFAULT_CACHE_COMPRESSION_THRESHOLD,
+        description="Minimum encoded size in bytes to compress a cached value",
+    )
 
     # Performance Configuration
     worker_threads: int = Field(
@@ -251,6 +387,26 @@ class Settings(BaseSettings):
     max_concurrent_requests: int = Field(
         default=100, description="Maximum concurrent requests"
     )
+    workflow_max_concurrent_steps: int = Field(
+        default=DEFAULT_WORKFLOW_MAX_CONCURRENT_STEPS,
+        description="Maximum workflow steps running at once across all executions",
+    )
+    workflow_step_cache_backend: str = Field(
+        default="memory",
+        description="Backend for cached workflow step results (memory or redis)",
+    )
+    workflow_step_cache_ttl: int = Field(
+        default=DEFAULT_WORKFLOW_STEP_CACHE_TTL,
+        description="Default TTL in seconds of cached workflow step results",
+    )
+    workflow_checkpoints_enabled: bool = Field(
+        default=False,
+        description="Checkpoint workflow executions to the database for resume",
+    )
+    workflow_checkpoint_interval: float = Field(
+        default=DEFAULT_WORKFLOW_CHECKPOINT_INTERVAL,
+        description="Seconds between batched workflow checkpoint writes",
+    )
 
     # Tool Registry Settings
     tool_registry_enabled: bool = Field(
@@ -282,6 +438,14 @@ class Settings(BaseSettings):
     policy_default_allow: bool = Field(
         default=False, description="Default policy allow"
     )
+    policy_decision_cache_size: int = Field(
+        default=DEFAULT_POLICY_DECISION_CACHE_SIZE,
+        description="Maximum number of cached access decisions (0 disables)",
+    )
+    policy_decision_cache_ttl: float = Field(
+        default=DEFAULT_POLICY_DECISION_CACHE_TTL,
+        description="Seconds an access decision stays cached",
+    )
 
     # Admin Settings
     admin_enabled: bool = Field(default=True, description="Enable admin interface")
@@ -484,7 +648,14 @@ def validate_configuration() -> bool:
             raise ValueError("Database URL must be configured")
 
         # Validate vector database settings
-        if settings.vector_search_enabled and not settings.weaviate_url:
+        if settings.vector_backend not in ("weaviate", "embedded"):
+            raise ValueError(f"Unknown vector backend: {settings.vector_backend}")
+
+        if (
+            settings.vector_search_enabled
+            and settings.vector_backend == "weaviate"
+            and not settings.weaviate_url
+        ):
             raise ValueError("Weaviate URL must be configured for vector search")
 
         return True
@@ -0,0 +1,202 @@
+"""
+Embedding Batching and Caching
+
+This module provides the batching and caching layer used by LLMService so
+that concurrent embedding requests share one provider call and repeated
+texts are not embedded twice.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    LRU cache of embeddings keyed by a hash of model and text.
+
+    When a path is given the cache is loaded from and saved to a JSON file,
+    so embeddings survive restarts.
+    """
+
+    def __init__(self, max_size: int, path: str | None = None):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_size: Maximum number of cached embeddings
+            path: Optional file for persisting the cache
+        """
+        self.max_size = max_size
+        self.path = Path(path) if path else None
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Build the cache key for a text embedded with a model."""
+        return hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding."""
+        embedding = self._entries.get(key)
+        if embedding is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return embedding
+
+    def set(self, key: str, embedding: list[float]) -> None:
+        """Cache an embedding, evicting the least recently used entry."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def load(self) -> None:
+        """Load persisted embeddings."""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                entries = json.load(f)
+            for key, embedding in list(entries.items())[-self.max_size :]:
+                self._entries[key] = embedding
+            logger.info(f"Loaded {len(self._entries)} cached embeddings")
+        except Exception as e:
+            logger.warning(f"Failed to load embedding cache from {self.path}: {e}")
+
+    def save(self) -> None:
+        """Persist cached embeddings."""
+        if not self.path:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save embedding cache to {self.path}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batched provider calls.
+
+    Texts submitted within ``batch_window`` seconds of the first pending
+    text are sent together, up to ``max_batch_size`` distinct texts per
+    call. Duplicate texts within a batch are embedded once.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+        max_batch_size: int,
+        batch_window: float,
+    ):
+        """
+        Initialize embedding batcher.
+
+        Args:
+            embed_batch: Coroutine embedding a list of texts in order
+            max_batch_size: Maximum distinct texts per provider call
+            batch_window: Seconds to wait for more texts before flushing
+        """
+        self.embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.texts = 0
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed a text as part of the next batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(text, []).append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending texts as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: dict[str, list[asyncio.Future]]) -> None:
+        """Embed a batch and resolve the waiting futures."""
+        texts = list(batch)
+        self.batches += 1
+        self.texts += len(texts)
+
+        try:
+            embeddings = await self.embed_batch(texts)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for text, embedding in zip(texts, embeddings, strict=True):
+            for future in batch[text]:
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def close(self) -> None:
+        """Flush pending texts and wait for in-flight batches."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            "batches": self.batches,
+            "texts": self.texts,
+            "avg_batch_size": self.texts / self.batches if self.batches else 0.0,
+            "pending": len(self._pending),
+        }
@@ -5,11 +5,15 @@ This module provides LLM integration for embeddings generation,
 text generation, and tool description processing.
 """
 
+import asyncio
+from typing import Any
+
 import httpx
 
 from ..config import LLMProvider, get_settings
 from ..exceptions import EmbeddingError
 from ..utils.logging import get_logger
+from .embeddings import EmbeddingBatcher, EmbeddingCache
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -39,6 +43,17 @@ class LLMService:
         # HTTP client for API calls
         self.http_client = httpx.AsyncClient(timeout=30)
 
+        # Embedding cache and request coalescing
+        self.embedding_cache = EmbeddingCache(
+            max_size=settings.embedding_cache_size,
+            path=settings.embedding_cache_path,
+        )
+        self.embedding_batcher = EmbeddingBatcher(
+            self._generate_openai_embeddings,
+            max_batch_size=settings.embedding_batch_size,
+            batch_window=settings.embedding_batch_window,
+        )
+
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -56,6 +71,8 @@ class LLMService:
             else:
                 logger.warning(f"Unsupported LLM provider: {self.provider}")
 
+            self.embedding_cache.load()
+
             self._initialized = True
             logger.info("LLM Service initialized successfully")
 
@@ -100,12 +117,30 @@ class LLMService:
         """
         Generate embedding for text.
 
+        Cached embeddings are returned directly; with the OpenAI provider,
+        concurrent requests are coalesced into batched API calls.
+
         Args:
             text: Input text
 
         Returns:
             List of embedding values
 
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several texts.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Embeddings in the same order as the texts
+
         Raises:
             EmbeddingError: If embedding generation fails
         """
@@ -113,11 +148,26 @@ class LLMService:
             if not self._initialized:
                 raise EmbeddingError(message="LLM service not initialized")
 
-            if self.provider == LLMProvider.OPENAI:
-                return await self._generate_openai_embedding(text)
-            else:
-                # Fallback to simple hash-based embedding
-                return self._generate_fallback_embedding(text)
+            keys = [self._embedding_cache_key(text) for text in texts]
+            embeddings = [self.embedding_cache.get(key) for key in keys]
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+            if missing:
+                if self.provider == LLMProvider.OPENAI:
+                    generated = await asyncio.gather(
+                        *(self.embedding_batcher.embed(texts[i]) for i in missing)
+                    )
+                else:
+                    # Fallback to simple hash-based embedding
+                    generated = [
+                        self._generate_fallback_embedding(texts[i]) for i in missing
+                    ]
+
+                for i, embedding in zip(missing, generated, strict=True):
+                    embeddings[i] = embedding
+                    self.embedding_cache.set(keys[i], embedding)
+
+            return embeddings
 
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
@@ -125,14 +175,24 @@ class LLMService:
                 message=f"Failed to generate embedding: {str(e)}"
             ) from e
 
-    async def _generate_openai_embedding(self, text: str) -> list[float]:
-        """Generate embedding using OpenAI."""
+    def _embedding_cache_key(self, text: str) -> str:
+        """Get the cache key for a text under the current provider."""
+        if self.provider == LLMProvider.OPENAI:
+            model = self.settings.openai_embedding_model
+        else:
+            model = f"fallback-{self.settings.vector_dimension}"
+        return EmbeddingCache.make_key(model, text)
+
+    async def _generate_openai_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for a batch of texts using OpenAI."""
         try:
             response = await self.openai_client.embeddings.create(
-                model=self.settings.openai_embedding_model, input=text
+                model=self.settings.openai_embedding_model, input=texts
             )
 
-            return response.data[0].embedding
+            return [
+                item.embedding for item in sorted(response.data, key=lambda d: d.index)
+            ]
 
         except Exception as e:
             logger.error(f"OpenAI embedding failed: {e}")
@@ -217,12 +277,23 @@ class LLMService:
 
         logger.info("Shutting down LLM Service...")
 
+        # Finish pending embedding batches and persist the cache
+        await self.embedding_batcher.close()
+        self.embedding_cache.save()
+
         # Close HTTP client
         await self.http_client.aclose()
 
         self._initialized = False
         logger.info("LLM Service shutdown complete")
 
+    def get_embedding_stats(self) -> dict[str, Any]:
+        """Get embedding cache and batching statistics."""
+        return {
+            "cache": self.embedding_cache.get_stats(),
+            "batching": self.embedding_batcher.get_stats(),
+        }
+
     @property
     def is_initialized(self) -> bool:
         """Check if service is initialized."""
@@ -20,12 +20,17 @@ from fastapi.responses import JSONResponse
 
 from .api import create_api_router, get_api_version_manager
 from .cache.redis_cache import close_cache_manager
+from .composition.orchestrator import (
+    close_workflow_orchestrator,
+    get_workflow_orchestrator,
+)
 from .config import get_settings
 from .exceptions import MetaMCPError
 from .monitoring.health import setup_health_checks
 from .monitoring.metrics import setup_metrics
 from .monitoring.performance import performance_monitor
 from .performance.background_tasks import start_background_tasks, stop_background_tasks
+from .performance.http_client import close_http_client_manager
 from .security.middleware import RateLimitMiddleware, SecurityMiddleware
 from .server import MetaMCPServer
 from .services.service_discovery import ServiceType, service_discovery
@@ -80,6 +85,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Failed to include MCP routes: {e}")
 
+        # Initialize the workflow orchestrator shared by the composition API
+        try:
+            await get_workflow_orchestrator().initialize()
+            logger.info("Workflow Orchestrator initialized")
+        except Exception as e:
+            logger.error(f"Failed to initialize Workflow Orchestrator: {e}")
+
         # Start service discovery
         await service_discovery.start()
         logger.info("Service discovery started")
@@ -145,10 +157,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             # Database cleanup is handled by SQLAlchemy session management
             logger.info("Database connection pool closed")
 
+            # Write outstanding workflow checkpoints
+            await close_workflow_orchestrator()
+            logger.info("Workflow Orchestrator shut down")
+
             # Close cache manager
             await close_cache_manager()
             logger.info("Cache manager closed")
 
+            # Close outbound HTTP connection pools
+            await close_http_client_manager()
+
             # Shutdown version manager
             if hasattr(app.state, "version_manager"):
                 await app.state.version_manager.shutdown()
@@ -6,10 +6,16 @@ including health checking, failover, and intelligent load distribution.
 """
 
 import asyncio
+import hashlib
+import math
+import random
 import time
 import uuid
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from typing import Any
 
 from ..utils.logging import get_logger
@@ -72,19 +78,112 @@ class ServerHealth:
     total_requests: int = 0
     active_connections: int = 0
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, reporting status changes to the listener."""
+        changed = name == "status" and self.__dict__.get("status") != value
+        super().__setattr__(name, value)
+        listener = self.__dict__.get("_status_listener")
+        if changed and listener is not None:
+            listener(self)
+
+
+def stable_hash(key: str) -> int:
+    """Hash a string to 64 bits, identically in every process."""
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class ConsistentHashRing:
+    """
+    Consistent hash ring over server ids.
+
+    Each server is placed on the ring at a number of virtual nodes
+    proportional to its weight. The ring contains all member servers, not
+    only healthy ones: a lookup walks clockwise to the first node of a
+    healthy server, so a server going down only remaps the keys it owned
+    and they move back when it recovers.
+    """
+
+    def __init__(self, servers: list[ServerConfig], virtual_nodes: int = 160):
+        """
+        Build the ring.
+
+        Args:
+            servers: Member servers
+            virtual_nodes: Virtual nodes for a server of weight 100
+        """
+        nodes = sorted(
+            (stable_hash(f"{server.id}#{i}"), server.id)
+            for server in servers
+            for i in range(max(1, virtual_nodes * server.weight // 100))
+        )
+        self._hashes = [node_hash for node_hash, _ in nodes]
+        self._owners = [server_id for _, server_id in nodes]
+
+    def __len__(self) -> int:
+        """Get the number of virtual nodes."""
+        return len(self._hashes)
+
+    def get(self, key: str, healthy: frozenset[str]) -> str | None:
+        """
+        Get the id of the first healthy server clockwise from a key.
+
+        Args:
+            key: Key to place on the ring
+            healthy: Ids of servers that may be returned
+
+        Returns:
+            Server id, or None if no server on the ring is healthy
+        """
+        if not self._hashes or not healthy:
+            return None
+
+        start = bisect_right(self._hashes, stable_hash(key))
+        size = len(self._owners)
+        for offset in range(size):
+            owner = self._owners[(start + offset) % size]
+            if owner in healthy:
+                return owner
+        return None
+
+
+@dataclass(frozen=True)
+class _SelectionSnapshot:
+    """Precomputed selection state, replaced whenever health or membership changes."""
+
+    servers: tuple[ServerConfig, ...] = ()
+    healths: tuple[ServerHealth, ...] = ()
+    healthy_ids: frozenset[str] = frozenset()
+    cumulative_weights: tuple[int, ...] = ()
+    ring: ConsistentHashRing | None = None
+
 
 class HealthChecker:
     """Manages health checking for servers."""
 
-    def __init__(self, config: ServerConfig):
-        """Initialize health checker."""
+    def __init__(
+        self,
+        config: ServerConfig,
+        on_status_change: Callable[[str, ServerStatus], None] | None = None,
+    ):
+        """
+        Initialize health checker.
+
+        Args:
+            config: Server configuration
+            on_status_change: Called with the server id and new status
+                whenever the status changes
+        """
         self.config = config
+        self.on_status_change = on_status_change
         self.health = ServerHealth(
             server_id=config.id,
             status=ServerStatus.OFFLINE,
             last_check=0.0,
             response_time=0.0,
         )
+        self.health._status_listener = self._notify_status_change
         self._check_task: asyncio.Task | None = None
         self._running = False
 
@@ -229,6 +328,11 @@ class HealthChecker:
 
         logger.debug(f"Health check failed for {self.config.name}")
 
+    def _notify_status_change(self, health: ServerHealth) -> None:
+        """Report a status change to the listener."""
+        if self.on_status_change is not None:
+            self.on_status_change(self.config.id, health.status)
+
     async def get_health_status(self) -> ServerHealth:
         """Get current health status."""
         return self.health
@@ -239,18 +343,39 @@ class HealthChecker:
 
 
 class LoadBalancer:
-    """Multi-server load balancer for MCP."""
+    """
+    Multi-server load balancer for MCP.
+
+    Selection reads an immutable snapshot of the enabled, healthy servers
+    that is rebuilt only when a server is added, removed, enabled or
+    disabled, or changes health status, and swapped in with a single
+    assignment. Picking a server therefore takes no lock and does no
+    awaiting: round robin and power-of-two-choices strategies are O(1),
+    weighted round robin and consistent hashing O(log n).
+    """
 
     def __init__(
-        self, strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN
+        self,
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN,
+        virtual_nodes: int = 160,
     ):
-        """Initialize load balancer."""
+        """
+        Initialize load balancer.
+
+        Args:
+            strategy: Load balancing strategy
+            virtual_nodes: Consistent hash ring nodes per server of weight 100
+        """
         self.strategy = strategy
+        self.virtual_nodes = virtual_nodes
         self.servers: dict[str, ServerConfig] = {}
         self.health_checkers: dict[str, HealthChecker] = {}
         self.current_index = 0
+        # Serializes membership changes; selection does not take it
         self._lock = asyncio.Lock()
         self._running = False
+        self._ring = ConsistentHashRing([], virtual_nodes)
+        self._snapshot = _SelectionSnapshot()
 
     async def add_server(self, config: ServerConfig) -> None:
         """Add a server to the load balancer."""
@@ -258,8 +383,9 @@ class LoadBalancer:
             self.servers[config.id] = config
 
             # Create health checker
-            health_checker = HealthChecker(config)
+            health_checker = HealthChecker(config, self._on_status_change)
             self.health_checkers[config.id] = health_checker
+            self._rebuild(membership_changed=True)
 
             if self._running:
                 await health_checker.start()
@@ -272,35 +398,100 @@ class LoadBalancer:
             if server_id in self.servers:
                 del self.servers[server_id]
 
-                if server_id in self.health_checkers:
-                    await self.health_checkers[server_id].stop()
-                    del self.health_checkers[server_id]
+                health_checker = self.health_checkers.pop(server_id, None)
+                self._rebuild(membership_changed=True)
+                if health_checker:
+                    await health_checker.stop()
 
                 logger.info(f"Removed server {server_id} from load balancer")
 
+    async def set_server_enabled(self, server_id: str, enabled: bool) -> None:
+        """Enable or disable a server."""
+        async with self._lock:
+            config = self.servers.get(server_id)
+            if config is not None and config.enabled != enabled:
+                config.enabled = enabled
+                self._rebuild(membership_changed=True)
+
     async def get_server(self, client_id: str = None) -> ServerConfig | None:
         """Get a server based on the load balancing strategy."""
-        async with self._lock:
-            healthy_servers = await self._get_healthy_servers()
-
-            if not healthy_servers:
-                logger.warning("No healthy servers available")
-                return None
-
-            if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
-                return await self._round_robin_select(healthy_servers)
-            elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
-                return await self._least_connections_select(healthy_servers)
-            elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
-                return await self._weighted_round_robin_select(healthy_servers)
-            elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
-                return await self._least_response_time_select(healthy_servers)
-            elif self.strategy == LoadBalancingStrategy.IP_HASH:
-                return await self._ip_hash_select(healthy_servers, client_id)
-            elif self.strategy == LoadBalancingStrategy.CONSISTENT_HASH:
-                return await self._consistent_hash_select(healthy_servers, client_id)
-            else:
-                return healthy_servers[0]
+        return self.select_server(client_id)
+
+    def select_server(self, client_id: str = None) -> ServerConfig | None:
+        """
+        Select a server from the current snapshot without locking.
+
+        Args:
+            client_id: Client identifier for the hashing strategies
+
+        Returns:
+            Selected server, or None if no server is healthy
+        """
+        snapshot = self._snapshot
+        if not snapshot.servers:
+            logger.warning("No healthy servers available")
+            return None
+
+        if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
+            return self._round_robin_select(snapshot)
+        elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
+            return self._two_choices_select(snapshot, "active_connections")
+        elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
+            return self._weighted_round_robin_select(snapshot)
+        elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
+            return self._two_choices_select(snapshot, "response_time")
+        elif self.strategy == LoadBalancingStrategy.IP_HASH:
+            return self._ip_hash_select(snapshot, client_id)
+        elif self.strategy == LoadBalancingStrategy.CONSISTENT_HASH:
+            return self._consistent_hash_select(snapshot, client_id)
+        else:
+            return snapshot.servers[0]
+
+    def _on_status_change(self, server_id: str, status: ServerStatus) -> None:
+        """Rebuild the selection snapshot when a server's health changes."""
+        logger.debug(f"Server {server_id} changed status to {status.value}")
+        self._rebuild()
+
+    def _rebuild(self, membership_changed: bool = False) -> None:
+        """
+        Precompute the selection state and swap it in.
+
+        Args:
+            membership_changed: Whether the set of enabled servers changed,
+                which requires rebuilding the consistent hash ring
+        """
+        if membership_changed:
+            self._ring = ConsistentHashRing(
+                [config for config in self.servers.values() if config.enabled],
+                self.virtual_nodes,
+            )
+
+        servers = []
+        healths = []
+        for server_id, config in self.servers.items():
+            health_checker = self.health_checkers.get(server_id)
+            if (
+                config.enabled
+                and health_checker is not None
+                and health_checker.health.status == ServerStatus.HEALTHY
+            ):
+                servers.append(config)
+                healths.append(health_checker.health)
+
+        # Weights are reduced by their common divisor to keep the weighted
+        # round robin cycle short (100/200 cycles over 3 picks, not 300)
+        weights = [max(config.weight, 0) for config in servers]
+        divisor = math.gcd(*weights) or 1
+
+        self._snapshot = _SelectionSnapshot(
+            servers=tuple(servers),
+            healths=tuple(healths),
+            healthy_ids=frozenset(config.id for config in servers),
+            cumulative_weights=tuple(
+                accumulate(weight // divisor for weight in weights)
+            ),
+            ring=self._ring,
+        )
 
     async def _get_healthy_servers(self) -> list[ServerConfig]:
         """Get list of healthy servers."""
@@ -318,116 +509,64 @@ class LoadBalancer:
 
         return healthy_servers
 
-    async def _round_robin_select(self, servers: list[ServerConfig]) -> ServerConfig:
+    def _round_robin_select(self, snapshot: _SelectionSnapshot) -> ServerConfig:
         """Round robin server selection."""
-        if not servers:
-            return None
-
-        server = servers[self.current_index % len(servers)]
+        server = snapshot.servers[self.current_index % len(snapshot.servers)]
         self.current_index += 1
         return server
 
-    async def _least_connections_select(
-        self, servers: list[ServerConfig]
+    def _two_choices_select(
+        self, snapshot: _SelectionSnapshot, metric: str
     ) -> ServerConfig:
-        """Least connections server selection."""
-        if not servers:
-            return None
-
-        min_connections = float("inf")
-        selected_server = None
-
-        for server in servers:
-            health_checker = self.health_checkers.get(server.id)
-            if health_checker:
-                health = await health_checker.get_health_status()
-                if health.active_connections < min_connections:
-                    min_connections = health.active_connections
-                    selected_server = server
-
-        return selected_server
-
-    async def _weighted_round_robin_select(
-        self, servers: list[ServerConfig]
+        """
+        Power-of-two-choices selection.
+
+        Compares two random servers by a live health metric (active
+        connections or response time) and takes the lower one, which
+        spreads load almost as well as scanning every server and avoids
+        sending a burst of requests to the same least-loaded server.
+        """
+        count = len(snapshot.servers)
+        if count == 1:
+            return snapshot.servers[0]
+
+        first, second = random.sample(range(count), 2)
+        if getattr(snapshot.healths[second], metric) < getattr(
+            snapshot.healths[first], metric
+        ):
+            first = second
+        return snapshot.servers[first]
+
+    def _weighted_round_robin_select(
+        self, snapshot: _SelectionSnapshot
     ) -> ServerConfig:
         """Weighted round robin server selection."""
-        if not servers:
-            return None
-
-        # Calculate total weight
-        total_weight = sum(server.weight for server in servers)
+        total_weight = snapshot.cumulative_weights[-1]
+        if total_weight <= 0:
+            return self._round_robin_select(snapshot)
 
-        # Use current index to select server
-        current_weight = self.current_index % total_weight
+        position = self.current_index % total_weight
         self.current_index += 1
+        return snapshot.servers[bisect_right(snapshot.cumulative_weights, position)]
 
-        # Find server based on weight
-        for server in servers:
-            current_weight -= server.weight
-            if current_weight < 0:
-                return server
-
-        return servers[0]
-
-    async def _least_response_time_select(
-        self, servers: list[ServerConfig]
-    ) -> ServerConfig:
-        """Least response time server selection."""
-        if not servers:
-            return None
-
-        min_response_time = float("inf")
-        selected_server = None
-
-        for server in servers:
-            health_checker = self.health_checkers.get(server.id)
-            if health_checker:
-                health = await health_checker.get_health_status()
-                if health.response_time < min_response_time:
-                    min_response_time = health.response_time
-                    selected_server = server
-
-        return selected_server
-
-    async def _ip_hash_select(
-        self, servers: list[ServerConfig], client_id: str
+    def _ip_hash_select(
+        self, snapshot: _SelectionSnapshot, client_id: str
     ) -> ServerConfig:
         """IP hash server selection."""
-        if not servers or not client_id:
-            return servers[0] if servers else None
+        if not client_id:
+            return snapshot.servers[0]
 
-        # Simple hash of client ID
-        hash_value = hash(client_id)
-        index = hash_value % len(servers)
-        return servers[index]
+        return snapshot.servers[stable_hash(client_id) % len(snapshot.servers)]
 
-    async def _consistent_hash_select(
-        self, servers: list[ServerConfig], client_id: str
+    def _consistent_hash_select(
+        self, snapshot: _SelectionSnapshot, client_id: str
     ) -> ServerConfig:
         """Consistent hash server selection."""
-        if not servers or not client_id:
-            return servers[0] if servers else None
-
-        # Simple consistent hashing implementation
-        hash_value = hash(client_id)
-
-        # Create virtual nodes for better distribution
-        virtual_nodes = []
-        for server in servers:
-            for i in range(3):  # 3 virtual nodes per server
-                virtual_hash = hash(f"{server.id}-{i}")
-                virtual_nodes.append((virtual_hash, server))
-
-        # Sort virtual nodes
-        virtual_nodes.sort(key=lambda x: x[0])
-
-        # Find the first virtual node with hash >= client hash
-        for virtual_hash, server in virtual_nodes:
-            if virtual_hash >= hash_value:
-                return server
+        if not client_id:
+            return snapshot.servers[0]
 
-        # Wrap around to first server
-        return virtual_nodes[0][1]
+        server_id = snapshot.ring.get(client_id, snapshot.healthy_ids)
+        return self.servers.get(server_id) or snapshot.servers[0]
 
     async def get_server_health(self, server_id: str) -> ServerHealth | None:
         """Get health status for a specific server."""
@@ -496,6 +635,7 @@ class LoadBalancer:
             "total_connections": total_connections,
             "total_requests": total_requests,
             "health_check_interval": 30.0,  # Default interval
+            "ring_virtual_nodes": len(self._ring),
         }
 
 
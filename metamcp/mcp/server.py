@@ -24,6 +24,7 @@ from ..security.policies import PolicyEngine, PolicyEngineType
 from ..tools.registry import ToolRegistry
 from ..utils.logging import get_logger
 from ..vector.client import VectorSearchClient
+from ..vector.embedded import EmbeddedVectorIndex
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -275,7 +276,7 @@ class MCPServer:
         self.stdio_server: StdioMCPServer | None = None
         self.telemetry_manager: TelemetryManager | None = None
         self.tool_registry: ToolRegistry | None = None
-        self.vector_client: VectorSearchClient | None = None
+        self.vector_client: VectorSearchClient | EmbeddedVectorIndex | None = None
         self.auth_manager: AuthManager | None = None
         self.policy_engine: PolicyEngine | None = None
         self.router = APIRouter()
@@ -316,10 +317,16 @@ class MCPServer:
 
             # Initialize vector client
             if self.settings.vector_search_enabled:
-                self.vector_client = VectorSearchClient(
-                    url=self.settings.weaviate_url,
-                    api_key=self.settings.weaviate_api_key,
-                )
+                if self.settings.vector_backend == "embedded":
+                    self.vector_client = EmbeddedVectorIndex(
+                        dimension=self.settings.vector_dimension,
+                        path=self.settings.vector_index_path,
+                    )
+                else:
+                    self.vector_client = VectorSearchClient(
+                        url=self.settings.weaviate_url,
+                        api_key=self.settings.weaviate_api_key,
+                    )
                 await self.vector_client.initialize()
 
             # Initialize auth manager
@@ -0,0 +1,208 @@
+"""
+Outbound HTTP Client Pool
+
+This module provides a process-wide manager for outbound HTTP connections so
+tool executions, proxy calls and health checks reuse keep-alive connections
+instead of opening a new TCP/TLS connection per request.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+
+from ..config import get_settings
+from ..utils.logging import get_logger
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class HostPoolStats:
+    """Usage statistics for the connection pool of a single host."""
+
+    def __init__(self, max_connections: int):
+        """Initialize host pool statistics."""
+        self.max_connections = max_connections
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated_requests = 0
+        self.total_time = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert statistics to dictionary."""
+        return {
+            "max_connections": self.max_connections,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturated_requests": self.saturated_requests,
+            "saturation": self.in_flight / self.max_connections,
+            "avg_request_time": (
+                self.total_time / self.requests if self.requests else 0.0
+            ),
+        }
+
+
+class HTTPClientManager:
+    """
+    Shared outbound HTTP client manager.
+
+    One ``httpx.AsyncClient`` is kept per origin (scheme, host, port) so each
+    host gets its own keep-alive pool and connection limit; a slow upstream
+    can exhaust only its own connections. Timeouts are applied per request.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+    ):
+        """Initialize HTTP client manager."""
+        self.max_connections_per_host = (
+            max_connections_per_host or settings.http_client_max_connections_per_host
+        )
+        self.max_keepalive_connections = (
+            max_keepalive_connections or settings.http_client_max_keepalive_connections
+        )
+        self.keepalive_expiry = (
+            keepalive_expiry or settings.http_client_keepalive_expiry
+        )
+
+        http2 = settings.http_client_http2 if http2 is None else http2
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._stats: dict[str, HostPoolStats] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Get the origin key for a URL."""
+        parsed = httpx.URL(url)
+        return f"{parsed.scheme}://{parsed.host}:{parsed.port or ''}"
+
+    async def get_client(self, url: str) -> httpx.AsyncClient:
+        """Get the pooled client for the origin of a URL."""
+        origin = self._origin(url)
+        client = self._clients.get(origin)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections_per_host,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                    http2=self.http2,
+                )
+                self._clients[origin] = client
+                self._stats.setdefault(
+                    origin, HostPoolStats(self.max_connections_per_host)
+                )
+                logger.debug(f"Created pooled HTTP client for {origin}")
+
+        return client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: float | httpx.Timeout | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the pooled client for its host.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Per-request timeout in seconds
+            **kwargs: Additional arguments passed to ``httpx.AsyncClient.request``
+
+        Returns:
+            HTTP response
+        """
+        client = await self.get_client(url)
+        stats = self._stats[self._origin(url)]
+
+        if stats.in_flight >= stats.max_connections:
+            stats.saturated_requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        stats.requests += 1
+        start_time = time.time()
+
+        try:
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            return await client.request(method, url, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_time += time.time() - start_time
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-host pool statistics."""
+        return {
+            "http2": self.http2,
+            "hosts": {origin: stats.to_dict() for origin, stats in self._stats.items()},
+        }
+
+    async def close(self) -> None:
+        """Close all pooled clients."""
+        async with self._lock:
+            for client in self._clients.values():
+                await client.aclose()
+            self._clients.clear()
+            logger.info("Outbound HTTP client pool closed")
+
+
+# Global HTTP client manager instance
+_http_client_manager: HTTPClientManager | None = None
+
+
+def get_http_client_manager() -> HTTPClientManager:
+    """Get global HTTP client manager instance."""
+    global _http_client_manager
+    if _http_client_manager is None:
+        _http_client_manager = HTTPClientManager()
+    return _http_client_manager
+
+
+async def close_http_client_manager() -> None:
+    """Close global HTTP client manager."""
+    global _http_client_manager
+    if _http_client_manager is not None:
+        await _http_client_manager.close()
+        _http_client_manager = None
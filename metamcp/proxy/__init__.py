@@ -8,6 +8,8 @@ with MetaMCP's enhanced features like semantic search, security, and monitoring.
 from .discovery import ServerDiscovery
 from .interceptor import ToolCallInterceptor
 from .manager import ProxyManager
+from .stdio import StdioMCPConnection, StdioPoolManager, StdioSessionPool
+from .websocket import WebSocketMCPSession, WebSocketSessionManager
 from .wrapper import MCPProxyWrapper, WrappedServerConfig
 
 __all__ = [
@@ -15,5 +17,10 @@ __all__ = [
     "ProxyManager",
     "ToolCallInterceptor",
     "ServerDiscovery",
+    "StdioMCPConnection",
+    "StdioPoolManager",
+    "StdioSessionPool",
+    "WebSocketMCPSession",
+    "WebSocketSessionManager",
     "WrappedServerConfig",
 ]
@@ -14,6 +14,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ..exceptions import ServerDiscoveryError
+from ..performance.http_client import HTTPClientManager, get_http_client_manager
 from ..utils.logging import get_logger
 from .wrapper import WrappedServerConfig
 
@@ -76,9 +77,10 @@ class ServerDiscovery:
     and configuration file parsing.
     """
 
-    def __init__(self):
+    def __init__(self, http_client: HTTPClientManager | None = None):
         """Initialize the server discovery."""
         self.discovered_servers: list[DiscoveredServer] = []
+        self.http_client = http_client or get_http_client_manager()
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -272,35 +274,36 @@ class ServerDiscovery:
     async def _test_http_endpoint(self, endpoint: str, timeout: int) -> bool:
         """Test if an HTTP endpoint is an MCP server."""
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                # Try tools/list endpoint
-                try:
-                    response = await client.post(f"{endpoint}/tools/list")
-                    if response.status_code == 200:
-                        return True
-                except Exception as e:
-                    logger.debug(f"Tools list endpoint failed for {endpoint}: {e}")
-
-                # Try health endpoint
-                try:
-                    response = await client.get(f"{endpoint}/health")
-                    if response.status_code == 200:
+            # Try tools/list endpoint
+            try:
+                response = await self.http_client.post(
+                    f"{endpoint}/tools/list", timeout=timeout
+                )
+                if response.status_code == 200:
+                    return True
+            except Exception as e:
+                logger.debug(f"Tools list endpoint failed for {endpoint}: {e}")
+
+            # Try health endpoint
+            try:
+                response = await self.http_client.get(
+                    f"{endpoint}/health", timeout=timeout
+                )
+                if response.status_code == 200:
+                    return True
+            except Exception as e:
+                logger.debug(f"Health endpoint failed for {endpoint}: {e}")
+
+            # Try root endpoint
+            try:
+                response = await self.http_client.get(endpoint, timeout=timeout)
+                if response.status_code == 200:
+                    # Check if response contains MCP indicators
+                    content = response.text.lower()
+                    if "mcp" in content or "tools" in content:
                         return True
-                except Exception as e:
-                    logger.debug(f"Health endpoint failed for {endpoint}: {e}")
-
-                # Try root endpoint
-                try:
-                    response = await client.get(endpoint)
-                    if response.status_code == 200:
-                        # Check if response contains MCP indicators
-                        content = response.text.lower()
-                        if "mcp" in content or "tools" in content:
-                            return True
-                except Exception as e:
-                    logger.debug(f"Root endpoint failed for {endpoint}: {e}")
+            except Exception as e:
+                logger.debug(f"Root endpoint failed for {endpoint}: {e}")
 
         except Exception as e:
             logger.debug(f"HTTP endpoint test failed for {endpoint}: {e}")
@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ..exceptions import ProxyError
+from ..performance.http_client import HTTPClientManager, get_http_client_manager
 from ..utils.logging import get_logger
 from .wrapper import MCPProxyWrapper, WrappedServerConfig
 
@@ -39,9 +40,10 @@ class ProxyManager:
     wrapped MCP servers with discovery, registration, and monitoring.
     """
 
-    def __init__(self):
+    def __init__(self, http_client: HTTPClientManager | None = None):
         """Initialize the proxy manager."""
-        self.wrapper = MCPProxyWrapper()
+        self.http_client = http_client or get_http_client_manager()
+        self.wrapper = MCPProxyWrapper(http_client=self.http_client)
         self.registered_servers: dict[str, ServerInfo] = {}
         self._initialized = False
 
@@ -189,52 +191,49 @@ class ProxyManager:
 
             timeout = httpx.Timeout(5.0)  # Short timeout for health checks
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                for endpoint in endpoints:
-                    try:
-                        response = await client.get(endpoint)
-
-                        if response.status_code == 200:
-                            data = response.json()
-
-                            # Try different response formats
-                            if isinstance(data, dict):
-                                # Direct count
-                                if "count" in data:
-                                    return data["count"]
-                                # List of tools
-                                elif "tools" in data and isinstance(
-                                    data["tools"], list
-                                ):
-                                    return len(data["tools"])
-                                # Direct list
-                                elif isinstance(data, list):
-                                    return len(data)
-                                # Total count
-                                elif "total" in data:
-                                    return data["total"]
-
-                            # If response is a list, count items
+            for endpoint in endpoints:
+                try:
+                    response = await self.http_client.get(endpoint, timeout=timeout)
+
+                    if response.status_code == 200:
+                        data = response.json()
+
+                        # Try different response formats
+                        if isinstance(data, dict):
+                            # Direct count
+                            if "count" in data:
+                                return data["count"]
+                            # List of tools
+                            elif "tools" in data and isinstance(data["tools"], list):
+                                return len(data["tools"])
+                            # Direct list
                             elif isinstance(data, list):
                                 return len(data)
+                            # Total count
+                            elif "total" in data:
+                                return data["total"]
 
-                        elif response.status_code == 404:
-                            # Try next endpoint
-                            continue
-                        else:
-                            logger.debug(
-                                f"Endpoint {endpoint} returned {response.status_code}"
-                            )
+                        # If response is a list, count items
+                        elif isinstance(data, list):
+                            return len(data)
 
-                    except httpx.RequestError:
+                    elif response.status_code == 404:
                         # Try next endpoint
                         continue
-                    except Exception as e:
-                        logger.debug(f"Error checking {endpoint}: {e}")
-                        continue
+                    else:
+                        logger.debug(
+                            f"Endpoint {endpoint} returned {response.status_code}"
+                        )
 
-                # If no endpoints work, try to get tools via MCP protocol
-                return await self._get_mcp_tool_count(config)
+                except httpx.RequestError:
+                    # Try next endpoint
+                    continue
+                except Exception as e:
+                    logger.debug(f"Error checking {endpoint}: {e}")
+                    continue
+
+            # If no endpoints work, try to get tools via MCP protocol
+            return await self._get_mcp_tool_count(config)
 
         except Exception as e:
             logger.warning(f"Failed to get tool count from {config.name}: {e}")
@@ -432,18 +431,15 @@ class ProxyManager:
     async def _test_mcp_endpoint(self, endpoint: str) -> bool:
         """Test if an endpoint is an MCP server."""
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=5) as client:
-                # Try to get tools list
-                response = await client.post(f"{endpoint}/tools/list")
-                if response.status_code == 200:
-                    return True
+            # Try to get tools list
+            response = await self.http_client.post(f"{endpoint}/tools/list", timeout=5)
+            if response.status_code == 200:
+                return True
 
-                # Try health endpoint
-                response = await client.get(f"{endpoint}/health")
-                if response.status_code == 200:
-                    return True
+            # Try health endpoint
+            response = await self.http_client.get(f"{endpoint}/health", timeout=5)
+            if response.status_code == 200:
+                return True
 
         except Exception as e:
             logger.debug(f"MCP endpoint test failed for {endpoint}: {e}")
@@ -502,11 +498,8 @@ class ProxyManager:
     async def _test_http_health(self, endpoint: str) -> bool:
         """Test HTTP server health."""
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{endpoint}/health")
-                return response.status_code == 200
+            response = await self.http_client.get(f"{endpoint}/health", timeout=5)
+            return response.status_code == 200
 
         except Exception:
             return False
@@ -0,0 +1,538 @@
+"""
+Stdio MCP Transport
+
+This module provides the stdio transport for wrapped MCP servers, including a
+pool of long-lived server processes so tool calls do not pay process startup
+and MCP handshake costs on every request.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from ..exceptions import ProxyError
+from ..utils.constants import (
+    DEFAULT_STDIO_POOL_IDLE_TIMEOUT,
+    DEFAULT_STDIO_POOL_MAX_IN_FLIGHT,
+    DEFAULT_STDIO_POOL_MAX_SIZE,
+    DEFAULT_STDIO_POOL_REAP_INTERVAL,
+    DEFAULT_STDIO_WRITE_QUEUE_SIZE,
+    MCP_PROTOCOL_VERSION,
+    STDIO_MAX_MESSAGE_SIZE,
+)
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class StdioMCPConnection:
+    """
+    Manages stdio-based MCP server connections.
+
+    The server process is driven by asyncio pipes: a writer task drains a
+    bounded outgoing queue and a reader task routes each response line to
+    the future waiting on its JSON-RPC id, so many requests can be in flight
+    on one process without blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        timeout: int = 30,
+        write_queue_size: int = DEFAULT_STDIO_WRITE_QUEUE_SIZE,
+    ):
+        """Initialize stdio connection."""
+        self.command = command
+        self.timeout = timeout
+        self.process: asyncio.subprocess.Process | None = None
+        self._connected = False
+        self._request_ids = itertools.count(1)
+        self._pending: dict[Any, asyncio.Future] = {}
+        self._write_queue: asyncio.Queue[bytes] = asyncio.Queue(
+            maxsize=write_queue_size
+        )
+        self._reader_task: asyncio.Task | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._stderr_task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        """Start the stdio MCP server process."""
+        try:
+            # Split command into list for subprocess
+            cmd_parts = self.command.split()
+
+            self.process = await asyncio.create_subprocess_exec(
+                *cmd_parts,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=STDIO_MAX_MESSAGE_SIZE,
+            )
+
+            self._connected = True
+            self._reader_task = asyncio.create_task(self._read_loop())
+            self._writer_task = asyncio.create_task(self._write_loop())
+            self._stderr_task = asyncio.create_task(self._drain_stderr())
+            logger.info(f"Started stdio MCP server: {self.command}")
+
+        except Exception as e:
+            logger.error(f"Failed to start stdio MCP server: {e}")
+            raise ProxyError(f"Stdio connection failed: {str(e)}")
+
+    def next_request_id(self) -> int:
+        """Allocate a JSON-RPC request id unique to this connection."""
+        return next(self._request_ids)
+
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Send a JSON-RPC request with a fresh id and return its response."""
+        return await self.send_message(
+            {
+                "jsonrpc": "2.0",
+                "id": self.next_request_id(),
+                "method": method,
+                "params": params or {},
+            },
+            timeout=timeout,
+        )
+
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a JSON-RPC notification (no response expected)."""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self.send_message(message)
+
+    async def send_message(
+        self, message: dict[str, Any], timeout: float | None = None
+    ) -> dict[str, Any] | None:
+        """Send JSON-RPC message to stdio server."""
+        if not self.is_connected:
+            raise ProxyError("Stdio connection not established")
+
+        request_id = message.get("id")
+        data = (json.dumps(message) + "\n").encode()
+
+        if request_id is None:
+            await self._write_queue.put(data)
+            return None
+
+        if request_id in self._pending:
+            raise ProxyError(f"Duplicate stdio request id: {request_id}")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        try:
+            await self._write_queue.put(data)
+            return await asyncio.wait_for(future, timeout or self.timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Stdio request {request_id} timed out: {self.command}")
+            raise ProxyError(
+                f"Stdio request timed out after {timeout or self.timeout}s"
+            )
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _write_loop(self) -> None:
+        """Write queued messages to the server's stdin."""
+        try:
+            while True:
+                data = await self._write_queue.get()
+                self.process.stdin.write(data)
+                await self.process.stdin.drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Stdio communication error: {e}")
+            self._fail_pending(ProxyError(f"Stdio communication failed: {str(e)}"))
+
+    async def _read_loop(self) -> None:
+        """Route response lines from stdout to their waiting requests."""
+        try:
+            while True:
+                line = await self.process.stdout.readline()
+                if not line:
+                    break
+
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON response from stdio server: {e}")
+                    continue
+                if not isinstance(response, dict):
+                    logger.warning(f"Ignoring non-object stdio server output: {line!r}")
+                    continue
+
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Stdio communication error: {e}")
+
+        self._fail_pending(ProxyError("No response from stdio server"))
+
+    async def _drain_stderr(self) -> None:
+        """Consume stderr so a chatty server cannot fill the pipe and stall."""
+        try:
+            while True:
+                line = await self.process.stderr.readline()
+                if not line:
+                    break
+                logger.debug(
+                    f"[{self.command}] {line.decode(errors='replace').rstrip()}"
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Stopped reading stdio server stderr: {e}")
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Mark the connection dead and fail every outstanding request."""
+        self._connected = False
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def disconnect(self) -> None:
+        """Disconnect from stdio server."""
+        if self.process:
+            for task in (self._writer_task, self._reader_task, self._stderr_task):
+                if task:
+                    task.cancel()
+
+            try:
+                if self.process.returncode is None:
+                    self.process.terminate()
+                    await asyncio.wait_for(self.process.wait(), timeout=5)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+            finally:
+                self._fail_pending(ProxyError("Stdio connection closed"))
+                self.process = None
+                self._reader_task = None
+                self._writer_task = None
+                self._stderr_task = None
+                logger.info("Disconnected from stdio MCP server")
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests awaiting a response."""
+        return len(self._pending)
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if stdio connection is active."""
+        return (
+            self._connected
+            and self.process is not None
+            and self.process.returncode is None
+        )
+
+
+@dataclass
+class StdioPoolConfig:
+    """Configuration for a stdio session pool."""
+
+    max_size: int = DEFAULT_STDIO_POOL_MAX_SIZE
+    max_in_flight: int = DEFAULT_STDIO_POOL_MAX_IN_FLIGHT
+    idle_timeout: float = DEFAULT_STDIO_POOL_IDLE_TIMEOUT
+    handshake: bool = True
+
+
+class StdioSession:
+    """A warm stdio server process checked out by the pool."""
+
+    def __init__(self, connection: StdioMCPConnection):
+        """Initialize pooled session."""
+        self.connection = connection
+        self.in_flight = 0
+        self.total_requests = 0
+        self.created_at = time.time()
+        self.last_used = time.time()
+
+    @property
+    def is_healthy(self) -> bool:
+        """Check whether the underlying process is still usable."""
+        return self.connection.is_connected
+
+    def idle_for(self, now: float) -> float:
+        """Seconds since the session last finished a request."""
+        if self.in_flight:
+            return 0.0
+        return now - self.last_used
+
+
+class StdioSessionPool:
+    """
+    Pool of long-lived stdio MCP server processes for one server command.
+
+    Requests are routed to the least busy healthy process; a new process is
+    only spawned when every existing one already has ``max_in_flight``
+    outstanding requests and the pool is below ``max_size``. Dead processes
+    are dropped and replaced on the next request, idle ones are reaped.
+    """
+
+    def __init__(
+        self, command: str, timeout: int = 30, config: StdioPoolConfig | None = None
+    ):
+        """Initialize stdio session pool."""
+        self.command = command
+        self.timeout = timeout
+        self.config = config or StdioPoolConfig()
+        self.sessions: list[StdioSession] = []
+        self._retiring: set[StdioSession] = set()
+        self._lock = asyncio.Lock()
+        self._spawn_done = asyncio.Condition(self._lock)
+        self._spawning = 0
+        self._spawned = 0
+        self._respawned = 0
+        self._reaped = 0
+
+    async def request(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a JSON-RPC request through a pooled process."""
+        session = await self._acquire()
+        try:
+            return await session.connection.request(method, params)
+        finally:
+            await self._release(session)
+
+    async def warm_up(self) -> None:
+        """Ensure at least one healthy process is running."""
+        session = await self._acquire()
+        await self._release(session)
+
+    async def _acquire(self) -> StdioSession:
+        """Pick the least busy healthy session, spawning one if needed."""
+        retired: list[StdioSession] = []
+        try:
+            async with self._spawn_done:
+                while True:
+                    retired.extend(self._drop_unhealthy())
+
+                    session = min(
+                        self.sessions, key=lambda s: s.in_flight, default=None
+                    )
+                    can_spawn = (
+                        len(self.sessions) + self._spawning < self.config.max_size
+                    )
+                    if session is not None and (
+                        session.in_flight < self.config.max_in_flight
+                        or not can_spawn
+                    ):
+                        session.in_flight += 1
+                        session.total_requests += 1
+                        return session
+                    if can_spawn:
+                        break
+                    # Every slot is taken by a process still starting up
+                    await self._spawn_done.wait()
+
+                # Reserve the slot; the process is started without the lock so
+                # requests for warm sessions are not held up by a cold start
+                self._spawning += 1
+        finally:
+            await self._disconnect(retired)
+
+        session = None
+        try:
+            session = await self._spawn()
+        finally:
+            async with self._spawn_done:
+                self._spawning -= 1
+                if session is not None:
+                    self.sessions.append(session)
+                    session.in_flight += 1
+                    session.total_requests += 1
+                self._spawn_done.notify_all()
+
+        return session
+
+    async def _release(self, session: StdioSession) -> None:
+        """Return a session to the pool, discarding it if it died."""
+        async with self._lock:
+            session.in_flight -= 1
+            session.last_used = time.time()
+            if session.is_healthy:
+                return
+
+            if session in self.sessions:
+                self.sessions.remove(session)
+                self._respawned += 1
+                logger.warning(f"Discarding dead stdio session: {self.command}")
+            elif session not in self._retiring:
+                return
+
+            if session.in_flight:
+                self._retiring.add(session)
+                return
+            self._retiring.discard(session)
+
+        # The last request of a dead session cleans up its process
+        await session.connection.disconnect()
+
+    def _drop_unhealthy(self) -> list[StdioSession]:
+        """
+        Remove sessions whose process has exited.
+
+        Returns:
+            Dropped sessions with no requests left, to be disconnected once
+            the pool lock is released
+        """
+        retired = []
+        for session in [s for s in self.sessions if not s.is_healthy]:
+            self.sessions.remove(session)
+            self._respawned += 1
+            logger.warning(f"Respawning dead stdio session: {self.command}")
+            if session.in_flight:
+                # Disconnected by _release once its last request returns
+                self._retiring.add(session)
+            else:
+                retired.append(session)
+        return retired
+
+    @staticmethod
+    async def _disconnect(sessions: list[StdioSession]) -> None:
+        """Terminate the processes of sessions no longer in the pool."""
+        if sessions:
+            await asyncio.gather(
+                *(session.connection.disconnect() for session in sessions)
+            )
+
+    async def _spawn(self) -> StdioSession:
+        """Start a new server process and perform the MCP handshake."""
+        connection = StdioMCPConnection(self.command, self.timeout)
+        await connection.connect()
+
+        if self.config.handshake:
+            try:
+                response = await connection.request(
+                    "initialize",
+                    {
+                        "protocolVersion": MCP_PROTOCOL_VERSION,
+                        "capabilities": {},
+                        "clientInfo": {"name": "metamcp-proxy", "version": "1.0.0"},
+                    },
+                )
+                if "error" in response:
+                    logger.warning(
+                        f"Stdio server rejected initialize: {response['error']}"
+                    )
+                else:
+                    await connection.notify("notifications/initialized")
+            except Exception:
+                await connection.disconnect()
+                raise
+
+        self._spawned += 1
+        return StdioSession(connection)
+
+    async def reap_idle(self) -> int:
+        """Terminate sessions idle for longer than the configured timeout."""
+        now = time.time()
+        async with self._lock:
+            idle = [
+                s
+                for s in self.sessions
+                if s.idle_for(now) > self.config.idle_timeout
+            ]
+            for session in idle:
+                self.sessions.remove(session)
+
+        await self._disconnect(idle)
+        self._reaped += len(idle)
+        return len(idle)
+
+    async def close(self) -> None:
+        """Terminate all pooled processes."""
+        async with self._lock:
+            sessions = [*self.sessions, *self._retiring]
+            self.sessions.clear()
+            self._retiring.clear()
+
+        await self._disconnect(sessions)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "command": self.command,
+            "size": len(self.sessions),
+            "spawning": self._spawning,
+            "in_flight": sum(s.in_flight for s in self.sessions),
+            "spawned": self._spawned,
+            "respawned": self._respawned,
+            "reaped": self._reaped,
+        }
+
+
+class StdioPoolManager:
+    """Registry of stdio session pools keyed by server command."""
+
+    def __init__(
+        self,
+        config: StdioPoolConfig | None = None,
+        reap_interval: float = DEFAULT_STDIO_POOL_REAP_INTERVAL,
+    ):
+        """Initialize stdio pool manager."""
+        self.config = config or StdioPoolConfig()
+        self.reap_interval = reap_interval
+        self.pools: dict[str, StdioSessionPool] = {}
+        self._reaper_task: asyncio.Task | None = None
+
+    def get_pool(self, command: str, timeout: int = 30) -> StdioSessionPool:
+        """Get or create the pool for a server command."""
+        pool = self.pools.get(command)
+        if pool is None:
+            pool = StdioSessionPool(command, timeout, self.config)
+            self.pools[command] = pool
+        self._start_reaper()
+        return pool
+
+    def _start_reaper(self) -> None:
+        """Start the idle reaper task if it is not running."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reaper_loop())
+
+    async def _reaper_loop(self) -> None:
+        """Background loop terminating idle processes."""
+        while True:
+            try:
+                await asyncio.sleep(self.reap_interval)
+                for pool in list(self.pools.values()):
+                    await pool.reap_idle()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Stdio pool reaper error: {e}")
+
+    async def close(self) -> None:
+        """Stop the reaper and terminate all pools."""
+        if self._reaper_task:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+        for pool in self.pools.values():
+            await pool.close()
+        self.pools.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get statistics for all pools."""
+        return {command: pool.get_stats() for command, pool in self.pools.items()}
@@ -0,0 +1,250 @@
+"""
+WebSocket MCP Transport
+
+This module provides persistent WebSocket sessions for wrapped MCP servers.
+Concurrent tool calls to the same endpoint share one socket; responses are
+routed back to their callers by JSON-RPC id.
+"""
+
+import asyncio
+import itertools
+import json
+from typing import Any
+
+from ..exceptions import ProxyError
+from ..utils.constants import (
+    DEFAULT_WEBSOCKET_MAX_RECONNECT_ATTEMPTS,
+    DEFAULT_WEBSOCKET_PING_INTERVAL,
+    DEFAULT_WEBSOCKET_PING_TIMEOUT,
+    DEFAULT_WEBSOCKET_RECONNECT_BASE_DELAY,
+    DEFAULT_WEBSOCKET_RECONNECT_MAX_DELAY,
+)
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class WebSocketMCPSession:
+    """
+    Persistent, multiplexed WebSocket connection to one MCP server.
+
+    A reader task resolves the future registered for each outstanding
+    JSON-RPC id. Liveness is enforced with protocol-level pings; when the
+    socket drops, outstanding requests fail and the next request reconnects
+    with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout: int = 30,
+        ping_interval: float = DEFAULT_WEBSOCKET_PING_INTERVAL,
+        ping_timeout: float = DEFAULT_WEBSOCKET_PING_TIMEOUT,
+        max_reconnect_attempts: int = DEFAULT_WEBSOCKET_MAX_RECONNECT_ATTEMPTS,
+        reconnect_base_delay: float = DEFAULT_WEBSOCKET_RECONNECT_BASE_DELAY,
+        reconnect_max_delay: float = DEFAULT_WEBSOCKET_RECONNECT_MAX_DELAY,
+    ):
+        """Initialize WebSocket session."""
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_base_delay = reconnect_base_delay
+        self.reconnect_max_delay = reconnect_max_delay
+
+        self.websocket = None
+        self._connected = False
+        self._request_ids = itertools.count(1)
+        self._pending: dict[Any, asyncio.Future] = {}
+        self._reader_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+        self.connects = 0
+        self.reconnects = 0
+        self.total_requests = 0
+
+    async def connect(self) -> None:
+        """Open the socket, retrying with exponential backoff."""
+        async with self._lock:
+            if self.is_connected:
+                return
+
+            import websockets
+
+            # A socket that dropped may still have a reader running; it must
+            # not outlive the socket or touch the session after reconnecting
+            await self._close_socket(ProxyError("WebSocket connection closed"))
+
+            last_error: Exception | None = None
+            for attempt in range(self.max_reconnect_attempts):
+                try:
+                    self.websocket = await websockets.connect(
+                        self.endpoint,
+                        open_timeout=self.timeout,
+                        ping_interval=self.ping_interval,
+                        ping_timeout=self.ping_timeout,
+                    )
+                    break
+                except Exception as e:
+                    last_error = e
+                    delay = min(
+                        self.reconnect_base_delay * (2**attempt),
+                        self.reconnect_max_delay,
+                    )
+                    logger.warning(
+                        f"WebSocket connect to {self.endpoint} failed "
+                        f"(attempt {attempt + 1}), retrying in {delay:.1f}s: {e}"
+                    )
+                    if attempt < self.max_reconnect_attempts - 1:
+                        await asyncio.sleep(delay)
+            else:
+                raise ProxyError(f"WebSocket connection failed: {str(last_error)}")
+
+            if self.connects:
+                self.reconnects += 1
+            self.connects += 1
+            self._connected = True
+            self._reader_task = asyncio.create_task(self._read_loop(self.websocket))
+            logger.info(f"Connected to WebSocket MCP server: {self.endpoint}")
+
+    async def request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Send a JSON-RPC request and wait for its response."""
+        if not self.is_connected:
+            await self.connect()
+
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.total_requests += 1
+
+        try:
+            await self.websocket.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": method,
+                        "params": params or {},
+                    }
+                )
+            )
+            return await asyncio.wait_for(future, timeout or self.timeout)
+        except asyncio.TimeoutError:
+            raise ProxyError(
+                f"WebSocket request timed out after {timeout or self.timeout}s"
+            )
+        except ProxyError:
+            raise
+        except Exception as e:
+            # This request reports the error itself; fail the others on the socket
+            self._pending.pop(request_id, None)
+            self._fail_pending(ProxyError(f"WebSocket communication failed: {e}"))
+            raise ProxyError(f"WebSocket communication failed: {str(e)}")
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_loop(self, websocket: Any) -> None:
+        """Route messages from one socket to their waiting requests."""
+        try:
+            async for raw in websocket:
+                try:
+                    message = json.loads(raw)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Invalid JSON from WebSocket server: {e}")
+                    continue
+                if not isinstance(message, dict):
+                    logger.warning(
+                        f"Ignoring non-object message from WebSocket server: {raw!r}"
+                    )
+                    continue
+
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"WebSocket connection to {self.endpoint} lost: {e}")
+
+        # Only the reader of the current socket may mark the session down
+        if websocket is self.websocket:
+            self._fail_pending(ProxyError("WebSocket connection closed"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Mark the session disconnected and fail outstanding requests."""
+        self._connected = False
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self) -> None:
+        """Close the socket and stop the reader."""
+        await self._close_socket(ProxyError("WebSocket session closed"))
+
+    async def _close_socket(self, error: Exception) -> None:
+        """Stop the reader, close the socket and fail outstanding requests."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception as e:
+                logger.debug(f"Error closing WebSocket {self.endpoint}: {e}")
+            self.websocket = None
+        self._fail_pending(error)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests awaiting a response."""
+        return len(self._pending)
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the socket is open."""
+        return self._connected and self.websocket is not None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get session statistics."""
+        return {
+            "endpoint": self.endpoint,
+            "connected": self.is_connected,
+            "in_flight": self.in_flight,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "total_requests": self.total_requests,
+        }
+
+
+class WebSocketSessionManager:
+    """Registry of persistent WebSocket sessions keyed by endpoint."""
+
+    def __init__(self):
+        """Initialize WebSocket session manager."""
+        self.sessions: dict[str, WebSocketMCPSession] = {}
+
+    def get_session(self, endpoint: str, timeout: int = 30) -> WebSocketMCPSession:
+        """Get or create the session for an endpoint."""
+        session = self.sessions.get(endpoint)
+        if session is None:
+            session = WebSocketMCPSession(endpoint, timeout)
+            self.sessions[endpoint] = session
+        return session
+
+    async def close(self) -> None:
+        """Close all sessions."""
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get statistics for all sessions."""
+        return {
+            endpoint: session.get_stats() for endpoint, session in self.sessions.items()
+        }
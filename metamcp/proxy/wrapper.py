@@ -5,8 +5,6 @@ This module provides the main wrapper functionality for arbitrary MCP servers,
 adding MetaMCP's enhanced features like semantic search, security, and monitoring.
 """
 
-import json
-import subprocess
 from dataclasses import dataclass
 from typing import Any
 
@@ -16,9 +14,12 @@ from mcp.types import Resource, TextContent, Tool
 from ..config import get_settings
 from ..exceptions import ProxyError, ToolExecutionError
 from ..monitoring.telemetry import TelemetryManager
+from ..performance.http_client import HTTPClientManager, get_http_client_manager
 from ..security.auth import AuthManager
 from ..security.policies import PolicyEngine, PolicyEngineType
 from ..utils.logging import get_logger
+from .stdio import StdioPoolConfig, StdioPoolManager
+from .websocket import WebSocketSessionManager
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -41,83 +42,6 @@ class WrappedServerConfig:
     metadata: dict[str, Any] = None
 
 
-class StdioMCPConnection:
-    """Manages stdio-based MCP server connections."""
-
-    def __init__(self, command: str, timeout: int = 30):
-        """Initialize stdio connection."""
-        self.command = command
-        self.timeout = timeout
-        self.process: subprocess.Popen | None = None
-        self._connected = False
-
-    async def connect(self) -> None:
-        """Start the stdio MCP server process."""
-        try:
-            # Split command into list for subprocess
-            cmd_parts = self.command.split()
-
-            self.process = subprocess.Popen(
-                cmd_parts,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
-            )
-
-            self._connected = True
-            logger.info(f"Started stdio MCP server: {self.command}")
-
-        except Exception as e:
-            logger.error(f"Failed to start stdio MCP server: {e}")
-            raise ProxyError(f"Stdio connection failed: {str(e)}")
-
-    async def send_message(self, message: dict[str, Any]) -> dict[str, Any]:
-        """Send JSON-RPC message to stdio server."""
-        if not self.process or not self._connected:
-            raise ProxyError("Stdio connection not established")
-
-        try:
-            # Send message
-            message_str = json.dumps(message) + "\n"
-            self.process.stdin.write(message_str)
-            self.process.stdin.flush()
-
-            # Read response
-            response_line = self.process.stdout.readline()
-            if not response_line:
-                raise ProxyError("No response from stdio server")
-
-            response = json.loads(response_line.strip())
-            return response
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from stdio server: {e}")
-            raise ProxyError(f"Invalid JSON response: {str(e)}")
-        except Exception as e:
-            logger.error(f"Stdio communication error: {e}")
-            raise ProxyError(f"Stdio communication failed: {str(e)}")
-
-    async def disconnect(self) -> None:
-        """Disconnect from stdio server."""
-        if self.process:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-            finally:
-                self.process = None
-                self._connected = False
-                logger.info("Disconnected from stdio MCP server")
-
-    @property
-    def is_connected(self) -> bool:
-        """Check if stdio connection is active."""
-        return self._connected and self.process is not None
-
-
 class MCPProxyWrapper:
     """
     Proxy wrapper for arbitrary MCP servers.
@@ -126,10 +50,20 @@ class MCPProxyWrapper:
     features like semantic search, security, and monitoring.
     """
 
-    def __init__(self):
+    def __init__(self, http_client: HTTPClientManager | None = None):
         """Initialize the MCP proxy wrapper."""
         self.wrapped_servers: dict[str, WrappedServerConfig] = {}
-        self.stdio_connections: dict[str, StdioMCPConnection] = {}
+        self.http_client = http_client or get_http_client_manager()
+        self.stdio_pools = StdioPoolManager(
+            StdioPoolConfig(
+                max_size=settings.stdio_pool_max_size,
+                max_in_flight=settings.stdio_pool_max_in_flight,
+                idle_timeout=settings.stdio_pool_idle_timeout,
+                handshake=settings.stdio_pool_handshake,
+            ),
+            reap_interval=settings.stdio_pool_reap_interval,
+        )
+        self.websocket_sessions = WebSocketSessionManager()
         self.fastmcp: FastMCP | None = None
         self.auth_manager: AuthManager | None = None
         self.policy_engine: PolicyEngine | None = None
@@ -219,34 +153,31 @@ class MCPProxyWrapper:
 
     async def _test_http_connection(self, config: WrappedServerConfig) -> None:
         """Test HTTP connection to MCP server."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            try:
-                response = await client.get(f"{config.endpoint}/health")
-                if response.status_code != 200:
-                    raise ProxyError(
-                        f"Server health check failed: {response.status_code}"
-                    )
-            except Exception as e:
-                raise ProxyError(f"HTTP connection failed: {str(e)}")
+        try:
+            response = await self.http_client.get(
+                f"{config.endpoint}/health", timeout=config.timeout
+            )
+            if response.status_code != 200:
+                raise ProxyError(f"Server health check failed: {response.status_code}")
+        except Exception as e:
+            raise ProxyError(f"HTTP connection failed: {str(e)}")
 
     async def _test_websocket_connection(self, config: WrappedServerConfig) -> None:
         """Test WebSocket connection to MCP server."""
-        import websockets
-
         try:
-            async with websockets.connect(config.endpoint, timeout=config.timeout):
-                pass
+            session = self.websocket_sessions.get_session(
+                config.endpoint, config.timeout
+            )
+            await session.connect()
         except Exception as e:
             raise ProxyError(f"WebSocket connection failed: {str(e)}")
 
     async def _test_stdio_connection(self, config: WrappedServerConfig) -> None:
         """Test stdio connection to MCP server."""
         try:
-            connection = StdioMCPConnection(config.endpoint)
-            await connection.connect()
-            await connection.disconnect()
+            # Warm the pool so tool discovery reuses the same process
+            pool = self.stdio_pools.get_pool(config.endpoint, config.timeout)
+            await pool.warm_up()
         except Exception as e:
             raise ProxyError(f"Stdio connection failed: {str(e)}")
 
@@ -296,44 +227,30 @@ class MCPProxyWrapper:
         self, config: WrappedServerConfig
     ) -> list[dict[str, Any]]:
         """Get tools from HTTP MCP server."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            headers = {}
-            if config.auth_required and config.auth_token:
-                headers["Authorization"] = f"Bearer {config.auth_token}"
+        headers = {}
+        if config.auth_required and config.auth_token:
+            headers["Authorization"] = f"Bearer {config.auth_token}"
 
-            response = await client.post(
-                f"{config.endpoint}/tools/list", headers=headers
-            )
+        response = await self.http_client.post(
+            f"{config.endpoint}/tools/list", headers=headers, timeout=config.timeout
+        )
 
-            if response.status_code != 200:
-                raise ProxyError(f"Failed to get tools: {response.status_code}")
+        if response.status_code != 200:
+            raise ProxyError(f"Failed to get tools: {response.status_code}")
 
-            return response.json().get("tools", [])
+        return response.json().get("tools", [])
 
     async def _get_websocket_server_tools(
         self, config: WrappedServerConfig
     ) -> list[dict[str, Any]]:
         """Get tools from WebSocket MCP server."""
-        import json
-
-        import websockets
+        session = self.websocket_sessions.get_session(config.endpoint, config.timeout)
+        result = await session.request("tools/list")
 
-        async with websockets.connect(
-            config.endpoint, timeout=config.timeout
-        ) as websocket:
-            # Send tools/list request
-            request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}
+        if "error" in result:
+            raise ProxyError(f"WebSocket tools/list failed: {result['error']}")
 
-            await websocket.send(json.dumps(request))
-            response = await websocket.recv()
-            result = json.loads(response)
-
-            if "error" in result:
-                raise ProxyError(f"WebSocket tools/list failed: {result['error']}")
-
-            return result.get("result", {}).get("tools", [])
+        return result.get("result", {}).get("tools", [])
 
     async def _get_stdio_server_tools(
         self, config: WrappedServerConfig
@@ -342,20 +259,13 @@ class MCPProxyWrapper:
         if not config.auth_required or not config.auth_token:
             raise ProxyError("Stdio server requires authentication token")
 
-        connection = StdioMCPConnection(config.endpoint, config.timeout)
-        await connection.connect()
+        pool = self.stdio_pools.get_pool(config.endpoint, config.timeout)
+        response = await pool.request("tools/list")
 
-        try:
-            # Send tools/list request
-            request = {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}
-            response = await connection.send_message(request)
+        if "error" in response:
+            raise ProxyError(f"Stdio tools/list failed: {response['error']}")
 
-            if "error" in response:
-                raise ProxyError(f"Stdio tools/list failed: {response['error']}")
-
-            return response.get("result", {}).get("tools", [])
-        finally:
-            await connection.disconnect()
+        return response.get("result", {}).get("tools", [])
 
     def _wrap_tool(
         self, tool: dict[str, Any], server_id: str, config: WrappedServerConfig
@@ -451,54 +361,39 @@ class MCPProxyWrapper:
         self, tool_name: str, config: WrappedServerConfig, args: dict[str, Any]
     ) -> Any:
         """Execute tool via HTTP."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            headers = {"Content-Type": "application/json"}
-            if config.auth_required and config.auth_token:
-                headers["Authorization"] = f"Bearer {config.auth_token}"
-
-            response = await client.post(
-                f"{config.endpoint}/tools/call",
-                headers=headers,
-                json={"name": tool_name, "arguments": args},
+        headers = {"Content-Type": "application/json"}
+        if config.auth_required and config.auth_token:
+            headers["Authorization"] = f"Bearer {config.auth_token}"
+
+        response = await self.http_client.post(
+            f"{config.endpoint}/tools/call",
+            headers=headers,
+            json={"name": tool_name, "arguments": args},
+            timeout=config.timeout,
+        )
+
+        if response.status_code != 200:
+            raise ToolExecutionError(
+                f"HTTP tool execution failed: {response.status_code}"
             )
 
-            if response.status_code != 200:
-                raise ToolExecutionError(
-                    f"HTTP tool execution failed: {response.status_code}"
-                )
-
-            return response.json().get("result")
+        return response.json().get("result")
 
     async def _execute_websocket_tool(
         self, tool_name: str, config: WrappedServerConfig, args: dict[str, Any]
     ) -> Any:
         """Execute tool via WebSocket."""
-        import json
-
-        import websockets
-
-        async with websockets.connect(
-            config.endpoint, timeout=config.timeout
-        ) as websocket:
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {"name": tool_name, "arguments": args},
-            }
-
-            await websocket.send(json.dumps(request))
-            response = await websocket.recv()
-            result = json.loads(response)
-
-            if "error" in result:
-                raise ToolExecutionError(
-                    f"WebSocket tool execution failed: {result['error']}"
-                )
+        session = self.websocket_sessions.get_session(config.endpoint, config.timeout)
+        result = await session.request(
+            "tools/call", {"name": tool_name, "arguments": args}
+        )
+
+        if "error" in result:
+            raise ToolExecutionError(
+                f"WebSocket tool execution failed: {result['error']}"
+            )
 
-            return result.get("result")
+        return result.get("result")
 
     async def _execute_stdio_tool(
         self, tool_name: str, config: WrappedServerConfig, args: dict[str, Any]
@@ -507,26 +402,17 @@ class MCPProxyWrapper:
         if not config.auth_required or not config.auth_token:
             raise ProxyError("Stdio server requires authentication token")
 
-        connection = StdioMCPConnection(config.endpoint, config.timeout)
-        await connection.connect()
+        pool = self.stdio_pools.get_pool(config.endpoint, config.timeout)
+        response = await pool.request(
+            "tools/call", {"name": tool_name, "arguments": args}
+        )
 
-        try:
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {"name": tool_name, "arguments": args},
-            }
-            response = await connection.send_message(request)
-
-            if "error" in response:
-                raise ToolExecutionError(
-                    f"Stdio tool execution failed: {response['error']}"
-                )
+        if "error" in response:
+            raise ToolExecutionError(
+                f"Stdio tool execution failed: {response['error']}"
+            )
 
-            return response.get("result")
-        finally:
-            await connection.disconnect()
+        return response.get("result")
 
     async def _handle_list_tools(self) -> list[Tool]:
         """Handle list tools request."""
@@ -586,6 +472,8 @@ class MCPProxyWrapper:
     async def shutdown(self) -> None:
         """Shutdown the proxy wrapper."""
         logger.info("Shutting down MCP Proxy Wrapper...")
+        await self.stdio_pools.close()
+        await self.websocket_sessions.close()
         self._initialized = False
 
     @property
@@ -7,15 +7,22 @@ request sanitization, and security headers.
 
 from __future__ import annotations
 
+import json
+import math
 import re
+from collections.abc import Callable, Coroutine
+from datetime import UTC
 from typing import Any
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message
 
 from ..config import get_settings
 from ..utils.logging import get_logger
+from .rate_limiting import RateLimiter, RateLimitStrategy
 
 try:
     # Prefer redis.asyncio (available in redis>=4.2)
@@ -27,6 +34,32 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
+class RequestBodyTooLarge(Exception):
+    """Raised when a request body exceeds the configured size limit."""
+
+
+class PreparsedBodyRoute(APIRoute):
+    """
+    Route that reuses the JSON body already parsed by SecurityMiddleware.
+
+    Routers handling large payloads can set ``route_class=PreparsedBodyRoute``
+    so FastAPI validates the body without decoding it a second time.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Get the route handler."""
+        handler = super().get_route_handler()
+
+        async def preparsed_body_handler(request: Request) -> Response:
+            json_body = getattr(request.state, "json_body", None)
+            if json_body is not None:
+                # Seed the cache Request.json() reads before parsing
+                request._json = json_body
+            return await handler(request)
+
+        return preparsed_body_handler
+
+
 class SecurityMiddleware(BaseHTTPMiddleware):
     """
     Security middleware for input validation and request sanitization.
@@ -53,6 +86,32 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             re.IGNORECASE,
         )
 
+        # Single automata scanning for every content attack at once
+        content_patterns = {
+            "sql_injection": self.sql_injection_pattern,
+            "xss": self.xss_pattern,
+            "command_injection": self.command_injection_pattern,
+        }
+        self.content_pattern = self._combine_patterns(content_patterns)
+        self.malicious_pattern = self._combine_patterns(
+            {**content_patterns, "path_traversal": self.path_traversal_pattern}
+        )
+
+        # Request body limits
+        self.max_body_size = self.settings.security_max_body_size
+        self.max_json_depth = self.settings.security_max_json_depth
+
+    @staticmethod
+    def _combine_patterns(patterns: dict[str, re.Pattern]) -> re.Pattern:
+        """Combine patterns into one alternation with a named group each."""
+        return re.compile(
+            "|".join(
+                [f"(?P<{name}>{pattern.pattern})" for name, pattern in patterns.items()]
+                + ["(?P<null_byte>\x00)"]
+            ),
+            re.IGNORECASE,
+        )
+
     async def dispatch(self, request: Request, call_next):
         """Process request through security middleware."""
         try:
@@ -73,7 +132,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                 body_validation = await self._validate_request_body(request)
                 if not body_validation["valid"]:
                     return JSONResponse(
-                        status_code=400,
+                        status_code=body_validation.get("status_code", 400),
                         content={
                             "error": f"Invalid request body: {body_validation['reason']}"
                         },
@@ -138,26 +197,49 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         return True
 
     async def _validate_request_body(self, request: Request) -> dict[str, Any]:
-        """Validate request body for malicious content."""
+        """
+        Validate request body for malicious content.
+
+        The body is streamed once under the size limit. JSON bodies are
+        parsed once and handed to downstream handlers through
+        ``request.state.json_body``.
+        """
         try:
+            try:
+                body = await self._read_body(request)
+            except RequestBodyTooLarge:
+                logger.warning(f"Request body exceeds {self.max_body_size} bytes")
+                return {
+                    "valid": False,
+                    "reason": "Request body too large",
+                    "status_code": 413,
+                }
+
             # Get content type
             content_type = request.headers.get("content-type", "")
 
             if "application/json" in content_type:
                 # Validate JSON body
-                body = await request.json()
-                return self._validate_json_body(body)
-            elif "application/x-www-form-urlencoded" in content_type:
+                if not body:
+                    return {"valid": True}
+                json_body = json.loads(
+                    body,
+                    parse_float=self._parse_float,
+                    parse_constant=self._reject_constant,
+                )
+                result = self._validate_json_body(json_body)
+                if result["valid"]:
+                    request.state.json_body = json_body
+                return result
+            elif (
+                "application/x-www-form-urlencoded" in content_type
+                or "multipart/form-data" in content_type
+            ):
                 # Validate form data
                 form_data = await request.form()
                 return self._validate_form_data(form_data)
-            elif "multipart/form-data" in content_type:
-                # Validate multipart form data
-                form_data = await request.form()
-                return self._validate_form_data(form_data)
             else:
-                # For other content types, read as text and validate
-                body = await request.body()
+                # For other content types, validate as text
                 body_text = body.decode("utf-8", errors="ignore")
                 return self._validate_text_body(body_text)
 
@@ -165,69 +247,101 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             logger.error(f"Error validating request body: {e}")
             return {"valid": False, "reason": "Invalid request body format"}
 
-    def _validate_json_body(self, body: Any) -> dict[str, Any]:
-        """Validate JSON request body."""
-        if isinstance(body, dict):
-            return self._validate_dict(body)
-        elif isinstance(body, list):
-            return self._validate_list(body)
-        elif isinstance(body, (str, int, float, bool)):
-            return self._validate_primitive(body)
-        else:
-            return {"valid": False, "reason": "Unsupported JSON type"}
-
-    def _validate_dict(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Validate dictionary data."""
-        for key, value in data.items():
-            # Validate key
-            if not self._validate_string(key):
-                return {"valid": False, "reason": f"Invalid key: {key}"}
-
-            # Validate value
-            if isinstance(value, dict):
-                result = self._validate_dict(value)
-                if not result["valid"]:
-                    return result
-            elif isinstance(value, list):
-                result = self._validate_list(value)
-                if not result["valid"]:
-                    return result
-            else:
-                result = self._validate_primitive(value)
-                if not result["valid"]:
-                    return result
+    async def _read_body(self, request: Request) -> bytes:
+        """
+        Read the request body, enforcing the size limit as chunks arrive.
 
-        return {"valid": True}
+        Raises:
+            RequestBodyTooLarge: If the body exceeds the configured limit
+        """
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > self.max_body_size:
+            raise RequestBodyTooLarge()
+
+        chunks = []
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise RequestBodyTooLarge()
+            chunks.append(chunk)
+
+        body = b"".join(chunks)
+        # Same cache Request.body() fills, for later reads in this middleware
+        request._body = body
+        self._replay_body(request, body)
+        return body
+
+    @staticmethod
+    def _replay_body(request: Request, body: bytes) -> None:
+        """
+        Hand the consumed body on to the downstream application.
 
-    def _validate_list(self, data: list[Any]) -> dict[str, Any]:
-        """Validate list data."""
-        for item in data:
-            if isinstance(item, dict):
-                result = self._validate_dict(item)
-            elif isinstance(item, list):
-                result = self._validate_list(item)
-            else:
-                result = self._validate_primitive(item)
+        ``call_next`` reads the body through ``request.receive``, which
+        would otherwise wait on a stream this middleware already drained.
+        """
+        receive = request._receive
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if replayed:
+                return await receive()
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        request._receive = replay_receive
+
+    @staticmethod
+    def _parse_float(value: str) -> float:
+        """Parse a JSON float, rejecting values that overflow to infinity."""
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError(f"Invalid numeric value: {value}")
+        return number
+
+    @staticmethod
+    def _reject_constant(value: str) -> float:
+        """Reject the non-standard NaN, Infinity and -Infinity literals."""
+        raise ValueError(f"Invalid numeric value: {value}")
 
-            if not result["valid"]:
-                return result
+    def _validate_json_body(self, body: Any) -> dict[str, Any]:
+        """
+        Validate JSON request body.
 
-        return {"valid": True}
+        Walks the document once without recursion, enforcing the depth
+        limit and collecting every key and string value, then scans all of
+        them with a single pass of the combined pattern.
+        """
+        strings: list[str] = []
+        stack: list[tuple[Any, int]] = [(body, 1)]
 
-    def _validate_primitive(self, value: Any) -> dict[str, Any]:
-        """Validate primitive values."""
-        if isinstance(value, str):
-            if not self._validate_string(value):
-                return {"valid": False, "reason": f"Invalid string value: {value}"}
-        elif isinstance(value, (int, float)):
-            # Validate numeric values
-            if not self._validate_number(value):
-                return {"valid": False, "reason": f"Invalid numeric value: {value}"}
-        elif isinstance(value, bool):
-            # Boolean values are always valid
-            pass
-        else:
-            return {"valid": False, "reason": f"Unsupported value type: {type(value)}"}
+        while stack:
+            value, depth = stack.pop()
+            if isinstance(value, dict):
+                if depth > self.max_json_depth:
+                    return {"valid": False, "reason": "JSON nesting too deep"}
+                strings.extend(value)
+                stack.extend((item, depth + 1) for item in value.values())
+            elif isinstance(value, list):
+                if depth > self.max_json_depth:
+                    return {"valid": False, "reason": "JSON nesting too deep"}
+                stack.extend((item, depth + 1) for item in value)
+            elif isinstance(value, str):
+                strings.append(value)
+
+        # \x01 is neither a word nor a whitespace character, so no pattern
+        # can match across two joined strings
+        match = self.content_pattern.search("\x01".join(strings))
+        if match:
+            logger.warning(
+                f"{match.lastgroup} attempt detected in request body: "
+                f"{match.group(0)!r}"
+            )
+            return {
+                "valid": False,
+                "reason": f"Invalid string value: {match.lastgroup}",
+            }
 
         return {"valid": True}
 
@@ -236,32 +350,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         if not isinstance(value, str):
             return False
 
-        # Check for SQL injection
-        if self.sql_injection_pattern.search(value):
-            logger.warning(f"SQL injection attempt detected: {value}")
-            return False
-
-        # Check for XSS
-        if self.xss_pattern.search(value):
-            logger.warning(f"XSS attempt detected: {value}")
-            return False
-
-        # Check for command injection
-        if self.command_injection_pattern.search(value):
-            logger.warning(f"Command injection attempt detected: {value}")
-            return False
-
-        # Check for null bytes
-        if "\x00" in value:
-            logger.warning(f"Null byte detected in string: {value}")
-            return False
-
-        return True
-
-    def _validate_number(self, value: float) -> bool:
-        """Validate numeric values."""
-        # Check for NaN or infinity
-        if not (float("-inf") < value < float("inf")):
+        match = self.content_pattern.search(value)
+        if match:
+            logger.warning(f"{match.lastgroup} attempt detected: {value}")
             return False
 
         return True
@@ -304,13 +395,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         if not isinstance(value, str):
             return False
 
-        return (
-            self.sql_injection_pattern.search(value)
-            or self.xss_pattern.search(value)
-            or self.path_traversal_pattern.search(value)
-            or self.command_injection_pattern.search(value)
-            or "\x00" in value
-        )
+        return self.malicious_pattern.search(value) is not None
 
     def _add_security_headers(self, response: Response) -> Response:
         """Add security headers to response."""
@@ -345,12 +430,20 @@ class SecurityMiddleware(BaseHTTPMiddleware):
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware.
+
+    With Redis, requests are checked by a shared RateLimiter using the
+    configured strategy and token leasing; otherwise each process keeps
+    its own sliding window counters.
     """
 
     def __init__(self, app):
         super().__init__(app)
         self.settings = get_settings()
-        self.request_counts: dict[str, list[int]] = {}
+        # Per-IP sliding window counters: (window start, previous count,
+        # current count)
+        self.request_counts: dict[str, tuple[int, int, int]] = {}
+        self._last_sweep_window = 0
+        self._limiter: RateLimiter | None = None
 
         # Lazy Redis client for distributed rate limiting
         self._redis: AsyncRedis | None = None
@@ -402,40 +495,70 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Check if client has exceeded rate limit.
         Returns (allowed, limit, remaining, reset_epoch_seconds).
         """
+        # Distributed rate limiting using Redis if available; the limiter
+        # falls back to its own in-memory state if Redis fails
+        if self._redis is not None:
+            limiter = await self._get_limiter()
+            result = await limiter.check_rate_limit(f"ip:{client_ip}")
+            reset = int(result.reset_time.replace(tzinfo=UTC).timestamp())
+            return (result.allowed, result.limit, result.remaining, reset)
+
         limit = self.settings.rate_limit_requests
         window = self.settings.rate_limit_window
-        current_time = int(time.time())
+        now = time.time()
+        current_time = int(now)
         window_start = current_time - (current_time % window)
         reset = window_start + window
 
-        # Distributed rate limiting using Redis if available
-        if self._redis is not None:
-            key = f"rl:{client_ip}:{window_start}:{window}"
-            try:
-                # Use INCR with expiry for atomic counter per window
-                count = await self._redis.incr(key)
-                if count == 1:
-                    await self._redis.expire(key, window)
-                remaining = max(0, limit - count)
-                return (count <= limit, limit, remaining, reset)
-            except Exception as e:  # pragma: no cover
-                logger.error(f"Redis rate limiting failed, falling back to memory: {e}")
-                # fall back to memory
-
-        # Fallback: in-memory per-process
-        if client_ip not in self.request_counts:
-            self.request_counts[client_ip] = []
-        # Remove old requests outside the window
-        self.request_counts[client_ip] = [
-            ts for ts in self.request_counts[client_ip] if ts > current_time - window
-        ]
-        if len(self.request_counts[client_ip]) >= limit:
-            remaining = 0
-            return (False, limit, remaining, reset)
-        self.request_counts[client_ip].append(current_time)
-        remaining = max(0, limit - len(self.request_counts[client_ip]))
+        # Fallback: in-memory per-process sliding window counter
+        if window_start != self._last_sweep_window:
+            self._sweep_request_counts(window_start - window)
+            self._last_sweep_window = window_start
+
+        counted_start, previous, current = self.request_counts.get(
+            client_ip, (window_start, 0, 0)
+        )
+        if counted_start != window_start:
+            previous = current if counted_start == window_start - window else 0
+            current = 0
+
+        # Weight the previous window by how much of it still overlaps the
+        # sliding window ending now
+        weight = 1 - (now - window_start) / window
+        estimated = previous * max(0.0, weight) + current
+        if estimated + 1 > limit:
+            self.request_counts[client_ip] = (window_start, previous, current)
+            return (False, limit, 0, reset)
+
+        self.request_counts[client_ip] = (window_start, previous, current + 1)
+        remaining = max(0, int(limit - estimated - 1))
         return (True, limit, remaining, reset)
 
+    async def _get_limiter(self) -> RateLimiter:
+        """Get the Redis-backed limiter, starting it on first use."""
+        if self._limiter is None:
+            self._limiter = RateLimiter(redis=self._redis)
+            self._limiter.global_config.update(
+                default_limit=self.settings.rate_limit_requests,
+                default_window=self.settings.rate_limit_window,
+                default_strategy=RateLimitStrategy(self.settings.rate_limit_strategy),
+                default_lease_size=self.settings.rate_limit_lease_size,
+                default_lease_ttl=self.settings.rate_limit_lease_ttl,
+            )
+            # Loads the scripts and sweeps the per-client states of idle IPs
+            await self._limiter.initialize()
+        return self._limiter
+
+    def _sweep_request_counts(self, previous_window_start: int) -> None:
+        """Drop counters that no longer affect the sliding window."""
+        stale = [
+            ip
+            for ip, (counted_start, _, _) in self.request_counts.items()
+            if counted_start < previous_window_start
+        ]
+        for ip in stale:
+            del self.request_counts[ip]
+
     def _rate_limit_headers(
         self, limit: int, remaining: int, reset: int
     ) -> dict[str, str]:
@@ -5,7 +5,10 @@ This module provides policy-based access control using OPA with predefined polic
 versioning, and advanced security features.
 """
 
+import json
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
@@ -19,6 +22,12 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# OPA module evaluating every active policy for a list of resources
+BATCH_POLICY_NAME = "batch_access"
+
+# Context fields enforced by the context checks rather than the policies
+VOLATILE_CONTEXT_FIELDS = frozenset({"rate_limit_key", "limit", "quota_key", "usage"})
+
 
 @dataclass
 class PolicyVersion:
@@ -45,6 +54,79 @@ class PolicyRule:
     priority: int = 0
 
 
+class PolicyDecisionCache:
+    """
+    Bounded LRU cache of access decisions with a TTL.
+
+    Every invalidation starts a new generation; decisions evaluated under
+    an older generation are discarded instead of being stored, so a policy
+    change during an in-flight OPA query cannot leave a stale entry.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initialize policy decision cache.
+
+        Args:
+            max_size: Maximum number of cached decisions
+            ttl: Seconds a decision stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict[tuple, tuple[bool, float]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple) -> bool | None:
+        """Get a cached decision, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: tuple, decision: bool, generation: int) -> None:
+        """Cache a decision evaluated under the given generation."""
+        if generation != self.generation or self.max_size <= 0:
+            return
+
+        self._entries[key] = (decision, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop all cached decisions."""
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "generation": self.generation,
+        }
+
+
 class PolicyEngine:
     """
     Policy Engine for access control using OPA with advanced features.
@@ -91,6 +173,12 @@ class PolicyEngine:
         self.ip_whitelist: list[str] = []
         self.ip_blacklist: list[str] = []
 
+        # Cached access decisions, invalidated on policy or IP list changes
+        self.decision_cache = PolicyDecisionCache(
+            max_size=settings.policy_decision_cache_size,
+            ttl=settings.policy_decision_cache_ttl,
+        )
+
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -349,6 +437,15 @@ class PolicyEngine:
                         f"Failed to upload policy {policy_name}: {response.text}"
                     )
 
+            # Upload the batch evaluation module for check_access_many
+            response = await self.http_client.put(
+                f"{self.opa_url}/v1/policies/{BATCH_POLICY_NAME}",
+                data=self._build_batch_policy(),
+                headers={"Content-Type": "text/plain"},
+            )
+            if response.status_code not in [200, 201]:
+                logger.warning(f"Failed to upload batch policy: {response.text}")
+
             logger.info("Uploaded policies to OPA")
 
         except Exception as e:
@@ -382,46 +479,159 @@ class PolicyEngine:
                 logger.warning("Policy engine not initialized, denying access")
                 return False
 
-            # Check IP filtering first
-            if context and "ip" in context:
-                if not await self._check_ip_access(context["ip"]):
-                    logger.warning(f"IP access denied: {context['ip']}")
-                    return False
-
-            # Check rate limiting
-            if context and "rate_limit_key" in context:
-                if not await self._check_rate_limit(
-                    context["rate_limit_key"], context.get("limit", 100)
-                ):
-                    logger.warning(
-                        f"Rate limit exceeded for: {context['rate_limit_key']}"
-                    )
-                    return False
-
-            # Check resource quota
-            if context and "quota_key" in context:
-                if not await self._check_resource_quota(
-                    context["quota_key"],
-                    context.get("usage", 0),
-                    context.get("limit", 1000),
-                ):
-                    logger.warning(
-                        f"Resource quota exceeded for: {context['quota_key']}"
-                    )
-                    return False
+            if not await self._check_context(context):
+                return False
+
+            key = self._decision_key(user_id, resource, action, context)
+            decision = self.decision_cache.get(key)
+            if decision is not None:
+                return decision
 
             # Check main access policy
+            generation = self.decision_cache.generation
             if self.engine_type == PolicyEngineType.OPA:
-                return await self._check_access_opa(user_id, resource, action, context)
+                decision = await self._check_access_opa(
+                    user_id, resource, action, context
+                )
             else:
-                return await self._check_access_internal(
+                decision = await self._check_access_internal(
                     user_id, resource, action, context
                 )
 
+            self.decision_cache.set(key, decision, generation)
+            return decision
+
         except Exception as e:
             logger.error(f"Policy check failed: {e}")
             return False
 
+    async def check_access_many(
+        self,
+        user_id: str,
+        resources: list[str],
+        action: str,
+        context: dict[str, Any] | None = None,
+    ) -> list[bool]:
+        """
+        Check access to several resources at once.
+
+        Context checks (IP, rate limit, quota) run once for the whole batch.
+        With OPA, all resources are evaluated in a single query.
+
+        Args:
+            user_id: User ID
+            resources: Resources to access
+            action: Action to perform
+            context: Additional context (IP, time, etc.)
+
+        Returns:
+            Allow-mask with one entry per resource, in order
+        """
+        try:
+            if not self._initialized:
+                logger.warning("Policy engine not initialized, denying access")
+                return [False] * len(resources)
+
+            if not resources or not await self._check_context(context):
+                return [False] * len(resources)
+
+            keys = [
+                self._decision_key(user_id, resource, action, context)
+                for resource in resources
+            ]
+            mask = [self.decision_cache.get(key) for key in keys]
+            missing = [i for i, decision in enumerate(mask) if decision is None]
+            if not missing:
+                return mask
+
+            # Evaluate only the resources without a cached decision
+            generation = self.decision_cache.generation
+            missing_resources = [resources[i] for i in missing]
+            if self.engine_type == PolicyEngineType.OPA:
+                decisions = await self._check_access_many_opa(
+                    user_id, missing_resources, action, context
+                )
+            else:
+                decisions = self._check_access_many_internal(
+                    user_id, missing_resources, action
+                )
+
+            for i, decision in zip(missing, decisions, strict=True):
+                mask[i] = decision
+                self.decision_cache.set(keys[i], decision, generation)
+
+            return mask
+
+        except Exception as e:
+            logger.error(f"Batch policy check failed: {e}")
+            return [False] * len(resources)
+
+    def _decision_key(
+        self,
+        user_id: str,
+        resource: str,
+        action: str,
+        context: dict[str, Any] | None,
+    ) -> tuple:
+        """
+        Build the decision cache key for an access check.
+
+        Internal rules depend only on the role. OPA policies also see the
+        user ID and request context, so those are part of the key, except
+        for the counters handled by the context checks.
+        """
+        role = self._get_user_role(user_id)
+        if self.engine_type != PolicyEngineType.OPA:
+            return (role, resource, action)
+
+        policy_context = {
+            key: value
+            for key, value in (context or {}).items()
+            if key not in VOLATILE_CONTEXT_FIELDS
+        }
+        return (
+            role,
+            user_id,
+            resource,
+            action,
+            json.dumps(policy_context, sort_keys=True, default=str),
+        )
+
+    def get_decision_cache_stats(self) -> dict[str, Any]:
+        """Get decision cache statistics."""
+        return self.decision_cache.get_stats()
+
+    async def _check_context(self, context: dict[str, Any] | None) -> bool:
+        """Check IP filtering, rate limiting and quotas from request context."""
+        if not context:
+            return True
+
+        # Check IP filtering first
+        if "ip" in context:
+            if not await self._check_ip_access(context["ip"]):
+                logger.warning(f"IP access denied: {context['ip']}")
+                return False
+
+        # Check rate limiting
+        if "rate_limit_key" in context:
+            if not await self._check_rate_limit(
+                context["rate_limit_key"], context.get("limit", 100)
+            ):
+                logger.warning(f"Rate limit exceeded for: {context['rate_limit_key']}")
+                return False
+
+        # Check resource quota
+        if "quota_key" in context:
+            if not await self._check_resource_quota(
+                context["quota_key"],
+                context.get("usage", 0),
+                context.get("limit", 1000),
+            ):
+                logger.warning(f"Resource quota exceeded for: {context['quota_key']}")
+                return False
+
+        return True
+
     async def _check_ip_access(self, ip: str) -> bool:
         """Check IP access against whitelist/blacklist."""
         # Check blacklist first
@@ -468,41 +678,105 @@ class PolicyEngine:
         action: str,
         context: dict[str, Any] | None = None,
     ) -> bool:
-        """Check access using OPA."""
-        try:
-            # Prepare input data
-            input_data = {
-                "user": {"id": user_id, "role": self._get_user_role(user_id)},
-                "resource": resource,
-                "action": action,
-            }
+        """
+        Check access using OPA.
+
+        Raises:
+            PolicyViolationError: If OPA cannot be queried
+        """
+        # Prepare input data
+        input_data = {
+            "user": {"id": user_id, "role": self._get_user_role(user_id)},
+            "resource": resource,
+            "action": action,
+        }
 
-            if context:
-                input_data.update(context)
+        if context:
+            input_data.update(context)
 
-            # Determine which policy to use based on resource
-            policy_name = self._get_policy_name_for_resource(resource)
+        # Determine which policy to use based on resource
+        policy_name = self._get_policy_name_for_resource(resource)
 
-            if policy_name not in self.active_policies:
-                logger.warning(f"No policy found for resource: {resource}")
-                return False
+        if policy_name not in self.active_policies:
+            logger.warning(f"No policy found for resource: {resource}")
+            return False
 
-            # Query OPA
-            query_data = {"input": input_data}
-            response = await self.http_client.post(
-                f"{self.opa_url}/v1/data/{policy_name}/allow", json=query_data
+        # Query OPA
+        query_data = {"input": input_data}
+        response = await self.http_client.post(
+            f"{self.opa_url}/v1/data/{policy_name}/allow", json=query_data
+        )
+
+        if response.status_code != 200:
+            raise PolicyViolationError(
+                message=f"OPA query failed: {response.text}",
+                error_code="opa_query_failed",
             )
 
-            if response.status_code != 200:
-                logger.error(f"OPA query failed: {response.text}")
-                return False
+        result = response.json()
+        return result.get("result", False)
+
+    async def _check_access_many_opa(
+        self,
+        user_id: str,
+        resources: list[str],
+        action: str,
+        context: dict[str, Any] | None = None,
+    ) -> list[bool]:
+        """
+        Check access to several resources with one OPA query.
 
-            result = response.json()
-            return result.get("result", False)
+        Raises:
+            PolicyViolationError: If OPA cannot be queried
+        """
+        input_data = {
+            "user": {"id": user_id, "role": self._get_user_role(user_id)},
+            "resources": resources,
+            "action": action,
+        }
 
-        except Exception as e:
-            logger.error(f"OPA access check failed: {e}")
-            return False
+        if context:
+            input_data.update(context)
+
+        response = await self.http_client.post(
+            f"{self.opa_url}/v1/data/{BATCH_POLICY_NAME}",
+            json={"input": input_data},
+        )
+
+        if response.status_code != 200:
+            raise PolicyViolationError(
+                message=f"OPA batch query failed: {response.text}",
+                error_code="opa_query_failed",
+            )
+
+        # One partial set of allowed resources per policy
+        result = response.json().get("result", {})
+        allowed = {
+            policy_name: set(result.get(policy_name, []))
+            for policy_name in self.active_policies
+        }
+
+        return [
+            resource in allowed.get(self._get_policy_name_for_resource(resource), ())
+            for resource in resources
+        ]
+
+    def _build_batch_policy(self) -> str:
+        """Build the Rego module that evaluates active policies per resource."""
+        # Each policy sees the request input with a single resource
+        resource_input = 'object.union(input, {"resource": resource})'
+        rules = "".join(
+            f"""
+                {policy_name}[resource] {{
+                    resource := input.resources[_]
+                    data.{policy_name}.allow with input as {resource_input}
+                }}
+                """
+            for policy_name in self.active_policies
+        )
+        return f"""
+                package {BATCH_POLICY_NAME}
+                {rules}"""
 
     def _get_policy_name_for_resource(self, resource: str) -> str:
         """Get policy name for resource."""
@@ -546,6 +820,22 @@ class PolicyEngine:
             logger.error(f"Internal access check failed: {e}")
             return False
 
+    def _check_access_many_internal(
+        self, user_id: str, resources: list[str], action: str
+    ) -> list[bool]:
+        """Check access to several resources using internal policy rules."""
+        rules = self.fallback_rules.get(self._get_user_role(user_id), {})
+
+        allowed_actions = rules.get("actions", [])
+        if "*" not in allowed_actions and action not in allowed_actions:
+            return [False] * len(resources)
+
+        allowed_resources = set(rules.get("resources", []))
+        if "*" in allowed_resources:
+            return [True] * len(resources)
+
+        return [resource in allowed_resources for resource in resources]
+
     def _get_user_role(self, user_id: str) -> str:
         """Get user role from user ID."""
         # Simplified role mapping - in real implementation, this would query the database
@@ -706,6 +996,7 @@ class PolicyEngine:
 
             self.policy_versions[name].append(policy_version)
             self.active_policies[name] = policy_version
+            self.decision_cache.invalidate()
 
             # Upload to OPA if using OPA engine
             if self.engine_type == PolicyEngineType.OPA:
@@ -758,6 +1049,7 @@ class PolicyEngine:
 
             self.policy_versions[name].append(policy_version)
             self.active_policies[name] = policy_version
+            self.decision_cache.invalidate()
 
             # Upload to OPA if using OPA engine
             if self.engine_type == PolicyEngineType.OPA:
@@ -803,6 +1095,7 @@ class PolicyEngine:
             for policy_version in self.policy_versions[name]:
                 if policy_version.version == version:
                     self.active_policies[name] = policy_version
+                    self.decision_cache.invalidate()
 
                     # Upload to OPA if using OPA engine
                     if self.engine_type == PolicyEngineType.OPA:
@@ -822,6 +1115,7 @@ class PolicyEngine:
         try:
             if ip not in self.ip_whitelist:
                 self.ip_whitelist.append(ip)
+                self.decision_cache.invalidate()
                 logger.info(f"Added IP to whitelist: {ip}")
             return True
         except Exception as e:
@@ -833,6 +1127,7 @@ class PolicyEngine:
         try:
             if ip not in self.ip_blacklist:
                 self.ip_blacklist.append(ip)
+                self.decision_cache.invalidate()
                 logger.info(f"Added IP to blacklist: {ip}")
             return True
         except Exception as e:
@@ -844,6 +1139,7 @@ class PolicyEngine:
         try:
             if ip in self.ip_whitelist:
                 self.ip_whitelist.remove(ip)
+                self.decision_cache.invalidate()
                 logger.info(f"Removed IP from whitelist: {ip}")
             return True
         except Exception as e:
@@ -855,6 +1151,7 @@ class PolicyEngine:
         try:
             if ip in self.ip_blacklist:
                 self.ip_blacklist.remove(ip)
+                self.decision_cache.invalidate()
                 logger.info(f"Removed IP from blacklist: {ip}")
             return True
         except Exception as e:
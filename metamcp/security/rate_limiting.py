@@ -6,12 +6,34 @@ configurable limits, and detailed monitoring.
 """
 
 import asyncio
-from dataclasses import dataclass, field
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
 from ..utils.logging import get_logger
+from ..utils.redis_scripts import (
+    RedisScript,
+    fixed_window_script,
+    gcra_script,
+    leaky_bucket_script,
+    load_rate_limit_scripts,
+    release_lease_script,
+    sliding_window_counter_script,
+    sliding_window_script,
+    token_bucket_script,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+    NUMPY_AVAILABLE = False
 
 logger = get_logger(__name__)
 
@@ -23,6 +45,8 @@ class RateLimitStrategy(Enum):
     SLIDING_WINDOW = "sliding_window"
     TOKEN_BUCKET = "token_bucket"
     LEAKY_BUCKET = "leaky_bucket"
+    GCRA = "gcra"
+    SLIDING_WINDOW_COUNTER = "sliding_window_counter"
 
 
 @dataclass
@@ -36,6 +60,10 @@ class RateLimitConfig:
     burst_limit: int | None = None
     cost_per_request: int = 1
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Tokens each worker leases from Redis at once (0 disables leasing) and
+    # how long a lease is served locally before unused tokens are returned
+    lease_size: int = 0
+    lease_ttl: float = 1.0
 
 
 @dataclass
@@ -48,6 +76,13 @@ class RateLimitState:
     last_request: datetime = field(default_factory=datetime.utcnow)
     tokens: float = 0.0
     burst_tokens: float = 0.0
+    # Monotonic timestamps used by the GCRA and sliding window counter
+    # strategies and by the cleanup sweeper
+    tat: float = 0.0
+    window_index: int = 0
+    previous_count: int = 0
+    last_seen: float = 0.0
+    expires_at: float = math.inf
 
 
 @dataclass
@@ -63,6 +98,37 @@ class RateLimitResult:
     retry_after: int | None = None
 
 
+@dataclass
+class TokenLease:
+    """Batch of tokens leased from Redis and served by this worker."""
+
+    granted: int
+    tokens: int
+    remote_remaining: int
+    reset_time: datetime
+    # Monotonic times after which the lease is no longer served and after
+    # which its unused tokens can no longer be returned
+    expires_at: float
+    release_before: float
+
+
+# Strategies whose counts reset with the window; tokens leased in one window
+# must neither be served nor returned in the next
+_WINDOWED_STRATEGIES = {
+    RateLimitStrategy.FIXED_WINDOW,
+    RateLimitStrategy.SLIDING_WINDOW_COUNTER,
+}
+
+_REDIS_SCRIPTS: dict[RateLimitStrategy, RedisScript] = {
+    RateLimitStrategy.FIXED_WINDOW: fixed_window_script,
+    RateLimitStrategy.SLIDING_WINDOW: sliding_window_script,
+    RateLimitStrategy.TOKEN_BUCKET: token_bucket_script,
+    RateLimitStrategy.LEAKY_BUCKET: leaky_bucket_script,
+    RateLimitStrategy.GCRA: gcra_script,
+    RateLimitStrategy.SLIDING_WINDOW_COUNTER: sliding_window_counter_script,
+}
+
+
 class RateLimiter:
     """
     Advanced rate limiter with multiple strategies.
@@ -71,16 +137,37 @@ class RateLimiter:
     support for different algorithms and detailed monitoring.
     """
 
-    def __init__(self):
-        """Initialize the rate limiter."""
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, redis: Any | None = None
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            clock: Monotonic clock in seconds used by the GCRA and sliding
+                window counter strategies and by the cleanup sweeper
+            redis: Optional async Redis client. When set, every strategy is
+                checked with an atomic Lua script shared by all workers, and
+                the in-memory state is only used if Redis fails.
+        """
+        self.clock = clock
+        self.redis = redis
         self.limiters: dict[str, RateLimitConfig] = {}
         self.states: dict[str, RateLimitState] = {}
+        # Keys whose configuration was created from the defaults on first use
+        self._default_keys: set[str] = set()
+        self._leases: dict[str, TokenLease] = {}
+        self._lease_locks: dict[str, asyncio.Lock] = {}
         self.global_config: dict[str, Any] = {
             "default_limit": 100,
             "default_window": 60,
             "default_strategy": RateLimitStrategy.FIXED_WINDOW,
+            "default_lease_size": 0,
+            "default_lease_ttl": 1.0,
             "enable_monitoring": True,
             "cleanup_interval": 3600,  # 1 hour
+            "state_idle_ttl": 86400,  # 24 hours
+            "redis_key_prefix": "metamcp:rate_limit",
         }
 
         # Statistics
@@ -95,6 +182,13 @@ class RateLimiter:
         try:
             logger.info("Initializing Rate Limiter")
 
+            if self.redis is not None:
+                try:
+                    await load_rate_limit_scripts(self.redis)
+                except Exception as e:
+                    # Scripts are loaded on first use instead
+                    logger.warning(f"Failed to preload rate limit scripts: {e}")
+
             # Start cleanup task
             self._running = True
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
@@ -118,6 +212,10 @@ class RateLimiter:
                 except asyncio.CancelledError:
                     pass
 
+            # Give leased tokens back to the other workers
+            for key in list(self._leases):
+                await self._release_lease(self.limiters[key])
+
             logger.info("Rate Limiter shutdown complete")
 
         except Exception as e:
@@ -132,18 +230,11 @@ class RateLimiter:
         """
         try:
             self.limiters[config.key] = config
+            self._default_keys.discard(config.key)
 
             # Initialize state if not exists
             if config.key not in self.states:
-                self.states[config.key] = RateLimitState(
-                    key=config.key,
-                    tokens=(
-                        config.limit
-                        if config.strategy == RateLimitStrategy.TOKEN_BUCKET
-                        else 0
-                    ),
-                    burst_tokens=config.burst_limit or config.limit,
-                )
+                self.states[config.key] = self._new_state(config)
 
             # Initialize statistics
             if config.key not in self.stats:
@@ -153,6 +244,12 @@ class RateLimiter:
                     "blocked_requests": 0,
                     "total_cost": 0,
                     "last_reset": datetime.utcnow(),
+                    "lease_acquisitions": 0,
+                    "lease_local_hits": 0,
+                    "lease_redis_calls": 0,
+                    "lease_tokens_granted": 0,
+                    "lease_tokens_returned": 0,
+                    "lease_tokens_expired": 0,
                 }
 
             logger.info(
@@ -163,6 +260,17 @@ class RateLimiter:
             logger.error(f"Failed to add rate limit: {e}")
             raise
 
+    def _new_state(self, config: RateLimitConfig) -> RateLimitState:
+        """Create the initial state of a rate limit."""
+        return RateLimitState(
+            key=config.key,
+            tokens=(
+                config.limit if config.strategy == RateLimitStrategy.TOKEN_BUCKET else 0
+            ),
+            burst_tokens=config.burst_limit or config.limit,
+            last_seen=self.clock(),
+        )
+
     async def check_rate_limit(
         self, key: str, cost: int = 1, context: dict[str, Any] | None = None
     ) -> RateLimitResult:
@@ -185,27 +293,30 @@ class RateLimiter:
                     limit=self.global_config["default_limit"],
                     window_seconds=self.global_config["default_window"],
                     strategy=self.global_config["default_strategy"],
+                    lease_size=self.global_config["default_lease_size"],
+                    lease_ttl=self.global_config["default_lease_ttl"],
                 )
                 await self.add_rate_limit(config)
+                self._default_keys.add(key)
 
             config = self.limiters[key]
-            state = self.states[key]
+            state = self.states.get(key)
+            if state is None:
+                # Swept after draining; a fresh state is equivalent
+                state = self.states[key] = self._new_state(config)
 
             # Update statistics
             self.stats[key]["total_requests"] += 1
             self.stats[key]["total_cost"] += cost
 
-            # Check rate limit based on strategy
-            if config.strategy == RateLimitStrategy.FIXED_WINDOW:
-                result = await self._check_fixed_window(config, state, cost)
-            elif config.strategy == RateLimitStrategy.SLIDING_WINDOW:
-                result = await self._check_sliding_window(config, state, cost)
-            elif config.strategy == RateLimitStrategy.TOKEN_BUCKET:
-                result = await self._check_token_bucket(config, state, cost)
-            elif config.strategy == RateLimitStrategy.LEAKY_BUCKET:
-                result = await self._check_leaky_bucket(config, state, cost)
-            else:
-                raise ValueError(f"Unsupported rate limit strategy: {config.strategy}")
+            result = None
+            if self.redis is not None:
+                if config.lease_size > 0:
+                    result = await self._check_leased(config, cost)
+                else:
+                    result = await self._check_redis(config, cost)
+            if result is None:
+                result = await self._check_local(config, state, cost)
 
             # Update statistics
             if result.allowed:
@@ -215,6 +326,7 @@ class RateLimiter:
 
             # Update last request time
             state.last_request = datetime.utcnow()
+            state.last_seen = self.clock()
 
             return result
 
@@ -229,6 +341,24 @@ class RateLimiter:
                 window_seconds=60,
             )
 
+    async def _check_local(
+        self, config: RateLimitConfig, state: RateLimitState, cost: int
+    ) -> RateLimitResult:
+        """Check rate limit against the in-process state."""
+        if config.strategy == RateLimitStrategy.FIXED_WINDOW:
+            return await self._check_fixed_window(config, state, cost)
+        if config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            return await self._check_sliding_window(config, state, cost)
+        if config.strategy == RateLimitStrategy.TOKEN_BUCKET:
+            return await self._check_token_bucket(config, state, cost)
+        if config.strategy == RateLimitStrategy.LEAKY_BUCKET:
+            return await self._check_leaky_bucket(config, state, cost)
+        if config.strategy == RateLimitStrategy.GCRA:
+            return self._check_gcra(config, state, cost)
+        if config.strategy == RateLimitStrategy.SLIDING_WINDOW_COUNTER:
+            return self._check_sliding_window_counter(config, state, cost)
+        raise ValueError(f"Unsupported rate limit strategy: {config.strategy}")
+
     async def _check_fixed_window(
         self, config: RateLimitConfig, state: RateLimitState, cost: int
     ) -> RateLimitResult:
@@ -395,6 +525,296 @@ class RateLimiter:
                 cost_used=cost,
             )
 
+    def _check_gcra(
+        self, config: RateLimitConfig, state: RateLimitState, cost: int
+    ) -> RateLimitResult:
+        """
+        Check rate limit using the generic cell rate algorithm.
+
+        The only state is the theoretical arrival time (TAT) of the next
+        request. Each unit of cost advances it by one emission interval
+        (``window_seconds / limit``) and a request is allowed while the TAT
+        stays within the burst tolerance of the current time.
+        """
+        now = self.clock()
+        interval = config.window_seconds / config.limit
+        tolerance = interval * (config.burst_limit or config.limit)
+
+        tat = max(state.tat, now)
+        new_tat = tat + interval * cost
+        allow_at = new_tat - tolerance
+
+        if now < allow_at:
+            remaining = int((tolerance - (tat - now)) / interval)
+            return RateLimitResult(
+                allowed=False,
+                remaining=max(0, remaining),
+                reset_time=datetime.utcnow() + timedelta(seconds=tat - now),
+                retry_after=max(1, math.ceil(allow_at - now)),
+                limit=config.limit,
+                window_seconds=config.window_seconds,
+                cost_used=cost,
+            )
+
+        state.tat = new_tat
+        state.expires_at = new_tat
+        return RateLimitResult(
+            allowed=True,
+            remaining=max(0, int((tolerance - (new_tat - now)) / interval)),
+            reset_time=datetime.utcnow() + timedelta(seconds=new_tat - now),
+            limit=config.limit,
+            window_seconds=config.window_seconds,
+            cost_used=cost,
+        )
+
+    def _check_sliding_window_counter(
+        self, config: RateLimitConfig, state: RateLimitState, cost: int
+    ) -> RateLimitResult:
+        """
+        Check rate limit using the sliding window counter strategy.
+
+        Only the counts of the current and previous fixed windows are kept.
+        The previous count is weighted by how much of the previous window
+        still overlaps the sliding window ending now.
+        """
+        now = self.clock()
+        window = config.window_seconds
+        index = int(now // window)
+
+        if index != state.window_index:
+            state.previous_count = (
+                state.current_count if index == state.window_index + 1 else 0
+            )
+            state.current_count = 0
+            state.window_index = index
+
+        elapsed = now - index * window
+        weight = 1 - elapsed / window
+        estimated = state.previous_count * weight + state.current_count
+        window_end = (index + 1) * window
+        reset_time = datetime.utcnow() + timedelta(seconds=window_end - now)
+
+        if estimated + cost <= config.limit:
+            state.current_count += cost
+            state.expires_at = window_end + window
+            return RateLimitResult(
+                allowed=True,
+                remaining=max(0, int(config.limit - estimated - cost)),
+                reset_time=reset_time,
+                limit=config.limit,
+                window_seconds=config.window_seconds,
+                cost_used=cost,
+            )
+
+        # Wait until enough of the previous window has slid out, or for the
+        # next window if the current one alone is over the limit
+        headroom = config.limit - state.current_count - cost
+        if state.previous_count and headroom >= 0:
+            retry_after = (1 - headroom / state.previous_count) * window - elapsed
+        else:
+            retry_after = window_end - now
+
+        return RateLimitResult(
+            allowed=False,
+            remaining=max(0, int(config.limit - estimated)),
+            reset_time=reset_time,
+            retry_after=max(1, math.ceil(retry_after)),
+            limit=config.limit,
+            window_seconds=config.window_seconds,
+            cost_used=cost,
+        )
+
+    def _redis_keys(self, config: RateLimitConfig) -> list[str]:
+        """Get the Redis keys holding the state of a rate limit."""
+        # The hash tag keeps all keys of a limit in one Redis Cluster slot
+        key = (
+            f"{self.global_config['redis_key_prefix']}:"
+            f"{config.strategy.value}:{{{config.key}}}"
+        )
+        if config.strategy == RateLimitStrategy.SLIDING_WINDOW:
+            return [key, f"{key}:seq"]
+        return [key]
+
+    async def _check_redis(
+        self, config: RateLimitConfig, cost: int
+    ) -> RateLimitResult | None:
+        """
+        Check rate limit with the strategy's Lua script in one round-trip.
+
+        Returns:
+            Rate limit result, or None if Redis failed
+        """
+        args = [config.limit, config.window_seconds * 1000, cost]
+        if config.strategy == RateLimitStrategy.GCRA:
+            args.append(config.burst_limit or config.limit)
+
+        try:
+            allowed, remaining, reset_ms, retry_ms = await _REDIS_SCRIPTS[
+                config.strategy
+            ](self.redis, self._redis_keys(config), args)
+        except Exception as e:
+            logger.error(f"Redis rate limit check failed, falling back to memory: {e}")
+            return None
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            remaining=int(remaining),
+            reset_time=datetime.utcnow() + timedelta(milliseconds=int(reset_ms)),
+            retry_after=None if allowed else max(1, math.ceil(int(retry_ms) / 1000)),
+            limit=config.limit,
+            window_seconds=config.window_seconds,
+            cost_used=cost,
+        )
+
+    async def _check_leased(
+        self, config: RateLimitConfig, cost: int
+    ) -> RateLimitResult | None:
+        """
+        Check rate limit against a batch of tokens leased from Redis.
+
+        Requests are served from the local lease until it runs out or
+        expires. Only then is Redis called, to return the unused tokens and
+        lease a new batch. Each worker can overshoot the limit by at most the
+        tokens it holds.
+
+        Returns:
+            Rate limit result, or None if Redis failed
+        """
+        result = self._take_from_lease(config, cost)
+        if result is not None:
+            return result
+
+        lock = self._lease_locks.setdefault(config.key, asyncio.Lock())
+        async with lock:
+            # Another request may have leased a new batch while we waited
+            result = self._take_from_lease(config, cost)
+            if result is not None:
+                return result
+
+            await self._release_lease(config)
+
+            stats = self.stats[config.key]
+            stats["lease_redis_calls"] += 1
+            result = await self._check_redis(config, max(cost, config.lease_size))
+            if result is not None and not result.allowed and result.remaining >= cost:
+                # Lease whatever is left of the limit
+                stats["lease_redis_calls"] += 1
+                result = await self._check_redis(config, result.remaining)
+
+            if result is None:
+                return None
+            if not result.allowed:
+                return replace(result, cost_used=cost)
+
+            now = self.clock()
+            window_end = now + max(
+                0.0, (result.reset_time - datetime.utcnow()).total_seconds()
+            )
+            expires_at = now + config.lease_ttl
+            release_before = math.inf
+            if config.strategy in _WINDOWED_STRATEGIES:
+                expires_at = min(expires_at, window_end)
+                release_before = window_end
+
+            lease = TokenLease(
+                granted=result.cost_used,
+                tokens=result.cost_used - cost,
+                remote_remaining=result.remaining,
+                reset_time=result.reset_time,
+                expires_at=expires_at,
+                release_before=release_before,
+            )
+            self._leases[config.key] = lease
+            stats["lease_acquisitions"] += 1
+            stats["lease_tokens_granted"] += lease.granted
+
+            return replace(
+                result,
+                remaining=lease.remote_remaining + lease.tokens,
+                cost_used=cost,
+            )
+
+    def _take_from_lease(
+        self, config: RateLimitConfig, cost: int
+    ) -> RateLimitResult | None:
+        """Serve a request from the local lease if it still covers the cost."""
+        lease = self._leases.get(config.key)
+        if lease is None or lease.tokens < cost or self.clock() >= lease.expires_at:
+            return None
+
+        lease.tokens -= cost
+        self.stats[config.key]["lease_local_hits"] += 1
+        return RateLimitResult(
+            allowed=True,
+            remaining=lease.remote_remaining + lease.tokens,
+            reset_time=lease.reset_time,
+            limit=config.limit,
+            window_seconds=config.window_seconds,
+            cost_used=cost,
+        )
+
+    async def _release_lease(self, config: RateLimitConfig) -> None:
+        """Return the unused tokens of a key's lease to Redis."""
+        lease = self._leases.pop(config.key, None)
+        if lease is None or lease.tokens == 0:
+            return
+
+        stats = self.stats[config.key]
+        returned = 0
+        if self.clock() < lease.release_before:
+            stats["lease_redis_calls"] += 1
+            try:
+                returned = int(
+                    await release_lease_script(
+                        self.redis,
+                        self._redis_keys(config),
+                        [
+                            config.strategy.value,
+                            lease.tokens,
+                            config.limit,
+                            config.window_seconds * 1000,
+                        ],
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Failed to return leased tokens for {config.key}: {e}")
+
+        stats["lease_tokens_returned"] += returned
+        stats["lease_tokens_expired"] += lease.tokens - returned
+
+    async def get_lease_statistics(self) -> dict[str, Any]:
+        """
+        Get token leasing statistics.
+
+        Returns:
+            Leasing statistics, including how many checks were answered per
+            Redis round-trip and how many tokens this worker currently holds,
+            which bounds how far it can overshoot the limits
+        """
+        totals = {
+            name: sum(stats.get(name, 0) for stats in self.stats.values())
+            for name in (
+                "lease_acquisitions",
+                "lease_local_hits",
+                "lease_redis_calls",
+                "lease_tokens_granted",
+                "lease_tokens_returned",
+                "lease_tokens_expired",
+            )
+        }
+        checks = totals["lease_acquisitions"] + totals["lease_local_hits"]
+        return {
+            "active_leases": len(self._leases),
+            "outstanding_tokens": sum(lease.tokens for lease in self._leases.values()),
+            "leased_checks": checks,
+            "checks_per_redis_call": (
+                checks / totals["lease_redis_calls"]
+                if totals["lease_redis_calls"] > 0
+                else 0
+            ),
+            **totals,
+        }
+
     async def reset_rate_limit(self, key: str) -> bool:
         """
         Reset rate limit for a key.
@@ -412,6 +832,14 @@ class RateLimiter:
                 state.tokens = 0
                 state.window_start = datetime.utcnow()
                 state.last_request = datetime.utcnow()
+                state.tat = 0.0
+                state.previous_count = 0
+                state.expires_at = math.inf
+
+                if self.redis is not None and key in self.limiters:
+                    # The leased tokens belong to the state being deleted
+                    self._leases.pop(key, None)
+                    await self.redis.delete(*self._redis_keys(self.limiters[key]))
 
                 # Reset statistics
                 if key in self.stats:
@@ -490,6 +918,10 @@ class RateLimiter:
             True if removed successfully
         """
         try:
+            if key in self._leases:
+                await self._release_lease(self.limiters[key])
+            self._lease_locks.pop(key, None)
+
             if key in self.limiters:
                 del self.limiters[key]
 
@@ -499,6 +931,8 @@ class RateLimiter:
             if key in self.stats:
                 del self.stats[key]
 
+            self._default_keys.discard(key)
+
             logger.info(f"Removed rate limit: {key}")
             return True
 
@@ -518,25 +952,85 @@ class RateLimiter:
                 logger.error(f"Error in cleanup loop: {e}")
 
     async def _cleanup_expired_states(self) -> None:
-        """Clean up expired rate limit states."""
+        """
+        Clean up expired rate limit states.
+
+        GCRA and sliding window counter states are dropped as soon as they
+        have drained, since a fresh state behaves identically; limits created
+        from the defaults are removed with them. Rate limits unused for
+        longer than ``state_idle_ttl`` are removed entirely.
+        """
         try:
-            now = datetime.utcnow()
-            expired_keys = []
+            now = self.clock()
+            expired_leases = [
+                key for key, lease in self._leases.items() if lease.expires_at <= now
+            ]
+            for key in expired_leases:
+                await self._release_lease(self.limiters[key])
+
+            drained_keys, idle_keys = self._find_expired_states(
+                now, now - self.global_config["state_idle_ttl"]
+            )
 
-            for key, state in self.states.items():
-                # Remove states that haven't been used for a long time
-                if (now - state.last_request).total_seconds() > 86400:  # 24 hours
-                    expired_keys.append(key)
+            for key in drained_keys:
+                if key in self._default_keys:
+                    await self.remove_rate_limit(key)
+                else:
+                    self.states.pop(key, None)
 
-            for key in expired_keys:
+            for key in idle_keys:
                 await self.remove_rate_limit(key)
 
-            if expired_keys:
-                logger.info(f"Cleaned up {len(expired_keys)} expired rate limit states")
+            if drained_keys or idle_keys:
+                logger.info(
+                    f"Cleaned up {len(drained_keys)} drained and "
+                    f"{len(idle_keys)} idle rate limit states"
+                )
 
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
+    def _find_expired_states(
+        self, now: float, idle_before: float
+    ) -> tuple[list[str], list[str]]:
+        """
+        Find drained and idle states in one pass.
+
+        Expiry and last-seen times are compared as arrays when numpy is
+        available, so sweeping many keys costs one vectorized comparison.
+
+        Returns:
+            Keys of drained states and keys of idle rate limits
+        """
+        keys = list(self.states)
+        if not keys:
+            return [], []
+
+        states = self.states.values()
+        if NUMPY_AVAILABLE:
+            count = len(keys)
+            expires_at = np.fromiter(
+                (s.expires_at for s in states), dtype=np.float64, count=count
+            )
+            last_seen = np.fromiter(
+                (s.last_seen for s in states), dtype=np.float64, count=count
+            )
+            idle = last_seen <= idle_before
+            drained = (expires_at <= now) & ~idle
+            return (
+                [keys[i] for i in np.flatnonzero(drained)],
+                [keys[i] for i in np.flatnonzero(idle)],
+            )
+
+        drained_keys = []
+        idle_keys = []
+        for key, state in zip(keys, states, strict=True):
+            if state.last_seen <= idle_before:
+                idle_keys.append(key)
+            elif state.expires_at <= now:
+                drained_keys.append(key)
+        return drained_keys, idle_keys
+
     async def get_statistics(self) -> dict[str, Any]:
         """
         Get rate limiter statistics.
@@ -566,6 +1060,7 @@ class RateLimiter:
                     else 0
                 ),
                 "rate_limits": await self.get_all_rate_limits(),
+                "leasing": await self.get_lease_statistics(),
             }
 
         except Exception as e:
@@ -0,0 +1,166 @@
+"""
+Search Index
+
+In-memory inverted index with BM25 scoring used by SearchService for
+keyword and hybrid tool search.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric terms.
+
+    Underscores, hyphens and punctuation separate terms, so
+    ``database_query`` yields ``database`` and ``query``.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def tool_search_text(tool: dict[str, Any]) -> str:
+    """Build the searchable text of a tool."""
+    return " ".join(
+        [
+            tool.get("name", ""),
+            tool.get("description", ""),
+            tool.get("category") or "",
+            " ".join(tool.get("tags", [])),
+        ]
+    )
+
+
+def top_k(scores: dict[str, float], k: int) -> list[tuple[str, float]]:
+    """Return the ``k`` highest scoring items, best first."""
+    return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[list[str]], k: int = 60
+) -> dict[str, float]:
+    """
+    Fuse ranked lists with reciprocal rank fusion.
+
+    Each list contributes ``1 / (k + rank)`` for every document it ranks,
+    so documents ranked well by several retrievers rise to the top without
+    having to calibrate their raw scores against each other.
+
+    Args:
+        rankings: Document IDs of each retriever, best first
+        k: Rank smoothing constant
+
+    Returns:
+        Fused score per document ID
+    """
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return fused
+
+
+class BM25Index:
+    """
+    Inverted index scored with Okapi BM25.
+
+    Postings map each term to the documents containing it and their term
+    frequency, so a query only touches documents that share a term with it.
+    Documents can be added, replaced and removed incrementally.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize BM25 index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[str, int]] = {}
+        self.doc_terms: dict[str, Counter] = {}
+        self.doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return len(self.doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        """Check if a document is indexed."""
+        return doc_id in self.doc_terms
+
+    @property
+    def average_length(self) -> float:
+        """Average document length in terms."""
+        return self._total_length / len(self.doc_terms) if self.doc_terms else 0.0
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Index a document, replacing any previous version."""
+        self.remove(doc_id)
+
+        terms = tokenize(text)
+        counts = Counter(terms)
+        for term, frequency in counts.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        self.doc_terms[doc_id] = counts
+        self.doc_lengths[doc_id] = len(terms)
+        self._total_length += len(terms)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document, returning whether it was indexed."""
+        counts = self.doc_terms.pop(doc_id, None)
+        if counts is None:
+            return False
+
+        for term in counts:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+
+        self._total_length -= self.doc_lengths.pop(doc_id)
+        return True
+
+    def candidates(self, terms: Iterable[str]) -> set[str]:
+        """Get documents containing at least one of the terms."""
+        docs: set[str] = set()
+        for term in terms:
+            docs.update(self.postings.get(term, ()))
+        return docs
+
+    def scores(self, query: str) -> dict[str, float]:
+        """Compute BM25 scores for every document matching the query."""
+        doc_count = len(self.doc_terms)
+        average_length = self.average_length or 1.0
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            matches = len(postings)
+            idf = math.log(1 + (doc_count - matches + 0.5) / (matches + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.doc_lengths[doc_id] / average_length
+                )
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + norm)
+                )
+
+        return scores
+
+    def search(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Return the ``limit`` best matching documents, best first."""
+        return top_k(self.scores(query), limit)
@@ -6,14 +6,28 @@ semantic search, vector search, and search result processing.
 """
 
 import time
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from typing import Any
 
 from ..exceptions import SearchError
 from ..utils.logging import get_logger
+from .search_index import (
+    BM25Index,
+    reciprocal_rank_fusion,
+    tokenize,
+    tool_search_text,
+    top_k,
+)
 
 logger = get_logger(__name__)
 
+# Reciprocal rank fusion smoothing constant
+RRF_K = 60
+
+# Candidates ranked by each retriever per requested hybrid result
+HYBRID_CANDIDATE_MULTIPLIER = 3
+
 
 class SearchService:
     """
@@ -23,8 +37,28 @@ class SearchService:
     semantic search, vector search, and search result processing.
     """
 
-    def __init__(self):
-        """Initialize the search service."""
+    def __init__(
+        self,
+        vector_client: Any | None = None,
+        llm_service: Any | None = None,
+    ):
+        """
+        Initialize the search service.
+
+        Args:
+            vector_client: Optional vector search backend for semantic search
+            llm_service: Optional LLM service for query embeddings
+        """
+        self.vector_client = vector_client
+        self.llm_service = llm_service
+
+        # Searchable tools and their keyword index
+        self.tools: dict[str, dict[str, Any]] = {}
+        self._tool_ids_by_name: dict[str, str] = {}
+        self.keyword_index = BM25Index()
+        for tool in self._get_available_tools():
+            self.index_tool(tool)
+
         self.search_history: list[dict[str, Any]] = []
         self.search_metrics: dict[str, Any] = {
             "total_searches": 0,
@@ -135,6 +169,9 @@ class SearchService:
         """
         Perform semantic search using vector embeddings.
 
+        Uses the vector backend when one is configured; otherwise falls back
+        to term overlap over the tools sharing at least one query term.
+
         Args:
             query: Search query
             max_results: Maximum number of results
@@ -144,36 +181,40 @@ class SearchService:
             List of search results
         """
         try:
-            # This would integrate with a vector database like Pinecone or Weaviate
-            # For now, we'll use a simple text-based similarity
+            if self.vector_client and self.llm_service:
+                query_embedding = await self.llm_service.generate_embedding(query)
+                hits = await self.vector_client.search(
+                    collection="tools",
+                    query_embedding=query_embedding,
+                    limit=max_results,
+                    similarity_threshold=similarity_threshold,
+                )
+                return [
+                    self._format_result(
+                        self._resolve_tool(hit["id"], hit.get("metadata", {})),
+                        hit["score"],
+                        "semantic",
+                    )
+                    for hit in hits
+                ]
 
-            # Get all available tools (this would come from tool registry)
-            all_tools = self._get_available_tools()
+            query_terms = set(tokenize(query))
+            if similarity_threshold > 0:
+                candidates = self.keyword_index.candidates(query_terms)
+            else:
+                candidates = set(self.tools)
 
-            # Calculate similarity scores
-            scored_results = []
-            for tool in all_tools:
-                score = self._calculate_similarity(query, tool)
+            scores = {}
+            for tool_id in candidates:
+                score = self._term_overlap(
+                    query_terms, self.keyword_index.doc_terms[tool_id].keys()
+                )
                 if score >= similarity_threshold:
-                    scored_results.append(
-                        {"tool": tool, "score": score, "match_type": "semantic"}
-                    )
-
-            # Sort by score and limit results
-            scored_results.sort(key=lambda x: x["score"], reverse=True)
-            results = scored_results[:max_results]
+                    scores[tool_id] = score
 
-            # Format results
             return [
-                {
-                    "id": result["tool"]["id"],
-                    "name": result["tool"]["name"],
-                    "description": result["tool"]["description"],
-                    "category": result["tool"].get("category"),
-                    "score": result["score"],
-                    "match_type": result["match_type"],
-                }
-                for result in results
+                self._format_result(self.tools[tool_id], score, "semantic")
+                for tool_id, score in top_k(scores, max_results)
             ]
 
         except Exception as e:
@@ -184,7 +225,7 @@ class SearchService:
         self, query: str, max_results: int
     ) -> list[dict[str, Any]]:
         """
-        Perform keyword-based search.
+        Perform keyword-based search scored with BM25.
 
         Args:
             query: Search query
@@ -194,39 +235,10 @@ class SearchService:
             List of search results
         """
         try:
-            # Get all available tools
-            all_tools = self._get_available_tools()
-
-            # Simple keyword matching
-            query_terms = query.lower().split()
-            results = []
-
-            for tool in all_tools:
-                score = 0.0
-                tool_text = f"{tool['name']} {tool['description']} {' '.join(tool.get('tags', []))}".lower()
-
-                # Count matching terms
-                for term in query_terms:
-                    if term in tool_text:
-                        score += 1.0
-
-                if score > 0:
-                    # Normalize score
-                    score = score / len(query_terms)
-                    results.append(
-                        {
-                            "id": tool["id"],
-                            "name": tool["name"],
-                            "description": tool["description"],
-                            "category": tool.get("category"),
-                            "score": score,
-                            "match_type": "keyword",
-                        }
-                    )
-
-            # Sort by score and limit results
-            results.sort(key=lambda x: x["score"], reverse=True)
-            return results[:max_results]
+            return [
+                self._format_result(self.tools[tool_id], score, "keyword")
+                for tool_id, score in self.keyword_index.search(query, max_results)
+            ]
 
         except Exception as e:
             logger.error(f"Keyword search failed: {e}")
@@ -238,6 +250,8 @@ class SearchService:
         """
         Perform hybrid search combining semantic and keyword search.
 
+        The two rankings are fused with reciprocal rank fusion.
+
         Args:
             query: Search query
             max_results: Maximum number of results
@@ -247,46 +261,36 @@ class SearchService:
             List of search results
         """
         try:
-            # Perform both search types
+            # Rank deeper than the result size so fusion can promote tools
+            # that only one of the retrievers ranks highly
+            depth = max_results * HYBRID_CANDIDATE_MULTIPLIER
             semantic_results = await self._semantic_search(
-                query, max_results, similarity_threshold
+                query, depth, similarity_threshold
             )
-            keyword_results = await self._keyword_search(query, max_results)
+            keyword_results = await self._keyword_search(query, depth)
 
-            # Combine and deduplicate results
-            combined_results = {}
+            semantic_by_id = {result["id"]: result for result in semantic_results}
+            keyword_by_id = {result["id"]: result for result in keyword_results}
 
-            # Add semantic results
-            for result in semantic_results:
-                combined_results[result["id"]] = {
-                    **result,
-                    "semantic_score": result["score"],
-                    "keyword_score": 0.0,
-                }
+            fused = reciprocal_rank_fusion(
+                [list(semantic_by_id), list(keyword_by_id)], k=RRF_K
+            )
 
-            # Add keyword results
-            for result in keyword_results:
-                if result["id"] in combined_results:
-                    # Update existing result
-                    combined_results[result["id"]]["keyword_score"] = result["score"]
-                    # Calculate combined score
-                    combined_results[result["id"]]["score"] = (
-                        combined_results[result["id"]]["semantic_score"] * 0.7
-                        + result["score"] * 0.3
-                    )
-                else:
-                    combined_results[result["id"]] = {
-                        **result,
-                        "semantic_score": 0.0,
-                        "keyword_score": result["score"],
-                        "score": result["score"] * 0.3,
+            results = []
+            for tool_id, score in top_k(fused, max_results):
+                semantic = semantic_by_id.get(tool_id)
+                keyword = keyword_by_id.get(tool_id)
+                results.append(
+                    {
+                        **(semantic or keyword),
+                        "score": score,
+                        "match_type": "hybrid",
+                        "semantic_score": semantic["score"] if semantic else 0.0,
+                        "keyword_score": keyword["score"] if keyword else 0.0,
                     }
+                )
 
-            # Sort by combined score and limit results
-            results = list(combined_results.values())
-            results.sort(key=lambda x: x["score"], reverse=True)
-
-            return results[:max_results]
+            return results
 
         except Exception as e:
             logger.error(f"Hybrid search failed: {e}")
@@ -304,27 +308,78 @@ class SearchService:
             Similarity score between 0 and 1
         """
         try:
-            # Simple text-based similarity for now
-            # In production, this would use vector embeddings
+            return self._term_overlap(
+                set(tokenize(query)), set(tokenize(tool_search_text(tool)))
+            )
 
-            query_lower = query.lower()
-            tool_text = f"{tool['name']} {tool['description']} {' '.join(tool.get('tags', []))}".lower()
+        except Exception as e:
+            logger.error(f"Similarity calculation failed: {e}")
+            return 0.0
 
-            # Calculate Jaccard similarity
-            query_words = set(query_lower.split())
-            tool_words = set(tool_text.split())
+    @staticmethod
+    def _term_overlap(query_terms: set[str], tool_terms: Iterable[str]) -> float:
+        """Calculate the Jaccard similarity of two term sets."""
+        tool_terms = set(tool_terms)
+        if not query_terms or not tool_terms:
+            return 0.0
 
-            if not query_words or not tool_words:
-                return 0.0
+        intersection = len(query_terms & tool_terms)
+        return intersection / (len(query_terms) + len(tool_terms) - intersection)
 
-            intersection = query_words.intersection(tool_words)
-            union = query_words.union(tool_words)
+    def _format_result(
+        self, tool: dict[str, Any], score: float, match_type: str
+    ) -> dict[str, Any]:
+        """Format a tool as a search result."""
+        return {
+            "id": tool["id"],
+            "name": tool["name"],
+            "description": tool["description"],
+            "category": tool.get("category"),
+            "score": score,
+            "match_type": match_type,
+        }
 
-            return len(intersection) / len(union)
+    def _resolve_tool(self, tool_id: str, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Get an indexed tool by ID or name, falling back to vector metadata."""
+        tool = self.tools.get(tool_id) or self.tools.get(
+            self._tool_ids_by_name.get(tool_id, "")
+        )
+        if tool is None:
+            categories = metadata.get("categories") or []
+            tool = {
+                "id": tool_id,
+                "name": metadata.get("name", tool_id),
+                "description": metadata.get("description", ""),
+                "category": categories[0] if categories else None,
+            }
+        return tool
 
-        except Exception as e:
-            logger.error(f"Similarity calculation failed: {e}")
-            return 0.0
+    def index_tool(self, tool: dict[str, Any]) -> None:
+        """
+        Add or update a tool in the search index.
+
+        Args:
+            tool: Tool data with at least ``id``, ``name`` and ``description``
+        """
+        previous = self.tools.get(tool["id"])
+        if previous is not None:
+            self._tool_ids_by_name.pop(previous["name"], None)
+
+        self.tools[tool["id"]] = tool
+        self._tool_ids_by_name[tool["name"]] = tool["id"]
+        self.keyword_index.add(tool["id"], tool_search_text(tool))
+
+    def remove_tool(self, tool_id: str) -> None:
+        """
+        Remove a tool from the search index.
+
+        Args:
+            tool_id: Tool ID
+        """
+        tool = self.tools.pop(tool_id, None)
+        if tool is not None:
+            self._tool_ids_by_name.pop(tool["name"], None)
+        self.keyword_index.remove(tool_id)
 
     def _get_available_tools(self) -> list[dict[str, Any]]:
         """
@@ -457,3 +512,20 @@ class SearchService:
             "search_types": search_types,
             "recent_queries": [s["query"] for s in self.search_history[-10:]],
         }
+
+
+# Global search service instance
+_search_service: SearchService | None = None
+
+
+def get_search_service() -> SearchService:
+    """
+    Get the global search service.
+
+    Tool services created by the app share this instance, so its keyword
+    index follows tool registrations, updates and deletions.
+    """
+    global _search_service
+    if _search_service is None:
+        _search_service = SearchService()
+    return _search_service
@@ -11,6 +11,7 @@ from typing import Any
 
 from ..exceptions import ToolExecutionError, ToolNotFoundError, ValidationError
 from ..utils.logging import get_logger
+from .search_service import SearchService
 
 logger = get_logger(__name__)
 
@@ -23,8 +24,14 @@ class ToolService:
     registration, discovery, execution, and lifecycle management.
     """
 
-    def __init__(self):
-        """Initialize the tool service."""
+    def __init__(self, search_service: SearchService | None = None):
+        """
+        Initialize the tool service.
+
+        Args:
+            search_service: Optional search service kept in sync with tool changes
+        """
+        self.search_service = search_service
         self.tools: dict[str, dict[str, Any]] = {}
         self.execution_history: list[dict[str, Any]] = []
 
@@ -79,6 +86,8 @@ class ToolService:
             }
 
             self.tools[tool_id] = tool_entry
+            if self.search_service:
+                self.search_service.index_tool(tool_entry)
 
             logger.info(f"Tool '{tool_data['name']}' registered with ID: {tool_id}")
             return tool_id
@@ -176,6 +185,8 @@ class ToolService:
 
         # Update in storage
         self.tools[tool["id"]] = tool
+        if self.search_service:
+            self.search_service.index_tool(tool)
 
         logger.info(f"Tool '{tool_name}' updated by user: {user_id}")
         return tool
@@ -202,6 +213,8 @@ class ToolService:
 
         # Update in storage
         self.tools[tool["id"]] = tool
+        if self.search_service:
+            self.search_service.remove_tool(tool["id"])
 
         logger.info(f"Tool '{tool_name}' deleted by user: {user_id}")
 
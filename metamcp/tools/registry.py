@@ -5,6 +5,7 @@ This module provides tool registration, discovery, and execution functionality.
 It manages tools with metadata, capabilities, and access control.
 """
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
@@ -12,6 +13,7 @@ from ..cache.decorators import cache_invalidate, cache_result
 from ..config import get_settings
 from ..exceptions import ToolExecutionError, ToolNotFoundError, ToolRegistrationError
 from ..llm.service import LLMService
+from ..performance.http_client import HTTPClientManager, get_http_client_manager
 from ..security.policies import PolicyEngine
 from ..utils.logging import get_logger
 from ..vector.client import VectorSearchClient
@@ -33,6 +35,7 @@ class ToolRegistry:
         vector_client: VectorSearchClient,
         llm_service: LLMService,
         policy_engine: PolicyEngine,
+        http_client: HTTPClientManager | None = None,
     ):
         """
         Initialize Tool Registry.
@@ -41,10 +44,12 @@ class ToolRegistry:
             vector_client: Vector search client for semantic discovery
             llm_service: LLM service for tool descriptions
             policy_engine: Policy engine for access control
+            http_client: Outbound HTTP client pool (defaults to the shared pool)
         """
         self.vector_client = vector_client
         self.llm_service = llm_service
         self.policy_engine = policy_engine
+        self.http_client = http_client or get_http_client_manager()
 
         # Tool storage
         self.tools: dict[str, dict[str, Any]] = {}
@@ -53,6 +58,9 @@ class ToolRegistry:
         # Execution tracking
         self.execution_history: list[dict[str, Any]] = []
 
+        # Execution URL that last succeeded for each tool
+        self.resolved_endpoints: dict[str, str] = {}
+
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -130,10 +138,9 @@ class ToolRegistry:
             },
         ]
 
-        for tool in initial_tools:
-            await self.register_tool(tool)
+        await self.register_tools(initial_tools)
 
-    @cache_invalidate(pattern="tools:list:*")
+    @cache_invalidate(tags=["tools:list"])
     async def register_tool(self, tool_data: dict[str, Any]) -> str:
         """
         Register a new tool.
@@ -157,7 +164,8 @@ class ToolRegistry:
                     error_code="missing_description",
                 )
 
-            # Store tool
+            # Store tool and forget any endpoint learned for a previous version
+            self.resolved_endpoints.pop(tool_id, None)
             self.tools[tool_id] = {
                 **tool_data,
                 "registered_at": datetime.now(UTC).isoformat(),
@@ -188,6 +196,26 @@ class ToolRegistry:
                 error_code="registration_failed",
             ) from e
 
+    async def register_tools(self, tools_data: list[dict[str, Any]]) -> list[str]:
+        """
+        Register several tools concurrently.
+
+        Registrations run together so the LLM service can embed all tool
+        descriptions in shared batched calls.
+
+        Args:
+            tools_data: Metadata and configuration of each tool
+
+        Returns:
+            Tool IDs in the same order
+
+        Raises:
+            ToolRegistrationError: If any registration fails
+        """
+        return list(
+            await asyncio.gather(*(self.register_tool(tool) for tool in tools_data))
+        )
+
     async def _generate_tool_embedding(self, tool_data: dict[str, Any]) -> list[float]:
         """Generate embedding for tool description."""
         try:
@@ -221,7 +249,13 @@ class ToolRegistry:
             logger.warning(f"Failed to generate tool embedding: {e}")
             return [0.0] * 1536  # Default embedding with correct dimension
 
-    @cache_result(ttl=300, key_prefix="tools:list", strategy="short")
+    @cache_result(
+        ttl=300,
+        key_prefix="tools:list",
+        strategy="short",
+        stale_ttl=60,
+        tags=["tools:list", "user:{user_id}"],
+    )
     async def list_tools(self, user_id: str) -> list[dict[str, Any]]:
         """
         List available tools for a user.
@@ -232,19 +266,15 @@ class ToolRegistry:
         Returns:
             List of available tools
         """
-        available_tools = []
+        allowed = await self._check_read_access(user_id, list(self.tools))
 
-        for tool_id, tool_data in self.tools.items():
-            try:
-                # Check access permissions
-                if await self.policy_engine.check_access(
-                    user_id=user_id, resource=f"tool:{tool_id}", action="read"
-                ):
-                    available_tools.append({"id": tool_id, **tool_data})
-            except Exception as e:
-                logger.warning(f"Access check failed for tool {tool_id}: {e}")
-                # Include tool if access check fails (fail open)
-                available_tools.append({"id": tool_id, **tool_data})
+        available_tools = [
+            {"id": tool_id, **tool_data}
+            for (tool_id, tool_data), is_allowed in zip(
+                self.tools.items(), allowed, strict=True
+            )
+            if is_allowed
+        ]
 
         return available_tools
 
@@ -299,16 +329,19 @@ class ToolRegistry:
                 )
 
                 # Filter by access permissions
-                filtered_results = []
-                for result in results:
-                    tool_id = result["id"]
-                    if await self.policy_engine.check_access(
-                        user_id=user_id, resource=f"tool:{tool_id}", action="read"
-                    ):
-                        tool_data = self.tools.get(tool_id, {})
-                        filtered_results.append(
-                            {**tool_data, "similarity_score": result.get("score", 0.0)}
-                        )
+                allowed = await self.policy_engine.check_access_many(
+                    user_id=user_id,
+                    resources=[f"tool:{result['id']}" for result in results],
+                    action="read",
+                )
+                filtered_results = [
+                    {
+                        **self.tools.get(result["id"], {}),
+                        "similarity_score": result.get("score", 0.0),
+                    }
+                    for result, is_allowed in zip(results, allowed, strict=True)
+                    if is_allowed
+                ]
 
                 return filtered_results[:max_results]
 
@@ -325,38 +358,50 @@ class ToolRegistry:
     ) -> list[dict[str, Any]]:
         """Fallback search using simple text matching."""
         query_lower = query.lower()
-        results = []
+        matches = []
 
         for tool_id, tool_data in self.tools.items():
-            try:
-                # Check access
-                if not await self.policy_engine.check_access(
-                    user_id=user_id, resource=f"tool:{tool_id}", action="read"
-                ):
-                    continue
-
-                # Simple text matching
-                description = tool_data.get("description", "").lower()
-                categories = [cat.lower() for cat in tool_data.get("categories", [])]
-
-                if query_lower in description or any(
-                    query_lower in cat for cat in categories
-                ):
-                    results.append(
-                        {
-                            "id": tool_id,
-                            **tool_data,
-                            "similarity_score": 0.8,  # Default score
-                        }
-                    )
+            # Simple text matching
+            description = tool_data.get("description", "").lower()
+            categories = [cat.lower() for cat in tool_data.get("categories", [])]
+
+            if query_lower in description or any(
+                query_lower in cat for cat in categories
+            ):
+                matches.append((tool_id, tool_data))
 
-            except Exception as e:
-                logger.warning(f"Access check failed for tool {tool_id}: {e}")
-                # Include if access check fails
-                results.append({"id": tool_id, **tool_data, "similarity_score": 0.8})
+        # Check access for the matching tools in one batch
+        allowed = await self._check_read_access(
+            user_id, [tool_id for tool_id, _ in matches]
+        )
+
+        results = [
+            {
+                "id": tool_id,
+                **tool_data,
+                "similarity_score": 0.8,  # Default score
+            }
+            for (tool_id, tool_data), is_allowed in zip(matches, allowed, strict=True)
+            if is_allowed
+        ]
 
         return results[:max_results]
 
+    async def _check_read_access(
+        self, user_id: str, tool_ids: list[str]
+    ) -> list[bool]:
+        """Check read access to tools, allowing all if the check fails."""
+        try:
+            return await self.policy_engine.check_access_many(
+                user_id=user_id,
+                resources=[f"tool:{tool_id}" for tool_id in tool_ids],
+                action="read",
+            )
+        except Exception as e:
+            logger.warning(f"Access check failed for tools: {e}")
+            # Include tools if access check fails (fail open)
+            return [True] * len(tool_ids)
+
     async def execute_tool(
         self, tool_name: str, arguments: dict[str, Any], user_id: str
     ) -> dict[str, Any]:
@@ -430,8 +475,6 @@ class ToolRegistry:
         self, tool_name: str, arguments: dict[str, Any], tool_data: dict[str, Any]
     ) -> Any:
         """Internal tool execution implementation with retry logic and improved error handling."""
-        import asyncio
-
         import httpx
 
         endpoint = tool_data.get("endpoint")
@@ -450,14 +493,14 @@ class ToolRegistry:
         retry_attempts = settings.tool_retry_attempts
         retry_delay = settings.tool_retry_delay
 
+        from ..utils.circuit_breaker import (
+            CircuitBreakerConfig,
+            CircuitBreakerOpenError,
+            get_circuit_breaker,
+        )
+
         # Circuit breaker configuration
         if settings.circuit_breaker_enabled:
-            from ..utils.circuit_breaker import (
-                CircuitBreakerConfig,
-                CircuitBreakerOpenError,
-                get_circuit_breaker,
-            )
-
             cb_config = CircuitBreakerConfig(
                 failure_threshold=settings.circuit_breaker_failure_threshold,
                 recovery_timeout=settings.circuit_breaker_recovery_timeout,
@@ -481,63 +524,90 @@ class ToolRegistry:
             endpoint,  # Direct endpoint
         ]
 
-        last_error = None
-        response = None
+        async def make_http_call(exec_endpoint: str):
+            return await self.http_client.post(
+                exec_endpoint,
+                timeout=timeout,
+                json={
+                    "tool": tool_name,
+                    "arguments": arguments,
+                    "timestamp": datetime.now(UTC).isoformat(),
+                },
+                headers={
+                    "Content-Type": "application/json",
+                    "User-Agent": "MetaMCP/1.0.0",
+                },
+            )
 
-        # Retry logic for each endpoint
-        for attempt in range(retry_attempts):
-            for exec_endpoint in execution_endpoints:
-                try:
-                    # Define the HTTP call function
-                    async def make_http_call():
-                        async with httpx.AsyncClient(timeout=timeout) as client:
-                            return await client.post(
-                                exec_endpoint,
-                                json={
-                                    "tool": tool_name,
-                                    "arguments": arguments,
-                                    "timestamp": datetime.now(UTC).isoformat(),
-                                },
-                                headers={
-                                    "Content-Type": "application/json",
-                                    "User-Agent": "MetaMCP/1.0.0",
-                                },
-                            )
+        async def try_endpoints(candidates: list[str], attempt: int):
+            """Call candidates in order until one succeeds or the host is down."""
+            response = None
+            last_error = None
 
+            for exec_endpoint in candidates:
+                try:
                     # Execute with circuit breaker if enabled
                     if circuit_breaker:
-                        try:
-                            response = await circuit_breaker.call(make_http_call)
-                        except CircuitBreakerOpenError as e:
-                            last_error = f"Circuit breaker open for {tool_name}: {e}"
-                            logger.warning(
-                                f"Circuit breaker open for {tool_name} at {exec_endpoint}"
-                            )
-                            continue
+                        response = await circuit_breaker.call(
+                            make_http_call, exec_endpoint
+                        )
                     else:
-                        response = await make_http_call()
+                        response = await make_http_call(exec_endpoint)
 
                     if response.status_code == 200:
-                        break
-                    else:
-                        last_error = f"HTTP {response.status_code}: {response.text}"
+                        self.resolved_endpoints[tool_name] = exec_endpoint
+                        return response, None
+
+                    last_error = f"HTTP {response.status_code}: {response.text}"
 
+                except CircuitBreakerOpenError as e:
+                    # The breaker is per tool, so every candidate is blocked
+                    logger.warning(f"Circuit breaker open for {tool_name}")
+                    return None, f"Circuit breaker open for {tool_name}: {e}"
                 except httpx.TimeoutException:
-                    last_error = f"Timeout connecting to {exec_endpoint}"
+                    # Other paths on the same host would time out as well
                     logger.warning(
                         f"Timeout on attempt {attempt + 1} for {tool_name} at {exec_endpoint}"
                     )
+                    return None, f"Timeout connecting to {exec_endpoint}"
                 except httpx.ConnectError:
-                    last_error = f"Connection error to {exec_endpoint}"
                     logger.warning(
                         f"Connection error on attempt {attempt + 1} for {tool_name} at {exec_endpoint}"
                     )
+                    return None, f"Connection error to {exec_endpoint}"
                 except Exception as e:
                     last_error = f"Error calling {exec_endpoint}: {str(e)}"
                     logger.warning(
                         f"Error on attempt {attempt + 1} for {tool_name} at {exec_endpoint}: {e}"
                     )
 
+            return response, last_error
+
+        last_error = None
+        response = None
+
+        # Retry logic: steady-state calls hit only the learned endpoint,
+        # alternatives are probed on a cold start or once it is gone
+        for attempt in range(retry_attempts):
+            resolved = self.resolved_endpoints.get(tool_name)
+            if resolved not in execution_endpoints:
+                resolved = None
+
+            if resolved:
+                response, last_error = await try_endpoints([resolved], attempt)
+                if response is not None and response.status_code in (404, 410):
+                    logger.info(
+                        f"Learned endpoint for {tool_name} returned "
+                        f"{response.status_code}, re-probing alternatives"
+                    )
+                    self.resolved_endpoints.pop(tool_name, None)
+                    resolved = None
+
+            if not resolved:
+                response, last_error = await try_endpoints(
+                    execution_endpoints, attempt
+                )
+
             # If we got a successful response, break out of retry loop
             if response and response.status_code == 200:
                 break
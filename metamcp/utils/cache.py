@@ -6,16 +6,37 @@ and caching strategies for improved performance.
 """
 
 import asyncio
+import fnmatch
+import heapq
 import json
+import math
+import pickle
+import random
+import sys
 import time
+import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
+from .cache_codecs import CacheSerializer, create_serializer
+from .cache_policies import create_eviction_policy
+from .constants import (
+    DEFAULT_CACHE_INVALIDATION_CHANNEL,
+    DEFAULT_CACHE_L1_MAX_SIZE,
+    DEFAULT_CACHE_L1_TTL,
+)
 from .logging import get_logger
+from .redis_scripts import ADD_TAG, claim_tag_script
 
 logger = get_logger(__name__)
 
+# Redis sets listing the keys cached under each tag
+TAG_KEY_PREFIX = "cache:tag:"
+# Keys deleted per UNLINK when invalidating
+UNLINK_BATCH_SIZE = 500
+
 
 @dataclass
 class CacheConfig:
@@ -25,6 +46,30 @@ class CacheConfig:
     max_size: int = 1000
     enable_compression: bool = False
     enable_serialization: bool = True
+    # Memory backend only: eviction policy (lru, lfu or tinylfu) and an
+    # optional bound on the estimated size of all values in bytes
+    eviction_policy: str = "lru"
+    max_bytes: int | None = None
+
+
+@dataclass
+class CacheEntry:
+    """Entry of the in-memory cache."""
+
+    value: Any
+    expires_at: float | None
+    created_at: float
+    size: int = 0
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the size of a cached value in bytes."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
 
 
 class CacheBackend(ABC):
@@ -62,58 +107,105 @@ class CacheBackend(ABC):
 
 
 class MemoryCacheBackend(CacheBackend):
-    """In-memory cache backend."""
+    """
+    In-memory cache backend.
+
+    Lookups, inserts and evictions are O(1): the eviction policy keeps keys
+    in ordered dicts, and expiry times sit in a min-heap so expired entries
+    are purged as they come due instead of by scanning the cache. When
+    ``max_bytes`` is set, values are also evicted to keep their estimated
+    total size within it.
+    """
+
+    def __init__(
+        self,
+        config: CacheConfig | None = None,
+        size_of: Callable[[Any], int] = estimate_size,
+    ):
+        """
+        Initialize memory cache backend.
 
-    def __init__(self, config: CacheConfig | None = None):
-        """Initialize memory cache backend."""
+        Args:
+            config: Cache configuration
+            size_of: Function estimating the size of a value in bytes, used
+                when ``max_bytes`` is set
+        """
         self.config = config or CacheConfig()
-        self._cache: dict[str, dict[str, Any]] = {}
-        self._access_times: dict[str, float] = {}
+        self._size_of = size_of
+        self._cache: dict[str, CacheEntry] = {}
+        self._policy = create_eviction_policy(
+            self.config.eviction_policy, self.config.max_size
+        )
+        # (expires_at, sequence, key); entries of overwritten or deleted keys
+        # stay until they come due or the heap is compacted
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._expiry_sequence = 0
+        self._bytes = 0
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
     async def get(self, key: str) -> Any | None:
         """Get value from cache."""
-        if key in self._cache:
-            entry = self._cache[key]
-
-            # Check expiration
-            if entry["expires_at"] and time.time() > entry["expires_at"]:
-                await self.delete(key)
-                self._misses += 1
-                return None
-
-            # Update access time
-            self._access_times[key] = time.time()
-            self._hits += 1
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
 
-            return entry["value"]
+        # Check expiration
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
 
-        self._misses += 1
-        return None
+        self._policy.on_access(key)
+        self._hits += 1
+        return entry.value
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in cache."""
         try:
-            # Check cache size limit
-            if len(self._cache) >= self.config.max_size:
-                await self._evict_oldest()
+            now = time.monotonic()
+            self._purge_expired(now)
 
             # Calculate expiration time
             expires_at = None
             if ttl is not None:
-                expires_at = time.time() + ttl
+                expires_at = now + ttl
             elif self.config.ttl > 0:
-                expires_at = time.time() + self.config.ttl
+                expires_at = now + self.config.ttl
 
-            # Store entry
-            self._cache[key] = {
-                "value": value,
-                "expires_at": expires_at,
-                "created_at": time.time(),
-            }
-            self._access_times[key] = time.time()
+            size = 0
+            if self.config.max_bytes is not None:
+                size = self._size_of(value)
+                if size > self.config.max_bytes:
+                    self._remove(key)
+                    logger.warning(f"Cache value for {key} exceeds max_bytes")
+                    return False
 
+            # Store entry
+            previous = self._cache.get(key)
+            self._cache[key] = CacheEntry(
+                value=value, expires_at=expires_at, created_at=now, size=size
+            )
+            if previous is None:
+                self._policy.on_insert(key)
+            else:
+                self._bytes -= previous.size
+                self._policy.on_access(key)
+            self._bytes += size
+
+            if expires_at is not None:
+                self._expiry_sequence += 1
+                heapq.heappush(
+                    self._expiry_heap, (expires_at, self._expiry_sequence, key)
+                )
+                if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                    self._compact_expiry_heap()
+
+            self._evict()
             return True
 
         except Exception as e:
@@ -123,12 +215,7 @@ class MemoryCacheBackend(CacheBackend):
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
         try:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_times:
-                    del self._access_times[key]
-                return True
-            return False
+            return self._remove(key)
 
         except Exception as e:
             logger.error(f"Failed to delete cache entry: {e}")
@@ -138,7 +225,9 @@ class MemoryCacheBackend(CacheBackend):
         """Clear all cache entries."""
         try:
             self._cache.clear()
-            self._access_times.clear()
+            self._policy.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
             return True
 
         except Exception as e:
@@ -147,13 +236,14 @@ class MemoryCacheBackend(CacheBackend):
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        if key in self._cache:
-            entry = self._cache[key]
-            if entry["expires_at"] and time.time() > entry["expires_at"]:
-                await self.delete(key)
-                return False
-            return True
-        return False
+        entry = self._cache.get(key)
+        if entry is None:
+            return False
+        if entry.expires_at is not None and time.monotonic() >= entry.expires_at:
+            self._remove(key)
+            self._expirations += 1
+            return False
+        return True
 
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -161,41 +251,178 @@ class MemoryCacheBackend(CacheBackend):
         hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
 
         # Clean expired entries
-        expired_count = 0
-        current_time = time.time()
-        for key, entry in list(self._cache.items()):
-            if entry["expires_at"] and current_time > entry["expires_at"]:
-                await self.delete(key)
-                expired_count += 1
+        expired_count = self._purge_expired(time.monotonic())
 
         return {
             "backend": "memory",
             "size": len(self._cache),
             "max_size": self.config.max_size,
+            "bytes": self._bytes,
+            "max_bytes": self.config.max_bytes,
+            "eviction_policy": self.config.eviction_policy,
             "hits": self._hits,
             "misses": self._misses,
             "hit_rate": hit_rate,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
             "expired_entries": expired_count,
             "ttl": self.config.ttl,
         }
 
-    async def _evict_oldest(self):
-        """Evict oldest cache entries."""
-        if not self._access_times:
-            return
+    async def clear_pattern(self, pattern: str) -> int:
+        """Delete all entries whose key matches a glob pattern."""
+        matching = [key for key in self._cache if fnmatch.fnmatchcase(key, pattern)]
+        for key in matching:
+            self._remove(key)
+        return len(matching)
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and forget it in the eviction policy."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        self._policy.on_remove(key)
+        return True
+
+    def _evict(self) -> None:
+        """Evict entries until the cache is within its size limits."""
+        max_bytes = self.config.max_bytes
+        while len(self._cache) > self.config.max_size or (
+            max_bytes is not None and self._bytes > max_bytes
+        ):
+            victim = self._policy.victim()
+            if victim is None:
+                break
+            self._remove(victim)
+            self._evictions += 1
+
+    def _purge_expired(self, now: float) -> int:
+        """Remove entries whose expiry time has passed."""
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap entries left behind by overwrites
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                purged += 1
+        self._expirations += purged
+        return purged
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop heap entries of keys that were overwritten or deleted."""
+        self._expiry_heap = [
+            (entry.expires_at, index, key)
+            for index, (key, entry) in enumerate(self._cache.items())
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._expiry_sequence = len(self._expiry_heap)
+
+
+def tag_key(tag: str) -> str:
+    """Get the Redis set listing the keys cached under a tag."""
+    return f"{TAG_KEY_PREFIX}{{{tag}}}"
+
+
+def add_tags(pipe: Any, key: str, tags: list[str], ttl: int) -> None:
+    """
+    Queue commands registering a key under tags on a Redis pipeline.
+
+    Each tag set lives as long as the longest-lived key added to it, so sets
+    of abandoned tags expire. Stale members left by keys that expired
+    earlier are harmless: invalidating them unlinks nothing.
+
+    The script is sent with EVAL rather than EVALSHA, since a pipeline
+    cannot reload it after a NOSCRIPT error.
+    """
+    for tag in tags:
+        pipe.eval(ADD_TAG, 1, tag_key(tag), key, ttl)
 
-        # Find oldest accessed entry
-        oldest_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-        await self.delete(oldest_key)
+
+async def unlink_matching(
+    redis: Any, pattern: str, batch_size: int = UNLINK_BATCH_SIZE
+) -> int:
+    """
+    Delete all keys matching a glob pattern without blocking Redis.
+
+    Keys are found incrementally with SCAN and deleted with UNLINK in
+    batches, so Redis keeps serving other clients while a large keyspace is
+    walked and frees the values in a background thread.
+
+    Args:
+        redis: Async Redis client
+        pattern: Glob pattern
+        batch_size: Keys scanned per SCAN call and deleted per UNLINK
+
+    Returns:
+        Number of deleted keys
+    """
+    count = 0
+    batch = []
+    async for key in redis.scan_iter(match=pattern, count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            count += await redis.unlink(*batch)
+            batch = []
+    if batch:
+        count += await redis.unlink(*batch)
+    return count
+
+
+async def invalidate_tag(
+    redis: Any, tag: str, batch_size: int = UNLINK_BATCH_SIZE
+) -> list[str]:
+    """
+    Delete all keys cached under a tag.
+
+    The tag set is first renamed atomically, so keys tagged while the
+    invalidation runs are kept in a new set rather than being lost. Its
+    members are then read with SSCAN and deleted with UNLINK in batches.
+
+    Args:
+        redis: Async Redis client
+        tag: Tag to invalidate
+        batch_size: Members read per SSCAN call and deleted per UNLINK
+
+    Returns:
+        Keys that were cached under the tag
+    """
+    set_key = tag_key(tag)
+    claimed = f"{set_key}:invalidating:{uuid.uuid4().hex}"
+    if not await claim_tag_script(redis, [set_key, claimed], []):
+        return []
+
+    keys = []
+    batch = []
+    async for member in redis.sscan_iter(claimed, count=batch_size):
+        key = member.decode("utf-8") if isinstance(member, bytes) else member
+        keys.append(key)
+        batch.append(key)
+        if len(batch) >= batch_size:
+            await redis.unlink(*batch)
+            batch = []
+    await redis.unlink(*batch, claimed)
+    return keys
 
 
 class RedisCacheBackend(CacheBackend):
     """Redis cache backend."""
 
-    def __init__(self, redis_url: str, config: CacheConfig | None = None):
+    def __init__(
+        self,
+        redis_url: str,
+        config: CacheConfig | None = None,
+        serializer: CacheSerializer | None = None,
+    ):
         """Initialize Redis cache backend."""
         self.redis_url = redis_url
         self.config = config or CacheConfig()
+        self.serializer = serializer or create_serializer(
+            "json", "zlib" if self.config.enable_compression else None
+        )
         self._redis = None
         self._hits = 0
         self._misses = 0
@@ -222,7 +449,7 @@ class RedisCacheBackend(CacheBackend):
 
             if value is not None:
                 self._hits += 1
-                return json.loads(value)
+                return self.serializer.loads(value)
 
             self._misses += 1
             return None
@@ -236,7 +463,7 @@ class RedisCacheBackend(CacheBackend):
         """Set value in cache."""
         try:
             redis_client = await self._get_redis()
-            serialized_value = json.dumps(value)
+            serialized_value = self.serializer.dumps(value)
 
             if ttl is not None:
                 await redis_client.setex(key, ttl, serialized_value)
@@ -283,6 +510,16 @@ class RedisCacheBackend(CacheBackend):
             logger.error(f"Failed to check existence in Redis cache: {e}")
             return False
 
+    async def clear_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob pattern."""
+        try:
+            redis_client = await self._get_redis()
+            return await unlink_matching(redis_client, pattern)
+
+        except Exception as e:
+            logger.error(f"Failed to clear pattern from Redis cache: {e}")
+            return 0
+
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         try:
@@ -300,6 +537,7 @@ class RedisCacheBackend(CacheBackend):
                 "misses": self._misses,
                 "hit_rate": hit_rate,
                 "ttl": self.config.ttl,
+                "serializer": self.serializer.get_stats(),
             }
 
         except Exception as e:
@@ -307,6 +545,436 @@ class RedisCacheBackend(CacheBackend):
             return {"backend": "redis", "error": str(e)}
 
 
+# Values of these types cannot be mutated, so L1 can hand them out as is
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Copy a cached value so callers cannot mutate the cached instance.
+
+    A pickle round trip is used as it is considerably faster than
+    copy.deepcopy for the JSON-like values held in the cache.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class TieredCacheBackend(CacheBackend):
+    """
+    Two-tier cache backend.
+
+    A bounded in-process L1 sits in front of a shared L2, normally Redis.
+    Reads are served from L1 and fill it from L2 on a miss; writes and
+    deletes go through to both tiers. When a Redis URL is given, every
+    change is published on a pub/sub channel so other workers drop their
+    copies from L1. L1 entries also expire after a short TTL, which bounds
+    staleness if an invalidation message is lost.
+
+    L1 keeps its own copy of each value and hands out copies, so a caller
+    mutating a result cannot change what other callers read, just as with
+    values decoded from Redis.
+    """
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        l1: MemoryCacheBackend | None = None,
+        redis_url: str | None = None,
+        channel: str = DEFAULT_CACHE_INVALIDATION_CHANNEL,
+    ):
+        """
+        Initialize tiered cache backend.
+
+        Args:
+            l2: Shared cache backend
+            l1: In-process cache backend; its TTL caps how long L1 keeps
+                entries
+            redis_url: Redis URL for pub/sub invalidation across workers
+            channel: Pub/sub channel for invalidation messages
+        """
+        self.l1 = l1 or MemoryCacheBackend(
+            CacheConfig(ttl=DEFAULT_CACHE_L1_TTL, max_size=DEFAULT_CACHE_L1_MAX_SIZE)
+        )
+        self.l2 = l2
+        self.redis_url = redis_url
+        self.channel = channel
+
+        # Identifies our own invalidation messages
+        self._origin = uuid.uuid4().hex
+        # Bumped on every write and remote invalidation; L2 reads that raced
+        # with one are not copied into L1
+        self._generation = 0
+
+        self._redis = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self._subscribe_lock = asyncio.Lock()
+        self._subscribe_retry_at = 0.0
+
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+        self._invalidations_sent = 0
+        self._invalidations_received = 0
+
+    async def get(self, key: str) -> Any | None:
+        """Get value from L1, falling back to L2."""
+        await self._ensure_subscribed()
+
+        value = await self.l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+            return _copy_value(value)
+
+        generation = self._generation
+        value = await self.l2.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._l2_hits += 1
+        if generation == self._generation:
+            await self.l1.set(key, _copy_value(value))
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: list[str] | None = None,
+    ) -> bool:
+        """
+        Set value in both tiers and invalidate other workers' L1.
+
+        Tags are registered in L2, which must support them when given.
+        """
+        await self._ensure_subscribed()
+
+        self._generation += 1
+        stored = (
+            await self.l2.set(key, value, ttl, tags=tags)
+            if tags
+            else await self.l2.set(key, value, ttl)
+        )
+        if not stored:
+            await self.l1.delete(key)
+            return False
+
+        l1_ttl = self.l1.config.ttl
+        await self.l1.set(
+            key,
+            _copy_value(value),
+            min(ttl, l1_ttl) if ttl is not None else l1_ttl,
+        )
+        await self._publish({"keys": [key]})
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from both tiers and other workers' L1."""
+        await self._ensure_subscribed()
+
+        self._generation += 1
+        await self.l1.delete(key)
+        result = await self.l2.delete(key)
+        await self._publish({"keys": [key]})
+        return result
+
+    async def clear(self) -> bool:
+        """Clear both tiers and other workers' L1."""
+        await self._ensure_subscribed()
+
+        self._generation += 1
+        await self.l1.clear()
+        result = await self.l2.clear()
+        await self._publish({"clear": True})
+        return result
+
+    async def clear_pattern(self, pattern: str) -> int:
+        """
+        Delete all entries matching a glob pattern from both tiers.
+
+        Returns:
+            Number of entries deleted from L2, or from L1 if the L2 backend
+            cannot delete by pattern
+        """
+        await self._ensure_subscribed()
+
+        self._generation += 1
+        count = await self.l1.clear_pattern(pattern)
+        if hasattr(self.l2, "clear_pattern"):
+            count = await self.l2.clear_pattern(pattern)
+        await self._publish({"pattern": pattern})
+        return count
+
+    async def invalidate_tags(self, tags: list[str]) -> list[str]:
+        """
+        Delete all entries cached under any of the tags from both tiers.
+
+        Returns:
+            Keys that were cached under the tags
+        """
+        if not hasattr(self.l2, "invalidate_tags"):
+            return []
+        await self._ensure_subscribed()
+
+        keys = await self.l2.invalidate_tags(tags)
+        # Invalidation may take several round trips; L2 reads that raced
+        # with it must not fill L1 afterwards
+        self._generation += 1
+        for key in keys:
+            await self.l1.delete(key)
+        if keys:
+            await self._publish({"keys": keys})
+        return keys
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in either tier."""
+        return await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get per-tier cache statistics."""
+        lookups = self._l1_hits + self._l2_hits + self._misses
+        l2_lookups = self._l2_hits + self._misses
+
+        return {
+            "backend": "tiered",
+            "l1": await self.l1.get_stats(),
+            "l2": await self.l2.get_stats(),
+            "l1_hits": self._l1_hits,
+            "l2_hits": self._l2_hits,
+            "misses": self._misses,
+            "l1_hit_rate": self._l1_hits / lookups if lookups > 0 else 0.0,
+            "l2_hit_rate": self._l2_hits / l2_lookups if l2_lookups > 0 else 0.0,
+            "hit_rate": (
+                (self._l1_hits + self._l2_hits) / lookups if lookups > 0 else 0.0
+            ),
+            "invalidations_sent": self._invalidations_sent,
+            "invalidations_received": self._invalidations_received,
+            "subscribed": self._listener is not None and not self._listener.done(),
+        }
+
+    async def close(self) -> None:
+        """Stop listening for invalidations and close the pub/sub connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def _ensure_subscribed(self) -> None:
+        """Subscribe to the invalidation channel if not already listening."""
+        if self.redis_url is None:
+            return
+        if self._listener is not None and not self._listener.done():
+            return
+        if time.monotonic() < self._subscribe_retry_at:
+            return
+
+        async with self._subscribe_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+
+            try:
+                if self._redis is None:
+                    import redis.asyncio as redis
+
+                    self._redis = redis.from_url(self.redis_url)
+                self._pubsub = self._redis.pubsub()
+                await self._pubsub.subscribe(self.channel)
+            except Exception as e:
+                logger.error(f"Failed to subscribe to cache invalidations: {e}")
+                self._subscribe_retry_at = time.monotonic() + 30
+                return
+
+            # Messages may have been missed while not subscribed
+            await self.l1.clear()
+            self._generation += 1
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Apply invalidation messages published by other workers."""
+        try:
+            async for message in self._pubsub.listen():
+                if message.get("type") == "message":
+                    await self._apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Cache invalidation listener failed: {e}")
+
+    async def _apply_invalidation(self, data: bytes | str) -> None:
+        """Drop the L1 entries named in an invalidation message."""
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+
+        if message.get("origin") == self._origin:
+            return
+
+        self._generation += 1
+        self._invalidations_received += 1
+        if message.get("clear"):
+            await self.l1.clear()
+        elif "pattern" in message:
+            await self.l1.clear_pattern(message["pattern"])
+        else:
+            for key in message.get("keys", []):
+                await self.l1.delete(key)
+
+    async def _publish(self, message: dict[str, Any]) -> None:
+        """Publish an invalidation message to other workers."""
+        if self._redis is None:
+            return
+
+        try:
+            message["origin"] = self._origin
+            await self._redis.publish(self.channel, json.dumps(message))
+            self._invalidations_sent += 1
+        except Exception as e:
+            logger.error(f"Failed to publish cache invalidation: {e}")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent computations of the same key.
+
+    The first caller for a key starts the computation as a task; callers
+    arriving while it runs await the same task instead of starting their
+    own. Cancelling one caller does not cancel the shared computation.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a computation for a key, or join the one already running.
+
+        Args:
+            key: Key identifying the computation
+            func: Coroutine function computing the value
+
+        Returns:
+            Result of the shared computation
+        """
+        task = self._calls.get(key) or self._start(key, func)
+        return await asyncio.shield(task)
+
+    def start_background(self, key: str, func: Callable[[], Awaitable[Any]]) -> None:
+        """Start a computation for a key unless one is already running."""
+        if key not in self._calls:
+            self._start(key, func)
+
+    def in_flight(self, key: str) -> bool:
+        """Check if a computation for a key is running."""
+        return key in self._calls
+
+    def _start(self, key: str, func: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start the shared computation task for a key."""
+        task = asyncio.ensure_future(func())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished computation."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Computation for cache key {key} failed: {task.exception()}")
+
+
+# Marks values stored with stale-while-revalidate metadata
+_SWR_MARKER = "__swr__"
+
+
+async def load_through(
+    key: str,
+    getter: Callable[[str], Awaitable[Any]],
+    setter: Callable[[str, Any, int | None], Awaitable[Any]],
+    loader: Callable[[], Awaitable[Any]],
+    flight: SingleFlight,
+    ttl: int | None = None,
+    stale_ttl: int | None = None,
+    beta: float = 1.0,
+) -> Any:
+    """
+    Get a value from a cache, computing it at most once per key on a miss.
+
+    Concurrent misses for the same key share a single computation. When
+    ``stale_ttl`` is set, values are stored with their refresh time and how
+    long they took to compute, and kept for ``stale_ttl`` seconds past
+    ``ttl``. A value past its refresh time is returned immediately while it
+    is recomputed in the background. Before that, each read may trigger an
+    early background refresh with a probability that rises as the refresh
+    time approaches and with the computation time (XFetch), so hot keys are
+    refreshed before they go stale instead of all at once.
+
+    Args:
+        key: Cache key
+        getter: Function reading a key from the cache
+        setter: Function writing a key, value and TTL to the cache
+        loader: Coroutine function computing the value
+        flight: Single-flight group coalescing computations
+        ttl: Time to live in seconds
+        stale_ttl: Seconds a value may be served stale while it is refreshed
+        beta: Eagerness of early refreshes; 0 disables them
+
+    Returns:
+        Cached or computed value
+    """
+
+    async def refresh() -> Any:
+        start_time = time.monotonic()
+        value = await loader()
+        if stale_ttl is None:
+            await setter(key, value, ttl)
+            return value
+
+        fresh_for = ttl if ttl is not None else 0
+        await setter(
+            key,
+            {
+                _SWR_MARKER: 1,
+                "value": value,
+                "refresh_at": time.time() + fresh_for,
+                "delta": time.monotonic() - start_time,
+            },
+            fresh_for + stale_ttl,
+        )
+        return value
+
+    cached = await getter(key)
+    if cached is None:
+        return await flight.do(key, refresh)
+    if stale_ttl is None:
+        return cached
+    if not (isinstance(cached, dict) and cached.get(_SWR_MARKER)):
+        # Stored without refresh metadata; recompute to add it
+        return await flight.do(key, refresh)
+
+    early = cached["delta"] * beta * -math.log(1.0 - random.random())
+    if time.time() + early >= cached["refresh_at"]:
+        flight.start_background(key, refresh)
+    return cached["value"]
+
+
 class Cache:
     """
     Main cache interface.
@@ -319,6 +987,7 @@ class Cache:
         """Initialize cache with backend."""
         self.backend = backend
         self.config = config or CacheConfig()
+        self._flight = SingleFlight()
 
     def _generate_key(self, *args, **kwargs) -> str:
         """Generate cache key from arguments."""
@@ -361,28 +1030,47 @@ class Cache:
         """Check if key exists in cache."""
         return await self.backend.exists(key)
 
-    async def get_or_set(self, key: str, default_func, ttl: int | None = None) -> Any:
+    async def get_or_set(
+        self,
+        key: str,
+        default_func,
+        ttl: int | None = None,
+        stale_ttl: int | None = None,
+        beta: float = 1.0,
+    ) -> Any:
         """
         Get value from cache or set default if not exists.
 
+        Concurrent calls for a missing key share one call of
+        ``default_func``.
+
         Args:
             key: Cache key
             default_func: Function to call if key doesn't exist
             ttl: Time to live in seconds
+            stale_ttl: Seconds a value may be served stale while it is
+                refreshed in the background (see ``load_through``)
+            beta: Eagerness of probabilistic early refreshes
 
         Returns:
-            Cached value or default
+            Cached or default value
         """
-        value = await self.get(key)
-        if value is None:
-            if asyncio.iscoroutinefunction(default_func):
-                value = await default_func()
-            else:
-                value = default_func()
-
-            await self.set(key, value, ttl)
 
-        return value
+        async def loader() -> Any:
+            if asyncio.iscoroutinefunction(default_func):
+                return await default_func()
+            return default_func()
+
+        return await load_through(
+            key,
+            self.get,
+            self.set,
+            loader,
+            self._flight,
+            ttl=ttl,
+            stale_ttl=stale_ttl,
+            beta=beta,
+        )
 
     async def invalidate_pattern(self, pattern: str) -> int:
         """
@@ -394,11 +1082,9 @@ class Cache:
         Returns:
             Number of invalidated entries
         """
-        # This is a simplified implementation
-        # In production, you might want to use Redis SCAN or similar
-        count = 0
-        # Implementation would depend on backend capabilities
-        return count
+        if not hasattr(self.backend, "clear_pattern"):
+            return 0
+        return await self.backend.clear_pattern(pattern)
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
@@ -426,21 +1112,12 @@ def cache(ttl: int | None = None, key_prefix: str = ""):
             # Get cache instance (this would be injected or global)
             cache_instance = get_cache_instance()
 
-            # Try to get from cache
-            cached_result = await cache_instance.get(cache_key)
-            if cached_result is not None:
-                return cached_result
+            async def compute():
+                if asyncio.iscoroutinefunction(func):
+                    return await func(*args, **kwargs)
+                return func(*args, **kwargs)
 
-            # Execute function
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
-
-            # Cache result
-            await cache_instance.set(cache_key, result, ttl)
-
-            return result
+            return await cache_instance.get_or_set(cache_key, compute, ttl)
 
         def sync_wrapper(*args, **kwargs):
             # For sync functions, we'd need to handle differently
@@ -486,3 +1163,19 @@ def create_redis_cache(redis_url: str, config: CacheConfig | None = None) -> Cac
     """Create Redis cache instance."""
     backend = RedisCacheBackend(redis_url, config)
     return Cache(backend, config)
+
+
+def create_tiered_cache(
+    redis_url: str,
+    config: CacheConfig | None = None,
+    l1_config: CacheConfig | None = None,
+    channel: str = DEFAULT_CACHE_INVALIDATION_CHANNEL,
+) -> Cache:
+    """Create tiered cache instance with an in-process L1 in front of Redis."""
+    backend = TieredCacheBackend(
+        RedisCacheBackend(redis_url, config),
+        MemoryCacheBackend(l1_config) if l1_config else None,
+        redis_url=redis_url,
+        channel=channel,
+    )
+    return Cache(backend, config)
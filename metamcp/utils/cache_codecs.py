@@ -0,0 +1,414 @@
+"""
+Cache Codecs
+
+Serialization of cached values to bytes for Redis. Every encoded value
+starts with a three byte header naming the codec and the compression used,
+so values written with one configuration can be read with another. Pickled
+values are only read when pickle is the configured codec, since anyone able
+to write to Redis could otherwise run code in every reader. Values without
+a header are read as legacy JSON or UTF-8 text.
+"""
+
+import json
+import pickle
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any
+
+from .logging import get_logger
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+# JSON and UTF-8 text never start with a NUL byte
+HEADER_MAGIC = 0
+HEADER_SIZE = 3
+
+# Pickle framing: buffer count and pickle length, then one length per buffer
+_PICKLE_FRAME = struct.Struct("<IQ")
+_BUFFER_LENGTH = struct.Struct("<Q")
+
+# Codecs that only build plain data when decoding
+_SAFE_CODECS = frozenset({"json", "msgpack"})
+
+
+class CacheCodec(ABC):
+    """Abstract base class for value codecs."""
+
+    name: str
+    codec_id: int
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: memoryview) -> Any:
+        """Decode a value."""
+        pass
+
+
+class JSONCodec(CacheCodec):
+    """Compact JSON; values JSON can't represent are stored as strings."""
+
+    name = "json"
+    codec_id = 1
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as JSON."""
+        return json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+
+    def loads(self, data: memoryview) -> Any:
+        """Decode a JSON value."""
+        return json.loads(bytes(data))
+
+
+class MsgpackCodec(CacheCodec):
+    """MessagePack; values msgpack can't represent are stored as strings."""
+
+    name = "msgpack"
+    codec_id = 2
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as MessagePack."""
+        return msgpack.packb(value, use_bin_type=True, default=str)
+
+    def loads(self, data: memoryview) -> Any:
+        """Decode a MessagePack value."""
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+class PickleCodec(CacheCodec):
+    """
+    Pickle protocol 5 with out-of-band buffers.
+
+    Large buffers (bytearrays, arrays) are appended after the pickle stream
+    instead of being copied into it, and are handed back to pickle as views
+    of the stored value when decoding. Pickle preserves all Python types
+    but executes code on load, so only use it with a trusted Redis.
+    """
+
+    name = "pickle"
+    codec_id = 3
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value with pickle."""
+        buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raw = [buffer.raw() for buffer in buffers]
+        return b"".join(
+            [
+                _PICKLE_FRAME.pack(len(raw), len(data)),
+                *(_BUFFER_LENGTH.pack(view.nbytes) for view in raw),
+                data,
+                *raw,
+            ]
+        )
+
+    def loads(self, data: memoryview) -> Any:
+        """Decode a pickled value."""
+        count, length = _PICKLE_FRAME.unpack_from(data)
+        offset = _PICKLE_FRAME.size
+        sizes = []
+        for _ in range(count):
+            sizes.append(_BUFFER_LENGTH.unpack_from(data, offset)[0])
+            offset += _BUFFER_LENGTH.size
+
+        stream = data[offset : offset + length]
+        offset += length
+        buffers = []
+        for size in sizes:
+            buffers.append(data[offset : offset + size])
+            offset += size
+        return pickle.loads(stream, buffers=buffers)
+
+
+class Compressor(ABC):
+    """Abstract base class for compressors."""
+
+    name: str
+    compression_id: int
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress data."""
+        pass
+
+    @abstractmethod
+    def decompress(self, data: memoryview) -> bytes:
+        """Decompress data."""
+        pass
+
+
+class ZlibCompressor(Compressor):
+    """zlib from the standard library."""
+
+    name = "zlib"
+    compression_id = 1
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data with zlib."""
+        return zlib.compress(data, 1)
+
+    def decompress(self, data: memoryview) -> bytes:
+        """Decompress zlib data."""
+        return zlib.decompress(data)
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard, via the zstandard package."""
+
+    name = "zstd"
+    compression_id = 2
+
+    def __init__(self):
+        """Initialize zstd contexts."""
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data with zstd."""
+        return self._compressor.compress(data)
+
+    def decompress(self, data: memoryview) -> bytes:
+        """Decompress zstd data."""
+        return self._decompressor.decompress(data)
+
+
+class Lz4Compressor(Compressor):
+    """LZ4 frames, via the lz4 package."""
+
+    name = "lz4"
+    compression_id = 3
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data with LZ4."""
+        return lz4.frame.compress(data)
+
+    def decompress(self, data: memoryview) -> bytes:
+        """Decompress LZ4 data."""
+        return lz4.frame.decompress(data)
+
+
+CODECS: dict[str, type[CacheCodec]] = {
+    "json": JSONCodec,
+    "msgpack": MsgpackCodec,
+    "pickle": PickleCodec,
+}
+
+COMPRESSORS: dict[str, type[Compressor]] = {
+    "zlib": ZlibCompressor,
+    "zstd": ZstdCompressor,
+    "lz4": Lz4Compressor,
+}
+
+_AVAILABLE = {
+    "msgpack": MSGPACK_AVAILABLE,
+    "zstd": ZSTD_AVAILABLE,
+    "lz4": LZ4_AVAILABLE,
+}
+
+
+def _available(name: str) -> bool:
+    """Check if the package behind a codec or compressor is installed."""
+    return _AVAILABLE.get(name, True)
+
+
+class CacheSerializer:
+    """
+    Encode cached values with a codec and compress large ones.
+
+    Args:
+        codec: Codec name (json, msgpack or pickle)
+        compression: Compressor name (zstd, lz4 or zlib), or None
+        compression_threshold: Minimum encoded size in bytes to compress
+    """
+
+    def __init__(
+        self,
+        codec: str = "json",
+        compression: str | None = None,
+        compression_threshold: int = 1024,
+    ):
+        """Initialize cache serializer."""
+        if codec not in CODECS:
+            raise ValueError(f"Unknown cache codec: {codec}")
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        if not _available(codec):
+            logger.warning(f"Cache codec {codec} is not installed, using json")
+            codec = "json"
+        if compression is not None and not _available(compression):
+            logger.warning(
+                f"Cache compression {compression} is not installed, using zlib"
+            )
+            compression = "zlib"
+
+        self.codec = CODECS[codec]()
+        self.compressor = COMPRESSORS[compression]() if compression else None
+        self.compression_threshold = compression_threshold
+
+        # Decoders are created on first use, so values written by workers
+        # with other settings can still be read. Pickle is never decoded
+        # unless it is the configured codec.
+        self._allowed_codecs = _SAFE_CODECS | {self.codec.name}
+        self._codecs = {self.codec.codec_id: self.codec}
+        self._compressors = (
+            {self.compressor.compression_id: self.compressor}
+            if self.compressor
+            else {}
+        )
+
+        self._encoded_bytes = 0
+        self._stored_bytes = 0
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value.
+
+        Args:
+            value: Value to encode
+
+        Returns:
+            Header followed by the encoded, possibly compressed value
+        """
+        data = self.codec.dumps(value)
+        self._encoded_bytes += len(data)
+
+        compression_id = 0
+        if self.compressor is not None and len(data) >= self.compression_threshold:
+            compressed = self.compressor.compress(data)
+            # Incompressible values are stored as they are
+            if len(compressed) < len(data):
+                data = compressed
+                compression_id = self.compressor.compression_id
+
+        self._stored_bytes += len(data)
+        return bytes((HEADER_MAGIC, self.codec.codec_id, compression_id)) + data
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a value.
+
+        Args:
+            data: Value as stored in Redis
+
+        Returns:
+            Decoded value
+
+        Raises:
+            ValueError: If the header names a codec this serializer does not
+                decode
+        """
+        if not data or data[0] != HEADER_MAGIC:
+            return _loads_legacy(data)
+
+        codec_id, compression_id = data[1], data[2]
+        payload = memoryview(data)[HEADER_SIZE:]
+        if compression_id:
+            payload = memoryview(
+                self._get_compressor(compression_id).decompress(payload)
+            )
+        return self._get_codec(codec_id).loads(payload)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get serializer statistics."""
+        return {
+            "codec": self.codec.name,
+            "compression": self.compressor.name if self.compressor else None,
+            "compression_threshold": self.compression_threshold,
+            "encoded_bytes": self._encoded_bytes,
+            "stored_bytes": self._stored_bytes,
+            "compression_ratio": (
+                self._stored_bytes / self._encoded_bytes
+                if self._encoded_bytes
+                else 1.0
+            ),
+        }
+
+    def _get_codec(self, codec_id: int) -> CacheCodec:
+        """Get the codec for a header codec id."""
+        codec = self._codecs.get(codec_id)
+        if codec is None:
+            codec_class = _by_id(CODECS, "codec_id", codec_id)
+            if codec_class.name not in self._allowed_codecs:
+                raise ValueError(
+                    f"Cached value uses the {codec_class.name} codec, "
+                    f"which is only read when configured"
+                )
+            codec = self._codecs[codec_id] = codec_class()
+        return codec
+
+    def _get_compressor(self, compression_id: int) -> Compressor:
+        """Get the compressor for a header compression id."""
+        compressor = self._compressors.get(compression_id)
+        if compressor is None:
+            compressor_class = _by_id(COMPRESSORS, "compression_id", compression_id)
+            compressor = self._compressors[compression_id] = compressor_class()
+        return compressor
+
+
+def _by_id(registry: dict[str, type], attribute: str, value: int) -> type:
+    """Find a registered codec or compressor class by its header id."""
+    for name, cls in registry.items():
+        if getattr(cls, attribute) == value:
+            if not _available(name):
+                raise ValueError(f"Cached value needs {name}, which is not installed")
+            return cls
+    raise ValueError(f"Unknown cache {attribute}: {value}")
+
+
+def _loads_legacy(data: bytes) -> Any:
+    """Decode a value written before values had a header."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def create_serializer(
+    codec: str = "json",
+    compression: str | None = None,
+    compression_threshold: int = 1024,
+) -> CacheSerializer:
+    """
+    Create a cache serializer.
+
+    Args:
+        codec: Codec name (json, msgpack or pickle)
+        compression: Compressor name (zstd, lz4 or zlib), "none" or None
+        compression_threshold: Minimum encoded size in bytes to compress
+
+    Returns:
+        Cache serializer
+    """
+    if compression == "none":
+        compression = None
+    return CacheSerializer(codec, compression, compression_threshold)
@@ -0,0 +1,296 @@
+"""
+Cache Eviction Policies
+
+Eviction policies for the in-memory cache backend. Each policy tracks the
+keys held by the cache and names the next key to evict; recording accesses,
+inserts and removals and choosing a victim are all O(1).
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class EvictionPolicy(ABC):
+    """Abstract base class for cache eviction policies."""
+
+    @abstractmethod
+    def on_insert(self, key: str) -> None:
+        """Record that a new key was added."""
+        pass
+
+    @abstractmethod
+    def on_access(self, key: str) -> None:
+        """Record a hit or an overwrite of an existing key."""
+        pass
+
+    @abstractmethod
+    def on_remove(self, key: str) -> None:
+        """Record that a key was removed."""
+        pass
+
+    @abstractmethod
+    def victim(self) -> str | None:
+        """Get the key that should be evicted next."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget all keys."""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evict the least recently used key."""
+
+    def __init__(self, capacity: int = 0):
+        """Initialize LRU policy."""
+        self._order: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Record that a new key was added."""
+        self._order[key] = None
+
+    def on_access(self, key: str) -> None:
+        """Record a hit or an overwrite of an existing key."""
+        self._order.move_to_end(key)
+
+    def on_remove(self, key: str) -> None:
+        """Record that a key was removed."""
+        self._order.pop(key, None)
+
+    def victim(self) -> str | None:
+        """Get the least recently used key."""
+        return next(iter(self._order), None)
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._order.clear()
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evict the least frequently used key.
+
+    Keys are grouped into buckets by access count, with ties broken by
+    recency, so the victim is always the oldest key of the lowest bucket.
+    """
+
+    def __init__(self, capacity: int = 0):
+        """Initialize LFU policy."""
+        self._counts: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+        self._min_count = 0
+
+    def on_insert(self, key: str) -> None:
+        """Record that a new key was added."""
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def on_access(self, key: str) -> None:
+        """Move a key to the next frequency bucket."""
+        count = self._counts[key]
+        self._unlink(key, count)
+        if self._min_count == count and count not in self._buckets:
+            self._min_count = count + 1
+
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def on_remove(self, key: str) -> None:
+        """Record that a key was removed."""
+        count = self._counts.pop(key, None)
+        if count is not None:
+            self._unlink(key, count)
+
+    def victim(self) -> str | None:
+        """Get the oldest of the least frequently used keys."""
+        if not self._buckets:
+            return None
+        if self._min_count not in self._buckets:
+            # The lowest bucket was emptied by a removal
+            self._min_count = min(self._buckets)
+        return next(iter(self._buckets[self._min_count]))
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._counts.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+    def _unlink(self, key: str, count: int) -> None:
+        """Remove a key from its frequency bucket."""
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+
+class CountMinSketch:
+    """
+    Approximate access frequencies in constant memory.
+
+    Counters saturate at 15 and are halved once the number of recorded
+    accesses reaches the sample size, so old popularity fades over time.
+    """
+
+    depth = 4
+    max_count = 15
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the sketch.
+
+        Args:
+            capacity: Number of entries in the cache
+        """
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._mask = width - 1
+        self._table = [[0] * width for _ in range(self.depth)]
+        self._sample_size = 10 * max(capacity, 16)
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        """Get one counter index per row."""
+        h = hash(key)
+        return [hash((h, row)) & self._mask for row in range(self.depth)]
+
+    def increment(self, key: str) -> None:
+        """Record an access to a key."""
+        for row, index in zip(self._table, self._indexes(key), strict=True):
+            if row[index] < self.max_count:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def frequency(self, key: str) -> int:
+        """Get the estimated access count of a key."""
+        return min(
+            row[index]
+            for row, index in zip(self._table, self._indexes(key), strict=True)
+        )
+
+    def _reset(self) -> None:
+        """Halve all counters."""
+        for row in self._table:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self._additions //= 2
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """
+    Window TinyLFU eviction.
+
+    New keys enter a small LRU admission window (1% of the capacity). When
+    the cache is full, the oldest key in the window competes with the
+    victim of the main segmented LRU, and whichever has been accessed less
+    often according to a count-min sketch is evicted. This keeps one-hit
+    wonders from flushing frequently used keys. The main area is split into
+    a probation segment and a protected segment (80%) for keys that were
+    hit again after admission.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize W-TinyLFU policy.
+
+        Args:
+            capacity: Number of entries in the cache
+        """
+        self._window_capacity = max(1, capacity // 100)
+        main_capacity = max(1, capacity - self._window_capacity)
+        self._protected_capacity = max(1, main_capacity * 4 // 5)
+        self._main_capacity = main_capacity
+
+        self._sketch = CountMinSketch(capacity)
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+
+    def on_insert(self, key: str) -> None:
+        """Admit a new key into the window."""
+        self._sketch.increment(key)
+        self._window[key] = None
+
+        # While the main area has room, overflow from the window is admitted
+        # without competing
+        if (
+            len(self._window) > self._window_capacity
+            and len(self._probation) + len(self._protected) < self._main_capacity
+        ):
+            oldest, _ = self._window.popitem(last=False)
+            self._probation[oldest] = None
+
+    def on_access(self, key: str) -> None:
+        """Record a hit, promoting probation keys to the protected segment."""
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self._protected_capacity:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+
+    def on_remove(self, key: str) -> None:
+        """Record that a key was removed."""
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def victim(self) -> str | None:
+        """Get the loser of the window candidate and the main victim."""
+        candidate = next(iter(self._window), None)
+        main_victim = next(iter(self._probation), None)
+        if main_victim is None:
+            main_victim = next(iter(self._protected), None)
+
+        if main_victim is None:
+            return candidate
+        if candidate is None or len(self._window) <= self._window_capacity:
+            return main_victim
+
+        if self._sketch.frequency(candidate) > self._sketch.frequency(main_victim):
+            del self._window[candidate]
+            self._probation[candidate] = None
+            return main_victim
+        return candidate
+
+    def clear(self) -> None:
+        """Forget all keys."""
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+
+
+EVICTION_POLICIES: dict[str, type[EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "tinylfu": TinyLFUPolicy,
+}
+
+
+def create_eviction_policy(name: str, capacity: int) -> EvictionPolicy:
+    """
+    Create an eviction policy by name.
+
+    Args:
+        name: Policy name (lru, lfu or tinylfu)
+        capacity: Number of entries in the cache
+
+    Returns:
+        Eviction policy
+    """
+    try:
+        return EVICTION_POLICIES[name](capacity)
+    except KeyError:
+        raise ValueError(f"Unknown cache eviction policy: {name}") from None
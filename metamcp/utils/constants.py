@@ -26,8 +26,19 @@ TOKEN_EXPIRY_MINUTES = 30
 # Rate Limiting
 DEFAULT_RATE_LIMIT_REQUESTS = 100
 DEFAULT_RATE_LIMIT_WINDOW = 60  # seconds
+DEFAULT_RATE_LIMIT_STRATEGY = "fixed_window"
+DEFAULT_RATE_LIMIT_LEASE_SIZE = 0  # tokens leased from Redis at once; 0 disables
+DEFAULT_RATE_LIMIT_LEASE_TTL = 1.0  # seconds
 RATE_LIMIT_BURST_MULTIPLIER = 2
 
+# Request Body Inspection
+MAX_REQUEST_BODY_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_JSON_DEPTH = 64
+
+# Policy Decision Cache
+DEFAULT_POLICY_DECISION_CACHE_SIZE = 10000
+DEFAULT_POLICY_DECISION_CACHE_TTL = 60  # seconds
+
 # Security Headers
 SECURITY_HEADERS = {
     "X-Content-Type-Options": "nosniff",
@@ -53,6 +64,13 @@ DEFAULT_DB_POOL_RECYCLE = 3600
 DEFAULT_CACHE_TTL = 3600  # 1 hour
 MAX_CACHE_TTL = 604800  # 1 week
 DEFAULT_CACHE_MAX_CONNECTIONS = 20
+DEFAULT_CACHE_L1_MAX_SIZE = 10000
+DEFAULT_CACHE_L1_TTL = 60  # seconds
+DEFAULT_CACHE_INVALIDATION_CHANNEL = "metamcp:cache:invalidate"
+# Standard library defaults; msgpack, zstd and lz4 need the cache-codecs extra
+DEFAULT_CACHE_CODEC = "json"
+DEFAULT_CACHE_COMPRESSION = "zlib"
+DEFAULT_CACHE_COMPRESSION_THRESHOLD = 1024  # bytes
 
 # =============================================================================
 # API CONSTANTS
@@ -95,10 +113,41 @@ DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
 DEFAULT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60  # seconds
 DEFAULT_CIRCUIT_BREAKER_SUCCESS_THRESHOLD = 2
 
+# Workflow Execution
+DEFAULT_WORKFLOW_MAX_CONCURRENT_STEPS = 100
+DEFAULT_WORKFLOW_FAN_OUT_CONCURRENCY = 10
+DEFAULT_WORKFLOW_STEP_CACHE_TTL = 300  # seconds
+DEFAULT_WORKFLOW_CHECKPOINT_INTERVAL = 1.0  # seconds
+DEFAULT_WORKFLOW_CHECKPOINT_BATCH_SIZE = 100
+
+# Stdio Session Pool
+MCP_PROTOCOL_VERSION = "2024-11-05"
+DEFAULT_STDIO_POOL_MAX_SIZE = 4
+DEFAULT_STDIO_POOL_MAX_IN_FLIGHT = 8  # requests per process before spawning
+DEFAULT_STDIO_POOL_IDLE_TIMEOUT = 300  # seconds
+DEFAULT_STDIO_POOL_REAP_INTERVAL = 60  # seconds
+DEFAULT_STDIO_WRITE_QUEUE_SIZE = 100  # queued messages per process
+STDIO_MAX_MESSAGE_SIZE = 16 * 1024 * 1024  # 16 MB per JSON-RPC line
+
+# WebSocket Sessions
+DEFAULT_WEBSOCKET_PING_INTERVAL = 20.0  # seconds
+DEFAULT_WEBSOCKET_PING_TIMEOUT = 20.0  # seconds
+DEFAULT_WEBSOCKET_MAX_RECONNECT_ATTEMPTS = 3
+DEFAULT_WEBSOCKET_RECONNECT_BASE_DELAY = 0.5  # seconds
+DEFAULT_WEBSOCKET_RECONNECT_MAX_DELAY = 30.0  # seconds
+
+# Outbound HTTP Client Pool
+DEFAULT_HTTP_MAX_CONNECTIONS_PER_HOST = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30.0  # seconds
+
 # =============================================================================
 # VECTOR SEARCH CONSTANTS
 # =============================================================================
 
+# Vector Backends
+DEFAULT_VECTOR_BACKEND = "weaviate"
+
 # Vector Dimensions
 DEFAULT_VECTOR_DIMENSION = 1536
 MAX_VECTOR_DIMENSION = 4096
@@ -108,6 +157,11 @@ DEFAULT_SIMILARITY_THRESHOLD = 0.7
 DEFAULT_MAX_SEARCH_RESULTS = 10
 MAX_SEARCH_RESULTS = 100
 
+# Embedding Generation
+DEFAULT_EMBEDDING_CACHE_SIZE = 10000
+DEFAULT_EMBEDDING_BATCH_SIZE = 100
+DEFAULT_EMBEDDING_BATCH_WINDOW = 0.01  # seconds
+
 # =============================================================================
 # MONITORING CONSTANTS
 # =============================================================================
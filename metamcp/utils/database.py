@@ -87,6 +87,11 @@ class DatabaseManager:
         async with self.acquire() as conn:
             await conn.execute(query, *args)
 
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        """Execute a query once per argument tuple in a single round trip."""
+        async with self.acquire() as conn:
+            await conn.executemany(query, args)
+
     async def fetch(self, query: str, *args) -> list:
         """Fetch multiple rows from a query."""
         async with self.acquire() as conn:
@@ -6,6 +6,7 @@ both in-memory and Redis-based rate limiting, including per-user and per-endpoin
 """
 
 import asyncio
+import math
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -14,6 +15,7 @@ from typing import Any
 
 from ..config import get_settings
 from ..utils.logging import get_logger
+from ..utils.redis_scripts import fixed_window_script, load_rate_limit_scripts
 
 logger = get_logger(__name__)
 
@@ -118,7 +120,6 @@ class RedisRateLimiter(RateLimiterBackend):
     def __init__(self, redis_url: str):
         self.redis_url = redis_url
         self._redis = None
-        self._lock = asyncio.Lock()
 
     async def _get_redis(self):
         if self._redis is None:
@@ -127,6 +128,7 @@ class RedisRateLimiter(RateLimiterBackend):
 
                 self._redis = redis.from_url(self.redis_url)
                 await self._redis.ping()
+                await load_rate_limit_scripts(self._redis)
                 logger.info(f"Connected to Redis for rate limiting: {self.redis_url}")
             except Exception as e:
                 logger.error(f"Failed to connect to Redis for rate limiting: {e}")
@@ -138,21 +140,16 @@ class RedisRateLimiter(RateLimiterBackend):
     ) -> tuple[bool, RateLimitInfo]:
         redis_client = await self._get_redis()
         now = int(time.time())
-        async with self._lock:
-            # Use Redis INCR and EXPIRE for atomic rate limiting
-            current = await redis_client.incr(key)
-            if current == 1:
-                await redis_client.expire(key, window)
-            ttl = await redis_client.ttl(key)
-            remaining = max(0, limit - current)
-            is_allowed = current <= limit
-            reset_time = now + (ttl if ttl > 0 else window)
-            return is_allowed, RateLimitInfo(
-                limit=limit,
-                remaining=remaining,
-                reset_time=reset_time,
-                window_size=window,
-            )
+        # Count and expire the window atomically in one round-trip
+        allowed, remaining, reset_ms, _ = await fixed_window_script(
+            redis_client, [key], [limit, window * 1000, 1]
+        )
+        return bool(allowed), RateLimitInfo(
+            limit=limit,
+            remaining=int(remaining),
+            reset_time=now + math.ceil(int(reset_ms) / 1000),
+            window_size=window,
+        )
 
     async def get_remaining(self, key: str, limit: int, window: int) -> RateLimitInfo:
         redis_client = await self._get_redis()
@@ -0,0 +1,376 @@
+"""
+Redis Lua Scripts
+
+This module provides the Lua scripts used for distributed rate limiting and
+cache tags, and a small wrapper that preloads them with SCRIPT LOAD and runs
+them with EVALSHA.
+
+Each rate limit script returns ``[allowed, remaining, reset_ms, retry_ms]``.
+All scripts except the fixed window one read the Redis server clock, so all
+workers share one time source. Floating point state is stored with explicit
+formatting because Lua would otherwise round numbers to 14 significant digits
+when passing them to Redis.
+"""
+
+import hashlib
+from typing import Any
+
+from ..utils.logging import get_logger
+
+try:
+    from redis.exceptions import NoScriptError
+except ImportError:  # pragma: no cover - optional dependency
+
+    class NoScriptError(Exception):  # type: ignore[no-redef]
+        """Placeholder used when redis is not installed."""
+
+
+logger = get_logger(__name__)
+
+
+_NOW = """
+redis.replicate_commands()
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+"""
+
+# KEYS[1]: counter; ARGV: limit, window_ms, cost
+FIXED_WINDOW = """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then
+  redis.call('SET', KEYS[1], 0, 'PX', window_ms)
+  ttl = window_ms
+end
+
+local count = tonumber(redis.call('GET', KEYS[1]))
+if count + cost > limit then
+  return {0, math.max(0, limit - count), ttl, ttl}
+end
+
+count = redis.call('INCRBY', KEYS[1], cost)
+return {1, limit - count, ttl, 0}
+"""
+
+# KEYS[1]: sorted set of request timestamps, KEYS[2]: member sequence
+# ARGV: limit, window_ms, cost
+SLIDING_WINDOW = (
+    _NOW
+    + """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local window = window_ms / 1000
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', string.format('%.6f', now - window))
+local count = redis.call('ZCARD', KEYS[1])
+
+if count + cost > limit then
+  local retry_ms = window_ms
+  local index = count + cost - limit - 1
+  if index < count then
+    local entry = redis.call('ZRANGE', KEYS[1], index, index, 'WITHSCORES')
+    retry_ms = math.ceil((tonumber(entry[2]) + window - now) * 1000)
+  end
+  return {0, math.max(0, limit - count), window_ms, retry_ms}
+end
+
+local score = string.format('%.6f', now)
+local seq = redis.call('INCRBY', KEYS[2], cost)
+for i = seq - cost + 1, seq do
+  redis.call('ZADD', KEYS[1], score, i)
+end
+redis.call('PEXPIRE', KEYS[1], window_ms)
+redis.call('PEXPIRE', KEYS[2], window_ms)
+return {1, limit - count - cost, window_ms, 0}
+"""
+)
+
+# KEYS[1]: hash with tokens and ts; ARGV: limit, window_ms, cost
+TOKEN_BUCKET = (
+    _NOW
+    + """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = limit / (window_ms / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+  tokens = limit
+else
+  tokens = math.min(limit, tokens + math.max(0, now - ts) * rate)
+end
+
+local allowed = 0
+local retry_ms = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_ms = math.ceil((cost - tokens) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', string.format('%.6f', tokens),
+  'ts', string.format('%.6f', now))
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {allowed, math.floor(tokens), window_ms, retry_ms}
+"""
+)
+
+# KEYS[1]: hash with level and ts; ARGV: limit, window_ms, cost
+LEAKY_BUCKET = (
+    _NOW
+    + """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = limit / (window_ms / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'level', 'ts')
+local level = tonumber(state[1]) or 0
+local ts = tonumber(state[2]) or now
+level = math.max(0, level - math.max(0, now - ts) * rate)
+
+local allowed = 0
+local retry_ms = 0
+if level + cost <= limit then
+  level = level + cost
+  allowed = 1
+else
+  retry_ms = math.ceil((level + cost - limit) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'level', string.format('%.6f', level),
+  'ts', string.format('%.6f', now))
+redis.call('PEXPIRE', KEYS[1], math.max(1, math.ceil(level / rate * 1000)))
+return {allowed, math.floor(limit - level), math.ceil(level / rate * 1000), retry_ms}
+"""
+)
+
+# KEYS[1]: theoretical arrival time; ARGV: limit, window_ms, cost, burst
+GCRA = (
+    _NOW
+    + """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local burst = tonumber(ARGV[4])
+local interval = window_ms / 1000 / limit
+local tolerance = interval * burst
+
+local tat = math.max(tonumber(redis.call('GET', KEYS[1])) or now, now)
+local new_tat = tat + interval * cost
+local allow_at = new_tat - tolerance
+
+if now < allow_at then
+  return {
+    0,
+    math.max(0, math.floor((tolerance - (tat - now)) / interval)),
+    math.ceil((tat - now) * 1000),
+    math.ceil((allow_at - now) * 1000),
+  }
+end
+
+redis.call('SET', KEYS[1], string.format('%.6f', new_tat),
+  'PX', math.max(1, math.ceil((new_tat - now) * 1000)))
+return {
+  1,
+  math.max(0, math.floor((tolerance - (new_tat - now)) / interval)),
+  math.ceil((new_tat - now) * 1000),
+  0,
+}
+"""
+)
+
+# KEYS[1]: hash with window index and counts; ARGV: limit, window_ms, cost
+SLIDING_WINDOW_COUNTER = (
+    _NOW
+    + """
+local limit = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local window = window_ms / 1000
+local index = math.floor(now / window)
+
+local state = redis.call('HMGET', KEYS[1], 'index', 'previous', 'current')
+local stored = tonumber(state[1])
+local previous = tonumber(state[2]) or 0
+local current = tonumber(state[3]) or 0
+if stored ~= index then
+  if stored == index - 1 then
+    previous = current
+  else
+    previous = 0
+  end
+  current = 0
+end
+
+local elapsed = now - index * window
+local estimated = previous * (1 - elapsed / window) + current
+local reset_ms = math.ceil(((index + 1) * window - now) * 1000)
+
+if estimated + cost > limit then
+  local headroom = limit - current - cost
+  local retry_ms = reset_ms
+  if previous > 0 and headroom >= 0 then
+    retry_ms = math.ceil(((1 - headroom / previous) * window - elapsed) * 1000)
+  end
+  return {0, math.max(0, math.floor(limit - estimated)), reset_ms, retry_ms}
+end
+
+current = current + cost
+redis.call('HSET', KEYS[1], 'index', index, 'previous', previous, 'current', current)
+redis.call('PEXPIRE', KEYS[1], reset_ms + window_ms)
+return {1, math.max(0, math.floor(limit - estimated - cost)), reset_ms, 0}
+"""
+)
+
+# KEYS: the strategy's keys; ARGV: strategy, unused, limit, window_ms
+# Returns the number of leased tokens given back to the limit
+RELEASE_LEASE = (
+    _NOW
+    + """
+local strategy = ARGV[1]
+local unused = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local window_ms = tonumber(ARGV[4])
+
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+
+if strategy == 'fixed_window' then
+  unused = math.min(unused, tonumber(redis.call('GET', KEYS[1])))
+  redis.call('DECRBY', KEYS[1], unused)
+elseif strategy == 'sliding_window' then
+  unused = #redis.call('ZPOPMAX', KEYS[1], unused) / 2
+elseif strategy == 'token_bucket' then
+  local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+  unused = math.max(0, math.min(unused, math.floor(limit - tokens)))
+  redis.call('HSET', KEYS[1], 'tokens', string.format('%.6f', tokens + unused))
+elseif strategy == 'leaky_bucket' then
+  local level = tonumber(redis.call('HGET', KEYS[1], 'level'))
+  unused = math.min(unused, math.floor(level))
+  redis.call('HSET', KEYS[1], 'level', string.format('%.6f', level - unused))
+elseif strategy == 'gcra' then
+  local interval = window_ms / 1000 / limit
+  local tat = tonumber(redis.call('GET', KEYS[1]))
+  unused = math.min(unused, math.floor((tat - now) / interval))
+  if unused <= 0 then
+    return 0
+  end
+  local new_tat = tat - interval * unused
+  redis.call('SET', KEYS[1], string.format('%.6f', new_tat),
+    'PX', math.max(1, math.ceil((new_tat - now) * 1000)))
+elseif strategy == 'sliding_window_counter' then
+  local current = tonumber(redis.call('HGET', KEYS[1], 'current'))
+  unused = math.min(unused, current)
+  redis.call('HSET', KEYS[1], 'current', current - unused)
+end
+
+return unused
+"""
+)
+
+# KEYS[1]: tag set, KEYS[2]: name to move it to
+# Moving the set aside lets keys tagged during an invalidation start a new set
+CLAIM_TAG = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+return 1
+"""
+
+
+# KEYS[1]: tag set; ARGV: key, ttl
+# Keeps the set alive as long as its longest-lived key. Compares with TTL
+# instead of using EXPIRE NX/GT, which need Redis 7.
+ADD_TAG = """
+redis.call('SADD', KEYS[1], ARGV[1])
+local ttl = tonumber(ARGV[2])
+if redis.call('TTL', KEYS[1]) < ttl then
+  redis.call('EXPIRE', KEYS[1], ttl)
+end
+return 1
+"""
+
+
+class RedisScript:
+    """
+    Lua script run with EVALSHA.
+
+    The SHA is computed locally, so a script can be run before it has been
+    loaded; if Redis reports NOSCRIPT (e.g. after a restart or SCRIPT FLUSH)
+    the script is loaded and the call is retried once.
+    """
+
+    def __init__(self, source: str):
+        """
+        Initialize the script.
+
+        Args:
+            source: Lua source code
+        """
+        self.source = source
+        self.sha = hashlib.sha1(source.encode()).hexdigest()
+
+    async def load(self, redis: Any) -> None:
+        """Load the script into the Redis script cache."""
+        self.sha = await redis.script_load(self.source)
+
+    async def __call__(self, redis: Any, keys: list[str], args: list[Any]) -> Any:
+        """
+        Run the script in a single round-trip.
+
+        Args:
+            redis: Async Redis client
+            keys: Keys accessed by the script
+            args: Script arguments
+
+        Returns:
+            Script result
+        """
+        try:
+            return await redis.evalsha(self.sha, len(keys), *keys, *args)
+        except NoScriptError:
+            logger.debug("Redis script cache miss, reloading script")
+            await self.load(redis)
+            return await redis.evalsha(self.sha, len(keys), *keys, *args)
+
+
+fixed_window_script = RedisScript(FIXED_WINDOW)
+sliding_window_script = RedisScript(SLIDING_WINDOW)
+token_bucket_script = RedisScript(TOKEN_BUCKET)
+leaky_bucket_script = RedisScript(LEAKY_BUCKET)
+gcra_script = RedisScript(GCRA)
+sliding_window_counter_script = RedisScript(SLIDING_WINDOW_COUNTER)
+release_lease_script = RedisScript(RELEASE_LEASE)
+claim_tag_script = RedisScript(CLAIM_TAG)
+
+RATE_LIMIT_SCRIPTS = (
+    fixed_window_script,
+    sliding_window_script,
+    token_bucket_script,
+    leaky_bucket_script,
+    gcra_script,
+    sliding_window_counter_script,
+    release_lease_script,
+)
+
+
+async def load_rate_limit_scripts(redis: Any) -> None:
+    """
+    Preload all rate limit scripts so the first checks use EVALSHA directly.
+
+    Args:
+        redis: Async Redis client
+    """
+    for script in RATE_LIMIT_SCRIPTS:
+        await script.load(redis)
@@ -0,0 +1,339 @@
+"""
+Embedded Vector Index
+
+This module provides an in-process vector index that implements the same
+interface as the Weaviate-backed VectorSearchClient, for single-node
+deployments that do not run an external vector database.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import VectorSearchError
+from ..utils.logging import get_logger
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+METADATA_FIELDS = (
+    "name",
+    "description",
+    "categories",
+    "endpoint",
+    "security_level",
+    "status",
+)
+
+
+class _VectorCollection:
+    """
+    Vectors of one collection stored as rows of a contiguous float32 matrix.
+
+    Rows are L2-normalised on insert, so cosine similarity for every row is
+    a single matrix-vector product. Deletes move the last row into the
+    freed slot to keep the matrix dense.
+    """
+
+    def __init__(self, dimension: int, capacity: int = 1024):
+        """Initialize an empty collection."""
+        self.dimension = dimension
+        self.vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        self.ids: list[str] = []
+        self.metadata: list[dict[str, Any]] = []
+        self.rows: dict[str, int] = {}
+
+    @property
+    def count(self) -> int:
+        """Number of stored vectors."""
+        return len(self.ids)
+
+    def _normalize(self, embedding: list[float]) -> "np.ndarray":
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.dimension,):
+            raise VectorSearchError(
+                message=(
+                    f"Embedding dimension {vector.shape[0]} does not match "
+                    f"collection dimension {self.dimension}"
+                ),
+                error_code="dimension_mismatch",
+            )
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def upsert(self, id: str, embedding: list[float], metadata: dict[str, Any]) -> None:
+        """Insert or replace a vector."""
+        vector = self._normalize(embedding)
+        row = self.rows.get(id)
+
+        if row is None:
+            row = self.count
+            if row >= self.vectors.shape[0]:
+                grown = np.zeros(
+                    (max(1, self.vectors.shape[0]) * 2, self.dimension),
+                    dtype=np.float32,
+                )
+                grown[:row] = self.vectors[:row]
+                self.vectors = grown
+            self.ids.append(id)
+            self.metadata.append(metadata)
+            self.rows[id] = row
+        else:
+            self.metadata[row] = metadata
+
+        self.vectors[row] = vector
+
+    def delete(self, id: str) -> bool:
+        """Remove a vector, returning whether it existed."""
+        row = self.rows.pop(id, None)
+        if row is None:
+            return False
+
+        last = self.count - 1
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.ids[row] = self.ids[last]
+            self.metadata[row] = self.metadata[last]
+            self.rows[self.ids[row]] = row
+
+        self.ids.pop()
+        self.metadata.pop()
+        return True
+
+    def search(
+        self, query_embedding: list[float], limit: int, threshold: float
+    ) -> list[tuple[str, float, dict[str, Any]]]:
+        """Return the top ``limit`` rows by cosine similarity."""
+        if not self.count or limit <= 0:
+            return []
+
+        scores = self.vectors[: self.count] @ self._normalize(query_embedding)
+
+        if limit < self.count:
+            top = np.argpartition(scores, -limit)[-limit:]
+        else:
+            top = np.arange(self.count)
+        top = top[np.argsort(scores[top])[::-1]]
+
+        return [
+            (self.ids[row], float(scores[row]), self.metadata[row])
+            for row in top
+            if scores[row] >= threshold
+        ]
+
+
+class EmbeddedVectorIndex:
+    """
+    In-process vector search backend.
+
+    Drop-in alternative to VectorSearchClient: answers ``search`` with an
+    exact vectorized cosine top-k over each collection and, when a storage
+    path is configured, persists collections as ``.npy`` files that are
+    memory-mapped (copy-on-write) on startup.
+    """
+
+    def __init__(self, dimension: int, path: str | None = None):
+        """
+        Initialize Embedded Vector Index.
+
+        Args:
+            dimension: Embedding dimension
+            path: Optional directory for persisting the index
+        """
+        self.dimension = dimension
+        self.path = Path(path) if path else None
+        self.collections: dict[str, _VectorCollection] = {}
+        self._lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Initialize the index and load persisted collections."""
+        if self._initialized:
+            return
+
+        if not NUMPY_AVAILABLE:
+            raise VectorSearchError(
+                message="numpy is required for the embedded vector index",
+                error_code="vector_init_failed",
+            )
+
+        try:
+            logger.info("Initializing Embedded Vector Index...")
+            if self.path:
+                self.path.mkdir(parents=True, exist_ok=True)
+                for vectors_file in self.path.glob("*.npy"):
+                    self._load_collection(vectors_file.stem)
+
+            self._initialized = True
+            logger.info(
+                f"Embedded Vector Index initialized with "
+                f"{len(self.collections)} collections"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to initialize Embedded Vector Index: {e}")
+            raise VectorSearchError(
+                message=f"Failed to initialize embedded vector index: {str(e)}",
+                error_code="vector_init_failed",
+            ) from e
+
+    def _get_collection(self, name: str) -> _VectorCollection:
+        """Get or create a collection."""
+        collection = self.collections.get(name)
+        if collection is None:
+            collection = _VectorCollection(self.dimension)
+            self.collections[name] = collection
+        return collection
+
+    def _load_collection(self, name: str) -> None:
+        """Memory-map a persisted collection."""
+        vectors = np.load(self.path / f"{name}.npy", mmap_mode="c")
+        with open(self.path / f"{name}.json", encoding="utf-8") as f:
+            state = json.load(f)
+
+        collection = _VectorCollection(vectors.shape[1], capacity=0)
+        collection.vectors = vectors
+        collection.ids = state["ids"]
+        collection.metadata = state["metadata"]
+        collection.rows = {id: row for row, id in enumerate(collection.ids)}
+        self.collections[name] = collection
+
+    def _save_collection(self, name: str) -> None:
+        """Atomically write a collection to disk."""
+        collection = self.collections[name]
+        vectors_tmp = self.path / f"{name}.npy.tmp"
+        state_tmp = self.path / f"{name}.json.tmp"
+
+        with open(vectors_tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(collection.vectors[: collection.count]))
+        with open(state_tmp, "w", encoding="utf-8") as f:
+            json.dump({"ids": collection.ids, "metadata": collection.metadata}, f)
+
+        os.replace(vectors_tmp, self.path / f"{name}.npy")
+        os.replace(state_tmp, self.path / f"{name}.json")
+
+    async def flush(self) -> None:
+        """Persist collections changed since the last flush."""
+        if not self.path:
+            return
+
+        with self._lock:
+            for name in self._dirty:
+                self._save_collection(name)
+            self._dirty.clear()
+
+    async def store_embedding(
+        self, collection: str, id: str, embedding: list[float], metadata: dict[str, Any]
+    ) -> None:
+        """
+        Store an embedding with metadata.
+
+        Args:
+            collection: Collection name
+            id: Unique identifier
+            embedding: Vector embedding
+            metadata: Associated metadata
+        """
+        try:
+            with self._lock:
+                self._get_collection(collection).upsert(
+                    id,
+                    embedding,
+                    {field: metadata.get(field) for field in METADATA_FIELDS},
+                )
+                self._dirty.add(collection)
+
+            logger.debug(f"Stored embedding for {id} in collection {collection}")
+
+        except VectorSearchError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to store embedding: {e}")
+            raise VectorSearchError(
+                message=f"Failed to store embedding: {str(e)}",
+                error_code="store_failed",
+            ) from e
+
+    async def search(
+        self,
+        collection: str,
+        query_embedding: list[float],
+        limit: int = 10,
+        similarity_threshold: float = 0.7,
+    ) -> list[dict[str, Any]]:
+        """
+        Search for similar embeddings.
+
+        Args:
+            collection: Collection name
+            query_embedding: Query vector
+            limit: Maximum number of results
+            similarity_threshold: Minimum similarity score
+
+        Returns:
+            List of search results with metadata
+        """
+        try:
+            with self._lock:
+                store = self.collections.get(collection)
+                matches = (
+                    store.search(query_embedding, limit, similarity_threshold)
+                    if store
+                    else []
+                )
+
+            return [
+                {"id": id, "score": score, "metadata": metadata}
+                for id, score, metadata in matches
+            ]
+
+        except VectorSearchError:
+            raise
+        except Exception as e:
+            logger.error(f"Vector search failed: {e}")
+            raise VectorSearchError(
+                message=f"Vector search failed: {str(e)}", error_code="search_failed"
+            ) from e
+
+    async def delete_embedding(self, collection: str, id: str) -> None:
+        """
+        Delete an embedding by ID.
+
+        Args:
+            collection: Collection name
+            id: Unique identifier
+        """
+        with self._lock:
+            store = self.collections.get(collection)
+            if store and store.delete(id):
+                self._dirty.add(collection)
+                logger.debug(f"Deleted embedding {id} from collection {collection}")
+
+    async def shutdown(self) -> None:
+        """Persist the index and shut down."""
+        if not self._initialized:
+            return
+
+        logger.info("Shutting down Embedded Vector Index...")
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to persist embedded vector index: {e}")
+
+        self._initialized = False
+        logger.info("Embedded Vector Index shutdown complete")
+
+    @property
+    def is_initialized(self) -> bool:
+        """Check if index is initialized."""
+        return self._initialized
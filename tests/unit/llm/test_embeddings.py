@@ -0,0 +1,161 @@
+"""
+Unit tests for embedding batching and caching.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from metamcp.config import LLMProvider
+from metamcp.exceptions import EmbeddingError
+from metamcp.llm.embeddings import EmbeddingBatcher, EmbeddingCache
+from metamcp.llm.service import LLMService
+
+
+def make_settings(**overrides):
+    """Build LLM service settings."""
+    values = {
+        "llm_provider": LLMProvider.FALLBACK,
+        "openai_embedding_model": "test-embedding",
+        "vector_dimension": 8,
+        "embedding_cache_size": 100,
+        "embedding_cache_path": None,
+        "embedding_batch_size": 10,
+        "embedding_batch_window": 0.01,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def embedding_response(texts):
+    """Build an OpenAI-style embeddings response, out of order."""
+    data = [
+        SimpleNamespace(index=i, embedding=[float(len(text)), float(i)])
+        for i, text in enumerate(texts)
+    ]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache."""
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        cache = EmbeddingCache(max_size=2)
+        cache.set("a", [1.0])
+        cache.set("b", [2.0])
+        cache.get("a")
+        cache.set("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
+        assert cache.get_stats()["hits"] == 3
+
+    def test_keys_depend_on_model(self):
+        """The same text embedded by different models has different keys."""
+        assert EmbeddingCache.make_key("m1", "text") != EmbeddingCache.make_key(
+            "m2", "text"
+        )
+
+    def test_persistence(self, tmp_path):
+        """Saved entries are loaded by a new cache."""
+        path = tmp_path / "embeddings.json"
+        cache = EmbeddingCache(max_size=10, path=str(path))
+        cache.set("a", [1.0, 2.0])
+        cache.save()
+
+        reloaded = EmbeddingCache(max_size=10, path=str(path))
+        reloaded.load()
+        assert reloaded.get("a") == [1.0, 2.0]
+
+
+class TestEmbeddingBatcher:
+    """Test EmbeddingBatcher."""
+
+    async def test_concurrent_requests_share_one_call(self):
+        """Concurrent texts are embedded in one batch, duplicates once."""
+        calls = []
+
+        async def embed_batch(texts):
+            calls.append(texts)
+            return [[float(len(text))] for text in texts]
+
+        batcher = EmbeddingBatcher(embed_batch, max_batch_size=10, batch_window=0.01)
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("bb"), batcher.embed("a")
+        )
+
+        assert results == [[1.0], [2.0], [1.0]]
+        assert calls == [["a", "bb"]]
+
+    async def test_full_batch_flushes_immediately(self):
+        """Reaching the batch size does not wait for the window."""
+        calls = []
+
+        async def embed_batch(texts):
+            calls.append(texts)
+            return [[0.0] for _ in texts]
+
+        batcher = EmbeddingBatcher(embed_batch, max_batch_size=2, batch_window=10)
+        await asyncio.wait_for(
+            asyncio.gather(*(batcher.embed(str(i)) for i in range(4))), timeout=1
+        )
+
+        assert calls == [["0", "1"], ["2", "3"]]
+
+    async def test_errors_propagate_to_all_waiters(self):
+        """A failed provider call fails every request in the batch."""
+        batcher = EmbeddingBatcher(
+            AsyncMock(side_effect=RuntimeError("boom")),
+            max_batch_size=10,
+            batch_window=0.01,
+        )
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestLLMServiceEmbeddings:
+    """Test LLMService embedding generation."""
+
+    async def test_openai_requests_are_batched_and_cached(self):
+        """Concurrent OpenAI embeddings use one call and repeats hit the cache."""
+        service = LLMService(make_settings(llm_provider=LLMProvider.OPENAI))
+        service.openai_client = Mock()
+        service.openai_client.embeddings.create = AsyncMock(
+            side_effect=lambda model, input: embedding_response(input)
+        )
+        service._initialized = True
+
+        first = await asyncio.gather(
+            service.generate_embedding("alpha"), service.generate_embedding("be")
+        )
+        again = await service.generate_embedding("alpha")
+
+        assert first == [[5.0, 0.0], [2.0, 1.0]]
+        assert again == [5.0, 0.0]
+        service.openai_client.embeddings.create.assert_awaited_once()
+        assert service.get_embedding_stats()["cache"]["hits"] == 1
+
+    async def test_generate_embeddings_preserves_order(self):
+        """Batch generation returns embeddings in input order."""
+        service = LLMService(make_settings())
+        await service.initialize()
+
+        texts = ["one", "two", "one"]
+        embeddings = await service.generate_embeddings(texts)
+
+        assert embeddings == [service._generate_fallback_embedding(t) for t in texts]
+        assert all(len(e) == 8 for e in embeddings)
+
+    async def test_uninitialized_service_raises(self):
+        """Embedding before initialization fails."""
+        service = LLMService(make_settings())
+
+        with pytest.raises(EmbeddingError):
+            await service.generate_embedding("text")
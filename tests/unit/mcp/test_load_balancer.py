@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from metamcp.mcp.load_balancer import (
+    ConsistentHashRing,
     HealthChecker,
     LoadBalancedMCPClient,
     LoadBalancer,
@@ -18,6 +19,7 @@ from metamcp.mcp.load_balancer import (
     ServerConfig,
     ServerHealth,
     ServerStatus,
+    stable_hash,
 )
 
 
@@ -437,13 +439,13 @@ class TestLoadBalancer:
             checker.health.status = ServerStatus.HEALTHY
 
         # Test round robin selection
-        server1 = await balancer._round_robin_select([config1, config2])
+        server1 = await balancer.get_server()
         assert server1.id == "server-1"
 
-        server2 = await balancer._round_robin_select([config1, config2])
+        server2 = await balancer.get_server()
         assert server2.id == "server-2"
 
-        server3 = await balancer._round_robin_select([config1, config2])
+        server3 = await balancer.get_server()
         assert server3.id == "server-1"  # Wraps around
 
     @pytest.mark.asyncio
@@ -479,7 +481,7 @@ class TestLoadBalancer:
         health_checker2.health.active_connections = 5
 
         # Test least connections selection
-        server = await balancer._least_connections_select([config1, config2])
+        server = await balancer.get_server()
         assert server.id == "server-2"  # Has fewer connections
 
     @pytest.mark.asyncio
@@ -514,7 +516,7 @@ class TestLoadBalancer:
         # Test weighted selection
         servers = []
         for _ in range(6):  # Test multiple selections
-            server = await balancer._weighted_round_robin_selection([config1, config2])
+            server = await balancer.get_server()
             servers.append(server.id)
 
         # Should have more server-2 selections due to higher weight
@@ -555,7 +557,7 @@ class TestLoadBalancer:
         health_checker2.health.response_time = 0.1
 
         # Test least response time selection
-        server = await balancer._least_response_time_select([config1, config2])
+        server = await balancer.get_server()
         assert server.id == "server-2"  # Has lower response time
 
     @pytest.mark.asyncio
@@ -589,12 +591,13 @@ class TestLoadBalancer:
         client_id1 = "client-1"
         client_id2 = "client-2"
 
-        server1 = await balancer._ip_hash_select([config1, config2], client_id1)
-        server2 = await balancer._ip_hash_select([config1, config2], client_id2)
+        server1 = await balancer.get_server(client_id1)
+        server2 = await balancer.get_server(client_id2)
 
         # Same client should always get same server
-        server1_again = await balancer._ip_hash_select([config1, config2], client_id1)
+        server1_again = await balancer.get_server(client_id1)
         assert server1.id == server1_again.id
+        assert server2 is not None
 
     @pytest.mark.asyncio
     async def test_consistent_hash_selection(self):
@@ -626,8 +629,8 @@ class TestLoadBalancer:
         # Test consistent hash selection
         client_id = "client-1"
 
-        server1 = await balancer._consistent_hash_select([config1, config2], client_id)
-        server2 = await balancer._consistent_hash_select([config1, config2], client_id)
+        server1 = await balancer.get_server(client_id)
+        server2 = await balancer.get_server(client_id)
 
         # Same client should always get same server
         assert server1.id == server2.id
@@ -809,6 +812,164 @@ class TestLoadBalancer:
         assert stats["total_requests"] == 150
 
 
+def make_servers(count: int, **kwargs) -> list[ServerConfig]:
+    """Create server configs named server-0, server-1, ..."""
+    return [
+        ServerConfig(
+            id=f"server-{i}",
+            name=f"Server {i}",
+            endpoint=f"http://localhost:{8000 + i}",
+            transport_type="http",
+            **kwargs,
+        )
+        for i in range(count)
+    ]
+
+
+async def make_balancer(
+    strategy: LoadBalancingStrategy, servers: list[ServerConfig], **kwargs
+) -> LoadBalancer:
+    """Create a load balancer with all servers healthy."""
+    balancer = LoadBalancer(strategy, **kwargs)
+    for config in servers:
+        await balancer.add_server(config)
+        balancer.health_checkers[config.id].health.status = ServerStatus.HEALTHY
+    return balancer
+
+
+class TestSelectionSnapshot:
+    """Test precomputed, lock-free server selection."""
+
+    @pytest.mark.asyncio
+    async def test_status_change_swaps_snapshot(self):
+        """Health transitions rebuild the snapshot; selection reads it only."""
+        servers = make_servers(2)
+        balancer = await make_balancer(LoadBalancingStrategy.ROUND_ROBIN, servers)
+        snapshot = balancer._snapshot
+        assert [config.id for config in snapshot.servers] == ["server-0", "server-1"]
+
+        checker = balancer.health_checkers["server-0"]
+        for _ in range(checker.config.failover_threshold):
+            await checker._handle_failure()
+
+        assert balancer._snapshot is not snapshot
+        assert {balancer.select_server().id for _ in range(4)} == {"server-1"}
+
+    @pytest.mark.asyncio
+    async def test_selection_does_not_touch_health_checkers(self):
+        """Selecting a server does not await any health checker."""
+        balancer = await make_balancer(
+            LoadBalancingStrategy.LEAST_CONNECTIONS, make_servers(3)
+        )
+
+        for checker in balancer.health_checkers.values():
+            checker.get_health_status = AsyncMock(side_effect=AssertionError)
+
+        assert await balancer.get_server() is not None
+
+    @pytest.mark.asyncio
+    async def test_set_server_enabled(self):
+        """Disabling a server removes it from selection and the ring."""
+        balancer = await make_balancer(
+            LoadBalancingStrategy.CONSISTENT_HASH, make_servers(2)
+        )
+        ring_size = len(balancer._ring)
+
+        await balancer.set_server_enabled("server-0", False)
+
+        assert len(balancer._ring) == ring_size // 2
+        assert {balancer.select_server(f"c{i}").id for i in range(50)} == {
+            "server-1"
+        }
+
+    @pytest.mark.asyncio
+    async def test_weighted_round_robin_proportions(self):
+        """Weighted selection follows the weights exactly over a cycle."""
+        servers = make_servers(3)
+        for config, weight in zip(servers, (1, 2, 0), strict=True):
+            config.weight = weight
+        balancer = await make_balancer(
+            LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN, servers
+        )
+
+        picks = [balancer.select_server().id for _ in range(30)]
+
+        assert picks.count("server-0") == 10
+        assert picks.count("server-1") == 20
+
+    @pytest.mark.asyncio
+    async def test_two_choices_least_connections(self):
+        """Power of two choices never picks the busiest of two candidates."""
+        balancer = await make_balancer(
+            LoadBalancingStrategy.LEAST_CONNECTIONS, make_servers(4)
+        )
+        for i, checker in enumerate(balancer.health_checkers.values()):
+            checker.health.active_connections = i * 10
+
+        picks = [balancer.select_server().id for _ in range(500)]
+
+        assert "server-3" not in picks
+        assert picks.count("server-0") > picks.count("server-2")
+
+    @pytest.mark.asyncio
+    async def test_ip_hash_is_stable(self):
+        """IP hashing does not depend on the per-process hash seed."""
+        balancer = await make_balancer(LoadBalancingStrategy.IP_HASH, make_servers(4))
+
+        server = balancer.select_server("10.0.0.1")
+
+        assert server.id == f"server-{stable_hash('10.0.0.1') % 4}"
+
+
+class TestConsistentHashRing:
+    """Test the consistent hash ring."""
+
+    def test_virtual_nodes_follow_weight(self):
+        """Servers get ring nodes in proportion to their weight."""
+        servers = make_servers(2)
+        servers[1].weight = 200
+
+        ring = ConsistentHashRing(servers, virtual_nodes=50)
+
+        assert len(ring) == 150
+
+    def test_keys_spread_over_servers(self):
+        """Keys are spread roughly evenly over equally weighted servers."""
+        servers = make_servers(4)
+        ring = ConsistentHashRing(servers, virtual_nodes=160)
+        healthy = frozenset(config.id for config in servers)
+
+        counts = {}
+        for i in range(4000):
+            owner = ring.get(f"client-{i}", healthy)
+            counts[owner] = counts.get(owner, 0) + 1
+
+        assert len(counts) == 4
+        assert min(counts.values()) > 600
+
+    def test_unhealthy_server_only_remaps_its_keys(self):
+        """Keys of healthy servers keep their server when another goes down."""
+        servers = make_servers(4)
+        ring = ConsistentHashRing(servers)
+        all_healthy = frozenset(config.id for config in servers)
+        degraded = all_healthy - {"server-2"}
+
+        for i in range(1000):
+            key = f"client-{i}"
+            before = ring.get(key, all_healthy)
+            after = ring.get(key, degraded)
+            assert after != "server-2"
+            if before != "server-2":
+                assert after == before
+
+    def test_no_healthy_servers(self):
+        """Lookups return None when no server on the ring is healthy."""
+        ring = ConsistentHashRing(make_servers(2))
+
+        assert ring.get("client", frozenset()) is None
+        assert ring.get("client", frozenset({"other"})) is None
+
+
 class TestLoadBalancedMCPClient:
     """Test LoadBalancedMCPClient functionality."""
 
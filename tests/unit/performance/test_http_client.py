@@ -0,0 +1,76 @@
+"""
+HTTP Client Pool Tests
+
+Tests for the shared outbound HTTP client manager.
+"""
+
+import httpx
+import pytest
+
+from metamcp.performance.http_client import HTTPClientManager
+
+
+def _mock_client(handler) -> httpx.AsyncClient:
+    """Create an httpx client backed by a mock transport."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestHTTPClientManager:
+    """Test HTTP client manager functionality."""
+
+    async def test_client_reused_per_origin(self):
+        """Requests to the same origin share one pooled client."""
+        manager = HTTPClientManager()
+        try:
+            first = await manager.get_client("http://tool:8001/execute")
+            second = await manager.get_client("http://tool:8001/health")
+            other = await manager.get_client("http://other:8001/execute")
+
+            assert first is second
+            assert first is not other
+        finally:
+            await manager.close()
+
+    async def test_per_host_connection_limit(self):
+        """Each host pool is created with the configured connection limit."""
+        manager = HTTPClientManager(max_connections_per_host=7)
+        try:
+            await manager.get_client("http://tool:8001")
+            stats = manager.get_stats()["hosts"]["http://tool:8001"]
+
+            assert stats["max_connections"] == 7
+        finally:
+            await manager.close()
+
+    async def test_request_records_stats(self):
+        """Requests and errors are counted per host."""
+        manager = HTTPClientManager()
+        origin = manager._origin("http://tool:8001")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/fail":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        await manager.get_client("http://tool:8001")
+        manager._clients[origin] = _mock_client(handler)
+        try:
+            response = await manager.post("http://tool:8001/execute", json={})
+            assert response.json() == {"ok": True}
+
+            with pytest.raises(httpx.ConnectError):
+                await manager.get("http://tool:8001/fail", timeout=1)
+
+            stats = manager.get_stats()["hosts"][origin]
+            assert stats["requests"] == 2
+            assert stats["errors"] == 1
+            assert stats["in_flight"] == 0
+        finally:
+            await manager.close()
+
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        """HTTP/2 is disabled when the h2 package is unavailable."""
+        monkeypatch.setattr("metamcp.performance.http_client.HTTP2_AVAILABLE", False)
+        manager = HTTPClientManager(http2=True)
+
+        assert manager.http2 is False
@@ -0,0 +1,5 @@
+"""
+Proxy Tests
+
+Unit tests for wrapped MCP server transports and connection pooling.
+"""
@@ -0,0 +1,338 @@
+"""
+Stdio Session Pool Tests
+
+Tests for the stdio transport and session pool used by the MCP proxy wrapper.
+"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from metamcp.exceptions import ProxyError
+from metamcp.proxy.stdio import (
+    StdioMCPConnection,
+    StdioPoolConfig,
+    StdioPoolManager,
+    StdioSessionPool,
+)
+
+FAKE_SERVER = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        if "id" not in message:
+            continue
+        if message["method"] == "exit":
+            sys.exit(0)
+        result = {"pid": os.getpid(), "method": message["method"]}
+        if message["method"] == "tools/call":
+            result["arguments"] = message["params"]["arguments"]
+        reply = {"jsonrpc": "2.0", "id": message["id"], "result": result}
+        sys.stdout.write(json.dumps(reply) + "\\n")
+        sys.stdout.flush()
+    """
+)
+
+
+@pytest.fixture
+def server_command(tmp_path):
+    """Write a minimal JSON-RPC echo server and return its command line."""
+    script = tmp_path / "fake_mcp_server.py"
+    script.write_text(FAKE_SERVER)
+    return f"{sys.executable} {script}"
+
+
+class TestStdioSessionPool:
+    """Test stdio session pool behaviour."""
+
+    async def test_reuses_process_across_requests(self, server_command):
+        """Sequential requests are served by the same warm process."""
+        pool = StdioSessionPool(server_command)
+        try:
+            first = await pool.request("tools/list")
+            second = await pool.request("tools/call", {"name": "x", "arguments": {}})
+
+            assert first["result"]["pid"] == second["result"]["pid"]
+            assert pool.get_stats()["spawned"] == 1
+        finally:
+            await pool.close()
+
+    async def test_request_ids_are_unique(self, server_command):
+        """Each request gets its own JSON-RPC id."""
+        pool = StdioSessionPool(server_command)
+        try:
+            first = await pool.request("tools/list")
+            second = await pool.request("tools/list")
+
+            assert first["id"] != second["id"]
+        finally:
+            await pool.close()
+
+    async def test_concurrent_requests_bounded_by_max_size(self, server_command):
+        """Concurrent load never spawns more than max_size processes."""
+        pool = StdioSessionPool(
+            server_command, config=StdioPoolConfig(max_size=2, max_in_flight=1)
+        )
+        try:
+            responses = await asyncio.gather(
+                *[
+                    pool.request("tools/call", {"name": "echo", "arguments": {"i": i}})
+                    for i in range(10)
+                ]
+            )
+
+            assert [r["result"]["arguments"]["i"] for r in responses] == list(range(10))
+            assert len(pool.sessions) <= 2
+        finally:
+            await pool.close()
+
+    async def test_respawns_dead_process(self, server_command):
+        """A process that exits is replaced on the next request."""
+        pool = StdioSessionPool(server_command)
+        try:
+            first = await pool.request("tools/list")
+            with pytest.raises(ProxyError):
+                await pool.request("exit")
+
+            second = await pool.request("tools/list")
+            assert second["result"]["pid"] != first["result"]["pid"]
+            assert pool.get_stats()["respawned"] == 1
+        finally:
+            await pool.close()
+
+    async def test_cold_spawn_does_not_block_warm_sessions(self, server_command):
+        """Warm sessions are handed out while another process starts."""
+        pool = StdioSessionPool(
+            server_command, config=StdioPoolConfig(max_size=2, max_in_flight=1)
+        )
+        try:
+            await pool.warm_up()
+            warm = await pool._acquire()
+
+            started = asyncio.Event()
+            proceed = asyncio.Event()
+            spawn = pool._spawn
+
+            async def slow_spawn():
+                started.set()
+                await proceed.wait()
+                return await spawn()
+
+            pool._spawn = slow_spawn
+            cold = asyncio.create_task(pool._acquire())
+            await started.wait()
+
+            await asyncio.wait_for(pool._release(warm), timeout=1)
+            assert await asyncio.wait_for(pool._acquire(), timeout=1) is warm
+            assert pool.get_stats()["spawning"] == 1
+
+            proceed.set()
+            session = await cold
+            assert session is not warm
+            assert len(pool.sessions) == 2
+            assert pool.get_stats()["spawning"] == 0
+        finally:
+            await pool.close()
+
+    async def test_failed_spawn_releases_reservation(self, server_command):
+        """A process that fails to start does not keep its pool slot."""
+        pool = StdioSessionPool(server_command, config=StdioPoolConfig(max_size=1))
+        try:
+            spawn = pool._spawn
+
+            async def failing_spawn():
+                raise ProxyError("Failed to start")
+
+            pool._spawn = failing_spawn
+            with pytest.raises(ProxyError):
+                await pool.request("tools/list")
+
+            pool._spawn = spawn
+            assert (await pool.request("tools/list"))["result"]
+            assert pool.get_stats()["spawning"] == 0
+        finally:
+            await pool.close()
+
+    async def test_dead_busy_session_disconnected_on_release(self, server_command):
+        """A dead session dropped while busy is cleaned up by its last request."""
+        pool = StdioSessionPool(server_command)
+        try:
+            session = await pool._acquire()
+            session.connection.process.kill()
+            await session.connection.process.wait()
+
+            replacement = await pool._acquire()
+            assert session not in pool.sessions
+            assert session.connection.process is not None
+
+            await pool._release(session)
+            await pool._release(replacement)
+
+            assert session.connection.process is None
+            assert pool._retiring == set()
+        finally:
+            await pool.close()
+
+    async def test_close_reaches_retiring_sessions(self, server_command):
+        """Closing the pool also terminates dropped sessions still in use."""
+        pool = StdioSessionPool(server_command)
+        session = await pool._acquire()
+        session.connection.process.kill()
+        await session.connection.process.wait()
+        await pool._release(await pool._acquire())
+
+        await pool.close()
+
+        assert session.connection.process is None
+
+    async def test_teardown_does_not_hold_the_lock(self, server_command):
+        """A slow process shutdown does not block other requests."""
+        pool = StdioSessionPool(server_command, config=StdioPoolConfig(idle_timeout=0))
+        try:
+            await pool.warm_up()
+            idle = pool.sessions[0]
+            await asyncio.sleep(0.01)
+
+            stopping = asyncio.Event()
+            proceed = asyncio.Event()
+            disconnect = idle.connection.disconnect
+
+            async def slow_disconnect():
+                stopping.set()
+                await proceed.wait()
+                await disconnect()
+
+            idle.connection.disconnect = slow_disconnect
+            reaper = asyncio.create_task(pool.reap_idle())
+            await stopping.wait()
+
+            session = await asyncio.wait_for(pool._acquire(), timeout=1)
+            await asyncio.wait_for(pool._release(session), timeout=1)
+            assert session is not idle
+
+            proceed.set()
+            assert await reaper == 1
+        finally:
+            await pool.close()
+
+    async def test_reap_idle(self, server_command):
+        """Idle processes are terminated by the reaper."""
+        pool = StdioSessionPool(server_command, config=StdioPoolConfig(idle_timeout=0))
+        try:
+            await pool.warm_up()
+            await asyncio.sleep(0.01)
+
+            assert await pool.reap_idle() == 1
+            assert pool.sessions == []
+        finally:
+            await pool.close()
+
+
+class TestStdioPoolManager:
+    """Test stdio pool registry."""
+
+    async def test_get_pool_is_keyed_by_command(self, server_command):
+        """The same command always maps to the same pool."""
+        manager = StdioPoolManager()
+        try:
+            assert manager.get_pool(server_command) is manager.get_pool(server_command)
+            assert manager.get_pool("other") is not manager.get_pool(server_command)
+        finally:
+            await manager.close()
+
+
+class TestStdioMCPConnection:
+    """Test the non-blocking stdio transport."""
+
+    async def test_out_of_order_responses_are_demultiplexed(self, tmp_path):
+        """Responses are routed to callers by JSON-RPC id, not arrival order."""
+        script = tmp_path / "reversing_server.py"
+        script.write_text(
+            textwrap.dedent(
+                """
+                import json
+                import sys
+
+                batch = []
+                for line in sys.stdin:
+                    batch.append(json.loads(line))
+                    if len(batch) == 3:
+                        for message in reversed(batch):
+                            reply = {
+                                "jsonrpc": "2.0",
+                                "id": message["id"],
+                                "result": message["params"],
+                            }
+                            sys.stdout.write(json.dumps(reply) + "\\n")
+                        sys.stdout.flush()
+                        batch = []
+                """
+            )
+        )
+        connection = StdioMCPConnection(f"{sys.executable} {script}")
+        await connection.connect()
+        try:
+            responses = await asyncio.gather(
+                *[connection.request("echo", {"n": n}) for n in range(3)]
+            )
+
+            assert [r["result"]["n"] for r in responses] == [0, 1, 2]
+        finally:
+            await connection.disconnect()
+
+    async def test_non_object_lines_are_skipped(self, tmp_path):
+        """Stray JSON values on stdout do not stop the reader."""
+        script = tmp_path / "noisy_server.py"
+        script.write_text(
+            textwrap.dedent(
+                """
+                import json
+                import sys
+
+                for line in sys.stdin:
+                    message = json.loads(line)
+                    sys.stdout.write('42\\n[]\\n"starting"\\n')
+                    reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+                    sys.stdout.write(json.dumps(reply) + "\\n")
+                    sys.stdout.flush()
+                """
+            )
+        )
+        connection = StdioMCPConnection(f"{sys.executable} {script}", timeout=5)
+        await connection.connect()
+        try:
+            assert (await connection.request("tools/list"))["result"] == {}
+            assert connection.is_connected
+        finally:
+            await connection.disconnect()
+
+    async def test_request_timeout(self, tmp_path):
+        """A silent server fails the request without blocking the loop."""
+        script = tmp_path / "silent_server.py"
+        script.write_text("import sys\nfor line in sys.stdin:\n    pass\n")
+        connection = StdioMCPConnection(f"{sys.executable} {script}", timeout=0.2)
+        await connection.connect()
+        try:
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker_task = asyncio.create_task(ticker())
+            with pytest.raises(ProxyError):
+                await connection.request("tools/list")
+            ticker_task.cancel()
+
+            assert ticks > 5
+            assert connection.in_flight == 0
+        finally:
+            await connection.disconnect()
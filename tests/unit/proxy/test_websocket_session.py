@@ -0,0 +1,161 @@
+"""
+WebSocket Session Tests
+
+Tests for persistent, multiplexed WebSocket sessions to wrapped MCP servers.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from metamcp.exceptions import ProxyError
+from metamcp.proxy.websocket import WebSocketMCPSession, WebSocketSessionManager
+
+websockets = pytest.importorskip("websockets")
+
+
+@pytest.fixture
+async def mcp_server():
+    """Run a JSON-RPC echo server that answers each batch of 3 in reverse."""
+    connections = []
+
+    async def handler(websocket):
+        connections.append(websocket)
+        batch = []
+        async for raw in websocket:
+            message = json.loads(raw)
+            if message["method"] == "drop":
+                await websocket.close()
+                return
+            if message["method"] == "noise":
+                await websocket.send("[]")
+                await websocket.send("1")
+            batch.append(message)
+            if message["method"] != "echo" or len(batch) == 3:
+                for item in reversed(batch):
+                    reply = {"jsonrpc": "2.0", "id": item["id"]}
+                    reply["result"] = item["params"]
+                    await websocket.send(json.dumps(reply))
+                batch = []
+
+    server = await websockets.serve(handler, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"ws://127.0.0.1:{port}", connections
+    server.close()
+    await server.wait_closed()
+
+
+class TestWebSocketMCPSession:
+    """Test WebSocket session behaviour."""
+
+    async def test_concurrent_requests_share_one_socket(self, mcp_server):
+        """Concurrent requests are multiplexed and demultiplexed by id."""
+        endpoint, connections = mcp_server
+        session = WebSocketMCPSession(endpoint, timeout=5)
+        try:
+            responses = await asyncio.gather(
+                *[session.request("echo", {"n": n}) for n in range(3)]
+            )
+
+            assert [r["result"]["n"] for r in responses] == [0, 1, 2]
+            assert len(connections) == 1
+        finally:
+            await session.close()
+
+    async def test_reconnects_after_drop(self, mcp_server):
+        """A dropped socket fails in-flight requests and reconnects next time."""
+        endpoint, connections = mcp_server
+        session = WebSocketMCPSession(endpoint, timeout=5)
+        try:
+            await session.request("tools/list")
+            with pytest.raises(ProxyError):
+                await session.request("drop")
+
+            response = await session.request("tools/list", {"again": True})
+            assert response["result"] == {"again": True}
+            assert session.get_stats()["reconnects"] == 1
+            assert len(connections) == 2
+        finally:
+            await session.close()
+
+    async def test_reconnect_retires_the_old_socket(self, mcp_server):
+        """A reconnect closes the old socket and stops its reader."""
+        endpoint, connections = mcp_server
+        session = WebSocketMCPSession(endpoint, timeout=5)
+        try:
+            await session.request("tools/list")
+            old_socket, old_reader = session.websocket, session._reader_task
+
+            with patch.object(old_socket, "send", side_effect=OSError("broken")):
+                with pytest.raises(ProxyError):
+                    await session.request("tools/list")
+            assert not old_reader.done()
+
+            await session.connect()
+            await asyncio.wait_for(old_socket.wait_closed(), timeout=1)
+            await asyncio.sleep(0)
+
+            assert old_reader.done()
+            assert session.is_connected
+            response = await session.request("tools/list", {"again": True})
+            assert response["result"] == {"again": True}
+            assert len(connections) == 2
+        finally:
+            await session.close()
+
+    async def test_stale_reader_does_not_fail_new_socket(self, mcp_server):
+        """A reader for a replaced socket leaves the session alone."""
+        endpoint, _ = mcp_server
+        session = WebSocketMCPSession(endpoint, timeout=5)
+        try:
+            await session.connect()
+            old_socket = session.websocket
+            await old_socket.close()
+
+            await session._read_loop(old_socket)
+            assert not session.is_connected
+
+            await session.connect()
+            await session._read_loop(old_socket)
+
+            assert session.is_connected
+        finally:
+            await session.close()
+
+    async def test_non_object_messages_are_skipped(self, mcp_server):
+        """Valid JSON that is not an object does not stop the reader."""
+        endpoint, _ = mcp_server
+        session = WebSocketMCPSession(endpoint, timeout=5)
+        try:
+            response = await session.request("noise", {"n": 1})
+
+            assert response["result"] == {"n": 1}
+            assert session.is_connected
+        finally:
+            await session.close()
+
+    async def test_connect_gives_up_after_retries(self):
+        """Connection attempts back off and eventually raise."""
+        session = WebSocketMCPSession(
+            "ws://127.0.0.1:1",
+            timeout=1,
+            max_reconnect_attempts=2,
+            reconnect_base_delay=0.01,
+        )
+
+        with pytest.raises(ProxyError):
+            await session.connect()
+
+
+class TestWebSocketSessionManager:
+    """Test WebSocket session registry."""
+
+    async def test_get_session_is_keyed_by_endpoint(self):
+        """The same endpoint always maps to the same session."""
+        manager = WebSocketSessionManager()
+
+        assert manager.get_session("ws://a") is manager.get_session("ws://a")
+        assert manager.get_session("ws://b") is not manager.get_session("ws://a")
+        await manager.close()
@@ -0,0 +1,110 @@
+"""
+Request Body Inspection Tests
+
+Tests for single-pass request body validation in the security middleware.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from metamcp.security.middleware import PreparsedBodyRoute, SecurityMiddleware
+
+
+class Payload(BaseModel):
+    """Tool call payload."""
+
+    arguments: dict
+
+
+@pytest.fixture
+def client():
+    """Create a test client with a pre-parsed body route."""
+    app = FastAPI()
+    router = APIRouter(route_class=PreparsedBodyRoute)
+
+    @router.post("/execute")
+    async def execute(payload: Payload, request: Request):
+        return {
+            "arguments": payload.arguments,
+            "preparsed": request.state.json_body == payload.model_dump(),
+        }
+
+    app.include_router(router)
+    app.add_middleware(SecurityMiddleware)
+    return TestClient(app)
+
+
+class TestBodyInspection:
+    """Test request body inspection."""
+
+    def test_body_is_parsed_once_and_handed_on(self, client, monkeypatch):
+        """The route receives the body parsed by the middleware."""
+        import json
+
+        calls = []
+        original = json.loads
+        monkeypatch.setattr(
+            json, "loads", lambda *a, **kw: calls.append(1) or original(*a, **kw)
+        )
+
+        response = client.post(
+            "/execute", json={"arguments": {"city": "Berlin", "days": None}}
+        )
+        monkeypatch.undo()
+
+        # Decoded once by the middleware, not again by the route
+        assert len(calls) == 1
+        assert response.status_code == 200
+        assert response.json() == {
+            "arguments": {"city": "Berlin", "days": None},
+            "preparsed": True,
+        }
+
+    def test_oversized_body_rejected(self, client):
+        """Bodies above the size limit get 413."""
+        response = client.post(
+            "/execute", json={"arguments": {"blob": "x" * (11 * 1024 * 1024)}}
+        )
+
+        assert response.status_code == 413
+
+    def test_nesting_depth_limit(self, client):
+        """Deeply nested documents are rejected."""
+        nested: dict = {}
+        for _ in range(100):
+            nested = {"a": nested}
+
+        response = client.post("/execute", json={"arguments": nested})
+
+        assert response.status_code == 400
+        assert "too deep" in response.json()["error"]
+
+    def test_malicious_nested_key_rejected(self, client):
+        """Keys are scanned as well as values."""
+        response = client.post(
+            "/execute", json={"arguments": {"x": [{"<script>": 1}]}}
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("number", ["1e999", "NaN", "Infinity", "-Infinity"])
+    def test_non_finite_numbers_rejected(self, client, number):
+        """NaN, infinities and floats overflowing to infinity are rejected."""
+        response = client.post(
+            "/execute",
+            content=f'{{"arguments": {{"n": {number}}}}}'.encode(),
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 400
+
+    def test_patterns_do_not_span_strings(self):
+        """Adjacent strings are not matched as one."""
+        middleware = SecurityMiddleware(Mock())
+
+        assert middleware._validate_json_body({"onclick": "=x"})["valid"]
+        assert not middleware._validate_json_body({"a": "onclick=x"})["valid"]
@@ -0,0 +1,95 @@
+"""
+Tests for batched policy evaluation.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from metamcp.config import PolicyEngineType
+from metamcp.security.policies import BATCH_POLICY_NAME, PolicyEngine
+
+
+@pytest.fixture
+async def internal_engine():
+    """Create an initialized internal policy engine."""
+    engine = PolicyEngine(PolicyEngineType.INTERNAL)
+    await engine.initialize()
+    return engine
+
+
+class TestCheckAccessMany:
+    """Test PolicyEngine.check_access_many."""
+
+    async def test_internal_mask_matches_single_checks(self, internal_engine):
+        """The allow-mask agrees with check_access for every resource."""
+        resources = ["tool:public", "tool:calculator", "data:public:x"]
+
+        for user_id in ["admin", "user", "anonymous"]:
+            for action in ["read", "execute"]:
+                mask = await internal_engine.check_access_many(
+                    user_id, resources, action
+                )
+                expected = [
+                    await internal_engine.check_access(user_id, resource, action)
+                    for resource in resources
+                ]
+                assert mask == expected
+
+    async def test_context_checked_once_for_batch(self, internal_engine):
+        """Rate limiting counts a batch as one request."""
+        context = {"rate_limit_key": "batch_user", "limit": 1}
+
+        first = await internal_engine.check_access_many(
+            "admin", ["tool:a", "tool:b"], "read", context
+        )
+        second = await internal_engine.check_access_many(
+            "admin", ["tool:a", "tool:b"], "read", context
+        )
+
+        assert first == [True, True]
+        assert second == [False, False]
+
+    async def test_uninitialized_engine_denies_all(self):
+        """An uninitialized engine denies every resource."""
+        engine = PolicyEngine(PolicyEngineType.INTERNAL)
+
+        assert await engine.check_access_many("admin", ["tool:a"], "read") == [False]
+
+    async def test_opa_uses_single_query(self, internal_engine):
+        """OPA mode evaluates the whole batch in one request."""
+        internal_engine.engine_type = PolicyEngineType.OPA
+        internal_engine.opa_url = "http://opa:8181"
+        internal_engine.http_client = Mock(
+            post=AsyncMock(
+                return_value=httpx.Response(
+                    200,
+                    json={
+                        "result": {
+                            "tool_access": ["tool:a"],
+                            "data_access": ["data:public:x"],
+                        }
+                    },
+                )
+            )
+        )
+
+        mask = await internal_engine.check_access_many(
+            "user", ["tool:a", "tool:b", "data:public:x"], "read"
+        )
+
+        assert mask == [True, False, True]
+        internal_engine.http_client.post.assert_awaited_once()
+        url = internal_engine.http_client.post.await_args.args[0]
+        payload = internal_engine.http_client.post.await_args.kwargs["json"]
+        assert url == f"http://opa:8181/v1/data/{BATCH_POLICY_NAME}"
+        assert payload["input"]["resources"] == ["tool:a", "tool:b", "data:public:x"]
+
+    async def test_batch_policy_covers_active_policies(self, internal_engine):
+        """The generated Rego module has one rule per active policy."""
+        module = internal_engine._build_batch_policy()
+
+        assert f"package {BATCH_POLICY_NAME}" in module
+        for policy_name in internal_engine.active_policies:
+            assert f"data.{policy_name}.allow" in module
@@ -0,0 +1,130 @@
+"""
+Tests for the policy decision cache.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from metamcp.config import PolicyEngineType
+from metamcp.security.policies import PolicyDecisionCache, PolicyEngine
+
+
+@pytest.fixture
+async def opa_engine():
+    """Create a policy engine answering through a mocked OPA."""
+    engine = PolicyEngine(PolicyEngineType.INTERNAL)
+    await engine.initialize()
+    engine.engine_type = PolicyEngineType.OPA
+    engine.opa_url = "http://opa:8181"
+    engine.http_client = Mock(
+        post=AsyncMock(return_value=httpx.Response(200, json={"result": True})),
+        put=AsyncMock(return_value=httpx.Response(200)),
+    )
+    return engine
+
+
+class TestPolicyDecisionCache:
+    """Test PolicyDecisionCache."""
+
+    def test_lru_eviction(self):
+        """The least recently used decision is evicted."""
+        cache = PolicyDecisionCache(max_size=2, ttl=60)
+        cache.set(("a",), True, cache.generation)
+        cache.set(("b",), False, cache.generation)
+        cache.get(("a",))
+        cache.set(("c",), True, cache.generation)
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is True
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Decisions expire after the TTL."""
+        now = [100.0]
+        monkeypatch.setattr(
+            "metamcp.security.policies.time.monotonic", lambda: now[0]
+        )
+        cache = PolicyDecisionCache(max_size=10, ttl=5)
+        cache.set(("a",), True, cache.generation)
+
+        now[0] += 4
+        assert cache.get(("a",)) is True
+        now[0] += 2
+        assert cache.get(("a",)) is None
+
+    def test_stale_generation_not_stored(self):
+        """Decisions evaluated before an invalidation are discarded."""
+        cache = PolicyDecisionCache(max_size=10, ttl=60)
+        generation = cache.generation
+        cache.invalidate()
+        cache.set(("a",), True, generation)
+
+        assert cache.get(("a",)) is None
+
+
+class TestPolicyEngineDecisionCache:
+    """Test decision caching in PolicyEngine."""
+
+    async def test_repeated_checks_hit_cache(self, opa_engine):
+        """A repeated check does not query OPA again."""
+        assert await opa_engine.check_access("user", "tool:a", "read")
+        assert await opa_engine.check_access("user", "tool:a", "read")
+
+        opa_engine.http_client.post.assert_awaited_once()
+        stats = opa_engine.get_decision_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    async def test_volatile_context_shares_entry(self, opa_engine):
+        """Quota usage does not fragment the cache key."""
+        for usage in (1, 2):
+            await opa_engine.check_access(
+                "user", "tool:a", "read", {"quota_key": "q", "usage": usage}
+            )
+
+        opa_engine.http_client.post.assert_awaited_once()
+
+    async def test_batch_checks_only_query_misses(self, opa_engine):
+        """check_access_many evaluates only uncached resources."""
+        await opa_engine.check_access("user", "tool:a", "read")
+        opa_engine.http_client.post.return_value = httpx.Response(
+            200, json={"result": {"tool_access": ["tool:b"]}}
+        )
+
+        mask = await opa_engine.check_access_many(
+            "user", ["tool:a", "tool:b", "tool:c"], "read"
+        )
+
+        assert mask == [True, True, False]
+        payload = opa_engine.http_client.post.await_args.kwargs["json"]
+        assert payload["input"]["resources"] == ["tool:b", "tool:c"]
+
+    async def test_policy_changes_invalidate(self, opa_engine):
+        """Policy and IP list changes clear cached decisions."""
+        changes = [
+            lambda: opa_engine.update_policy("tool_access", "package x", "d", "u"),
+            lambda: opa_engine.create_policy("other", "package y", "d", "u"),
+            lambda: opa_engine.activate_policy_version(
+                "tool_access", opa_engine.policy_versions["tool_access"][0].version
+            ),
+            lambda: opa_engine.add_ip_to_blacklist("10.0.0.1"),
+            lambda: opa_engine.remove_ip_from_blacklist("10.0.0.1"),
+        ]
+
+        for change in changes:
+            await opa_engine.check_access("user", "tool:a", "read")
+            assert opa_engine.get_decision_cache_stats()["size"] == 1
+            await change()
+            assert opa_engine.get_decision_cache_stats()["size"] == 0
+
+    async def test_opa_errors_are_not_cached(self, opa_engine):
+        """A failed OPA query denies access without caching the denial."""
+        opa_engine.http_client.post.return_value = httpx.Response(500)
+        assert not await opa_engine.check_access("user", "tool:a", "read")
+
+        opa_engine.http_client.post.return_value = httpx.Response(
+            200, json={"result": True}
+        )
+        assert await opa_engine.check_access("user", "tool:a", "read")
@@ -0,0 +1,267 @@
+"""
+Unit tests for the GCRA and sliding window counter rate limiting strategies.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from metamcp.security import rate_limiting
+from metamcp.security.middleware import RateLimitMiddleware
+from metamcp.security.rate_limiting import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStrategy,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def rate_limiter(clock):
+    """Create a rate limiter driven by the fake clock."""
+    return RateLimiter(clock=clock)
+
+
+async def add_limit(limiter, strategy, limit=5, window=10, **kwargs):
+    """Add a rate limit keyed by the strategy name."""
+    await limiter.add_rate_limit(
+        RateLimitConfig(
+            key=strategy.value,
+            limit=limit,
+            window_seconds=window,
+            strategy=strategy,
+            **kwargs,
+        )
+    )
+    return strategy.value
+
+
+class TestGCRA:
+    """Test the GCRA strategy."""
+
+    async def test_burst_then_steady_rate(self, rate_limiter, clock):
+        """A full burst is allowed, then one request per emission interval."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.GCRA)
+
+        results = [await rate_limiter.check_rate_limit(key) for _ in range(5)]
+        assert all(r.allowed for r in results)
+        assert [r.remaining for r in results] == [4, 3, 2, 1, 0]
+
+        blocked = await rate_limiter.check_rate_limit(key)
+        assert not blocked.allowed
+        assert blocked.retry_after == 2
+
+        clock.advance(2)
+        assert (await rate_limiter.check_rate_limit(key)).allowed
+        assert not (await rate_limiter.check_rate_limit(key)).allowed
+
+    async def test_burst_limit_and_cost(self, rate_limiter, clock):
+        """The burst limit bounds the tolerance and cost scales the increment."""
+        key = await add_limit(
+            rate_limiter, RateLimitStrategy.GCRA, limit=10, burst_limit=4
+        )
+
+        assert (await rate_limiter.check_rate_limit(key, cost=3)).allowed
+        assert not (await rate_limiter.check_rate_limit(key, cost=2)).allowed
+        assert (await rate_limiter.check_rate_limit(key, cost=1)).allowed
+
+    async def test_state_is_constant_size(self, rate_limiter, clock):
+        """Only the theoretical arrival time is tracked."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.GCRA)
+        for _ in range(100):
+            await rate_limiter.check_rate_limit(key)
+            clock.advance(0.5)
+
+        state = rate_limiter.states[key]
+        assert state.tat == state.expires_at
+        assert state.tat <= clock.now + 10
+
+
+class TestSlidingWindowCounter:
+    """Test the sliding window counter strategy."""
+
+    async def test_previous_window_is_weighted(self, rate_limiter, clock):
+        """Requests from the previous window count by their overlap."""
+        clock.now = 1000.0  # start of a 10 second window
+        key = await add_limit(rate_limiter, RateLimitStrategy.SLIDING_WINDOW_COUNTER)
+
+        for _ in range(5):
+            assert (await rate_limiter.check_rate_limit(key)).allowed
+        assert not (await rate_limiter.check_rate_limit(key)).allowed
+
+        # Half way into the next window half of the previous count remains
+        clock.advance(15)
+        allowed = [
+            (await rate_limiter.check_rate_limit(key)).allowed for _ in range(4)
+        ]
+        assert allowed == [True, True, False, False]
+
+    async def test_retry_after_accounts_for_sliding(self, rate_limiter, clock):
+        """Retry-After is when enough of the previous window has slid out."""
+        clock.now = 1000.0
+        key = await add_limit(rate_limiter, RateLimitStrategy.SLIDING_WINDOW_COUNTER)
+        for _ in range(5):
+            await rate_limiter.check_rate_limit(key)
+
+        clock.advance(11)
+        result = await rate_limiter.check_rate_limit(key)
+        assert not result.allowed
+        assert result.retry_after == 1
+
+        clock.advance(result.retry_after)
+        assert (await rate_limiter.check_rate_limit(key)).allowed
+
+    async def test_old_windows_are_forgotten(self, rate_limiter, clock):
+        """Counts older than the previous window are dropped."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.SLIDING_WINDOW_COUNTER)
+        for _ in range(5):
+            await rate_limiter.check_rate_limit(key)
+
+        clock.advance(25)
+        result = await rate_limiter.check_rate_limit(key)
+        assert result.allowed
+        assert result.remaining == 4
+
+
+class TestExpiredStateSweeper:
+    """Test the cleanup sweeper."""
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    async def test_drained_and_idle_states(self, rate_limiter, clock, numpy_available):
+        """Drained states are dropped and idle limits removed."""
+        if numpy_available and not rate_limiting.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+
+        gcra = await add_limit(rate_limiter, RateLimitStrategy.GCRA)
+        counter = await add_limit(
+            rate_limiter, RateLimitStrategy.SLIDING_WINDOW_COUNTER
+        )
+        fixed = await add_limit(rate_limiter, RateLimitStrategy.FIXED_WINDOW)
+        for key in (gcra, counter, fixed):
+            await rate_limiter.check_rate_limit(key)
+
+        clock.advance(30)
+        with patch.object(rate_limiting, "NUMPY_AVAILABLE", numpy_available):
+            await rate_limiter._cleanup_expired_states()
+
+        assert set(rate_limiter.states) == {fixed}
+        assert set(rate_limiter.limiters) == {gcra, counter, fixed}
+
+        # A swept key starts again from a fresh state
+        assert (await rate_limiter.check_rate_limit(gcra)).remaining == 4
+
+        clock.advance(rate_limiter.global_config["state_idle_ttl"] + 1)
+        with patch.object(rate_limiting, "NUMPY_AVAILABLE", numpy_available):
+            await rate_limiter._cleanup_expired_states()
+
+        # gcra and fixed were idle past the TTL; counter has no state to age
+        assert rate_limiter.states == {}
+        assert set(rate_limiter.limiters) == {counter}
+
+    async def test_drained_default_limits_are_removed(self, rate_limiter, clock):
+        """Limits created from the defaults are removed once drained."""
+        rate_limiter.global_config["default_strategy"] = RateLimitStrategy.GCRA
+        await rate_limiter.check_rate_limit("ip:1.2.3.4")
+
+        clock.advance(rate_limiter.global_config["default_window"])
+        await rate_limiter._cleanup_expired_states()
+
+        assert rate_limiter.limiters == {}
+        assert rate_limiter.stats == {}
+
+
+class TestRateLimitMiddlewareMemory:
+    """Test the in-memory path of the security RateLimitMiddleware."""
+
+    @pytest.fixture
+    def middleware(self):
+        """Create middleware without Redis."""
+        with patch("metamcp.security.middleware.get_settings") as get_settings:
+            settings = get_settings.return_value
+            settings.rate_limit_requests = 3
+            settings.rate_limit_window = 60
+            settings.rate_limit_use_redis = False
+            yield RateLimitMiddleware(app=None)
+
+    async def test_counter_state_is_constant_size(self, middleware):
+        """Each client keeps a fixed-size counter instead of timestamps."""
+        with patch("metamcp.security.middleware.time.time", return_value=6000.0):
+            results = [await middleware._check_rate_limit("1.2.3.4") for _ in range(4)]
+
+        assert [r[0] for r in results] == [True, True, True, False]
+        assert [r[2] for r in results] == [2, 1, 0, 0]
+        assert middleware.request_counts["1.2.3.4"] == (6000, 0, 3)
+
+    async def test_previous_window_slides_out(self, middleware):
+        """The previous window's count decays across the current window."""
+        with patch("metamcp.security.middleware.time.time", return_value=6000.0):
+            for _ in range(3):
+                await middleware._check_rate_limit("1.2.3.4")
+
+        with patch("metamcp.security.middleware.time.time", return_value=6070.0):
+            assert not (await middleware._check_rate_limit("1.2.3.4"))[0]
+
+        with patch("metamcp.security.middleware.time.time", return_value=6110.0):
+            assert (await middleware._check_rate_limit("1.2.3.4"))[0]
+
+    async def test_stale_clients_are_swept(self, middleware):
+        """Counters older than the previous window are dropped."""
+        with patch("metamcp.security.middleware.time.time", return_value=6000.0):
+            await middleware._check_rate_limit("1.2.3.4")
+        with patch("metamcp.security.middleware.time.time", return_value=6200.0):
+            await middleware._check_rate_limit("5.6.7.8")
+
+        assert set(middleware.request_counts) == {"5.6.7.8"}
+
+
+class TestStrategyBenchmark:
+    """Benchmark the new strategies against the existing ones."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    async def test_check_throughput(self, strategy):
+        """Every strategy checks a hot key in well under a millisecond."""
+        limiter = RateLimiter()
+        key = await add_limit(limiter, strategy, limit=1_000_000, window=60)
+        iterations = 2000
+
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            await limiter.check_rate_limit(key)
+        per_check = (time.perf_counter() - start_time) / iterations
+
+        assert per_check < 0.001  # 1ms per check
+
+    @pytest.mark.benchmark
+    async def test_sweep_many_keys(self, rate_limiter, clock):
+        """Sweeping drained states scales to many keys."""
+        rate_limiter.global_config["default_strategy"] = RateLimitStrategy.GCRA
+        for i in range(5000):
+            await rate_limiter.check_rate_limit(f"ip:{i}")
+
+        clock.advance(rate_limiter.global_config["default_window"])
+        start_time = time.perf_counter()
+        await rate_limiter._cleanup_expired_states()
+        sweep_time = time.perf_counter() - start_time
+
+        assert rate_limiter.states == {}
+        assert sweep_time < 1.0  # 1 second threshold
@@ -0,0 +1,341 @@
+"""
+Unit tests for the Redis Lua script backend of the rate limiter.
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from metamcp.security.middleware import RateLimitMiddleware
+from metamcp.security.rate_limiting import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStrategy,
+)
+from metamcp.utils import redis_scripts
+from metamcp.utils.redis_scripts import (
+    RATE_LIMIT_SCRIPTS,
+    RedisScript,
+    fixed_window_script,
+    gcra_script,
+    release_lease_script,
+)
+
+
+@pytest.fixture
+def redis():
+    """Create a mock async Redis client."""
+    client = AsyncMock()
+    client.evalsha.return_value = [1, 4, 10000, 0]
+    client.script_load.side_effect = lambda source: RedisScript(source).sha
+    return client
+
+
+@pytest.fixture
+def rate_limiter(redis):
+    """Create a rate limiter backed by the mock Redis client."""
+    return RateLimiter(redis=redis)
+
+
+async def add_limit(limiter, strategy, **kwargs):
+    """Add a five per ten seconds rate limit keyed by the strategy name."""
+    await limiter.add_rate_limit(
+        RateLimitConfig(
+            key=strategy.value,
+            limit=5,
+            window_seconds=10,
+            strategy=strategy,
+            **kwargs,
+        )
+    )
+    return strategy.value
+
+
+class TestRedisScript:
+    """Test the EVALSHA script wrapper."""
+
+    async def test_runs_with_evalsha(self, redis):
+        """Scripts run by SHA without sending the source."""
+        script = RedisScript("return 1")
+
+        await script(redis, ["a", "b"], [1, 2])
+
+        redis.evalsha.assert_awaited_once_with(script.sha, 2, "a", "b", 1, 2)
+        redis.eval.assert_not_called()
+
+    async def test_reloads_on_noscript(self, redis):
+        """A flushed script cache is repopulated and the call retried."""
+        script = RedisScript("return 1")
+        redis.evalsha.side_effect = [redis_scripts.NoScriptError("NOSCRIPT"), 1]
+
+        assert await script(redis, ["a"], []) == 1
+
+        redis.script_load.assert_awaited_once_with("return 1")
+        assert redis.evalsha.await_count == 2
+
+
+class TestRedisRateLimiter:
+    """Test the Redis backend of RateLimiter."""
+
+    async def test_initialize_preloads_scripts(self, rate_limiter, redis):
+        """All strategy scripts are loaded at startup."""
+        await rate_limiter.initialize()
+        await rate_limiter.shutdown()
+
+        loaded = {call.args[0] for call in redis.script_load.await_args_list}
+        assert loaded == {script.source for script in RATE_LIMIT_SCRIPTS}
+
+    @pytest.mark.parametrize("strategy", list(RateLimitStrategy))
+    async def test_single_round_trip(self, rate_limiter, redis, strategy):
+        """Every strategy is checked with exactly one EVALSHA."""
+        key = await add_limit(rate_limiter, strategy)
+
+        result = await rate_limiter.check_rate_limit(key, cost=2)
+
+        assert result.allowed
+        assert result.remaining == 4
+        assert result.retry_after is None
+        redis.evalsha.assert_awaited_once()
+        args = redis.evalsha.await_args.args
+        assert args[2] == f"metamcp:rate_limit:{strategy.value}:{{{key}}}"
+        assert list(args[2 + args[1] :][:3]) == [5, 10000, 2]
+
+    async def test_sliding_window_keys_share_a_slot(self, rate_limiter, redis):
+        """The sliding window log and its sequence use the same hash tag."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.SLIDING_WINDOW)
+
+        await rate_limiter.check_rate_limit(key)
+
+        _, numkeys, log_key, seq_key, *_ = redis.evalsha.await_args.args
+        assert numkeys == 2
+        assert seq_key == f"{log_key}:seq"
+
+    async def test_gcra_passes_burst_limit(self, rate_limiter, redis):
+        """GCRA receives the burst limit as its tolerance."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.GCRA, burst_limit=3)
+
+        await rate_limiter.check_rate_limit(key)
+
+        assert redis.evalsha.await_args.args[-1] == 3
+
+    async def test_blocked_result(self, rate_limiter, redis):
+        """Retry-After is rounded up to whole seconds."""
+        redis.evalsha.return_value = [0, 0, 8000, 1500]
+        key = await add_limit(rate_limiter, RateLimitStrategy.TOKEN_BUCKET)
+
+        result = await rate_limiter.check_rate_limit(key)
+
+        assert not result.allowed
+        assert result.retry_after == 2
+        assert rate_limiter.stats[key]["blocked_requests"] == 1
+
+    async def test_falls_back_to_memory(self, rate_limiter, redis):
+        """Requests are limited in-process while Redis is unavailable."""
+        redis.evalsha.side_effect = ConnectionError("redis down")
+        key = await add_limit(rate_limiter, RateLimitStrategy.GCRA)
+
+        results = [await rate_limiter.check_rate_limit(key) for _ in range(6)]
+
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+
+    async def test_reset_deletes_redis_state(self, rate_limiter, redis):
+        """Resetting a limit clears its Redis keys."""
+        key = await add_limit(rate_limiter, RateLimitStrategy.SLIDING_WINDOW)
+
+        assert await rate_limiter.reset_rate_limit(key)
+
+        keys = rate_limiter._redis_keys(rate_limiter.limiters[key])
+        redis.delete.assert_awaited_once_with(*keys)
+
+
+class TestTokenLeasing:
+    """Test serving hot keys from tokens leased from Redis."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a manually advanced clock."""
+        now = [1000.0]
+        clock = lambda: now[0]  # noqa: E731
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    @pytest.fixture
+    def leasing_limiter(self, redis, clock):
+        """Create a rate limiter whose lease releases return all tokens."""
+        acquisitions = [[1, 40, 10000, 0]]
+
+        async def evalsha(sha, numkeys, *keys_and_args):
+            if sha == release_lease_script.sha:
+                return keys_and_args[numkeys + 1]
+            return acquisitions.pop(0) if len(acquisitions) > 1 else acquisitions[0]
+
+        redis.evalsha.side_effect = evalsha
+        limiter = RateLimiter(clock=clock, redis=redis)
+        limiter.acquisitions = acquisitions
+        return limiter
+
+    def calls(self, redis, script=None):
+        """Get the EVALSHA calls, optionally only those of one script."""
+        return [
+            call.args
+            for call in redis.evalsha.await_args_list
+            if script is None or call.args[0] == script.sha
+        ]
+
+    async def test_lease_is_served_locally(self, leasing_limiter, redis):
+        """One Redis call leases tokens for the following requests."""
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.TOKEN_BUCKET, lease_size=10
+        )
+
+        results = [await leasing_limiter.check_rate_limit(key) for _ in range(10)]
+
+        assert all(r.allowed for r in results)
+        assert [r.remaining for r in results] == list(range(49, 39, -1))
+        assert len(self.calls(redis)) == 1
+        assert self.calls(redis)[0][-1] == 10
+
+        await leasing_limiter.check_rate_limit(key)
+        assert len(self.calls(redis)) == 2
+        assert self.calls(redis, release_lease_script) == []
+
+    async def test_expired_lease_returns_unused_tokens(
+        self, leasing_limiter, redis, clock
+    ):
+        """Unused tokens go back to Redis when a lease expires."""
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.GCRA, lease_size=10, lease_ttl=1.0
+        )
+        for _ in range(3):
+            await leasing_limiter.check_rate_limit(key)
+
+        clock.advance(1.0)
+        await leasing_limiter.check_rate_limit(key)
+
+        (release,) = self.calls(redis, release_lease_script)
+        assert list(release[3:]) == ["gcra", 7, 5, 10000]
+        stats = await leasing_limiter.get_lease_statistics()
+        assert stats["lease_tokens_returned"] == 7
+        assert stats["lease_acquisitions"] == 2
+        assert stats["lease_local_hits"] == 2
+        assert stats["outstanding_tokens"] == 9
+        assert stats["checks_per_redis_call"] == 4 / 3
+
+    async def test_partial_lease_near_the_limit(self, leasing_limiter, redis):
+        """What is left of the limit is leased when a full batch is not."""
+        leasing_limiter.acquisitions[:] = [[0, 3, 10000, 1000], [1, 0, 10000, 0]]
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.LEAKY_BUCKET, lease_size=10
+        )
+
+        results = [await leasing_limiter.check_rate_limit(key) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, True]
+        assert [call[-1] for call in self.calls(redis)] == [10, 3]
+
+    async def test_denied_lease_reports_request_cost(self, leasing_limiter):
+        """A denied lease is reported with the request's own cost."""
+        leasing_limiter.acquisitions[:] = [[0, 0, 10000, 2000]]
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.TOKEN_BUCKET, lease_size=10
+        )
+
+        result = await leasing_limiter.check_rate_limit(key)
+
+        assert not result.allowed
+        assert result.cost_used == 1
+        assert result.retry_after == 2
+
+    async def test_windowed_lease_ends_with_the_window(
+        self, leasing_limiter, redis, clock
+    ):
+        """Tokens leased in one fixed window are not used or returned later."""
+        leasing_limiter.acquisitions[:] = [[1, 40, 500, 0]]
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.FIXED_WINDOW, lease_size=10
+        )
+        await leasing_limiter.check_rate_limit(key)
+
+        clock.advance(0.5)
+        await leasing_limiter.check_rate_limit(key)
+
+        assert len(self.calls(redis)) == 2
+        assert self.calls(redis, release_lease_script) == []
+        stats = await leasing_limiter.get_lease_statistics()
+        assert stats["lease_tokens_expired"] == 9
+
+    async def test_shutdown_returns_leases(self, leasing_limiter, redis):
+        """Leased tokens are given back on shutdown."""
+        key = await add_limit(
+            leasing_limiter, RateLimitStrategy.SLIDING_WINDOW, lease_size=10
+        )
+        await leasing_limiter.check_rate_limit(key)
+
+        await leasing_limiter.shutdown()
+
+        (release,) = self.calls(redis, release_lease_script)
+        assert release[1] == 2
+        assert release[5] == 9
+
+
+class TestRateLimitMiddlewareRedis:
+    """Test the Redis path of the security RateLimitMiddleware."""
+
+    @pytest.fixture
+    async def make_middleware(self, redis):
+        """Create middleware whose limiter is backed by the mock Redis client."""
+        middlewares = []
+
+        def make_middleware(strategy="fixed_window", lease_size=0):
+            with patch("metamcp.security.middleware.get_settings") as get_settings:
+                settings = get_settings.return_value
+                settings.rate_limit_requests = 3
+                settings.rate_limit_window = 60
+                settings.rate_limit_use_redis = False
+                settings.rate_limit_strategy = strategy
+                settings.rate_limit_lease_size = lease_size
+                settings.rate_limit_lease_ttl = 1.0
+                middleware = RateLimitMiddleware(app=None)
+            middleware._redis = redis
+            middlewares.append(middleware)
+            return middleware
+
+        yield make_middleware
+
+        for middleware in middlewares:
+            if middleware._limiter is not None:
+                await middleware._limiter.shutdown()
+
+    async def test_fixed_window_is_one_round_trip(self, make_middleware, redis):
+        """The middleware counts a request with a single script call."""
+        redis.evalsha.return_value = [1, 2, 60000, 0]
+        middleware = make_middleware()
+
+        allowed, limit, remaining, reset = await middleware._check_rate_limit(
+            "1.2.3.4"
+        )
+
+        assert (allowed, limit, remaining) == (True, 3, 2)
+        assert reset == pytest.approx(time.time() + 60, abs=2)
+        redis.evalsha.assert_awaited_once()
+        assert redis.evalsha.await_args.args[0] == fixed_window_script.sha
+        redis.incr.assert_not_called()
+
+    async def test_configured_strategy_script(self, make_middleware, redis):
+        """The configured strategy selects the Lua script."""
+        middleware = make_middleware(strategy="gcra")
+
+        await middleware._check_rate_limit("1.2.3.4")
+
+        assert redis.evalsha.await_args.args[0] == gcra_script.sha
+
+    async def test_leases_reduce_redis_calls(self, make_middleware, redis):
+        """With leasing, one Redis call serves a batch of requests."""
+        redis.evalsha.return_value = [1, 40, 60000, 0]
+        middleware = make_middleware(strategy="token_bucket", lease_size=10)
+
+        results = [await middleware._check_rate_limit("1.2.3.4") for _ in range(10)]
+
+        assert all(allowed for allowed, _, _, _ in results)
+        redis.evalsha.assert_awaited_once()
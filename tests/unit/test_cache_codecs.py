@@ -0,0 +1,231 @@
+"""
+Unit tests for the Redis cache codecs.
+"""
+
+import json
+import os
+import pickle
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from metamcp.cache.redis_cache import RedisCache
+from metamcp.utils import cache_codecs
+from metamcp.utils.cache_codecs import (
+    HEADER_SIZE,
+    CacheSerializer,
+    PickleCodec,
+    create_serializer,
+)
+from metamcp.utils.constants import DEFAULT_CACHE_CODEC, DEFAULT_CACHE_COMPRESSION
+
+VALUE = {"tools": [{"name": f"tool-{i}", "score": i / 10} for i in range(100)]}
+
+
+def available_codecs():
+    """Get the codecs whose packages are installed."""
+    return [name for name in cache_codecs.CODECS if cache_codecs._available(name)]
+
+
+def available_compressors():
+    """Get the compressors whose packages are installed."""
+    return [
+        name for name in cache_codecs.COMPRESSORS if cache_codecs._available(name)
+    ]
+
+
+class TestCacheSerializer:
+    """Test encoding and decoding cached values."""
+
+    @pytest.mark.parametrize("codec", available_codecs())
+    @pytest.mark.parametrize("compression", [None, *available_compressors()])
+    def test_round_trip(self, codec, compression):
+        """Values survive every codec and compression."""
+        serializer = CacheSerializer(codec, compression, compression_threshold=64)
+
+        for value in (VALUE, "text", 42, 1.5, None, [1, "a", True]):
+            assert serializer.loads(serializer.dumps(value)) == value
+
+    def test_header(self):
+        """Encoded values are tagged with their codec and compression."""
+        serializer = CacheSerializer("json", "zlib", compression_threshold=64)
+
+        small = serializer.dumps({"a": 1})
+        large = serializer.dumps(VALUE)
+
+        assert small[:HEADER_SIZE] == bytes((0, 1, 0))
+        assert large[:HEADER_SIZE] == bytes((0, 1, 1))
+        assert len(large) < len(json.dumps(VALUE))
+
+    def test_incompressible_values_are_stored_raw(self):
+        """Compression is skipped when it does not make a value smaller."""
+        serializer = CacheSerializer("pickle", "zlib", compression_threshold=1)
+
+        data = serializer.dumps(os.urandom(512))
+
+        assert data[2] == 0
+
+    def test_reads_values_written_with_other_settings(self):
+        """The header, not the configuration, decides how to decode."""
+        writer = CacheSerializer("json", "zlib", compression_threshold=1)
+        reader = CacheSerializer("pickle")
+
+        assert reader.loads(writer.dumps(VALUE)) == VALUE
+
+    def test_pickle_is_not_read_unless_configured(self):
+        """A forged pickle payload is rejected instead of being unpickled."""
+
+        class Exploit:
+            def __reduce__(self):
+                return (os.system, ("exit 1",))
+
+        forged = CacheSerializer("pickle").dumps(Exploit())
+        reader = CacheSerializer("json")
+
+        with patch.object(cache_codecs.pickle, "loads") as loads:
+            with pytest.raises(ValueError, match="pickle"):
+                reader.loads(forged)
+        loads.assert_not_called()
+
+    def test_legacy_values(self):
+        """Values written before the header existed are still readable."""
+        serializer = CacheSerializer("json")
+
+        assert serializer.loads(b'{"a":[1,2]}') == {"a": [1, 2]}
+        assert serializer.loads(b"plain text") == "plain text"
+        assert serializer.loads(b"\xff\xfe") == b"\xff\xfe"
+
+    def test_json_stringifies_unsupported_types(self):
+        """JSON keeps the old behaviour of storing other objects as strings."""
+
+        class Tool:
+            def __str__(self):
+                return "tool"
+
+        serializer = CacheSerializer("json")
+
+        assert serializer.loads(serializer.dumps({"tool": Tool()})) == {"tool": "tool"}
+
+    def test_pickle_preserves_types(self):
+        """Pickle keeps tuples, sets and bytes intact."""
+        serializer = CacheSerializer("pickle")
+        value = {"ids": (1, 2), "tags": {"a"}, "blob": b"\x00\x01"}
+
+        assert serializer.loads(serializer.dumps(value)) == value
+
+    def test_pickle_out_of_band_buffers(self):
+        """Buffers are stored after the pickle stream instead of inside it."""
+        codec = PickleCodec()
+        buffer = bytearray(b"x" * 100_000)
+
+        data = codec.dumps(pickle.PickleBuffer(buffer))
+
+        count, length = cache_codecs._PICKLE_FRAME.unpack_from(data)
+        assert count == 1
+        assert length < 100
+        assert bytes(codec.loads(memoryview(data))) == bytes(buffer)
+
+    def test_unknown_names(self):
+        """Unknown codecs and compressors are rejected."""
+        with pytest.raises(ValueError, match="codec"):
+            CacheSerializer("yaml")
+        with pytest.raises(ValueError, match="compression"):
+            CacheSerializer("json", "brotli")
+
+    def test_missing_packages_fall_back(self):
+        """Optional codecs fall back to the standard library."""
+        with patch.dict(cache_codecs._AVAILABLE, {"msgpack": False, "zstd": False}):
+            serializer = create_serializer("msgpack", "zstd")
+
+        assert serializer.codec.name == "json"
+        assert serializer.compressor.name == "zlib"
+        assert create_serializer("json", "none").compressor is None
+
+    def test_defaults_need_no_extra(self):
+        """The default settings use the standard library without falling back."""
+        unavailable = dict.fromkeys(cache_codecs._AVAILABLE, False)
+        with (
+            patch.dict(cache_codecs._AVAILABLE, unavailable),
+            patch.object(cache_codecs, "logger") as logger,
+        ):
+            serializer = create_serializer(
+                DEFAULT_CACHE_CODEC, DEFAULT_CACHE_COMPRESSION
+            )
+
+        assert serializer.codec.name == DEFAULT_CACHE_CODEC
+        assert serializer.compressor.name == DEFAULT_CACHE_COMPRESSION
+        logger.warning.assert_not_called()
+
+    def test_stats(self):
+        """Statistics report how much compression saved."""
+        serializer = CacheSerializer("json", "zlib", compression_threshold=64)
+
+        serializer.dumps(VALUE)
+
+        stats = serializer.get_stats()
+        assert stats["stored_bytes"] < stats["encoded_bytes"]
+        assert 0 < stats["compression_ratio"] < 1
+
+
+class TestRedisCacheSerialization:
+    """Test RedisCache with the serializer."""
+
+    @pytest.fixture
+    def redis(self):
+        """Create a mock Redis client storing values in a dict."""
+        store = {}
+
+        def setex(key, ttl, value):
+            store[key] = value
+            return True
+
+        client = AsyncMock()
+        client.setex.side_effect = setex
+        client.get.side_effect = store.get
+        client.mget.side_effect = lambda keys: [store.get(key) for key in keys]
+        client.pipeline = MagicMock()
+        client.store = store
+        return client
+
+    @pytest.fixture
+    def cache(self, redis):
+        """Create a RedisCache using the mock client."""
+        cache = RedisCache(
+            "redis://localhost:6379",
+            serializer=CacheSerializer("json", "zlib", compression_threshold=64),
+        )
+        cache._redis = redis
+        return cache
+
+    async def test_set_and_get(self, cache, redis):
+        """Large values are stored compressed and read back."""
+        assert await cache.set("tools", VALUE)
+
+        assert redis.store["tools"][:HEADER_SIZE] == bytes((0, 1, 1))
+        assert await cache.get("tools") == VALUE
+
+    async def test_forged_pickle_is_a_miss(self, cache, redis):
+        """Values in a codec the cache does not read are treated as misses."""
+        redis.store["tools"] = CacheSerializer("pickle").dumps(VALUE)
+
+        assert await cache.get("tools", "default") == "default"
+
+    async def test_get_many(self, cache, redis):
+        """Several values are read with one MGET."""
+        await cache.set("a", 1)
+        await cache.set("b", VALUE)
+
+        assert await cache.get_many(["a", "b", "c"]) == {"a": 1, "b": VALUE}
+        redis.mget.assert_awaited_once()
+
+    async def test_set_many_uses_pipeline(self, cache, redis):
+        """Several values are written in one non-transactional pipeline."""
+        pipe = redis.pipeline.return_value
+        pipe.execute = AsyncMock()
+
+        assert await cache.set_many({"a": 1, "b": 2}, ttl=10**9)
+
+        redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        assert {call.args[1] for call in pipe.setex.call_args_list} == {cache.max_ttl}
+        pipe.execute.assert_awaited_once()
@@ -0,0 +1,133 @@
+"""
+Unit tests for the cache decorators.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from metamcp.cache.decorators import (
+    cache_invalidate,
+    cache_method_result,
+    cache_result,
+)
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager storing values in a dict."""
+    store = {}
+    manager = Mock()
+    manager.store = store
+    manager.get = AsyncMock(side_effect=lambda key, strategy="default": store.get(key))
+
+    async def set_value(key, value, ttl=None, strategy="default", tags=None):
+        store[key] = value
+        return True
+
+    manager.set = AsyncMock(side_effect=set_value)
+    manager.invalidate_tags = AsyncMock(return_value=0)
+    with patch("metamcp.cache.decorators.get_cache_manager", return_value=manager):
+        yield manager
+
+
+class TestCacheResult:
+    """Test the cache_result decorator."""
+
+    async def test_caches_result(self, cache_manager):
+        """A cached result is returned without calling the function."""
+        calls = 0
+
+        @cache_result(ttl=60, key_prefix="test")
+        async def compute(x):
+            nonlocal calls
+            calls += 1
+            return x * 2
+
+        assert await compute(2) == 4
+        assert await compute(2) == 4
+        assert await compute(3) == 6
+        assert calls == 2
+
+    async def test_concurrent_misses_call_once(self, cache_manager):
+        """A stampede on an expired key runs the function once."""
+        calls = 0
+
+        @cache_result(ttl=300, key_prefix="tools")
+        async def list_tools():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["a", "b"]
+
+        results = await asyncio.gather(*(list_tools() for _ in range(100)))
+
+        assert all(r == ["a", "b"] for r in results)
+        assert calls == 1
+        assert cache_manager.set.await_count == 1
+
+    async def test_stale_ttl_extends_storage(self, cache_manager):
+        """Results cached with stale_ttl are kept past their TTL."""
+
+        @cache_result(ttl=60, stale_ttl=30)
+        async def compute():
+            return "value"
+
+        assert await compute() == "value"
+
+        _, value, ttl, _ = cache_manager.set.await_args.args
+        assert ttl == 90
+        assert value["value"] == "value"
+        assert await compute() == "value"
+
+    async def test_tags_are_filled_with_arguments(self, cache_manager):
+        """Tag templates are formatted with the call's bound arguments."""
+
+        @cache_result(ttl=60, tags=["tools", "user:{user_id}:{scope}"])
+        async def list_tools(user_id, scope="all"):
+            return []
+
+        await list_tools("u1")
+
+        assert cache_manager.set.await_args.kwargs["tags"] == [
+            "tools",
+            "user:u1:all",
+        ]
+
+
+class TestCacheInvalidate:
+    """Test the cache_invalidate decorator."""
+
+    async def test_invalidates_tags(self, cache_manager):
+        """Tags are invalidated after the function runs."""
+
+        @cache_invalidate(tags=["tool:{name}"])
+        async def update_tool(name, data):
+            return name
+
+        assert await update_tool("search", {}) == "search"
+
+        cache_manager.invalidate_tags.assert_awaited_once_with(["tool:search"])
+
+
+class TestCacheMethodResult:
+    """Test the cache_method_result decorator."""
+
+    async def test_concurrent_misses_call_once(self, cache_manager):
+        """Concurrent method calls share one execution."""
+
+        class Service:
+            calls = 0
+
+            @cache_method_result(ttl=60)
+            async def fetch(self, item_id):
+                Service.calls += 1
+                await asyncio.sleep(0.01)
+                return {"id": item_id}
+
+        service = Service()
+        results = await asyncio.gather(*(service.fetch(1) for _ in range(10)))
+
+        assert results == [{"id": 1}] * 10
+        assert Service.calls == 1
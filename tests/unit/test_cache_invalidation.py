@@ -0,0 +1,252 @@
+"""
+Unit tests for non-blocking and tag-based cache invalidation.
+"""
+
+import fnmatch
+from unittest.mock import patch
+
+import pytest
+
+from metamcp.cache.redis_cache import CacheManager, RedisCache
+from metamcp.utils.cache import (
+    Cache,
+    CacheConfig,
+    MemoryCacheBackend,
+    TieredCacheBackend,
+    invalidate_tag,
+    tag_key,
+    unlink_matching,
+)
+from metamcp.utils.cache_codecs import CacheSerializer
+from metamcp.utils.redis_scripts import ADD_TAG, claim_tag_script
+
+
+class FakePipeline:
+    """Pipeline queueing calls to a FakeRedis."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    async def execute(self):
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+class FakeRedis:
+    """Just enough of an async Redis client for cache invalidation."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+        self.unlink_calls = []
+        self.pipelines = []
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        return True
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    async def eval(self, source, numkeys, *keys_and_args):
+        assert source == ADD_TAG
+        (key,), (member, ttl) = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        await self.sadd(key, member)
+        if self.ttls.get(key, -1) < ttl:
+            self.ttls[key] = ttl
+        return 1
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.values) + list(self.sets):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def sscan_iter(self, key, count=None):
+        for member in list(self.sets.get(key, ())):
+            yield member.encode()
+
+    async def unlink(self, *keys):
+        self.unlink_calls.append(keys)
+        count = 0
+        for key in keys:
+            found = self.values.pop(key, None) is not None
+            found = self.sets.pop(key, None) is not None or found
+            count += found
+        return count
+
+    async def evalsha(self, sha, numkeys, *keys_and_args):
+        assert sha == claim_tag_script.sha
+        source, target = keys_and_args[:numkeys]
+        if source not in self.sets:
+            return 0
+        self.sets[target] = self.sets.pop(source)
+        return 1
+
+    def pipeline(self, transaction=True):
+        pipe = FakePipeline(self)
+        self.pipelines.append((pipe, transaction))
+        return pipe
+
+
+@pytest.fixture
+def redis():
+    """Create a fake Redis client."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_cache(redis):
+    """Create a RedisCache backed by the fake client."""
+    cache = RedisCache("redis://localhost:6379", serializer=CacheSerializer("json"))
+    cache._redis = redis
+    return cache
+
+
+class TestUnlinkMatching:
+    """Test deleting keys by pattern without KEYS."""
+
+    async def test_deletes_in_batches(self, redis):
+        """Matching keys are unlinked in bounded batches."""
+        for i in range(25):
+            await redis.setex(f"tool:{i}", 60, b"x")
+        await redis.setex("user:1", 60, b"x")
+
+        assert await unlink_matching(redis, "tool:*", batch_size=10) == 25
+
+        assert [len(call) for call in redis.unlink_calls] == [10, 10, 5]
+        assert list(redis.values) == ["user:1"]
+
+
+class TestTagInvalidation:
+    """Test tag sets in Redis."""
+
+    async def test_set_registers_tags(self, redis_cache, redis):
+        """Tagged writes add the key to each tag set in one pipeline."""
+        assert await redis_cache.set("k1", "v", ttl=60, tags=["tools", "user:1"])
+        await redis_cache.set("k2", "v", ttl=300, tags=["tools"])
+        await redis_cache.set("k3", "v", ttl=30, tags=["tools"])
+
+        assert redis.sets[tag_key("tools")] == {"k1", "k2", "k3"}
+        assert redis.sets[tag_key("user:1")] == {"k1"}
+        # A tag set lives as long as its longest-lived key
+        assert redis.ttls[tag_key("tools")] == 300
+        assert [transaction for _, transaction in redis.pipelines] == [False] * 3
+
+    async def test_tags_avoid_redis_7_commands(self, redis_cache, redis):
+        """Tag TTLs are extended by a script, not EXPIRE NX/GT."""
+        await redis_cache.set("key", "value", ttl=60, tags=["tools"])
+
+        (pipe, _), = redis.pipelines
+        assert [name for name, _, _ in pipe.calls] == ["setex", "eval"]
+
+    async def test_untagged_set_skips_pipeline(self, redis_cache, redis):
+        """Writes without tags stay a single SETEX."""
+        await redis_cache.set("key", "value")
+
+        assert redis.pipelines == []
+
+    async def test_invalidate_tag(self, redis_cache, redis):
+        """Invalidating a tag deletes its keys and the tag set."""
+        await redis_cache.set("k1", "v", tags=["tools"])
+        await redis_cache.set("k2", "v", tags=["tools", "user:1"])
+        await redis_cache.set("k3", "v", tags=["user:1"])
+
+        keys = await redis_cache.invalidate_tags(["tools"])
+
+        assert sorted(keys) == ["k1", "k2"]
+        assert set(redis.values) == {"k3"}
+        assert tag_key("tools") not in redis.sets
+        assert not any("invalidating" in key for key in redis.sets)
+
+    async def test_unknown_tag(self, redis):
+        """Invalidating a tag nothing was cached under does nothing."""
+        assert await invalidate_tag(redis, "missing") == []
+        assert redis.unlink_calls == []
+
+    async def test_keys_tagged_during_invalidation_survive(self, redis):
+        """Keys tagged while an invalidation runs go into a fresh set."""
+        await redis.sadd(tag_key("tools"), "old")
+        await redis.setex("old", 60, b"x")
+        original_sscan = redis.sscan_iter
+
+        async def sscan_then_tag(key, count=None):
+            await redis.sadd(tag_key("tools"), "new")
+            async for member in original_sscan(key, count):
+                yield member
+
+        with patch.object(redis, "sscan_iter", sscan_then_tag):
+            assert await invalidate_tag(redis, "tools") == ["old"]
+
+        assert redis.sets[tag_key("tools")] == {"new"}
+
+
+class TestCacheManagerInvalidation:
+    """Test CacheManager helpers built on tags and SCAN."""
+
+    @pytest.fixture
+    def manager(self, redis_cache):
+        """Create a CacheManager in front of the fake Redis, with an L1."""
+        with patch("metamcp.cache.redis_cache.settings") as settings:
+            settings.cache_codec = "json"
+            settings.cache_compression = "none"
+            settings.cache_l1_max_size = 100
+            settings.cache_l1_ttl = 60
+            settings.cache_invalidation_channel = "invalidate"
+            manager = CacheManager()
+        manager.redis_cache = redis_cache
+        manager.backend.l2 = redis_cache
+        manager.backend.redis_url = None
+        return manager
+
+    async def test_invalidate_tags_clears_both_tiers(self, manager, redis):
+        """Tag invalidation reaches Redis and the in-process L1."""
+        await manager.set("k1", "v", tags=["user:1"])
+        await manager.set("k2", "v")
+
+        assert await manager.invalidate_tags(["user:1"]) == 1
+
+        assert not await manager.backend.l1.exists("k1")
+        assert await manager.get("k1") is None
+        assert await manager.get("k2") == "v"
+
+    async def test_clear_user_cache(self, manager, redis):
+        """Clearing a user's cache uses its tag and its key prefix."""
+        await manager.set("opaque", "v", tags=["user:1"])
+        await manager.set("user:1:profile", "v")
+        await manager.set("user:2:profile", "v")
+
+        assert await manager.clear_user_cache("1") == 2
+        assert set(redis.values) == {"user:2:profile"}
+
+
+class TestCacheInvalidatePattern:
+    """Test Cache.invalidate_pattern."""
+
+    async def test_memory_backend(self):
+        """Matching entries are removed from an in-memory cache."""
+        cache = Cache(MemoryCacheBackend())
+        await cache.set("tool:a", 1)
+        await cache.set("tool:b", 2)
+        await cache.set("user:a", 3)
+
+        assert await cache.invalidate_pattern("tool:*") == 2
+        assert await cache.get("user:a") == 3
+
+    async def test_tiered_backend(self, redis_cache, redis):
+        """Pattern invalidation goes through both tiers."""
+        tiered = TieredCacheBackend(redis_cache, MemoryCacheBackend(CacheConfig()))
+        cache = Cache(tiered)
+        await cache.set("tool:a", 1)
+
+        assert await cache.invalidate_pattern("tool:*") == 1
+        assert redis.values == {}
@@ -173,8 +173,67 @@ class TestWorkflowPersistence:
         result = await persistence.cleanup_old_executions(30)
 
         assert result == 5
-        # Should call execute twice (step executions, then main executions)
-        assert mock_db.execute.call_count == 2
+        # Step executions, checkpoints, then main executions
+        assert mock_db.execute.call_count == 3
+        for call in mock_db.execute.call_args_list:
+            query, days = call.args
+            assert "make_interval(days => $1)" in query
+            assert "%s" not in query
+            assert days == 30
+
+    @pytest.mark.asyncio
+    async def test_save_checkpoints(self, persistence):
+        """Test saving a batch of checkpoints in one statement."""
+        mock_db = AsyncMock()
+        persistence.db = mock_db
+        checkpoints = [
+            {
+                "execution_id": f"exec{i}",
+                "workflow_id": "test-workflow",
+                "status": "running",
+                "request": {"workflow_id": "test-workflow"},
+                "state": {"step_results": {"step1": i}},
+            }
+            for i in range(3)
+        ]
+
+        await persistence.save_checkpoints(checkpoints)
+
+        mock_db.executemany.assert_called_once()
+        query, args = mock_db.executemany.call_args[0]
+        assert "ON CONFLICT (execution_id)" in query
+        assert [row[0] for row in args] == ["exec0", "exec1", "exec2"]
+        assert json.loads(args[2][4]) == {"step_results": {"step1": 2}}
+
+    @pytest.mark.asyncio
+    async def test_save_checkpoints_empty(self, persistence):
+        """Test that an empty batch does not touch the database."""
+        mock_db = AsyncMock()
+        persistence.db = mock_db
+
+        await persistence.save_checkpoints([])
+
+        mock_db.executemany.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_load_checkpoint(self, persistence):
+        """Test loading a checkpoint."""
+        mock_db = AsyncMock()
+        mock_db.fetchrow.return_value = {
+            "execution_id": "exec1",
+            "workflow_id": "test-workflow",
+            "status": "running",
+            "request": json.dumps({"workflow_id": "test-workflow"}),
+            "state": json.dumps({"step_results": {"step1": "done"}}),
+            "updated_at": None,
+        }
+        persistence.db = mock_db
+
+        result = await persistence.load_checkpoint("exec1")
+
+        assert result["execution_id"] == "exec1"
+        assert result["request"] == {"workflow_id": "test-workflow"}
+        assert result["state"]["step_results"] == {"step1": "done"}
 
     @pytest.mark.asyncio
     async def test_save_workflow_error(self, persistence, sample_workflow):
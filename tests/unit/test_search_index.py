@@ -0,0 +1,130 @@
+"""
+Unit tests for the BM25 search index and hybrid search.
+"""
+
+from unittest.mock import AsyncMock
+
+from metamcp.services.search_index import (
+    BM25Index,
+    reciprocal_rank_fusion,
+    tokenize,
+    top_k,
+)
+from metamcp.services.search_service import SearchService, get_search_service
+from metamcp.services.tool_service import ToolService
+
+
+class TestBM25Index:
+    """Test BM25Index."""
+
+    def test_tokenize_splits_identifiers(self):
+        """Identifiers and punctuation are split into lowercase terms."""
+        assert tokenize("Database_Query, HTTP-API v2") == [
+            "database",
+            "query",
+            "http",
+            "api",
+            "v2",
+        ]
+
+    def test_rare_terms_score_higher(self):
+        """Documents matching rarer terms rank first."""
+        index = BM25Index()
+        index.add("a", "database query tool")
+        index.add("b", "database backup tool")
+        index.add("c", "http client tool")
+
+        results = index.search("database query", 3)
+
+        assert [doc_id for doc_id, _ in results] == ["a", "b"]
+        assert results[0][1] > results[1][1]
+
+    def test_incremental_updates(self):
+        """Replacing and removing documents updates postings."""
+        index = BM25Index()
+        index.add("a", "database query")
+        index.add("a", "file upload")
+        index.add("b", "database backup")
+
+        assert [doc_id for doc_id, _ in index.search("database", 5)] == ["b"]
+        assert index.remove("b")
+        assert not index.remove("b")
+        assert index.search("database", 5) == []
+        assert "database" not in index.postings
+        assert len(index) == 1
+        assert index.average_length == 2
+
+    def test_top_k(self):
+        """Top-k returns the best items in descending order."""
+        assert top_k({"a": 1.0, "b": 3.0, "c": 2.0}, 2) == [("b", 3.0), ("c", 2.0)]
+
+    def test_reciprocal_rank_fusion(self):
+        """Documents ranked by both lists beat single-list leaders."""
+        fused = reciprocal_rank_fusion([["a", "b"], ["c", "b"]], k=60)
+
+        assert max(fused, key=fused.get) == "b"
+        assert fused["a"] == fused["c"]
+
+
+class TestSearchServiceIndex:
+    """Test SearchService index maintenance and hybrid search."""
+
+    async def test_keyword_search_uses_bm25(self):
+        """Keyword search ranks the best BM25 match first."""
+        service = SearchService()
+
+        results = await service._keyword_search("sql database", 10)
+
+        assert results[0]["id"] == "tool-1"
+        assert all(r["match_type"] == "keyword" for r in results)
+
+    async def test_tool_service_keeps_index_in_sync(self):
+        """Registering, updating and deleting tools updates search results."""
+        search_service = SearchService()
+        tool_service = ToolService(search_service=search_service)
+
+        tool_id = await tool_service.register_tool(
+            {
+                "name": "weather_lookup",
+                "description": "Get weather forecasts",
+                "endpoint": "http://weather:8000",
+            },
+            "user-1",
+        )
+        results = await search_service._keyword_search("weather", 5)
+        assert [r["id"] for r in results] == [tool_id]
+
+        await tool_service.update_tool(
+            "weather_lookup", {"description": "Get tide tables"}, "user-1"
+        )
+        assert [r["id"] for r in await search_service._keyword_search("tide", 5)] == [
+            tool_id
+        ]
+
+        await tool_service.delete_tool("weather_lookup", "user-1")
+        assert await search_service._keyword_search("weather tide", 5) == []
+
+    def test_admin_tool_service_uses_shared_index(self):
+        """The app's tool service updates the shared search service."""
+        from metamcp.api import admin
+
+        assert admin.tool_service.search_service is get_search_service()
+
+    async def test_hybrid_search_fuses_vector_and_keyword_rankings(self):
+        """Hybrid search combines vector hits with BM25 matches."""
+        vector_client = AsyncMock()
+        vector_client.search.return_value = [
+            {"id": "api_client", "score": 0.9, "metadata": {}},
+            {"id": "file_processor", "score": 0.8, "metadata": {}},
+        ]
+        llm_service = AsyncMock()
+        llm_service.generate_embedding.return_value = [0.1, 0.2]
+        service = SearchService(vector_client=vector_client, llm_service=llm_service)
+
+        results = await service._hybrid_search("http api", 2, 0.5)
+
+        assert results[0]["id"] == "tool-2"
+        assert results[0]["semantic_score"] == 0.9
+        assert results[0]["keyword_score"] > 0
+        assert results[0]["match_type"] == "hybrid"
+        assert len(results) == 2
@@ -0,0 +1,245 @@
+"""
+Unit tests for the two-tier (L1 + L2) cache backend.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from metamcp.cache.redis_cache import CacheManager
+from metamcp.utils.cache import (
+    Cache,
+    CacheConfig,
+    MemoryCacheBackend,
+    TieredCacheBackend,
+)
+
+
+@pytest.fixture
+def l1():
+    """Create the in-process tier."""
+    return MemoryCacheBackend(CacheConfig(ttl=60, max_size=10))
+
+
+@pytest.fixture
+def l2():
+    """Create the shared tier."""
+    return MemoryCacheBackend(CacheConfig(ttl=3600, max_size=100))
+
+
+@pytest.fixture
+def tiered(l1, l2):
+    """Create a tiered backend without pub/sub."""
+    return TieredCacheBackend(l2, l1)
+
+
+class TestTieredCacheBackend:
+    """Test read-through and write-through behaviour."""
+
+    async def test_read_through_fills_l1(self, tiered, l1, l2):
+        """An L2 hit is copied into L1 and later served from there."""
+        await l2.set("key", {"a": 1})
+
+        assert await tiered.get("key") == {"a": 1}
+        assert await l1.get("key") == {"a": 1}
+
+        with patch.object(l2, "get", AsyncMock()) as l2_get:
+            assert await tiered.get("key") == {"a": 1}
+        l2_get.assert_not_called()
+
+        stats = await tiered.get_stats()
+        assert stats["l1_hits"] == 1
+        assert stats["l2_hits"] == 1
+        assert stats["l1_hit_rate"] == 0.5
+        assert stats["hit_rate"] == 1.0
+
+    async def test_l1_values_are_isolated(self, tiered, l2):
+        """Mutating a value read or written does not change the cached one."""
+        tools = [{"name": "search"}]
+        await tiered.set("written", tools)
+        tools.append({"name": "leaked"})
+
+        await l2.set("filled", {"tools": ["search"]})
+        (await tiered.get("filled"))["tools"].append("leaked")
+
+        for key in ("written", "filled"):
+            value = await tiered.get(key)
+            value.clear()
+
+        assert await tiered.get("written") == [{"name": "search"}]
+        assert await tiered.get("filled") == {"tools": ["search"]}
+        assert (await tiered.get_stats())["l1_hits"] == 4
+
+    async def test_miss(self, tiered):
+        """A miss in both tiers is counted against L2."""
+        assert await tiered.get("missing") is None
+
+        stats = await tiered.get_stats()
+        assert stats["misses"] == 1
+        assert stats["l2_hit_rate"] == 0.0
+
+    async def test_write_through(self, tiered, l1, l2):
+        """Writes go to both tiers with the L1 TTL capped."""
+        assert await tiered.set("key", "value", ttl=3600)
+
+        assert await l2.get("key") == "value"
+        assert l1._cache["key"].expires_at <= l1._cache["key"].created_at + 60
+
+        await tiered.set("short", "value", ttl=5)
+        assert l1._cache["short"].expires_at <= l1._cache["short"].created_at + 5
+
+    async def test_failed_l2_write_drops_l1(self, tiered, l1, l2):
+        """L1 never keeps a value that did not reach L2."""
+        await l1.set("key", "old")
+
+        with patch.object(l2, "set", AsyncMock(return_value=False)):
+            assert not await tiered.set("key", "new")
+
+        assert await l1.get("key") is None
+
+    async def test_delete_and_clear(self, tiered, l1, l2):
+        """Deletes and clears reach both tiers."""
+        await tiered.set("a", 1)
+        await tiered.set("b", 2)
+
+        await tiered.delete("a")
+        assert not await l1.exists("a")
+        assert not await l2.exists("a")
+
+        await tiered.clear()
+        assert not await tiered.exists("b")
+
+    async def test_clear_pattern(self, tiered, l1):
+        """Pattern clears drop matching L1 entries."""
+        await tiered.set("tool:a", 1)
+        await tiered.set("tool:b", 2)
+        await tiered.set("user:a", 3)
+
+        await tiered.clear_pattern("tool:*")
+
+        assert set(l1._cache) == {"user:a"}
+
+    async def test_usable_through_cache(self, tiered):
+        """The tiered backend plugs into the Cache interface."""
+        cache = Cache(tiered)
+
+        value = await cache.get_or_set("key", lambda: "computed")
+
+        assert value == "computed"
+        assert await cache.get("key") == "computed"
+
+
+class TestTieredCacheInvalidation:
+    """Test L1 invalidation across workers."""
+
+    @pytest.fixture
+    def redis(self):
+        """Create a mock Redis client for publishing."""
+        return AsyncMock()
+
+    @pytest.fixture
+    async def subscribed(self, tiered, redis):
+        """Pretend the backend is subscribed to the invalidation channel."""
+        tiered.redis_url = "redis://localhost:6379"
+        tiered._redis = redis
+        tiered._listener = asyncio.get_running_loop().create_future()
+        return tiered
+
+    async def test_writes_publish_invalidations(self, subscribed, redis):
+        """Set and delete tell other workers to drop the key."""
+        await subscribed.set("key", 1)
+        await subscribed.delete("key")
+
+        assert redis.publish.await_count == 2
+        channel, payload = redis.publish.await_args.args
+        assert channel == subscribed.channel
+        message = json.loads(payload)
+        assert message["keys"] == ["key"]
+        assert message["origin"] == subscribed._origin
+
+    async def test_remote_invalidation_drops_l1(self, subscribed, l1, l2):
+        """A message from another worker removes the key from L1 only."""
+        await subscribed.set("key", 1)
+
+        await subscribed._apply_invalidation(
+            json.dumps({"origin": "other", "keys": ["key"]})
+        )
+
+        assert not await l1.exists("key")
+        assert await l2.exists("key")
+        assert (await subscribed.get_stats())["invalidations_received"] == 1
+
+    async def test_own_invalidations_are_ignored(self, subscribed, l1):
+        """Messages published by this worker do not drop its fresh copy."""
+        await subscribed.set("key", 1)
+
+        await subscribed._apply_invalidation(
+            json.dumps({"origin": subscribed._origin, "keys": ["key"]})
+        )
+
+        assert await l1.exists("key")
+
+    async def test_remote_clear_and_pattern(self, subscribed, l1):
+        """Clear and pattern messages are applied to L1."""
+        await subscribed.set("tool:a", 1)
+        await subscribed.set("user:a", 2)
+
+        await subscribed._apply_invalidation(
+            json.dumps({"origin": "other", "pattern": "tool:*"})
+        )
+        assert set(l1._cache) == {"user:a"}
+
+        await subscribed._apply_invalidation(
+            json.dumps({"origin": "other", "clear": 1})
+        )
+        assert l1._cache == {}
+
+    async def test_racing_invalidation_skips_l1_fill(self, subscribed, l1, l2):
+        """An L2 read that raced with an invalidation is not cached in L1."""
+        await l2.set("key", "stale")
+        original_get = l2.get
+
+        async def get_then_invalidate(key):
+            value = await original_get(key)
+            await subscribed._apply_invalidation(
+                json.dumps({"origin": "other", "keys": [key]})
+            )
+            return value
+
+        with patch.object(l2, "get", side_effect=get_then_invalidate):
+            assert await subscribed.get("key") == "stale"
+
+        assert not await l1.exists("key")
+
+
+class TestCacheManagerTiers:
+    """Test the tiered backend behind CacheManager."""
+
+    def test_l1_enabled(self):
+        """CacheManager fronts Redis with an L1 when configured."""
+        with patch("metamcp.cache.redis_cache.settings") as settings:
+            settings.cache_redis_url = "redis://localhost:6379/1"
+            settings.cache_codec = "json"
+            settings.cache_compression = "none"
+            settings.cache_l1_max_size = 500
+            settings.cache_l1_ttl = 30
+            settings.cache_invalidation_channel = "invalidate"
+            manager = CacheManager()
+
+        assert isinstance(manager.backend, TieredCacheBackend)
+        assert manager.backend.l2 is manager.redis_cache
+        assert manager.backend.l1.config.max_size == 500
+        assert manager.backend.channel == "invalidate"
+
+    def test_l1_disabled(self):
+        """A zero L1 size keeps CacheManager talking to Redis directly."""
+        with patch("metamcp.cache.redis_cache.settings") as settings:
+            settings.cache_redis_url = "redis://localhost:6379/1"
+            settings.cache_codec = "json"
+            settings.cache_compression = "none"
+            settings.cache_l1_max_size = 0
+            manager = CacheManager()
+
+        assert manager.backend is manager.redis_cache
@@ -0,0 +1,116 @@
+"""
+Tool Registry Tests
+
+Tests for tool execution endpoint resolution in the tool registry.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from metamcp.tools.registry import ToolRegistry
+
+TOOL = {"name": "lookup", "description": "Lookup", "endpoint": "http://tool:8001"}
+
+
+def _response(status_code: int) -> httpx.Response:
+    """Build a response for the given status code."""
+    return httpx.Response(status_code, json={"ok": status_code == 200})
+
+
+@pytest.fixture
+def http_client():
+    """Mock outbound HTTP client."""
+    return Mock(post=AsyncMock())
+
+
+@pytest.fixture
+def registry(http_client):
+    """Tool registry using the mock HTTP client."""
+    return ToolRegistry(None, None, Mock(), http_client=http_client)
+
+
+class TestEndpointResolution:
+    """Test learning of tool execution endpoints."""
+
+    async def test_cold_start_probes_and_learns_endpoint(self, registry, http_client):
+        """The first call probes patterns and remembers the one that worked."""
+        http_client.post.side_effect = [_response(404), _response(200)]
+
+        result = await registry._execute_tool_internal("lookup", {}, TOOL)
+
+        assert result["status"] == "success"
+        assert registry.resolved_endpoints["lookup"] == (
+            "http://tool:8001/tools/lookup/execute"
+        )
+        assert http_client.post.await_count == 2
+
+    async def test_steady_state_uses_single_request(self, registry, http_client):
+        """Once learned, each call issues exactly one request."""
+        registry.resolved_endpoints["lookup"] = "http://tool:8001/tools/lookup/execute"
+        http_client.post.return_value = _response(200)
+
+        await registry._execute_tool_internal("lookup", {}, TOOL)
+
+        http_client.post.assert_awaited_once()
+        assert http_client.post.await_args.args[0] == (
+            "http://tool:8001/tools/lookup/execute"
+        )
+
+    async def test_gone_endpoint_is_invalidated_and_reprobed(
+        self, registry, http_client
+    ):
+        """A 410 on the learned endpoint triggers a fresh probe."""
+        registry.resolved_endpoints["lookup"] = "http://tool:8001/tools/lookup/execute"
+        http_client.post.side_effect = [_response(410), _response(200)]
+
+        await registry._execute_tool_internal("lookup", {}, TOOL)
+
+        assert registry.resolved_endpoints["lookup"] == "http://tool:8001/execute"
+
+    async def test_unreachable_host_skips_remaining_patterns(
+        self, registry, http_client, monkeypatch
+    ):
+        """A connection error does not fan out to the other URL patterns."""
+        monkeypatch.setattr("metamcp.tools.registry.settings.tool_retry_attempts", 1)
+        http_client.post.side_effect = httpx.ConnectError("refused")
+
+        result = await registry._execute_tool_internal("lookup", {}, TOOL)
+
+        assert result["fallback"] is True
+        assert http_client.post.await_count == 1
+        assert "lookup" not in registry.resolved_endpoints
+
+
+class TestBatchedAccessChecks:
+    """Test that listing and search check access in one batch."""
+
+    async def test_fallback_search_checks_matches_in_one_call(self, registry):
+        """Only matching tools are checked, with a single policy call."""
+        registry.tools = {
+            "a": {"description": "weather forecast", "categories": []},
+            "b": {"description": "weather radar", "categories": []},
+            "c": {"description": "stock prices", "categories": []},
+        }
+        registry.policy_engine.check_access_many = AsyncMock(
+            return_value=[True, False]
+        )
+
+        results = await registry._fallback_search("weather", "user", 10)
+
+        assert [r["id"] for r in results] == ["a"]
+        registry.policy_engine.check_access_many.assert_awaited_once_with(
+            user_id="user", resources=["tool:a", "tool:b"], action="read"
+        )
+
+    async def test_failed_access_check_fails_open(self, registry):
+        """Tools stay visible if the policy engine raises."""
+        registry.tools = {"a": {"description": "weather", "categories": []}}
+        registry.policy_engine.check_access_many = AsyncMock(
+            side_effect=RuntimeError("opa down")
+        )
+
+        results = await registry._fallback_search("weather", "user", 10)
+
+        assert [r["id"] for r in results] == ["a"]
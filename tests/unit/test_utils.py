@@ -359,6 +359,103 @@ class TestMemoryCacheBackend:
         assert stats["hit_rate"] == 2 / 3
         assert stats["ttl"] == 60
 
+    async def test_overwrite_does_not_evict(self, cache_backend):
+        """Overwriting a key in a full cache keeps all other entries."""
+        for i in range(100):
+            await cache_backend.set(f"key{i}", f"value{i}")
+
+        await cache_backend.set("key50", "updated")
+
+        assert (await cache_backend.get_stats())["size"] == 100
+        assert await cache_backend.exists("key0") is True
+        assert await cache_backend.get("key50") == "updated"
+
+    async def test_lru_eviction_follows_access(self, cache_backend):
+        """Recently read entries survive eviction."""
+        for i in range(100):
+            await cache_backend.set(f"key{i}", f"value{i}")
+        await cache_backend.get("key0")
+
+        await cache_backend.set("overflow_key", "overflow_value")
+
+        assert await cache_backend.exists("key0") is True
+        assert await cache_backend.exists("key1") is False
+
+    async def test_expired_entries_purged_without_scan(self, cache_backend):
+        """Expired entries are purged from the expiry heap."""
+        await cache_backend.set("short", "value", ttl=0)
+        await cache_backend.set("long", "value")
+        await cache_backend.set("short", "value", ttl=0)
+
+        stats = await cache_backend.get_stats()
+
+        assert stats["size"] == 1
+        assert stats["expirations"] == 2
+
+    async def test_lfu_policy(self):
+        """The LFU policy evicts the least frequently read entry."""
+        backend = MemoryCacheBackend(CacheConfig(max_size=3, eviction_policy="lfu"))
+        await backend.set("hot", 1)
+        await backend.get("hot")
+        await backend.set("warm", 2)
+        await backend.get("warm")
+        await backend.set("cold", 3)
+
+        await backend.set("new", 4)
+
+        assert await backend.exists("cold") is False
+        assert await backend.exists("hot") is True
+
+    async def test_tinylfu_policy_resists_scans(self):
+        """A scan of one-off keys does not flush frequently read entries."""
+        backend = MemoryCacheBackend(
+            CacheConfig(max_size=100, eviction_policy="tinylfu")
+        )
+        for i in range(100):
+            await backend.set(f"hot{i}", i)
+        for _ in range(3):
+            for i in range(100):
+                await backend.get(f"hot{i}")
+
+        for i in range(1000):
+            await backend.set(f"scan{i}", i)
+
+        hot = [await backend.exists(f"hot{i}") for i in range(100)]
+        assert sum(hot) >= 75
+
+    async def test_unknown_policy(self):
+        """Unknown eviction policies are rejected."""
+        with pytest.raises(ValueError):
+            MemoryCacheBackend(CacheConfig(eviction_policy="random"))
+
+    async def test_max_bytes(self):
+        """Entries are evicted to keep the total size within max_bytes."""
+        backend = MemoryCacheBackend(CacheConfig(max_size=100, max_bytes=10))
+        await backend.set("a", "12345")
+        await backend.set("b", "123456")
+
+        assert await backend.exists("a") is False
+        assert (await backend.get_stats())["bytes"] == 6
+
+        assert await backend.set("c", "x" * 11) is False
+        assert await backend.exists("c") is False
+
+    @pytest.mark.performance
+    async def test_constant_time_at_scale(self):
+        """Inserts into a full 100k entry cache do not scan the cache."""
+        backend = MemoryCacheBackend(CacheConfig(max_size=100_000))
+        for i in range(100_000):
+            await backend.set(f"key{i}", i)
+
+        start_time = time.perf_counter()
+        for i in range(10_000):
+            await backend.set(f"new{i}", i)
+            await backend.get(f"key{i + 10_000}")
+        elapsed = time.perf_counter() - start_time
+
+        assert (await backend.get_stats())["evictions"] == 10_000
+        assert elapsed < 1.0
+
 
 class TestCache:
     """Test Cache interface."""
@@ -388,6 +485,111 @@ class TestCache:
         value = await cache.get_or_set("test_key", async_func)
         assert value == "async_value"
 
+    async def test_get_or_set_coalesces_concurrent_misses(self, cache):
+        """Concurrent misses for one key share a single computation."""
+        calls = 0
+
+        async def slow_func():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        values = await asyncio.gather(
+            *(cache.get_or_set("hot", slow_func) for _ in range(50))
+        )
+
+        assert values == ["value"] * 50
+        assert calls == 1
+        assert not cache._flight.in_flight("hot")
+
+    async def test_get_or_set_shares_errors(self, cache):
+        """A failed computation fails every waiter and is not cached."""
+        calls = 0
+
+        async def failing_func():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("key", failing_func) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert calls == 1
+        assert await cache.get_or_set("key", lambda: "ok") == "ok"
+
+    async def test_get_or_set_cancelled_waiter(self, cache):
+        """Cancelling one waiter does not cancel the shared computation."""
+        release = asyncio.Event()
+
+        async def slow_func():
+            await release.wait()
+            return "value"
+
+        first = asyncio.create_task(cache.get_or_set("key", slow_func))
+        second = asyncio.create_task(cache.get_or_set("key", slow_func))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "value"
+
+    async def test_stale_while_revalidate(self, cache):
+        """A stale value is served while it is refreshed in the background."""
+        values = iter(["v1", "v2"])
+        refreshed = asyncio.Event()
+
+        async def compute():
+            value = next(values)
+            if value == "v2":
+                refreshed.set()
+            return value
+
+        now = 1000.0
+        with patch("metamcp.utils.cache.time.time", side_effect=lambda: now):
+            assert await cache.get_or_set("key", compute, 10, stale_ttl=60) == "v1"
+            assert await cache.get_or_set("key", compute, 10, stale_ttl=60) == "v1"
+
+            now = 1011.0
+            assert await cache.get_or_set("key", compute, 10, stale_ttl=60) == "v1"
+            await asyncio.wait_for(refreshed.wait(), 1)
+            await asyncio.sleep(0)
+
+            assert await cache.get_or_set("key", compute, 10, stale_ttl=60) == "v2"
+
+    async def test_probabilistic_early_refresh(self, cache):
+        """Slow computations are refreshed early as expiry approaches."""
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await cache.get_or_set("key", compute, 10, stale_ttl=60)
+        entry = await cache.get("key")
+        entry["delta"] = 1.0
+        entry["refresh_at"] = time.time() + 0.5
+        await cache.set("key", entry, 70)
+
+        # With random() close to 1 the early refresh margin is large
+        with patch("metamcp.utils.cache.random.random", return_value=0.999):
+            assert await cache.get_or_set("key", compute, 10, stale_ttl=60) == 1
+        await asyncio.sleep(0)
+        assert calls == 2
+
+        # With beta=0 a value is only refreshed once it is due
+        entry = await cache.get("key")
+        entry["refresh_at"] = time.time() + 0.5
+        await cache.set("key", entry, 70)
+        await cache.get_or_set("key", compute, 10, stale_ttl=60, beta=0)
+        await asyncio.sleep(0)
+        assert calls == 2
+
     def test_generate_key(self, cache):
         """Test cache key generation."""
         key = cache._generate_key("arg1", "arg2", kwarg1="value1", kwarg2="value2")
@@ -0,0 +1,321 @@
+"""
+Unit tests for workflow checkpoints and resume.
+"""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from metamcp.composition.checkpoint import (
+    CheckpointWriter,
+    restore_state,
+    snapshot_state,
+)
+from metamcp.composition.engine import WorkflowEngine
+from metamcp.composition.orchestrator import WorkflowOrchestrator
+from metamcp.composition.models import (
+    StepStatus,
+    StepType,
+    WorkflowDefinition,
+    WorkflowExecutionRequest,
+    WorkflowState,
+    WorkflowStatus,
+    WorkflowStep,
+)
+from metamcp.exceptions import WorkflowExecutionError
+
+
+class FakePersistence:
+    """Persistence keeping checkpoints in a dict, as JSON like the database."""
+
+    def __init__(self):
+        self.checkpoints = {}
+        self.batches = []
+        self.fail = False
+
+    async def save_checkpoints(self, checkpoints):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append([c["execution_id"] for c in checkpoints])
+        for checkpoint in checkpoints:
+            self.checkpoints[checkpoint["execution_id"]] = json.loads(
+                json.dumps(checkpoint, default=str)
+            )
+
+    async def load_checkpoint(self, execution_id):
+        return self.checkpoints.get(execution_id)
+
+    async def get_interrupted_checkpoints(self, limit=100):
+        return [c for c in self.checkpoints.values() if c["status"] == "running"]
+
+    async def delete_checkpoint(self, execution_id):
+        return self.checkpoints.pop(execution_id, None) is not None
+
+
+def make_state(execution_id: str = "e1") -> WorkflowState:
+    """Create a running workflow state."""
+    return WorkflowState(
+        workflow_id="workflow",
+        execution_id=execution_id,
+        status=WorkflowStatus.RUNNING,
+        started_at=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def persistence():
+    """Create a fake persistence layer."""
+    return FakePersistence()
+
+
+@pytest.fixture
+def writer(persistence):
+    """Create a checkpoint writer that is flushed explicitly."""
+    return CheckpointWriter(persistence, interval=3600)
+
+
+class TestStateSnapshots:
+    """Test snapshotting workflow states."""
+
+    def test_round_trip(self):
+        """Restored states match the snapshotted ones."""
+        state = make_state()
+        state.step_results = {"a": {"rows": [1, 2]}}
+        state.step_statuses = {"a": StepStatus.COMPLETED, "b": StepStatus.FAILED}
+        state.variables = {"user": "u1"}
+        state.cache_hits = ["a"]
+
+        data = json.loads(json.dumps(snapshot_state(state)))
+        restored = restore_state(data)
+
+        assert restored == state
+
+    def test_snapshot_is_a_copy(self):
+        """Later changes to the state do not alter a snapshot."""
+        state = make_state()
+        snapshot = snapshot_state(state)
+
+        state.step_results["a"] = 1
+
+        assert snapshot["step_results"] == {}
+
+
+class TestCheckpointWriter:
+    """Test batched checkpoint writes."""
+
+    async def test_records_are_coalesced(self, writer, persistence):
+        """Several records of an execution are written once per flush."""
+        request = WorkflowExecutionRequest(workflow_id="workflow")
+        first, second = make_state("e1"), make_state("e2")
+
+        for i in range(5):
+            first.step_results[f"s{i}"] = i
+            writer.record(request, first)
+        writer.record(request, second)
+
+        assert await writer.flush() == 2
+
+        assert persistence.batches == [["e1", "e2"]]
+        assert len(persistence.checkpoints["e1"]["state"]["step_results"]) == 5
+        assert writer.get_stats()["pending"] == 0
+
+    async def test_batch_size(self, persistence):
+        """Flushes are split into batches of at most batch_size executions."""
+        writer = CheckpointWriter(persistence, interval=3600, batch_size=2)
+        request = WorkflowExecutionRequest(workflow_id="workflow")
+        for i in range(5):
+            writer.record(request, make_state(f"e{i}"))
+
+        await writer.flush()
+
+        assert [len(batch) for batch in persistence.batches] == [2, 2, 1]
+
+    async def test_failed_writes_are_retried(self, writer, persistence):
+        """Checkpoints that failed to save are kept for the next flush."""
+        request = WorkflowExecutionRequest(workflow_id="workflow")
+        writer.record(request, make_state())
+        persistence.fail = True
+
+        assert await writer.flush() == 0
+
+        persistence.fail = False
+        assert await writer.flush() == 1
+        assert writer.get_stats()["failures"] == 1
+
+    async def test_close_flushes(self, writer, persistence):
+        """Closing the writer writes outstanding checkpoints."""
+        writer.start()
+        writer.record(WorkflowExecutionRequest(workflow_id="workflow"), make_state())
+
+        await writer.close()
+
+        assert "e1" in persistence.checkpoints
+
+
+class TestResume:
+    """Test resuming executions from checkpoints."""
+
+    @pytest.fixture
+    def workflow(self):
+        """Create a workflow a -> b -> c with an independent step d."""
+        return WorkflowDefinition(
+            id="workflow",
+            name="Workflow",
+            entry_point="a",
+            parallel_execution=True,
+            steps=[
+                WorkflowStep(
+                    id=step_id,
+                    name=step_id,
+                    step_type=StepType.TOOL_CALL,
+                    config={"tool_name": step_id},
+                    depends_on=depends_on,
+                )
+                for step_id, depends_on in (
+                    ("a", []),
+                    ("b", ["a"]),
+                    ("c", ["b"]),
+                    ("d", []),
+                )
+            ],
+        )
+
+    async def test_resume_skips_completed_steps(self, workflow, writer, persistence):
+        """A resumed execution only runs the steps that did not complete."""
+        engine = WorkflowEngine(checkpointer=writer)
+        await engine.register_workflow(workflow)
+        request = WorkflowExecutionRequest(workflow_id=workflow.id)
+        calls = []
+
+        async def failing_tools(tool_name, arguments):
+            calls.append(tool_name)
+            if tool_name == "b":
+                raise RuntimeError("upstream down")
+            return f"{tool_name}-result"
+
+        with pytest.raises(WorkflowExecutionError):
+            await engine.execute_workflow(request, failing_tools)
+        await writer.flush()
+
+        (checkpoint,) = persistence.checkpoints.values()
+        assert checkpoint["status"] == "failed"
+        assert checkpoint["state"]["step_statuses"]["a"] == "completed"
+
+        # A fresh engine, as after a restart
+        engine = WorkflowEngine(checkpointer=writer)
+        await engine.register_workflow(workflow)
+        calls.clear()
+        tools = AsyncMock(side_effect=lambda tool_name, arguments: f"{tool_name}-ok")
+
+        result = await engine.resume_workflow(
+            WorkflowExecutionRequest(**checkpoint["request"]),
+            restore_state(checkpoint["state"]),
+            tools,
+        )
+
+        assert [call.args[0] for call in tools.await_args_list] == ["b", "c"]
+        assert result.execution_id == checkpoint["execution_id"]
+        assert result.status == WorkflowStatus.COMPLETED
+        assert result.step_results == {
+            "a": "a-result",
+            "b": "b-ok",
+            "c": "c-ok",
+            "d": "d-result",
+        }
+
+        await writer.flush()
+        assert persistence.checkpoints[result.execution_id]["status"] == "completed"
+
+    async def test_checkpoint_after_each_step(self, workflow, persistence):
+        """Progress is recorded as steps complete, not only at the end."""
+        writer = CheckpointWriter(persistence, interval=3600)
+        writer.record = AsyncMock(wraps=writer.record)
+        engine = WorkflowEngine(checkpointer=writer)
+        await engine.register_workflow(workflow)
+
+        await engine.execute_workflow(
+            WorkflowExecutionRequest(workflow_id=workflow.id),
+            AsyncMock(return_value="ok"),
+        )
+
+        assert writer.record.call_count >= 4
+
+    async def test_resume_requires_execution_id(self, workflow):
+        """States without an execution ID cannot be resumed."""
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        state = make_state(None)
+
+        with pytest.raises(WorkflowExecutionError, match="without an ID"):
+            await engine.resume_workflow(
+                WorkflowExecutionRequest(workflow_id=workflow.id),
+                state,
+                AsyncMock(),
+            )
+
+
+class TestOrchestratorResume:
+    """Test resuming and discarding executions through the orchestrator."""
+
+    @pytest.fixture
+    async def orchestrator(self, persistence):
+        """Create an orchestrator using the fake persistence layer."""
+        orchestrator = WorkflowOrchestrator()
+        with patch(
+            "metamcp.composition.persistence.get_persistence_manager",
+            return_value=persistence,
+        ):
+            yield orchestrator
+
+    async def test_interrupted_executions_are_discovered(
+        self, orchestrator, writer, persistence
+    ):
+        """Running checkpoints left by a previous run are listed and discardable."""
+        request = WorkflowExecutionRequest(workflow_id="workflow")
+        writer.record(request, make_state("e1"))
+        finished = make_state("e2")
+        finished.status = WorkflowStatus.COMPLETED
+        writer.record(request, finished)
+        await writer.flush()
+
+        await orchestrator._discover_interrupted_executions()
+
+        (interrupted,) = await orchestrator.get_interrupted_executions()
+        assert interrupted.execution_id == "e1"
+        assert await orchestrator.discard_interrupted_execution("e1")
+        assert await orchestrator.get_interrupted_executions() == []
+        assert set(persistence.checkpoints) == {"e2"}
+
+    async def test_running_execution_is_not_resumed(self, orchestrator):
+        """An execution running in this process cannot be resumed twice."""
+        orchestrator.engine.executions["e1"] = make_state("e1")
+
+        with pytest.raises(WorkflowExecutionError, match="still running"):
+            await orchestrator.resume_workflow("e1", AsyncMock())
+        with pytest.raises(WorkflowExecutionError, match="running"):
+            await orchestrator.discard_interrupted_execution("e1")
+
+    async def test_concurrent_resumes_are_rejected(self, orchestrator, persistence):
+        """A second resume is rejected while the first is loading its checkpoint."""
+        loading = asyncio.Event()
+        proceed = asyncio.Event()
+
+        async def slow_load(execution_id):
+            loading.set()
+            await proceed.wait()
+            return None
+
+        persistence.load_checkpoint = slow_load
+        first = asyncio.create_task(orchestrator.resume_workflow("e1", AsyncMock()))
+        await loading.wait()
+
+        with pytest.raises(WorkflowExecutionError, match="still running"):
+            await orchestrator.resume_workflow("e1", AsyncMock())
+
+        proceed.set()
+        with pytest.raises(WorkflowExecutionError, match="No checkpoint"):
+            await first
+        assert orchestrator._resuming == set()
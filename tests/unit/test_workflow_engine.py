@@ -0,0 +1,615 @@
+"""
+Unit tests for the workflow engine.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from metamcp.api import composition as composition_api
+from metamcp.composition.engine import WorkflowEngine, step_cache_key
+from metamcp.composition.models import (
+    StepStatus,
+    StepType,
+    WorkflowDefinition,
+    WorkflowExecutionRequest,
+    WorkflowStep,
+)
+from metamcp.composition.orchestrator import close_workflow_orchestrator
+from metamcp.config import get_settings
+from metamcp.exceptions import WorkflowExecutionError
+from metamcp.utils.cache import create_memory_cache
+
+
+def tool_step(step_id: str, *depends_on: str, **arguments) -> WorkflowStep:
+    """Create a tool call step calling a tool named after the step."""
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        step_type=StepType.TOOL_CALL,
+        config={"tool_name": step_id, "arguments": arguments},
+        depends_on=list(depends_on),
+    )
+
+
+def make_workflow(steps: list[WorkflowStep], **kwargs) -> WorkflowDefinition:
+    """Create a workflow starting at its first step."""
+    return WorkflowDefinition(
+        id="workflow",
+        name="Workflow",
+        steps=steps,
+        entry_point=steps[0].id,
+        **kwargs,
+    )
+
+
+class ToolRecorder:
+    """Tool executor sleeping per tool and recording concurrency."""
+
+    def __init__(self, delays: dict[str, float] | None = None, fail: set | None = None):
+        self.delays = delays or {}
+        self.fail = fail or set()
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.cancelled: list[str] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, tool_name, arguments):
+        self.started.append(tool_name)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(tool_name, 0.01))
+            if tool_name in self.fail:
+                raise RuntimeError(f"{tool_name} failed")
+            self.finished.append(tool_name)
+            return tool_name
+        except asyncio.CancelledError:
+            self.cancelled.append(tool_name)
+            raise
+        finally:
+            self.running -= 1
+
+
+async def run(engine, workflow, tools) -> tuple:
+    """Register and execute a workflow, returning the result and its state."""
+    await engine.register_workflow(workflow)
+    result = await engine.execute_workflow(
+        WorkflowExecutionRequest(workflow_id=workflow.id), tools
+    )
+    return result, engine.executions[result.execution_id]
+
+
+class TestStepScheduling:
+    """Test dependency-driven step scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_successors_do_not_wait_for_slow_siblings(self):
+        """A step starts once its own dependencies finish, not its wave."""
+        workflow = make_workflow(
+            [
+                tool_step("fast"),
+                tool_step("slow"),
+                tool_step("after_fast", "fast"),
+                tool_step("after_slow", "slow"),
+            ],
+            parallel_execution=True,
+        )
+        tools = ToolRecorder({"slow": 0.2, "after_fast": 0.15, "after_slow": 0.01})
+
+        start = time.monotonic()
+        result, _ = await run(WorkflowEngine(), workflow, tools)
+        elapsed = time.monotonic() - start
+
+        # Critical path is slow -> after_slow (0.21s), not 0.2 + 0.15
+        assert elapsed < 0.3
+        assert tools.finished.index("after_fast") < tools.finished.index("slow")
+        assert result.step_results == {
+            "fast": "fast",
+            "slow": "slow",
+            "after_fast": "after_fast",
+            "after_slow": "after_slow",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sequential_respects_dependencies(self):
+        """Without parallel execution steps run one at a time in order."""
+        workflow = make_workflow(
+            [tool_step("c", "b"), tool_step("a"), tool_step("b", "a")],
+        )
+        tools = ToolRecorder()
+
+        await run(WorkflowEngine(), workflow, tools)
+
+        assert tools.started == ["a", "b", "c"]
+        assert tools.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_workflow_concurrency_limit(self):
+        """max_concurrency caps the steps a workflow runs at once."""
+        workflow = make_workflow(
+            [tool_step(f"step{i}") for i in range(10)],
+            parallel_execution=True,
+            max_concurrency=3,
+        )
+        tools = ToolRecorder()
+
+        await run(WorkflowEngine(), workflow, tools)
+
+        assert len(tools.finished) == 10
+        assert tools.max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_engine_concurrency_limit(self):
+        """The engine-wide limit is shared by concurrent executions."""
+        engine = WorkflowEngine(max_concurrent_steps=4)
+        workflow = make_workflow(
+            [tool_step(f"step{i}") for i in range(6)], parallel_execution=True
+        )
+        await engine.register_workflow(workflow)
+        tools = ToolRecorder()
+
+        request = WorkflowExecutionRequest(workflow_id=workflow.id)
+        await asyncio.gather(
+            engine.execute_workflow(request, tools),
+            engine.execute_workflow(request, tools),
+        )
+
+        assert len(tools.finished) == 12
+        assert tools.max_running == 4
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency(self):
+        """Workflows depending on unknown steps are rejected at registration."""
+        workflow = make_workflow([tool_step("a"), tool_step("b", "missing")])
+
+        with pytest.raises(WorkflowExecutionError, match="unknown step missing"):
+            await run(WorkflowEngine(), workflow, ToolRecorder())
+
+
+class TestWorkflowPlans:
+    """Test executing compiled workflow plans."""
+
+    @pytest.mark.asyncio
+    async def test_register_compiles_plan(self):
+        """Registering a workflow compiles its plan once."""
+        engine = WorkflowEngine()
+        workflow = make_workflow([tool_step("a"), tool_step("b", "a", x="$a")])
+
+        await engine.register_workflow(workflow)
+        plan = engine.plans[workflow.id]
+        tools = ToolRecorder()
+        request = WorkflowExecutionRequest(workflow_id=workflow.id)
+        await engine.execute_workflow(request, tools)
+        await engine.execute_workflow(request, tools)
+
+        assert engine.plans[workflow.id] is plan
+        assert tools.finished == ["a", "b", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_arguments_and_conditions(self):
+        """Compiled arguments and conditions read the execution's variables."""
+        engine = WorkflowEngine()
+        skipped = tool_step("skipped")
+        skipped.condition = {
+            "operator": "equals",
+            "left_operand": "$mode",
+            "right_operand": "full",
+        }
+        workflow = make_workflow(
+            [tool_step("search", query="$input.query", limit=5), skipped]
+        )
+        await engine.register_workflow(workflow)
+        calls = []
+
+        async def tools(tool_name, arguments):
+            calls.append((tool_name, arguments))
+
+        await engine.execute_workflow(
+            WorkflowExecutionRequest(
+                workflow_id=workflow.id,
+                variables={"input": {"query": "cats"}, "mode": "fast"},
+            ),
+            tools,
+        )
+
+        assert calls == [("search", {"query": "cats", "limit": 5})]
+
+    @pytest.mark.asyncio
+    async def test_workflows_stored_directly_are_compiled(self):
+        """Workflows added to the registry directly get a plan on first use."""
+        engine = WorkflowEngine()
+        workflow = make_workflow([tool_step("a")])
+        engine.workflows[workflow.id] = workflow
+
+        result = await engine.execute_workflow(
+            WorkflowExecutionRequest(workflow_id=workflow.id), ToolRecorder()
+        )
+
+        assert result.step_results == {"a": "a"}
+        assert engine.plans[workflow.id].workflow is workflow
+
+
+class TestStepFailures:
+    """Test failure handling while steps run concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_running_steps(self):
+        """A failing step cancels its running siblings and its successors."""
+        engine = WorkflowEngine()
+        workflow = make_workflow(
+            [tool_step("bad"), tool_step("long"), tool_step("next", "bad")],
+            parallel_execution=True,
+        )
+        tools = ToolRecorder({"long": 5.0}, fail={"bad"})
+
+        start = time.monotonic()
+        with pytest.raises(WorkflowExecutionError, match="Step bad failed"):
+            await run(engine, workflow, tools)
+
+        assert time.monotonic() - start < 1.0
+        assert tools.cancelled == ["long"]
+        assert "next" not in tools.started
+
+        state = next(iter(engine.executions.values()))
+        assert state.step_statuses["bad"] == StepStatus.FAILED
+        assert state.step_statuses["long"] == StepStatus.CANCELLED
+        assert state.step_statuses["next"] == StepStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_without_fail_fast_running_steps_finish(self):
+        """With fail_fast disabled running siblings complete first."""
+        engine = WorkflowEngine()
+        workflow = make_workflow(
+            [tool_step("bad"), tool_step("long"), tool_step("next", "long")],
+            parallel_execution=True,
+            fail_fast=False,
+        )
+        tools = ToolRecorder({"long": 0.05}, fail={"bad"})
+
+        with pytest.raises(WorkflowExecutionError, match="Step bad failed"):
+            await run(engine, workflow, tools)
+
+        assert tools.finished == ["long"]
+        assert tools.cancelled == []
+        assert "next" not in tools.started
+
+
+def loop_step(step_id: str, items, **loop) -> WorkflowStep:
+    """Create a loop step calling the echo tool for each item."""
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        step_type=StepType.LOOP,
+        config={
+            "loop": {"items": items, **loop},
+            "body": {"tool_name": "echo", "arguments": {"item": "$loop_item"}},
+        },
+    )
+
+
+class EchoTool:
+    """Tool executor echoing its item after an item-dependent delay."""
+
+    def __init__(self, fail: set | None = None):
+        self.fail = fail or set()
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, tool_name, arguments):
+        item = arguments["item"]
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # Later items finish first
+            await asyncio.sleep(0.001 * (20 - item % 20))
+            if item in self.fail:
+                raise RuntimeError(f"item {item} failed")
+            return item
+        finally:
+            self.running -= 1
+
+
+class TestFanOut:
+    """Test bounded fan-out of loop and parallel steps."""
+
+    @pytest.mark.asyncio
+    async def test_map_loop_is_bounded_and_ordered(self):
+        """Map loops run up to max_concurrency iterations, in item order."""
+        workflow = make_workflow(
+            [loop_step("loop", "$items", mode="map", max_concurrency=5)]
+        )
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        tools = EchoTool()
+
+        result = await engine.execute_workflow(
+            WorkflowExecutionRequest(
+                workflow_id=workflow.id, variables={"items": list(range(40))}
+            ),
+            tools,
+        )
+
+        assert result.step_results["loop"] == list(range(40))
+        assert tools.max_running == 5
+
+        state = engine.executions[result.execution_id]
+        assert "loop_item" not in state.variables
+        assert state.partial_results == {}
+
+    @pytest.mark.asyncio
+    async def test_loop_is_sequential_by_default(self):
+        """Loops without map mode run one iteration at a time."""
+        tools = EchoTool()
+
+        result, _ = await run(
+            WorkflowEngine(), make_workflow([loop_step("loop", [3, 1, 2])]), tools
+        )
+
+        assert result.step_results["loop"] == [3, 1, 2]
+        assert tools.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_continue_on_error(self):
+        """Failed iterations are skipped when continue_on_error is set."""
+        workflow = make_workflow(
+            [loop_step("loop", [1, 2, 3, 4], mode="map", continue_on_error=True)]
+        )
+
+        result, _ = await run(WorkflowEngine(), workflow, EchoTool(fail={2}))
+
+        assert result.step_results["loop"] == [1, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failed_iteration_fails_loop(self):
+        """A failed iteration fails the loop and stops the others."""
+        workflow = make_workflow(
+            [loop_step("loop", list(range(100)), mode="map", max_concurrency=2)]
+        )
+        engine = WorkflowEngine()
+        tools = EchoTool(fail={3})
+
+        with pytest.raises(WorkflowExecutionError, match="Loop iteration 3 failed"):
+            await run(engine, workflow, tools)
+
+        state = next(iter(engine.executions.values()))
+        assert tools.calls < 10
+        assert tools.running == 0
+        assert state.partial_results == {}
+
+    @pytest.mark.asyncio
+    async def test_partial_results_stream_in(self):
+        """Completed iterations are visible before the loop finishes."""
+        workflow = make_workflow(
+            [loop_step("loop", list(range(10)), mode="map", max_concurrency=10)]
+        )
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        release = asyncio.Event()
+
+        async def tools(tool_name, arguments):
+            if arguments["item"] == 9:
+                await release.wait()
+            return arguments["item"]
+
+        execution = asyncio.create_task(
+            engine.execute_workflow(
+                WorkflowExecutionRequest(workflow_id=workflow.id), tools
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        state = next(iter(engine.executions.values()))
+        assert sorted(state.partial_results["loop"]) == list(range(9))
+
+        release.set()
+        result = await execution
+        assert result.step_results["loop"] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_parallel_step_is_bounded(self):
+        """Parallel sub-steps run up to max_concurrency at a time."""
+        step = WorkflowStep(
+            id="parallel",
+            name="parallel",
+            step_type=StepType.PARALLEL,
+            config={
+                "max_concurrency": 3,
+                "steps": [
+                    {"config": {"tool_name": "echo", "arguments": {"item": i}}}
+                    for i in range(12)
+                ],
+            },
+        )
+        tools = EchoTool()
+
+        result, _ = await run(WorkflowEngine(), make_workflow([step]), tools)
+
+        assert result.step_results["parallel"] == list(range(12))
+        assert tools.max_running == 3
+
+
+class TestStepCache:
+    """Test memoization of cacheable tool steps."""
+
+    @pytest.mark.asyncio
+    async def test_cacheable_step_is_called_once(self):
+        """Repeated executions reuse the cached result and report the hit."""
+        cached = tool_step("lookup", key="$key")
+        cached.cacheable = True
+        workflow = make_workflow([cached, tool_step("log", "lookup")])
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        tools = ToolRecorder()
+        request = WorkflowExecutionRequest(
+            workflow_id=workflow.id, variables={"key": "a"}
+        )
+
+        first = await engine.execute_workflow(request, tools)
+        second = await engine.execute_workflow(request, tools)
+
+        assert tools.started == ["lookup", "log", "log"]
+        assert first.cache_hits == []
+        assert second.cache_hits == ["lookup"]
+        assert second.step_results == first.step_results
+
+    @pytest.mark.asyncio
+    async def test_arguments_are_part_of_the_key(self):
+        """Calls with other arguments are not served from the cache."""
+        cached = tool_step("lookup", key="$key")
+        cached.cacheable = True
+        workflow = make_workflow([cached])
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        tools = ToolRecorder()
+
+        for key in ("a", "b", "a"):
+            await engine.execute_workflow(
+                WorkflowExecutionRequest(
+                    workflow_id=workflow.id, variables={"key": key}
+                ),
+                tools,
+            )
+
+        assert tools.started == ["lookup", "lookup"]
+
+    def test_key_is_canonical(self):
+        """Argument order does not change the key."""
+        assert step_cache_key("t", {"a": 1, "b": [1, 2]}) == step_cache_key(
+            "t", {"b": [1, 2], "a": 1}
+        )
+        assert step_cache_key("t", {"a": 1}) != step_cache_key("u", {"a": 1})
+        assert step_cache_key("t", {"a": 1}) != step_cache_key("t", {"a": "1"})
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_steps_are_not_cached(self):
+        """Steps are only memoized when marked cacheable."""
+        workflow = make_workflow([tool_step("lookup")])
+        engine = WorkflowEngine()
+        await engine.register_workflow(workflow)
+        tools = ToolRecorder()
+        request = WorkflowExecutionRequest(workflow_id=workflow.id)
+
+        await engine.execute_workflow(request, tools)
+        await engine.execute_workflow(request, tools)
+
+        assert tools.started == ["lookup", "lookup"]
+
+    @pytest.mark.asyncio
+    async def test_loop_items_share_cached_results(self):
+        """Loop iterations with equal arguments call the tool once."""
+        step = loop_step("loop", [1, 2, 1, 2, 1], mode="map")
+        step.cacheable = True
+        step.cache_ttl = 30
+        cache = create_memory_cache()
+        cache.backend.set = AsyncMock(wraps=cache.backend.set)
+        engine = WorkflowEngine(step_cache=cache)
+        calls = []
+
+        async def tools(tool_name, arguments):
+            calls.append(arguments["item"])
+            await asyncio.sleep(0.01)
+            return arguments["item"]
+
+        result, _ = await run(engine, make_workflow([step]), tools)
+
+        assert result.step_results["loop"] == [1, 2, 1, 2, 1]
+        assert sorted(calls) == [1, 2]
+        assert len(result.cache_hits) == 3
+        assert {call.args[2] for call in cache.backend.set.await_args_list} == {30}
+
+
+class TestSharedOrchestrator:
+    """Test the orchestrator shared by composition API requests."""
+
+    @pytest.fixture
+    async def orchestrator(self):
+        """Get the API's orchestrator and shut it down afterwards."""
+        yield composition_api.get_workflow_orchestrator()
+        await close_workflow_orchestrator()
+
+    @pytest.mark.asyncio
+    async def test_requests_share_the_step_cache(self, orchestrator):
+        """Cached step results carry over between API requests."""
+        cached = tool_step("lookup")
+        cached.cacheable = True
+        await orchestrator.register_workflow(make_workflow([cached]))
+        tools = ToolRecorder()
+        request = WorkflowExecutionRequest(workflow_id="workflow")
+
+        await composition_api.get_workflow_orchestrator().execute_workflow(
+            request, tools
+        )
+        second = await composition_api.get_workflow_orchestrator().execute_workflow(
+            request, tools
+        )
+
+        assert composition_api.get_workflow_orchestrator() is orchestrator
+        assert tools.started == ["lookup"]
+        assert second.cache_hits == ["lookup"]
+
+    @pytest.mark.asyncio
+    async def test_step_limit_spans_requests(self):
+        """The configured step limit holds across concurrent API requests."""
+        with patch.object(get_settings(), "workflow_max_concurrent_steps", 3):
+            orchestrator = composition_api.get_workflow_orchestrator()
+        try:
+            await orchestrator.register_workflow(
+                make_workflow(
+                    [tool_step(f"step{i}") for i in range(4)],
+                    parallel_execution=True,
+                )
+            )
+            tools = ToolRecorder()
+            request = WorkflowExecutionRequest(workflow_id="workflow")
+
+            await asyncio.gather(
+                *[
+                    composition_api.get_workflow_orchestrator().execute_workflow(
+                        request, tools
+                    )
+                    for _ in range(3)
+                ]
+            )
+
+            assert len(tools.finished) == 12
+            assert tools.max_running == 3
+        finally:
+            await close_workflow_orchestrator()
+
+    @pytest.mark.asyncio
+    async def test_status_reports_partial_results(self, orchestrator):
+        """A running execution's status includes finished loop iterations."""
+        await orchestrator.register_workflow(
+            make_workflow(
+                [loop_step("loop", list(range(4)), mode="map", max_concurrency=4)]
+            )
+        )
+        release = asyncio.Event()
+
+        async def tools(tool_name, arguments):
+            if arguments["item"] == 3:
+                await release.wait()
+            return arguments["item"]
+
+        execution = asyncio.create_task(
+            orchestrator.execute_workflow(
+                WorkflowExecutionRequest(workflow_id="workflow"), tools
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        execution_id = next(iter(orchestrator.engine.executions))
+        status = await orchestrator.get_workflow_status(execution_id)
+        assert status.partial_results == {"loop": {0: 0, 1: 1, 2: 2}}
+
+        release.set()
+        result = await execution
+        status = await orchestrator.get_workflow_status(execution_id)
+        assert status.partial_results == {}
+        assert status.step_results == result.step_results
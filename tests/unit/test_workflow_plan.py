@@ -0,0 +1,155 @@
+"""
+Unit tests for compiled workflow plans.
+"""
+
+import pytest
+
+from metamcp.composition.models import StepType, WorkflowDefinition, WorkflowStep
+from metamcp.composition.plan import (
+    compile_arguments,
+    compile_condition,
+    compile_variable,
+    compile_workflow,
+)
+from metamcp.exceptions import WorkflowExecutionError
+
+
+def make_workflow(*steps: tuple[str, list[str]]) -> WorkflowDefinition:
+    """Create a workflow from (step ID, dependencies) pairs."""
+    return WorkflowDefinition(
+        id="workflow",
+        name="Workflow",
+        steps=[
+            WorkflowStep(
+                id=step_id,
+                name=step_id,
+                step_type=StepType.TOOL_CALL,
+                config={"tool_name": step_id},
+                depends_on=depends_on,
+            )
+            for step_id, depends_on in steps
+        ],
+        entry_point=steps[0][0],
+    )
+
+
+class TestCompileWorkflow:
+    """Test compiling workflows into plans."""
+
+    def test_topological_order(self):
+        """Steps are ordered after their dependencies."""
+        plan = compile_workflow(
+            make_workflow(("d", ["b", "c"]), ("c", ["a"]), ("b", ["a"]), ("a", []))
+        )
+
+        order = [plan.steps[i].id for i in plan.order]
+        assert order == ["a", "c", "b", "d"]
+        assert plan.indegrees == (2, 1, 1, 0)
+        assert plan.roots == (3,)
+        assert [plan.steps[i].id for i in plan.steps[3].dependents] == ["c", "b"]
+
+    @pytest.mark.parametrize(
+        "steps, message",
+        [
+            ((("a", []), ("a", [])), "Duplicate step IDs"),
+            ((("a", ["b"]), ("b", ["a"])), "Circular dependencies"),
+            ((("a", []), ("b", ["c"])), "unknown step c"),
+        ],
+    )
+    def test_invalid_workflows(self, steps, message):
+        """Invalid workflows are rejected when compiled."""
+        with pytest.raises(WorkflowExecutionError, match=message):
+            compile_workflow(make_workflow(*steps))
+
+    def test_unsupported_operator(self):
+        """Unknown condition operators are rejected when compiled."""
+        workflow = make_workflow(("a", []))
+        workflow.steps[0].condition = {"operator": "matches", "left_operand": "x"}
+
+        with pytest.raises(WorkflowExecutionError, match="operator: matches"):
+            compile_workflow(workflow)
+
+    def test_loop_and_parallel_sub_steps(self):
+        """Loop bodies and parallel sub-steps are compiled with their step."""
+        workflow = make_workflow(("loop", []))
+        workflow.steps[0].step_type = StepType.LOOP
+        workflow.steps[0].config = {
+            "body": {"tool_name": "t", "arguments": {"item": "$loop_item"}}
+        }
+
+        plan = compile_workflow(workflow)
+        body = plan.steps[0].body.with_id("loop_body_3")
+
+        assert body.id == "loop_body_3"
+        assert body.arguments({"loop_item": 7}) == {"item": 7}
+        assert workflow.steps[0].id == "loop"
+
+    @pytest.mark.parametrize("value", [None, 0, -1, 2.5, "4", True])
+    @pytest.mark.parametrize(
+        "step_type, config",
+        [
+            (StepType.LOOP, lambda value: {"loop": {"max_concurrency": value}}),
+            (StepType.PARALLEL, lambda value: {"max_concurrency": value}),
+        ],
+    )
+    def test_invalid_max_concurrency(self, step_type, config, value):
+        """Fan-out limits must be positive integers."""
+        workflow = make_workflow(("fan_out", []))
+        workflow.steps[0].step_type = step_type
+        workflow.steps[0].config = config(value)
+
+        with pytest.raises(WorkflowExecutionError, match="max_concurrency"):
+            compile_workflow(workflow)
+
+
+class TestCompiledAccessors:
+    """Test compiled variables, arguments and conditions."""
+
+    def test_variable(self):
+        """Variable paths read nested values and literals pass through."""
+        variables = {"user": {"profile": {"name": "Ada"}}, "count": 0}
+
+        assert compile_variable("$user.profile.name")(variables) == "Ada"
+        assert compile_variable("$user.missing.name")(variables) is None
+        assert compile_variable("$count")(variables) == 0
+        assert compile_variable("literal")(variables) == "literal"
+        assert compile_variable(42)(variables) == 42
+
+    def test_arguments(self):
+        """Arguments are rebuilt for every call with the current variables."""
+        build = compile_arguments({"q": "$query", "opts": ["$limit", "raw"], "n": 1})
+
+        first = build({"query": "a", "limit": 5})
+        second = build({"query": "b"})
+
+        assert first == {"q": "a", "opts": [5, "raw"], "n": 1}
+        assert second == {"q": "b", "opts": [None, "raw"], "n": 1}
+        assert first["opts"] is not second["opts"]
+
+    @pytest.mark.parametrize(
+        "operator, right, expected",
+        [
+            ("equals", "$limit", True),
+            ("not_equals", 10, True),
+            ("greater_than", 3, True),
+            ("less_than", 3, False),
+            ("exists", None, True),
+            ("not_exists", None, False),
+        ],
+    )
+    def test_condition(self, operator, right, expected):
+        """Conditions compare the resolved operands."""
+        check = compile_condition(
+            {"operator": operator, "left_operand": "$value", "right_operand": right}
+        )
+
+        assert check({"value": 5, "limit": 5}) is expected
+
+    def test_contains(self):
+        """Contains checks the right operand in the left one."""
+        check = compile_condition(
+            {"operator": "contains", "left_operand": "$tags", "right_operand": "x"}
+        )
+
+        assert check({"tags": ["x", "y"]})
+        assert not check({"tags": []})
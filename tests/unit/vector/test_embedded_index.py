@@ -0,0 +1,96 @@
+"""
+Unit tests for the embedded vector index.
+"""
+
+import pytest
+
+from metamcp.exceptions import VectorSearchError
+from metamcp.vector.embedded import EmbeddedVectorIndex
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+async def index():
+    """Create an initialized in-memory index."""
+    index = EmbeddedVectorIndex(dimension=3)
+    await index.initialize()
+    yield index
+    await index.shutdown()
+
+
+def metadata(name):
+    """Build tool metadata."""
+    return {"name": name, "description": f"{name} tool", "categories": ["test"]}
+
+
+class TestEmbeddedVectorIndex:
+    """Test EmbeddedVectorIndex."""
+
+    async def test_search_orders_by_cosine_similarity(self, index):
+        """Results are sorted by score and carry metadata."""
+        await index.store_embedding("tools", "a", [1.0, 0.0, 0.0], metadata("a"))
+        await index.store_embedding("tools", "b", [0.8, 0.6, 0.0], metadata("b"))
+        await index.store_embedding("tools", "c", [0.0, 0.0, 1.0], metadata("c"))
+
+        results = await index.search(
+            "tools", [2.0, 0.0, 0.0], limit=2, similarity_threshold=0.0
+        )
+
+        assert [r["id"] for r in results] == ["a", "b"]
+        assert results[0]["score"] == pytest.approx(1.0)
+        assert results[1]["score"] == pytest.approx(0.8)
+        assert results[0]["metadata"]["name"] == "a"
+
+    async def test_similarity_threshold(self, index):
+        """Results below the threshold are dropped."""
+        await index.store_embedding("tools", "a", [1.0, 0.0, 0.0], metadata("a"))
+        await index.store_embedding("tools", "c", [0.0, 0.0, 1.0], metadata("c"))
+
+        results = await index.search("tools", [1.0, 0.0, 0.0], limit=10)
+
+        assert [r["id"] for r in results] == ["a"]
+
+    async def test_upsert_and_delete(self, index):
+        """Re-storing replaces a vector and deletes keep the rest searchable."""
+        for i in range(5):
+            await index.store_embedding(
+                "tools", f"t{i}", [1.0, float(i), 0.0], metadata(f"t{i}")
+            )
+        await index.store_embedding("tools", "t0", [0.0, 0.0, 1.0], metadata("t0"))
+        await index.delete_embedding("tools", "t1")
+        await index.delete_embedding("tools", "missing")
+
+        results = await index.search(
+            "tools", [0.0, 0.0, 1.0], limit=10, similarity_threshold=-1.0
+        )
+
+        assert results[0]["id"] == "t0"
+        assert {r["id"] for r in results} == {"t0", "t2", "t3", "t4"}
+
+    async def test_unknown_collection(self, index):
+        """Searching a missing collection returns no results."""
+        assert await index.search("missing", [1.0, 0.0, 0.0]) == []
+
+    async def test_dimension_mismatch(self, index):
+        """Embeddings of the wrong size are rejected."""
+        with pytest.raises(VectorSearchError):
+            await index.store_embedding("tools", "a", [1.0, 0.0], metadata("a"))
+
+    async def test_persistence(self, tmp_path):
+        """Collections survive a restart when a path is configured."""
+        index = EmbeddedVectorIndex(dimension=3, path=str(tmp_path))
+        await index.initialize()
+        await index.store_embedding("tools", "a", [1.0, 0.0, 0.0], metadata("a"))
+        await index.store_embedding("tools", "b", [0.0, 1.0, 0.0], metadata("b"))
+        await index.shutdown()
+
+        reloaded = EmbeddedVectorIndex(dimension=3, path=str(tmp_path))
+        await reloaded.initialize()
+        await reloaded.store_embedding("tools", "c", [0.0, 0.0, 1.0], metadata("c"))
+
+        results = await reloaded.search("tools", [0.0, 1.0, 0.0], limit=1)
+        assert results[0]["id"] == "b"
+        assert results[0]["metadata"]["description"] == "b tool"
+        assert reloaded.collections["tools"].count == 3
+        await reloaded.shutdown()